@@ -16,6 +16,7 @@ from app.core.config import Settings
 from app.federation.routes_public import register_federation_public_routes
 from app.middleware.correlation import CorrelationMiddleware
 from app.middleware.errors import ErrorHandlingMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
 from app.middleware.security import SecurityHeadersMiddleware
 
 _logger = logging.getLogger(__name__)
@@ -41,7 +42,9 @@ app = FastAPI(
     redirect_slashes=True,
 )
 
-# Middleware (no MetricsMiddleware — Lambda uses CloudWatch)
+# Middleware (no MetricsMiddleware — Lambda uses CloudWatch). The response
+# cache is innermost, as in app/main.py.
+app.add_middleware(ResponseCacheMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
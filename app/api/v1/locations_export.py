@@ -1,14 +1,23 @@
 """Locations export API endpoints."""
 
 import json
-from typing import Optional, Dict, Any, List
+from collections.abc import AsyncIterator
+from typing import Optional, Dict, Any, List, Literal, Tuple
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from pydantic import BaseModel
 
+from app.api.v1.locations_export_formats import (
+    ENCODERS,
+    accepts_gzip,
+    encode_batches,
+    gzip_chunks,
+    parquet_available,
+)
 from app.core.db import get_session
 
 router = APIRouter(prefix="/locations", tags=["locations"])
@@ -51,7 +60,88 @@ class SimpleExportResponse(BaseModel):
 
 
 # The /export endpoint has been removed as deprecated
-# Use /export-simple endpoint instead for location export functionality
+# Use /export-simple (one JSON document) or /export-stream (NDJSON / CSV /
+# Parquet, streamed) for location export functionality
+
+
+def _export_filters(
+    state: Optional[str], min_confidence: Optional[int]
+) -> Tuple[List[str], Dict[str, Any]]:
+    """Validated WHERE conditions (on `l` / `a`) and their bind params.
+
+    Invalid values are skipped rather than rejected, as /export-simple has
+    always done.
+    """
+    filters: List[str] = []
+    params: Dict[str, Any] = {}
+
+    # Add state filter with validation
+    if state:
+        # Validate state format - 2 letter code only
+        if (
+            isinstance(state, str)
+            and len(state.strip()) == 2
+            and state.strip().isalpha()
+        ):
+            filters.append("a.state_province = :state")
+            params["state"] = state.upper().strip()
+
+    # Add confidence filter with validation
+    if min_confidence:
+        try:
+            confidence_val = int(min_confidence)
+            if 0 <= confidence_val <= 100:
+                filters.append("COALESCE(l.confidence_score, 50) >= :min_confidence")
+                params["min_confidence"] = confidence_val
+        except (ValueError, TypeError):
+            # Invalid confidence value - skip this filter
+            pass
+
+    return filters, params
+
+
+def _isoformat(value: Any) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _location_record(row: Any) -> Dict[str, Any]:
+    """Shape one export row (location + aggregated sources) for output."""
+    # Parse sources JSON
+    sources = []
+    if row.sources:
+        if isinstance(row.sources, str):
+            sources_data = json.loads(row.sources)
+        else:
+            sources_data = row.sources
+
+        for src in sources_data:
+            # Format timestamps
+            for field in ("last_updated", "first_seen"):
+                if src.get(field):
+                    src[field] = _isoformat(src[field])
+            sources.append(src)
+
+    return {
+        "id": str(row.id),
+        "lat": float(row.lat) if row.lat else 0.0,
+        "lng": float(row.lng) if row.lng else 0.0,
+        "name": row.name or "Unknown",
+        "org": row.org_name or row.name or "",
+        "address": row.address or "",
+        "city": row.city,
+        "state": row.state,
+        "zip": row.zip,
+        "phone": row.phone,
+        "website": row.website,
+        "email": row.email,
+        "description": row.description,
+        "confidence_score": (
+            float(row.confidence_score) if row.confidence_score else 50.0
+        ),
+        "validation_status": row.validation_status or "needs_review",
+        "sources": sources,
+        "source_count": int(row.source_count) if row.source_count else 0,
+    }
 
 
 @router.get("/export-simple")
@@ -92,31 +182,8 @@ async def export_simple_locations(
           AND (l.validation_status IS NULL OR l.validation_status != 'rejected')
     """
 
-    params: Dict[str, Any] = {}
-
-    # Add state filter with validation
-    if state:
-        # Validate state format - 2 letter code only
-        if (
-            isinstance(state, str)
-            and len(state.strip()) == 2
-            and state.strip().isalpha()
-        ):
-            location_filter_sql += " AND a.state_province = :state"
-            params["state"] = state.upper().strip()
-
-    # Add confidence filter with validation
-    if min_confidence:
-        try:
-            confidence_val = int(min_confidence)
-            if 0 <= confidence_val <= 100:
-                location_filter_sql += (
-                    " AND COALESCE(l.confidence_score, 50) >= :min_confidence"
-                )
-                params["min_confidence"] = confidence_val
-        except (ValueError, TypeError):
-            # Invalid confidence value - skip this filter
-            pass
+    filters, params = _export_filters(state, min_confidence)
+    location_filter_sql += "".join(" AND " + f for f in filters)
 
     location_filter_sql += """
         ORDER BY COALESCE(l.confidence_score, 50) DESC, l.name
@@ -227,52 +294,7 @@ async def export_simple_locations(
         if row.state:
             states.add(row.state)
 
-        # Parse sources JSON
-        sources = []
-        if row.sources:
-            if isinstance(row.sources, str):
-                sources_data = json.loads(row.sources)
-            else:
-                sources_data = row.sources
-
-            for src in sources_data:
-                # Format timestamps
-                if src.get("last_updated"):
-                    src["last_updated"] = (
-                        src["last_updated"].isoformat()
-                        if hasattr(src["last_updated"], "isoformat")
-                        else str(src["last_updated"])
-                    )
-                if src.get("first_seen"):
-                    src["first_seen"] = (
-                        src["first_seen"].isoformat()
-                        if hasattr(src["first_seen"], "isoformat")
-                        else str(src["first_seen"])
-                    )
-                sources.append(src)
-
-        location_data = {
-            "id": str(row.id),
-            "lat": float(row.lat) if row.lat else 0.0,
-            "lng": float(row.lng) if row.lng else 0.0,
-            "name": row.name or "Unknown",
-            "org": row.org_name or row.name or "",
-            "address": row.address or "",
-            "city": row.city,
-            "state": row.state,
-            "zip": row.zip,
-            "phone": row.phone,
-            "website": row.website,
-            "email": row.email,
-            "description": row.description,
-            "confidence_score": (
-                float(row.confidence_score) if row.confidence_score else 50.0
-            ),
-            "validation_status": row.validation_status or "needs_review",
-            "sources": sources,
-            "source_count": int(row.source_count) if row.source_count else 0,
-        }
-
+        location_data = _location_record(row)
         locations.append(location_data)
 
     # Build metadata
@@ -295,3 +317,150 @@ async def export_simple_locations(
         metadata["min_confidence"] = min_confidence
 
     return {"metadata": metadata, "locations": locations}
+
+
+# Rows per fetch from the server-side cursor, and per encoded chunk.
+_STREAM_BATCH_ROWS = 1000
+
+# Unlike /export-simple, this query has no CTE or GROUP BY: rows come off the
+# primary-key index in id order and each one's sources are aggregated in a
+# LATERAL, so Postgres produces the first rows immediately and the cursor
+# below pulls the rest batch by batch. Ordering by id is what makes the
+# `cursor` parameter a stable resume point, so every join here yields at most
+# one row per location: a location with several addresses (or phones) must
+# not appear twice, or a resume from the first copy would skip nothing and
+# repeat the rest.
+_STREAM_SQL = """
+    SELECT
+        l.id,
+        l.latitude AS lat,
+        l.longitude AS lng,
+        l.name,
+        o.name AS org_name,
+        CONCAT_WS(', ', a.address_1, a.city, a.state_province, a.postal_code) AS address,
+        a.city,
+        a.state_province AS state,
+        a.postal_code AS zip,
+        p.number AS phone,
+        l.url AS website,
+        o.email AS email,
+        l.description,
+        COALESCE(l.confidence_score, 50) AS confidence_score,
+        COALESCE(l.validation_status, 'needs_review') AS validation_status,
+        COALESCE(s.sources, '[]'::json) AS sources,
+        COALESCE(s.source_count, 0) AS source_count
+    FROM location l
+    LEFT JOIN organization o ON o.id = l.organization_id
+    LEFT JOIN LATERAL (
+        SELECT address_1, city, state_province, postal_code FROM address
+        WHERE location_id = l.id AND address_type = 'physical'
+        ORDER BY id
+        LIMIT 1
+    ) a ON true
+    LEFT JOIN LATERAL (
+        SELECT number FROM phone WHERE location_id = l.id LIMIT 1
+    ) p ON true
+    LEFT JOIN LATERAL (
+        SELECT
+            json_agg(
+                json_build_object(
+                    'scraper', ls.scraper_id,
+                    'name', ls.name,
+                    'phone', p.number,
+                    'email', o.email,
+                    'website', o.website,
+                    'address', CONCAT_WS(', ', a.address_1, a.city, a.state_province, a.postal_code),
+                    'confidence_score', COALESCE(l.confidence_score, 50),
+                    'last_updated', ls.updated_at,
+                    'first_seen', ls.created_at
+                )
+                ORDER BY ls.updated_at DESC
+            ) AS sources,
+            COUNT(DISTINCT ls.scraper_id) AS source_count
+        FROM location_source ls
+        WHERE ls.location_id = l.id
+          AND (ls.source_type IS NULL OR ls.source_type != 'submarine')
+    ) s ON true
+    WHERE l.latitude IS NOT NULL
+      AND l.longitude IS NOT NULL
+      AND l.latitude BETWEEN -90 AND 90
+      AND l.longitude BETWEEN -180 AND 180
+      AND l.is_canonical = true
+      AND (l.validation_status IS NULL OR l.validation_status != 'rejected')
+      __FILTERS__
+    ORDER BY l.id
+"""
+
+
+async def _stream_records(
+    session: AsyncSession, sql: str, params: Dict[str, Any]
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield export records in batches from a server-side cursor."""
+    result = await session.stream(text(sql), params)
+    try:
+        async for rows in result.partitions(_STREAM_BATCH_ROWS):
+            yield [_location_record(row) for row in rows]
+    finally:
+        await result.close()
+
+
+@router.get("/export-stream")
+async def export_stream_locations(
+    request: Request,
+    format: Literal["ndjson", "csv", "parquet"] = Query(
+        "ndjson", description="Output format"
+    ),
+    state: Optional[str] = Query(None, description="Filter by state code (e.g., 'CA')"),
+    min_confidence: Optional[int] = Query(
+        None, ge=0, le=100, description="Minimum confidence score"
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Resume token: the `id` of the last location received. Rows are "
+            "ordered by id, so an interrupted or limited pull continues "
+            "exactly where it stopped."
+        ),
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Maximum number of locations (default: all)"
+    ),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """
+    Stream every matching location as NDJSON, CSV or Parquet.
+
+    Same records and filters as /export-simple, without its row cap: the
+    response starts as soon as the first rows are read and memory stays at
+    one batch however many locations match. NDJSON and CSV are gzipped when
+    the client accepts it; Parquet is compressed internally and needs
+    pyarrow on the server.
+    """
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(
+            status_code=406, detail="Parquet export is not available on this server"
+        )
+
+    filters, params = _export_filters(state, min_confidence)
+    if cursor:
+        filters.append("l.id > :cursor")
+        params["cursor"] = cursor
+    sql = _STREAM_SQL.replace(
+        "__FILTERS__", "".join("AND " + f + "\n      " for f in filters)
+    )
+    if limit is not None:
+        sql += "LIMIT :limit\n"
+        params["limit"] = limit
+
+    encoder = ENCODERS[format]()
+    body = encode_batches(_stream_records(session, sql, params), encoder)
+    headers = {
+        "Content-Disposition": (f'attachment; filename="locations.{encoder.extension}"')
+    }
+    if format != "parquet":
+        headers["Vary"] = "Accept-Encoding"
+        if accepts_gzip(request.headers.get("accept-encoding", "")):
+            body = gzip_chunks(body)
+            headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=encoder.media_type, headers=headers)
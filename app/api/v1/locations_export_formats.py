@@ -0,0 +1,215 @@
+"""Incremental encoders for the streamed locations export.
+
+Each encoder turns batches of export records (dicts shaped by
+``locations_export._location_record``) into bytes as they arrive, so the
+export never holds more than one batch in memory. ``gzip_chunks`` wraps any
+of them for clients that send ``Accept-Encoding: gzip``.
+
+Parquet needs pyarrow, which is not a dependency of the API image; asking
+for it without pyarrow installed is reported by the endpoint as a 406.
+"""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from typing import Any, Dict, List, Protocol
+
+# Column order for CSV and Parquet. `sources` is nested, so it is written as
+# a JSON string in both; NDJSON keeps it as an array.
+EXPORT_COLUMNS = (
+    "id",
+    "lat",
+    "lng",
+    "name",
+    "org",
+    "address",
+    "city",
+    "state",
+    "zip",
+    "phone",
+    "website",
+    "email",
+    "description",
+    "confidence_score",
+    "validation_status",
+    "source_count",
+    "sources",
+)
+
+
+class ExportEncoder(Protocol):
+    """Encodes export records batch by batch."""
+
+    media_type: str
+    extension: str
+
+    def encode(self, records: List[Dict[str, Any]]) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class NdjsonEncoder:
+    """One JSON object per line."""
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def encode(self, records: List[Dict[str, Any]]) -> bytes:
+        return "".join(
+            json.dumps(record, default=str) + "\n" for record in records
+        ).encode()
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class CsvEncoder:
+    """RFC 4180 CSV with a header row."""
+
+    media_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self) -> None:
+        self._header_written = False
+
+    def encode(self, records: List[Dict[str, Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if not self._header_written:
+            writer.writerow(EXPORT_COLUMNS)
+            self._header_written = True
+        for record in records:
+            writer.writerow(_flat_row(record))
+        return buffer.getvalue().encode()
+
+    def finish(self) -> bytes:
+        # An empty export still gets its header
+        return self.encode([]) if not self._header_written else b""
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file whose contents are handed off and dropped on drain."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetEncoder:
+    """Parquet file with one row group per batch (zstd-compressed).
+
+    The footer is only written by ``finish``, so a truncated download is not
+    a readable file; resume with the cursor instead.
+    """
+
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("lat", pa.float64()),
+                ("lng", pa.float64()),
+                ("name", pa.string()),
+                ("org", pa.string()),
+                ("address", pa.string()),
+                ("city", pa.string()),
+                ("state", pa.string()),
+                ("zip", pa.string()),
+                ("phone", pa.string()),
+                ("website", pa.string()),
+                ("email", pa.string()),
+                ("description", pa.string()),
+                ("confidence_score", pa.float64()),
+                ("validation_status", pa.string()),
+                ("source_count", pa.int32()),
+                ("sources", pa.string()),
+            ]
+        )
+        self._sink = _DrainableSink()
+        self._writer = pq.ParquetWriter(self._sink, self._schema, compression="zstd")
+
+    def encode(self, records: List[Dict[str, Any]]) -> bytes:
+        if records:
+            rows = [
+                dict(zip(EXPORT_COLUMNS, _flat_row(r), strict=True)) for r in records
+            ]
+            table = self._pa.Table.from_pylist(rows, schema=self._schema)
+            self._writer.write_table(table)
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+ENCODERS = {
+    "ndjson": NdjsonEncoder,
+    "csv": CsvEncoder,
+    "parquet": ParquetEncoder,
+}
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _flat_row(record: Dict[str, Any]) -> List[Any]:
+    row = dict(record)
+    row["sources"] = json.dumps(record.get("sources") or [], default=str)
+    return [row.get(column) for column in EXPORT_COLUMNS]
+
+
+async def encode_batches(
+    batches: AsyncIterator[List[Dict[str, Any]]], encoder: ExportEncoder
+) -> AsyncIterator[bytes]:
+    """Encode batches as they arrive, skipping empty chunks."""
+    async for records in batches:
+        chunk = encoder.encode(records)
+        if chunk:
+            yield chunk
+    tail = encoder.finish()
+    if tail:
+        yield tail
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip a byte stream, flushing once per chunk so output keeps flowing."""
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q=0 excluded)."""
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
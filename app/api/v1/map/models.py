@@ -89,6 +89,11 @@ class MapMetadata(BaseModel):
     format_version: str = Field(default="4.0")
     export_method: str = Field(default="API Query")
     aggregation_radius_meters: int = Field(default=150)
+    facets: Optional[Dict[str, Dict[str, int]]] = Field(
+        default=None,
+        description="Per-token location counts for services and languages "
+        "(map search with include_facets=true)",
+    )
 
 
 class MapLocationsResponse(BaseModel):
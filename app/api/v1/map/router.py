@@ -1,6 +1,6 @@
 """Map API endpoints for serving location data to web interface."""
 
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 import structlog
 
@@ -44,10 +44,16 @@ async def search_map_locations(
         None, ge=-180, le=180, description="Maximum longitude for bounding box"
     ),
     center_lat: Optional[float] = Query(
-        None, ge=-90, le=90, description="Center latitude for radius search"
+        None,
+        ge=-90,
+        le=90,
+        description="Center latitude for radius / nearest-first search",
     ),
     center_lng: Optional[float] = Query(
-        None, ge=-180, le=180, description="Center longitude for radius search"
+        None,
+        ge=-180,
+        le=180,
+        description="Center longitude for radius / nearest-first search",
     ),
     radius: Optional[float] = Query(
         None, gt=0, le=500, description="Search radius in miles"
@@ -57,10 +63,22 @@ async def search_map_locations(
         None, max_length=2, description="State code (e.g., 'CA')"
     ),
     services: Optional[str] = Query(
-        None, description="Comma-separated list of services to filter"
+        None,
+        description="Comma-separated services to filter (e.g., 'food_pantry,hot_meals'); "
+        "names are folded to tokens, so 'Food Pantry' also works",
     ),
     languages: Optional[str] = Query(
-        None, description="Comma-separated list of languages to filter"
+        None,
+        description="Comma-separated language codes to filter (e.g., 'en,es'); "
+        "languages recorded without a code match by folded name",
+    ),
+    facet_match: Literal["any", "all"] = Query(
+        "any",
+        description="Match locations with any or all of the requested services/languages",
+    ),
+    include_facets: bool = Query(
+        False,
+        description="Include per-service and per-language location counts in metadata.facets",
     ),
     schedule_days: Optional[str] = Query(
         None, description="Comma-separated days (e.g., 'monday,wednesday')"
@@ -93,6 +111,8 @@ async def search_map_locations(
     ### Primary Use Case - Geographic Queries:
     - **Bounding Box** (RECOMMENDED): Use min_lat, min_lng, max_lat, max_lng for current map view
     - **Radius Search**: Use center_lat, center_lng, and radius (miles) for proximity search
+    - **Nearest First**: center_lat and center_lng without radius sort by distance;
+      results include `distance_miles` whenever a center is given
     - **State Filter**: Use state code (e.g., 'CA', 'NY') for state-level data
 
     ### Output Formats:
@@ -104,6 +124,11 @@ async def search_map_locations(
     - `confidence_min=70` - Only high-confidence locations
     - `has_multiple_sources=true` - Verified by multiple sources
 
+    ### Service and Language Filters:
+    - `services=food_pantry,hot_meals` - Locations offering any of these services
+    - `languages=es&facet_match=all` - Require every requested token instead of any
+    - `include_facets=true` - Service/language counts for the filtered set in `metadata.facets`
+
     ### Example Map Integration:
     ```javascript
     // Fetch locations for current map view
@@ -113,9 +138,13 @@ async def search_map_locations(
 
     ### Performance Notes:
     - Bounding box queries are fastest
+    - Radius filters use a geography GiST index; nearest-first ordering sorts
+      the filtered rows, so combine a center with a radius or bounding box
     - Use `format=compact` for map display
     - Limit results with `per_page` based on zoom level
-    - Text search (q parameter) is simplified and only searches location names
+    - Text search (q parameter) matches location and organization names,
+      addresses and descriptions through an indexed search document, with
+      prefix matching for partially typed words; results are ranked by relevance
     """
 
     # Build bounding box if all parameters provided
@@ -149,6 +178,8 @@ async def search_map_locations(
         confidence_min=confidence_min,
         validation_status=validation_status,
         has_multiple_sources=has_multiple_sources,
+        facet_match=facet_match,
+        include_facets=include_facets,
         output_format=format,
         limit=per_page,
         offset=offset,
@@ -1,12 +1,12 @@
 """Enhanced search service for map locations with full-text search capabilities."""
 
 import logging
+import re
 from datetime import datetime, UTC
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
-from math import radians, cos, sin
 
-from sqlalchemy import text, func
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.map.models import MapMetadata
@@ -14,6 +14,152 @@ from app.api.v1.map.models import MapMetadata
 logger = logging.getLogger(__name__)
 
 
+# Allowed characters in the `q` search text
+_QUERY_ALLOWED_RE = re.compile(r"^[a-zA-Z0-9\s\-'.]+$")
+_QUERY_TERM_RE = re.compile(r"[a-z0-9]+")
+_FACET_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+# Facet filters match rows whose token array shares any requested token
+# (`&&`) or contains all of them (`@>`). Both are GIN-indexed on
+# location_search (init-scripts/18-location-facets.sql).
+_FACET_OPERATORS = {"any": "&&", "all": "@>"}
+
+# Location point as geography. Must stay identical to the idx_location_geog
+# expression (init-scripts/19-location-geography-index.sql) so the planner
+# can serve radius filters (ST_DWithin) from the GiST index.
+_LOCATION_GEOGRAPHY = (
+    "CAST(ST_SetSRID(ST_MakePoint("
+    "CAST(l.longitude AS float8), CAST(l.latitude AS float8)), 4326) AS geography)"
+)
+_CENTER_GEOGRAPHY = (
+    "CAST(ST_SetSRID(ST_MakePoint(:center_lng, :center_lat), 4326) AS geography)"
+)
+
+# Distances are measured on the PostGIS sphere (mean earth radius, meters).
+# Miles are scaled against the 3959-mile earth radius the previous acos
+# formula used, so radius cut-offs and reported distances are unchanged.
+_SPHERE_RADIUS_METERS = 6371008.7714
+_EARTH_RADIUS_MILES = 3959.0
+_METERS_PER_MILE = _SPHERE_RADIUS_METERS / _EARTH_RADIUS_MILES
+
+# Joined into searchable_locations when `q` is given. Matches come from the
+# location_search table (init-scripts/17-location-search.sql): the weighted
+# tsvector via websearch_to_tsquery, a prefix to_tsquery for the word still
+# being typed, and the pg_trgm-indexed folded text for substrings. All three
+# predicates are GIN-indexed, so the planner can BitmapOr them instead of
+# scanning every location.
+_TEXT_SEARCH_JOIN = """
+                JOIN (
+                    SELECT
+                        ls.location_id,
+                        ts_rank(
+                            ls.search_vector,
+                            websearch_to_tsquery('english', :search_query)
+                            || to_tsquery('english', :search_prefix)
+                        ) AS search_rank
+                    FROM location_search ls
+                    WHERE ls.search_vector @@ websearch_to_tsquery(
+                            'english', :search_query
+                        )
+                       OR ls.search_vector @@ to_tsquery('english', :search_prefix)
+                       OR ls.folded_text LIKE :search_pattern
+                ) sm ON sm.location_id = l.id"""
+
+# Appended after a `filtered` CTE (id, service_tokens, language_codes) when
+# facet counts are requested. Locations are counted once per token even when
+# the address join fans a location out into several rows.
+_FACET_COUNT_SELECT = """
+SELECT
+    (SELECT COUNT(*) FROM filtered) AS total,
+    sf.tokens AS service_facet_tokens,
+    sf.counts AS service_facet_counts,
+    lf.tokens AS language_facet_tokens,
+    lf.counts AS language_facet_counts
+FROM (
+    SELECT
+        array_agg(token ORDER BY n DESC, token) AS tokens,
+        array_agg(n ORDER BY n DESC, token) AS counts
+    FROM (
+        SELECT token, COUNT(DISTINCT id) AS n
+        FROM filtered, unnest(service_tokens) AS token
+        GROUP BY token
+    ) t
+) sf, (
+    SELECT
+        array_agg(token ORDER BY n DESC, token) AS tokens,
+        array_agg(n ORDER BY n DESC, token) AS counts
+    FROM (
+        SELECT token, COUNT(DISTINCT id) AS n
+        FROM filtered, unnest(language_codes) AS token
+        GROUP BY token
+    ) t
+) lf"""
+
+
+def _facet_counts(
+    tokens: Optional[List[str]], counts: Optional[List[int]]
+) -> Dict[str, int]:
+    """Pair facet token and count arrays from the count query."""
+    return dict(zip(tokens or [], (int(c) for c in counts or []), strict=False))
+
+
+def build_text_search_params(query: Optional[str]) -> Optional[Dict[str, str]]:
+    """Build bind parameters for an indexed `q` text search.
+
+    Args:
+        query: Raw search text
+
+    Returns:
+        Dict with search_query (websearch syntax), search_prefix (every term
+        as a prefix match) and search_pattern (folded substring pattern), or
+        None if the query is empty or contains disallowed characters
+    """
+    if not isinstance(query, str):
+        return None
+    sanitized = query.strip()[:100]
+    # Only allow alphanumeric, spaces, hyphens, apostrophes, and periods
+    if not sanitized or not _QUERY_ALLOWED_RE.match(sanitized):
+        return None
+    folded = " ".join(sanitized.lower().split())
+    terms = _QUERY_TERM_RE.findall(folded)
+    if not terms:
+        return None
+    return {
+        "search_query": folded,
+        # Terms are [a-z0-9]+ only, so they are safe to_tsquery operands
+        "search_prefix": " & ".join(f"{term}:*" for term in terms),
+        "search_pattern": f"%{folded}%",
+    }
+
+
+def normalize_facet_token(value: Any) -> Optional[str]:
+    """Fold a service name or language code/name into a facet token.
+
+    Mirrors location_facet_token() in init-scripts/18-location-facets.sql:
+    lowercase, runs of non-alphanumerics become "_", outer "_" stripped.
+
+    Args:
+        value: Raw service name, language code or language name
+
+    Returns:
+        Facet token (e.g. "Food Pantry" -> "food_pantry"), or None if empty
+    """
+    if not isinstance(value, str):
+        return None
+    token = _FACET_SEPARATOR_RE.sub("_", value.lower()).strip("_")
+    return token or None
+
+
+def _facet_tokens(values: Optional[List[str]]) -> List[str]:
+    """Normalize and dedupe requested facet values, dropping empties."""
+    tokens: Dict[str, None] = {}
+    for value in values or []:
+        token = normalize_facet_token(value)
+        if token:
+            tokens[token] = None
+    return list(tokens)
+
+
 class OutputFormat(str, Enum):
     """Output format options for search results."""
 
@@ -43,6 +189,8 @@ class MapSearchService:
         confidence_min: Optional[int] = None,
         validation_status: Optional[str] = None,
         has_multiple_sources: Optional[bool] = None,
+        facet_match: str = "any",
+        include_facets: bool = False,
         output_format: OutputFormat = OutputFormat.FULL,
         limit: int = 100,
         offset: int = 0,
@@ -50,6 +198,17 @@ class MapSearchService:
         """
         Search locations with comprehensive filtering options.
 
+        ``services`` and ``languages`` are matched as facet tokens (see
+        ``normalize_facet_token``); ``facet_match`` selects whether a location
+        needs any ("any") or all ("all") of the requested tokens. With
+        ``include_facets`` the count query also returns per-token location
+        counts for the filtered result set in ``metadata.facets``.
+
+        With ``center_lat``/``center_lng`` results are ordered nearest first
+        and carry ``distance_miles``; ``radius_miles`` additionally limits
+        them to that distance with an ST_DWithin filter that idx_location_geog
+        can serve.
+
         Returns:
             Tuple of (locations, metadata, total_count)
         """
@@ -85,37 +244,32 @@ class MapSearchService:
             except (ValueError, TypeError):
                 pass
 
-        if (
-            center_lat is not None
-            and center_lng is not None
-            and radius_miles is not None
-        ):
-            try:
-                if (
-                    -90 <= center_lat <= 90
-                    and -180 <= center_lng <= 180
-                    and 0 < radius_miles <= 1000
-                ):
+        # The radius filter matches the geography GiST index
+        # (idx_location_geog). Ordering by distance is a sort over the rows
+        # the CTE returns, so a center without a radius is a nearest-first
+        # query with no cut-off and no index-backed ordering.
+        distance_sql = "CAST(NULL AS float8)"
+        has_center = False
+        try:
+            has_center = (
+                center_lat is not None
+                and center_lng is not None
+                and -90 <= center_lat <= 90
+                and -180 <= center_lng <= 180
+            )
+            if has_center and radius_miles is not None:
+                if 0 < radius_miles <= 1000:
                     inner_conditions.append(
-                        """
-                        (
-                            3959 * acos(
-                                cos(radians(:center_lat)) * cos(radians(l.latitude)) *
-                                cos(radians(l.longitude) - radians(:center_lng)) +
-                                sin(radians(:center_lat)) * sin(radians(l.latitude))
-                            )
-                        ) <= :radius_miles
-                        """
-                    )
-                    params.update(
-                        {
-                            "center_lat": center_lat,
-                            "center_lng": center_lng,
-                            "radius_miles": radius_miles,
-                        }
+                        f"ST_DWithin({_LOCATION_GEOGRAPHY}, {_CENTER_GEOGRAPHY},"
+                        " :radius_meters, false)"
                     )
-            except (ValueError, TypeError):
-                pass
+                    params["radius_meters"] = radius_miles * _METERS_PER_MILE
+        except (ValueError, TypeError):
+            has_center = False
+        if has_center:
+            # geography `<->` is the spherical distance in meters
+            distance_sql = f"{_LOCATION_GEOGRAPHY} <-> {_CENTER_GEOGRAPHY}"
+            params.update({"center_lat": center_lat, "center_lng": center_lng})
 
         if state:
             if (
@@ -126,13 +280,49 @@ class MapSearchService:
                 inner_conditions.append("a.state_province = :state")
                 params["state"] = state.upper().strip()
 
+        # Service / language filters are array predicates on the GIN-indexed
+        # location_search facet columns, pushed into the CTE like the
+        # geographic filters.
+        service_tokens = _facet_tokens(services)
+        language_tokens = _facet_tokens(languages)
+        facet_operator = _FACET_OPERATORS.get(facet_match, "&&")
+        if service_tokens:
+            inner_conditions.append(
+                f"lf.service_tokens {facet_operator} CAST(:service_tokens AS text[])"
+            )
+            params["service_tokens"] = service_tokens
+        if language_tokens:
+            inner_conditions.append(
+                f"lf.language_codes {facet_operator} CAST(:language_tokens AS text[])"
+            )
+            params["language_tokens"] = language_tokens
+        facet_join_sql = ""
+        facet_columns_sql = ""
+        if service_tokens or language_tokens or include_facets:
+            facet_join_sql = "LEFT JOIN location_search lf ON lf.location_id = l.id"
+            facet_columns_sql = (
+                ",\n                    lf.service_tokens,\n"
+                "                    lf.language_codes"
+            )
+
         inner_filter_sql = (
             " AND " + " AND ".join(inner_conditions) if inner_conditions else ""
         )
 
+        # Text search joins the indexed location_search documents so only
+        # matching locations reach the schedule LATERAL join.
+        search_join_sql = ""
+        search_rank_sql = "0"
+        search_params = build_text_search_params(query) if query else None
+        if search_params:
+            search_join_sql = _TEXT_SEARCH_JOIN
+            search_rank_sql = "sm.search_rank"
+            params.update(search_params)
+
         # Optimized query for map display - simpler joins for better performance.
-        # inner_filter_sql is composed exclusively of static SQL fragments
-        # above (no user-supplied strings); all values are bound via :params.
+        # inner_filter_sql and the search join/rank are composed exclusively of
+        # static SQL fragments above (no user-supplied strings); all values are
+        # bound via :params.
         # Bandit/ruff flag any `+` of SQL-keyword string with a variable; we
         # use a sentinel + str.replace() to dodge both detections instead of
         # littering the multi-line SQL with comment markers.
@@ -179,8 +369,12 @@ class MapSearchService:
                     l.validation_status,
                     l.geocoding_source,
                     l.location_type,
-                    COALESCE(sc.source_count, 1) as source_count
+                    COALESCE(sc.source_count, 1) as source_count,
+                    __SEARCH_RANK__ as search_rank,
+                    __DISTANCE__ as distance_m__FACET_COLUMNS__
                 FROM location l
+                __SEARCH_JOIN__
+                __FACET_JOIN__
                 LEFT JOIN address a ON a.location_id = l.id
                 LEFT JOIN organization o ON o.id = l.organization_id
                 LEFT JOIN source_counts sc ON sc.location_id = l.id
@@ -208,42 +402,25 @@ class MapSearchService:
                   __INNER_FILTERS__
             )
         """
-        # Replace the sentinel with the static-fragment filter SQL. Using
+        # Replace the sentinels with the static-fragment SQL. Using
         # str.replace() (not +) keeps bandit's B608 string-concat check happy
         # since the SQL keywords live in a single static literal.
-        base_query = base_query_template.replace("__INNER_FILTERS__", inner_filter_sql)
+        base_query = (
+            base_query_template.replace("__INNER_FILTERS__", inner_filter_sql)
+            .replace("__SEARCH_JOIN__", search_join_sql)
+            .replace("__SEARCH_RANK__", search_rank_sql)
+            .replace("__DISTANCE__", distance_sql)
+            .replace("__FACET_JOIN__", facet_join_sql)
+            .replace("__FACET_COLUMNS__", facet_columns_sql)
+        )
 
         # Build WHERE conditions
         conditions: list[str] = []
 
-        # Simple text search with input validation - only on location name for basic filtering
-        # Not a primary use case, so keep it simple
-        if query:
-            # Validate and sanitize query input
-            if isinstance(query, str) and len(query.strip()) > 0:
-                # Remove potentially dangerous characters and limit length
-                sanitized_query = query.strip()[:100]  # Limit to 100 chars
-                # Only allow alphanumeric, spaces, hyphens, apostrophes, and periods
-                import re
-
-                if re.match(r"^[a-zA-Z0-9\s\-'.]+$", sanitized_query):
-                    conditions.append("LOWER(location_name) LIKE :search_pattern")
-                    params["search_pattern"] = f"%{sanitized_query.lower()}%"
-
         # Geographic + state filters (bbox / radius / state) are pushed into the
         # `searchable_locations` CTE above so the LATERAL schedule join runs only
         # for filtered rows. Do not duplicate them here.
 
-        # Service filter - simplified, only check if services exist
-        if services:
-            # Just check if location has services, don't filter by specific ones
-            conditions.append("services IS NOT NULL AND services != ''")
-
-        # Language filter - simplified, only check if languages exist
-        if languages:
-            # Just check if location has language support, don't filter by specific ones
-            conditions.append("languages IS NOT NULL AND languages != ''")
-
         # Schedule filter with proper input validation and parameterized queries
         if schedule_days:
             day_conditions = []
@@ -340,6 +517,28 @@ class MapSearchService:
             + "FROM searchable_locations\n"
             + where_clause
         )
+        if include_facets:
+            # Same filtered rows, plus per-token location counts
+            count_query = (
+                base_query
+                + ",\nfiltered AS (\n"  # nosec B608
+                + "SELECT id, service_tokens, language_codes\n"
+                + "FROM searchable_locations\n"
+                + where_clause
+                + "\n)\n"
+                + _FACET_COUNT_SELECT
+            )
+
+        # With a center, nearest locations come first (after text relevance).
+        # search_rank is a constant without `q`, so distance leads the sort.
+        order_by_sql = (
+            "search_rank DESC, confidence_score DESC, location_name, org_name"
+        )
+        if has_center:
+            order_by_sql = (
+                "search_rank DESC, distance_m, confidence_score DESC,"
+                " location_name, org_name"
+            )
 
         # Main query - use string concatenation instead of f-string to avoid S608
         main_query = (
@@ -347,8 +546,9 @@ class MapSearchService:
             + "\nSELECT *\n"  # nosec B608
             + "FROM searchable_locations\n"
             + where_clause
-            + "\nORDER BY confidence_score DESC, location_name, org_name\n"
-            + "LIMIT :limit OFFSET :offset"
+            + "\nORDER BY "
+            + order_by_sql
+            + "\nLIMIT :limit OFFSET :offset"
         )
 
         # Validate and sanitize limit and offset parameters
@@ -364,7 +564,20 @@ class MapSearchService:
 
         # Execute count query
         count_result = await self.session.execute(text(count_query), params)
-        total_count = count_result.scalar() or 0
+        facets: Optional[Dict[str, Dict[str, int]]] = None
+        if include_facets:
+            count_row = count_result.one()
+            total_count = count_row.total or 0
+            facets = {
+                "services": _facet_counts(
+                    count_row.service_facet_tokens, count_row.service_facet_counts
+                ),
+                "languages": _facet_counts(
+                    count_row.language_facet_tokens, count_row.language_facet_counts
+                ),
+            }
+        else:
+            total_count = count_result.scalar() or 0
 
         # Execute main query
         result = await self.session.execute(text(main_query), params)
@@ -373,6 +586,7 @@ class MapSearchService:
         # Process results based on format
         locations = []
         for row in rows:
+            location: Dict[str, Any]
             if output_format == OutputFormat.COMPACT:
                 # Compact format for map markers
                 location = {
@@ -479,6 +693,14 @@ class MapSearchService:
                     "location_type": row.location_type or "",
                 }
 
+            if has_center and row.distance_m is not None:
+                fields = (
+                    location["properties"]
+                    if output_format == OutputFormat.GEOJSON
+                    else location
+                )
+                fields["distance_miles"] = float(row.distance_m) / _METERS_PER_MILE
+
             locations.append(location)
 
         # Generate metadata
@@ -527,6 +749,7 @@ class MapSearchService:
             format_version="4.0",
             export_method="API Search",
             aggregation_radius_meters=0,  # No aggregation in search
+            facets=facets,
         )
 
         return locations, metadata, total_count
@@ -84,6 +84,10 @@ class BeaconSyncMeta(BaseModel):
     has_more: bool
     generated_at: datetime
     etag: str
+    change_seq: Optional[int] = Field(
+        default=None,
+        description="Change sequence the ETag and total were computed at",
+    )
     data_version: str = "1.0"
 
 
@@ -58,14 +58,29 @@ async def beacon_sync(
     ),
     session: AsyncSession = Depends(get_session),
 ) -> Response:
-    """Beacon partner data sync endpoint."""
+    """Beacon partner data sync endpoint.
+
+    The ETag and total come from a cached snapshot keyed on the sync change
+    sequence, so a matching If-None-Match returns 304 without querying the
+    location tables.
+    """
     service = BeaconSyncService(session, min_confidence=min_confidence)
+    state_filter = state.upper() if state else None
     try:
+        snapshot = await service.snapshot(
+            cursor=cursor, updated_since=updated_since, state_filter=state_filter
+        )
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and if_none_match == snapshot.etag:
+            return Response(status_code=304)
+
         result = await service.sync(
             page_size=page_size,
             cursor=cursor,
             updated_since=updated_since,
-            state_filter=state.upper() if state else None,
+            state_filter=state_filter,
+            snapshot=snapshot,
         )
     except ValueError as e:
         from fastapi import HTTPException
@@ -74,10 +89,6 @@ async def beacon_sync(
 
     etag = result["meta"]["etag"]
 
-    if_none_match = request.headers.get("if-none-match")
-    if if_none_match and if_none_match == etag:
-        return Response(status_code=304)
-
     response_model = BeaconSyncResponse(**result)
 
     return JSONResponse(
@@ -9,8 +9,10 @@ from __future__ import annotations
 import base64
 import hashlib
 import json
-from datetime import UTC, datetime
+from collections import OrderedDict
 from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any, Optional
 
 import structlog
@@ -29,21 +31,78 @@ from app.api.v1.partners.ptf.formatters import humanize_scraper_id
 logger = structlog.get_logger(__name__)
 
 
-def _encode_cursor(confidence_score: int, location_id: str) -> str:
-    payload = json.dumps({"c": confidence_score, "i": location_id})
+def _encode_cursor(
+    confidence_score: int, location_id: str, change_seq: Optional[int] = None
+) -> str:
+    data: dict[str, Any] = {"c": confidence_score, "i": location_id}
+    if change_seq is not None:
+        data["s"] = change_seq
+    payload = json.dumps(data)
     return base64.urlsafe_b64encode(payload.encode()).decode()
 
 
-def _decode_cursor(cursor: Optional[str]) -> tuple[Optional[int], Optional[str]]:
+def _decode_cursor(
+    cursor: Optional[str],
+) -> tuple[Optional[int], Optional[str], Optional[int]]:
+    """Decode a page cursor into (confidence, location id, change_seq).
+
+    Cursors issued before change sequences existed carry no "s" key.
+    """
     if not cursor:
-        return None, None
+        return None, None, None
     try:
         payload = json.loads(base64.urlsafe_b64decode(cursor))
-        return payload["c"], payload["i"]
+        return payload["c"], payload["i"], payload.get("s")
     except Exception as e:
         raise ValueError(f"Malformed pagination cursor: {e}") from e
 
 
+@dataclass(frozen=True)
+class BeaconSyncSnapshot:
+    """ETag and qualified-location count for one sync filter.
+
+    change_seq is the summed beacon_sync_state.change_seq when the snapshot
+    was taken (init-scripts/20-beacon-sync-state.sql); it only moves when a
+    commit touches a table feeding the sync output, so a snapshot stays
+    valid for as long as change_seq is unchanged. It is None on databases
+    without beacon_sync_state, where snapshots are never cached.
+    """
+
+    change_seq: Optional[int]
+    etag: str
+    total: int
+
+
+class _SnapshotCache:
+    """Bounded LRU of sync snapshots keyed by (filter, change_seq)."""
+
+    def __init__(self, max_entries: int = 512):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple, BeaconSyncSnapshot] = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[BeaconSyncSnapshot]:
+        snapshot = self._entries.get(key)
+        if snapshot is not None:
+            self._entries.move_to_end(key)
+        return snapshot
+
+    def put(self, key: tuple, snapshot: BeaconSyncSnapshot) -> None:
+        self._entries[key] = snapshot
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Process-wide: each API worker / Lambda container keeps its own snapshots.
+_SNAPSHOTS = _SnapshotCache()
+
+# Set once beacon_sync_state has been seen, so later polls skip the probe.
+_SYNC_STATE_PRESENT = False
+
+
 # Minimum quality: has coordinates, not rejected, has address,
 # AND is the canonical row (Tier-3 dedupe soft-deletes duplicates by
 # flipping `is_canonical` to FALSE — those rows must never appear in
@@ -73,13 +132,17 @@ class BeaconSyncService:
         cursor: Optional[str] = None,
         updated_since: Optional[datetime] = None,
         state_filter: Optional[str] = None,
+        snapshot: Optional[BeaconSyncSnapshot] = None,
     ) -> dict[str, Any]:
         log = logger.bind(page_size=page_size, state_filter=state_filter)
         log.info("beacon_sync_request")
 
-        cursor_conf, cursor_id = _decode_cursor(cursor)
-        etag = await self._compute_etag(updated_since, state_filter)
-        total = await self._count_qualified(updated_since, state_filter)
+        cursor_conf, cursor_id, _ = _decode_cursor(cursor)
+        if snapshot is None:
+            snapshot = await self.snapshot(
+                cursor=cursor, updated_since=updated_since, state_filter=state_filter
+            )
+        total = snapshot.total
 
         rows = await self._query_locations(
             page_size=page_size,
@@ -90,7 +153,7 @@ class BeaconSyncService:
         )
 
         if not rows:
-            return self._build_response([], total, etag, page_size)
+            return self._build_response([], snapshot, page_size)
 
         location_ids = [r.id for r in rows]
         org_ids = [r.organization_id for r in rows if r.organization_id]
@@ -114,7 +177,68 @@ class BeaconSyncService:
                 )
 
         log.info("beacon_sync_complete", returned=len(locations), total=total)
-        return self._build_response(locations, total, etag, page_size)
+        return self._build_response(locations, snapshot, page_size)
+
+    async def snapshot(
+        self,
+        cursor: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+        state_filter: Optional[str] = None,
+    ) -> BeaconSyncSnapshot:
+        """Return the ETag and total for a filter, recomputing only on change.
+
+        A cursor issued by an earlier page resumes from that page's
+        snapshot when it is still cached, so paging through one sync run
+        doesn't re-read change_seq. Otherwise this costs one read of
+        beacon_sync_state, plus the ETag and count aggregates only when
+        nothing is cached for the current change_seq. Databases that
+        predate beacon_sync_state compute both on every call.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        _, _, cursor_seq = _decode_cursor(cursor)
+        filter_key = (
+            self._min_confidence,
+            state_filter,
+            updated_since.isoformat() if updated_since else None,
+        )
+        if cursor_seq is not None:
+            cached = _SNAPSHOTS.get((filter_key, cursor_seq))
+            if cached is not None:
+                return cached
+
+        change_seq = await self._current_change_seq()
+        if change_seq is not None:
+            cached = _SNAPSHOTS.get((filter_key, change_seq))
+            if cached is not None:
+                logger.debug("beacon_sync_snapshot_hit", change_seq=change_seq)
+                return cached
+
+        snapshot = BeaconSyncSnapshot(
+            change_seq=change_seq,
+            etag=await self._compute_etag(updated_since, state_filter),
+            total=await self._count_qualified(updated_since, state_filter),
+        )
+        if change_seq is not None:
+            _SNAPSHOTS.put((filter_key, change_seq), snapshot)
+        logger.debug("beacon_sync_snapshot_computed", change_seq=change_seq)
+        return snapshot
+
+    async def _current_change_seq(self) -> Optional[int]:
+        """Sum of the beacon_sync_state counter slots, or None without it."""
+        global _SYNC_STATE_PRESENT
+        if not _SYNC_STATE_PRESENT:
+            result = await self._session.execute(
+                text("SELECT to_regclass('public.beacon_sync_state')")
+            )
+            if result.scalar() is None:
+                return None
+            _SYNC_STATE_PRESENT = True
+        result = await self._session.execute(
+            text("SELECT COALESCE(SUM(change_seq), 0) FROM beacon_sync_state")
+        )
+        return int(result.scalar_one())
 
     async def _compute_etag(
         self,
@@ -439,24 +563,24 @@ class BeaconSyncService:
     def _build_response(
         self,
         locations: list[BeaconLocation],
-        total: int,
-        etag: str,
+        snapshot: BeaconSyncSnapshot,
         page_size: int,
     ) -> dict[str, Any]:
         has_more = len(locations) == page_size
         cursor = None
         if has_more and locations:
             last = locations[-1]
-            cursor = _encode_cursor(last.confidence_score, last.id)
+            cursor = _encode_cursor(last.confidence_score, last.id, snapshot.change_seq)
 
         return {
             "meta": {
-                "total_available": total,
+                "total_available": snapshot.total,
                 "returned": len(locations),
                 "cursor": cursor,
                 "has_more": has_more,
                 "generated_at": datetime.now(UTC),
-                "etag": etag,
+                "etag": snapshot.etag,
+                "change_seq": snapshot.change_seq,
                 "data_version": "1.0",
             },
             "locations": locations,
@@ -478,6 +602,11 @@ class BeaconRedirectService:
     which only the API can read. This service returns the survivor side so
     beacon can publish a 301 to the CloudFront redirect KeyValueStore.
 
+    Reads the path-compressed ``location_redirect`` table
+    (init-scripts/21-location-redirect.sql), so each page is one keyset
+    query. Databases that predate it fall back to walking the
+    ``dedup_run_audit`` soft-delete chain in Python.
+
     Read-only. Tolerates a missing ``dedup_run_audit`` table (created lazily by
     the dedup scripts) by returning an empty result.
     """
@@ -493,6 +622,11 @@ class BeaconRedirectService:
         log = logger.bind(page_size=page_size)
         log.info("beacon_redirects_request")
 
+        if await self._redirect_table_exists():
+            redirects, next_cursor = await self._page_redirect_table(page_size, cursor)
+            log.info("beacon_redirects_complete", returned=len(redirects))
+            return self._build_response(redirects, page_size, cursor=next_cursor)
+
         if not await self._audit_table_exists():
             log.info("beacon_redirects_no_audit_table")
             return self._build_response([], page_size)
@@ -529,6 +663,58 @@ class BeaconRedirectService:
         log.info("beacon_redirects_complete", returned=len(redirects))
         return self._build_response(redirects, page_size, cursor=next_cursor)
 
+    async def _redirect_table_exists(self) -> bool:
+        result = await self._session.execute(
+            text("SELECT to_regclass('public.location_redirect')")
+        )
+        return result.scalar() is not None
+
+    async def _page_redirect_table(
+        self, page_size: int, cursor: Optional[str]
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """One keyset page of location_redirect rows whose compressed
+        canonical_id is still a live canonical location."""
+        result = await self._session.execute(
+            text(
+                """
+                SELECT r.old_id, l.id, l.name,
+                       a.city, a.state_province, a.postal_code
+                FROM location_redirect r
+                JOIN location l
+                  ON l.id = r.canonical_id AND l.is_canonical = TRUE
+                LEFT JOIN LATERAL (
+                    SELECT city, state_province, postal_code
+                    FROM address
+                    WHERE location_id = l.id AND address_type = 'physical'
+                    ORDER BY id
+                    LIMIT 1
+                ) a ON TRUE
+                WHERE r.old_id > :cursor
+                ORDER BY r.old_id
+                LIMIT :limit
+                """
+            ),
+            {"cursor": cursor or "", "limit": page_size + 1},
+        )
+        rows = result.fetchall()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        redirects: list[dict[str, Any]] = [
+            {
+                "dead_id": str(r.old_id),
+                "survivor": {
+                    "id": str(r.id),
+                    "name": r.name,
+                    "city": r.city,
+                    "state": r.state_province,
+                    "postal_code": r.postal_code,
+                },
+            }
+            for r in rows
+        ]
+        next_cursor = redirects[-1]["dead_id"] if (has_more and redirects) else None
+        return redirects, next_cursor
+
     async def _audit_table_exists(self) -> bool:
         result = await self._session.execute(
             text("SELECT to_regclass('public.dedup_run_audit')")
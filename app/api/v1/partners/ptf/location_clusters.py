@@ -0,0 +1,207 @@
+"""Maintenance of the precomputed PTF /locations dedup clusters.
+
+The list query joins `ptf_location_cluster` instead of running the tiered
+connected-components walk on every request (see the comment above
+`_LIST_SQL` in locations_queries.py). This module writes those rows with
+the same candidate filter and tier rule, via `_CLUSTER_INSERT_SQL`:
+
+  * `refresh_location_clusters` recomputes only the components that can
+    contain the given locations. The reconciler calls it for the
+    locations each job commits.
+  * `rebuild_location_clusters` recomputes every cluster
+    (scripts/rebuild_ptf_location_clusters.py).
+
+Both take a sync `Session` (the reconciler and scripts are sync) and leave
+the commit to the caller. Locks are transaction-scoped advisory locks: a
+refresh locks the grid cells its region covers (after computing the
+region, so the expansion runs unlocked), so workers refreshing overlapping
+regions take turns while the rest run in parallel. A rebuild takes the
+global lock exclusively; refreshes hold it shared.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, cast
+
+from sqlalchemy import text
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm import Session
+
+from app.api.v1.partners.ptf.locations_queries import (
+    _ADDR_SIM_THRESHOLD,
+    _CLUSTER_INSERT_SQL,
+    _DEDUP_LOOSE_DEG,
+    _DEDUP_TIGHT_DEG,
+    _FANO_ALLOWLIST_TUPLE,
+    _NAME_SIM_THRESHOLD,
+    _bind_allowlist,
+)
+
+_LOCK_SQL = "SELECT pg_advisory_xact_lock(hashtext('ptf_location_cluster'))"
+_SHARED_LOCK_SQL = (
+    "SELECT pg_advisory_xact_lock_shared(hashtext('ptf_location_cluster'))"
+)
+
+# Side of the grid cells a refresh locks (~5km). Overlapping regions share
+# a location and so a cell; distinct regions in one cell merely take turns.
+_LOCK_CELL_DEG = 0.05
+
+# One exclusive lock per cell covered by the region, taken in key order so
+# two refreshes can't deadlock on each other's cells.
+_REGION_LOCK_SQL = """
+SELECT pg_advisory_xact_lock(hashtext('ptf_location_cluster_cell'), cell)
+FROM (
+    SELECT DISTINCT hashtext(
+        floor(CAST(latitude AS float8) / :cell_deg) || ':'
+        || floor(CAST(longitude AS float8) / :cell_deg)
+    ) AS cell
+    FROM location
+    WHERE id = ANY(:ids)
+      AND latitude IS NOT NULL
+      AND longitude IS NOT NULL
+    ORDER BY cell
+) cells
+"""
+
+# Rows that can be PTF candidates (`_CANDIDATES_CTES`): canonical, geocoded,
+# not rejected and with contact info or a schedule. The name check is left
+# out, so this is a superset of the candidates, which only ever makes the
+# region bigger.
+_HOP_CANDIDATE_SQL = """(
+    __T__.is_canonical = TRUE
+    AND (__T__.validation_status != 'rejected' OR __T__.validation_status IS NULL)
+    AND NOT (__T__.latitude = 0 AND __T__.longitude = 0)
+    AND (
+        EXISTS (
+            SELECT 1 FROM phone
+            WHERE location_id = __T__.id
+              AND number IS NOT NULL AND number != ''
+        )
+        OR EXISTS (
+            SELECT 1 FROM organization o
+            WHERE o.id = __T__.organization_id
+              AND (
+                  (o.email IS NOT NULL AND o.email != '')
+                  OR (o.website IS NOT NULL AND o.website != '')
+              )
+        )
+        OR EXISTS (SELECT 1 FROM schedule s WHERE s.location_id = __T__.id)
+    )
+)"""
+
+# Every location that can share a component with the seeds: the seeds, the
+# members of their current clusters (a seed that moved away or stopped
+# qualifying may have been the only link holding those together), and then
+# every candidate reachable from a candidate through hops of at most the
+# loose-tier distance. Tier edges only join candidates and never span more
+# than that distance, so the components found within the region are
+# exactly the global ones. Non-candidates are never hopped through: their
+# stale rows are covered by the seeding, and they link nothing. Each hop is
+# an ST_DWithin against the `idx_location_coords` expression.
+_REGION_SQL = """
+WITH RECURSIVE seeds AS (
+    SELECT CAST(seed.id AS text) AS id
+    FROM unnest(CAST(:location_ids AS text[])) AS seed(id)
+    UNION
+    SELECT CAST(member.location_id AS text)
+    FROM ptf_location_cluster own
+    JOIN ptf_location_cluster member ON member.cluster_id = own.cluster_id
+    WHERE own.location_id = ANY(:location_ids)
+),
+region(id) AS (
+    SELECT id FROM seeds
+    UNION
+    SELECT CAST(n.id AS text)
+    FROM region r
+    JOIN location l ON l.id = r.id AND __FROM_CANDIDATE__
+    JOIN location n
+      ON ST_DWithin(
+             st_setsrid(
+                 st_makepoint(
+                     CAST(n.longitude AS float8), CAST(n.latitude AS float8)
+                 ),
+                 4326
+             ),
+             st_setsrid(
+                 st_makepoint(
+                     CAST(l.longitude AS float8), CAST(l.latitude AS float8)
+                 ),
+                 4326
+             ),
+             :dedup_loose_deg
+         )
+     AND __TO_CANDIDATE__
+)
+SELECT id FROM region
+""".replace(
+    "__FROM_CANDIDATE__", _HOP_CANDIDATE_SQL.replace("__T__", "l")
+).replace(
+    "__TO_CANDIDATE__", _HOP_CANDIDATE_SQL.replace("__T__", "n")
+)
+
+_SCOPE_CLAUSE = "AND l.id = ANY(:scope_ids)"
+
+
+def _cluster_params() -> dict[str, Any]:
+    return {
+        "allowlist": _FANO_ALLOWLIST_TUPLE,
+        "dedup_tight_deg": _DEDUP_TIGHT_DEG,
+        "dedup_loose_deg": _DEDUP_LOOSE_DEG,
+        "name_sim_threshold": _NAME_SIM_THRESHOLD,
+        "addr_sim_threshold": _ADDR_SIM_THRESHOLD,
+    }
+
+
+def refresh_location_clusters(db: Session, location_ids: Iterable[Any]) -> int:
+    """Recompute the clusters around `location_ids`.
+
+    Rows for region members that are no longer candidates (soft-deleted,
+    rejected, lost their contact info) are dropped; the rest are rewritten.
+
+    Returns:
+        Number of cluster rows written
+    """
+    ids = sorted({str(location_id) for location_id in location_ids})
+    if not ids:
+        return 0
+
+    region = [
+        row[0]
+        for row in db.execute(
+            text(_REGION_SQL),
+            {"location_ids": ids, "dedup_loose_deg": _DEDUP_LOOSE_DEG},
+        )
+    ]
+    db.execute(text(_SHARED_LOCK_SQL))
+    db.execute(text(_REGION_LOCK_SQL), {"ids": region, "cell_deg": _LOCK_CELL_DEG})
+    db.execute(
+        text("DELETE FROM ptf_location_cluster WHERE location_id = ANY(:ids)"),
+        {"ids": region},
+    )
+    sql = _CLUSTER_INSERT_SQL.format(bbox="", qfilter="", scope=_SCOPE_CLAUSE)
+    result = cast(
+        CursorResult,
+        db.execute(
+            _bind_allowlist(text(sql)), {**_cluster_params(), "scope_ids": region}
+        ),
+    )
+    return result.rowcount or 0
+
+
+def rebuild_location_clusters(db: Session) -> int:
+    """Recompute every cluster from scratch.
+
+    Uses DELETE rather than TRUNCATE so feed requests keep reading the
+    previous clusters until the caller commits.
+
+    Returns:
+        Number of cluster rows written
+    """
+    db.execute(text(_LOCK_SQL))
+    db.execute(text("DELETE FROM ptf_location_cluster"))
+    sql = _CLUSTER_INSERT_SQL.format(bbox="", qfilter="", scope="")
+    result = cast(
+        CursorResult, db.execute(_bind_allowlist(text(sql)), _cluster_params())
+    )
+    return result.rowcount or 0
@@ -86,17 +86,29 @@ def clamp_offset(value: int) -> int:
 # recursive-CTE connected-components walk (`edges` → `edges_both` →
 # `reachable` → `components`) assigns each candidate a `component_id`.
 # Self-loops in `edges_both` ensure every candidate (including
-# singletons) ends up in the result. Survivor per component is picked by
+# singletons) ends up in the result.
+#
+# The components walk no longer runs per request: `_CLUSTER_INSERT_SQL`
+# writes each candidate's `component_id` into `ptf_location_cluster`
+# (init-scripts/22-ptf-location-cluster.sql) ahead of time — see
+# `location_clusters.py` for the incremental refresh and full rebuild.
+# `_LIST_SQL` only joins the precomputed `cluster_id`. Candidates with no
+# row yet (written since the last refresh) are served as singletons.
+# Survivor per cluster is picked by
 # `has_qualifying_source DESC, confidence_score DESC NULLS LAST, id ASC`
 # so the FANO enrichment block is never silently stripped when a non-FANO
-# sibling exists.
+# sibling exists. Because the serve-time filters (bbox, q) apply to
+# candidates before that pick, the survivor is always a row that matches
+# the request.
 #
-# The CTE is inlined into both _LIST_SQL and _DETAIL_SQL rather than
-# string-concatenated so bandit's B608 (hardcoded_sql_expressions) heuristic
-# stays clean. Allowlist values are bound via SQLAlchemy `expanding=True`
-# (see `_bind_allowlist`); no scraper IDs are interpolated into SQL text.
-_LIST_SQL = """
-WITH RECURSIVE qualifying_source AS (
+# The CTEs are kept as string constants and spliced with `str.replace`
+# sentinels (the `{bbox}` / `{qfilter}` / `{scope}` slots are filled with
+# fixed clause text) rather than concatenated with user input, so bandit's
+# B608 (hardcoded_sql_expressions) heuristic stays clean. Allowlist values
+# are bound via SQLAlchemy `expanding=True` (see `_bind_allowlist`); no
+# scraper IDs are interpolated into SQL text.
+_CANDIDATES_CTES = """
+qualifying_source AS (
     SELECT location_id,
            BOOL_OR(true) AS has_qualifying_source
     FROM location_source
@@ -207,10 +219,14 @@ candidates AS (
       )
       {bbox}
       {qfilter}
+      {scope}
     ORDER BY l.id,
              fa.fa_org_id NULLS LAST,
              p.id NULLS LAST
-),
+)
+"""
+
+_COMPONENTS_CTES = """
 -- Loose pre-cluster: spatial-index-aware DBSCAN groups candidates
 -- within the loose-tier ceiling. ST_ClusterDBSCAN is a window function
 -- that internally walks the GIST index on `idx_location_coords` (when
@@ -285,7 +301,11 @@ components AS (
     FROM reachable
     GROUP BY node
 )
-SELECT DISTINCT ON (comp.component_id)
+"""
+
+_LIST_SQL = """
+WITH __CANDIDATES__
+SELECT DISTINCT ON (COALESCE(pc.cluster_id, c.id))
     c.id,
     c.name,
     c.short_name,
@@ -308,13 +328,30 @@ SELECT DISTINCT ON (comp.component_id)
     c.has_qualifying_source,
     c.zip_matched_fa
 FROM candidates c
-JOIN components comp ON comp.node = c.id
-ORDER BY comp.component_id,
+LEFT JOIN ptf_location_cluster pc ON pc.location_id = c.id
+ORDER BY COALESCE(pc.cluster_id, c.id),
          c.has_qualifying_source DESC,
          c.confidence_score DESC NULLS LAST,
          c.id
 LIMIT :limit OFFSET :offset
-"""
+""".replace(
+    "__CANDIDATES__", _CANDIDATES_CTES
+)
+
+# Components for every candidate in `{scope}` (empty for a full rebuild),
+# written straight into ptf_location_cluster. `cluster_id` is the smallest
+# member id, so an unchanged component keeps its id across refreshes.
+_CLUSTER_INSERT_SQL = """
+WITH RECURSIVE __CANDIDATES__,
+__COMPONENTS__
+INSERT INTO ptf_location_cluster (location_id, cluster_id)
+SELECT node, component_id
+FROM components
+""".replace(
+    "__CANDIDATES__", _CANDIDATES_CTES
+).replace(
+    "__COMPONENTS__", _COMPONENTS_CTES
+)
 
 _DETAIL_SQL = """
 WITH qualifying_source AS (
@@ -426,10 +463,6 @@ class PtfLocationsQuery:
             "limit": clamp_limit(limit),
             "offset": clamp_offset(offset),
             "allowlist": _FANO_ALLOWLIST_TUPLE,
-            "dedup_tight_deg": _DEDUP_TIGHT_DEG,
-            "dedup_loose_deg": _DEDUP_LOOSE_DEG,
-            "name_sim_threshold": _NAME_SIM_THRESHOLD,
-            "addr_sim_threshold": _ADDR_SIM_THRESHOLD,
         }
         bbox_clause = ""
         if bbox is not None:
@@ -461,7 +494,7 @@ class PtfLocationsQuery:
             )
             params["q"] = pattern
 
-        sql = _LIST_SQL.format(bbox=bbox_clause, qfilter=q_clause)
+        sql = _LIST_SQL.format(bbox=bbox_clause, qfilter=q_clause, scope="")
         result = await self._session.execute(_bind_allowlist(text(sql)), params)
         return result.fetchall()
 
@@ -187,9 +187,9 @@ async def list_ptf_locations(
         returned=len(items),
         dropped=dropped,
         fa_matched=fa_matched,
-        # Near-duplicate canonicals are collapsed at query time via a
-        # tiered connected-components walk (tight ~50m always-merge,
-        # loose ~200m gated by name/address similarity). See
+        # Near-duplicate canonicals are collapsed at query time via the
+        # precomputed tiered clusters in ptf_location_cluster (tight ~50m
+        # always-merge, loose ~200m gated by name/address similarity). See
         # `_LIST_SQL` in locations_queries.py.
         dedup_active=True,
     )
@@ -78,6 +78,13 @@ class Settings(BaseSettings):
         default=2592000, ge=0
     )  # 30 days default TTL for job results and failures
 
+    # API Response Cache Settings (app/middleware/response_cache.py)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    RESPONSE_CACHE_TTL_SECONDS: int = Field(default=300, ge=1)
+    RESPONSE_CACHE_MAX_BYTES: int = Field(default=64_000_000, ge=0)
+    RESPONSE_CACHE_MAX_BODY_BYTES: int = Field(default=2_000_000, ge=0)
+
     # Logging Settings
     LOG_LEVEL: str = "INFO"
     JSON_LOGS: bool = True
@@ -182,6 +189,11 @@ class Settings(BaseSettings):
     )
     ENRICHMENT_TIMEOUT: int = _SHARED["ENRICHMENT_TIMEOUT"]
     ENRICHMENT_CACHE_TTL: int = _SHARED["ENRICHMENT_CACHE_TTL"]
+    ENRICHMENT_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="Number of geocoding lookups resolved in parallel per job",
+    )
 
     # Provider-specific configuration
     ENRICHMENT_PROVIDER_CONFIG: Dict[str, Dict[str, Any]] = Field(
@@ -239,6 +251,19 @@ class Settings(BaseSettings):
     SUBMARINE_COOLDOWN_ERROR_DAYS: int = Field(
         default=_SHARED["SUBMARINE_COOLDOWN_ERROR_DAYS"], ge=0
     )
+    # Keep one browser alive across jobs (isolated session per job) and crawl up
+    # to SUBMARINE_CRAWL_CONCURRENCY different domains at once. Off: a fresh
+    # Chromium per job, one job at a time (the RQ forking worker needs this).
+    SUBMARINE_BROWSER_POOL: bool = False
+    SUBMARINE_CRAWL_CONCURRENCY: int = Field(default=1, ge=1, le=16)
+    # Where per-domain crawl politeness state lives (app/submarine/rate_limiter.py).
+    # "redis" shares it across jobs and workers; "memory" is per process.
+    SUBMARINE_RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"
+    SUBMARINE_RATE_LIMIT_MAX_BACKOFF: int = Field(default=600, ge=1)
+    SUBMARINE_RATE_LIMIT_MAX_WAIT: int = Field(default=120, ge=0)
+    # SQLite file remembering each site's last crawl (validators, content hash)
+    # so unchanged sites skip the browser and the LLM. Unset: no cache.
+    SUBMARINE_CRAWL_CACHE_PATH: str | None = None
 
     # Federation Settings (HSDS federation core)
     FEDERATION_ENABLED: bool = True
@@ -262,6 +287,13 @@ class Settings(BaseSettings):
     FEDERATION_INGEST_MAX_RECORDS_PER_PEER_PER_DAY: int = Field(default=50_000, ge=1)
     FEDERATION_INGEST_MAX_LLM_JOBS_PER_PEER_PER_DAY: int = Field(default=50_000, ge=1)
     FEDERATION_EXPORT_PAGE_SIZE: int = Field(default=1000, ge=1, le=10_000)
+    # How the reconciler publishes committed locations: "inline" appends the
+    # Updates at the end of each job; "outbox" only enqueues federation_outbox
+    # rows and leaves signing/appending to the publisher loop
+    # (`python -m app.federation publish-outbox`), which must then be running.
+    FEDERATION_PUBLISH_MODE: Literal["inline", "outbox"] = "inline"
+    FEDERATION_OUTBOX_BATCH_SIZE: int = Field(default=500, ge=1)
+    FEDERATION_OUTBOX_POLL_SECONDS: float = Field(default=5.0, gt=0)
     # Discovery document (.well-known/hsds-federation) — §8.4 / §6.7.
     # HSDS versions advertised. Set-membership, NOT exact-match (§8.4): a peer
     # accepts us if any advertised version is mutually supported. Default
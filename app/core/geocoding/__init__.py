@@ -8,12 +8,14 @@ This package provides centralized geocoding functionality including:
 """
 
 # Import main components for easy access
+from app.core.geocoding.batch import BatchGeocoder, BatchProvider, TokenBucket
 from app.core.geocoding.cache_backend import (
     GeocodingCacheBackend,
     get_geocoding_cache_backend,
     make_geocoding_cache_key,
     make_reverse_geocoding_cache_key,
 )
+from app.core.geocoding.hedging import HedgedGeocoder, LatencyHistogram
 from app.core.geocoding.service import (
     GeocodingService,
     get_geocoding_service,
@@ -26,10 +28,15 @@ from app.core.geocoding.constants import US_BOUNDS, STATE_BOUNDS
 __all__ = [
     "STATE_BOUNDS",
     "US_BOUNDS",
+    "BatchGeocoder",
+    "BatchProvider",
     "GeocodingCacheBackend",
     "GeocodingCorrector",
     "GeocodingService",
     "GeocodingValidator",
+    "HedgedGeocoder",
+    "LatencyHistogram",
+    "TokenBucket",
     "_geocoding_service",
     "get_geocoding_cache_backend",
     "get_geocoding_service",
@@ -0,0 +1,220 @@
+"""Concurrent batch geocoding with per-provider token-bucket rate limiting.
+
+The single-address ``GeocodingService.geocode`` path paces each provider with
+blocking sleeps, so geocoding a batch serially is bounded by the slowest
+provider's delay. ``BatchGeocoder`` instead runs lookups on a thread pool and
+gates every provider call through a token bucket sized from that provider's
+configured rate limit. A worker takes a token from the first provider (in
+preference order) that has one available, so overflow from the primary
+provider spills onto the fallbacks and batch throughput approaches the sum of
+the configured provider rates.
+"""
+
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+Coordinates = Tuple[float, float]
+
+# Default per-provider pacing, expressed as minimum seconds between requests
+# to match the existing GEOCODING_RATE_LIMIT / NOMINATIM_RATE_LIMIT settings.
+PROVIDER_RATE_LIMIT_ENV = {
+    "arcgis": ("GEOCODING_RATE_LIMIT", "0.5"),
+    "nominatim": ("NOMINATIM_RATE_LIMIT", "1.1"),
+    "census": ("CENSUS_RATE_LIMIT", "0.2"),
+    "amazon-location": ("AMAZON_LOCATION_RATE_LIMIT", "0.02"),
+}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_batch_address(address: Optional[str]) -> str:
+    """Normalize an address for in-batch deduplication.
+
+    Args:
+        address: Raw address string
+
+    Returns:
+        Lowercased address with collapsed whitespace, or "" for empty input
+    """
+    if not address:
+        return ""
+    return _WHITESPACE_RE.sub(" ", address).strip().lower()
+
+
+def provider_rate_per_second(provider: str) -> float:
+    """Return the configured request rate for a provider.
+
+    Args:
+        provider: Provider name ('arcgis', 'nominatim', 'census',
+            'amazon-location')
+
+    Returns:
+        Allowed requests per second derived from the provider's minimum delay
+    """
+    env_var, default = PROVIDER_RATE_LIMIT_ENV.get(provider, ("", "1.0"))
+    min_delay = float(os.getenv(env_var, default)) if env_var else float(default)
+    if min_delay <= 0:
+        return float("inf")
+    return 1.0 / min_delay
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take one token if available.
+
+        Returns:
+            0.0 when a token was taken, otherwise the seconds until one will
+            be available
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it."""
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                return
+            time.sleep(wait)
+
+
+@dataclass(frozen=True)
+class BatchProvider:
+    """A geocoding provider usable by ``BatchGeocoder``.
+
+    Attributes:
+        name: Provider name, also used as the cache namespace
+        geocode: Callable returning (lat, lon) or None for an address
+        rate: Allowed requests per second
+        burst: Token bucket capacity
+    """
+
+    name: str
+    geocode: Callable[[str], Optional[Coordinates]]
+    rate: float
+    burst: float = 1.0
+
+
+class BatchGeocoder:
+    """Geocode many addresses concurrently across rate-limited providers."""
+
+    def __init__(
+        self,
+        providers: Sequence[BatchProvider],
+        max_workers: int = 4,
+        buckets: Optional[dict[str, TokenBucket]] = None,
+    ) -> None:
+        """Create a batch geocoder.
+
+        Args:
+            providers: Providers in preference order
+            max_workers: Number of concurrent lookups
+            buckets: Optional pre-existing token buckets keyed by provider
+                name, so pacing carries over between batches
+        """
+        self.providers = list(providers)
+        self.max_workers = max(1, max_workers)
+        self.buckets = buckets if buckets is not None else {}
+        for provider in self.providers:
+            if provider.name not in self.buckets:
+                self.buckets[provider.name] = TokenBucket(provider.rate, provider.burst)
+
+    def _acquire_any(self, candidates: list[BatchProvider]) -> BatchProvider:
+        """Block until one of the candidate providers has a token.
+
+        Providers earlier in the list win whenever they have capacity.
+        """
+        while True:
+            waits = []
+            for provider in candidates:
+                wait = self.buckets[provider.name].try_acquire()
+                if wait == 0.0:
+                    return provider
+                waits.append(wait)
+            time.sleep(min(waits))
+
+    def geocode_one(self, address: str) -> Tuple[Optional[Coordinates], Optional[str]]:
+        """Geocode one address, falling back across providers.
+
+        Args:
+            address: Address string to geocode
+
+        Returns:
+            Tuple of (coordinates or None, name of the provider that answered)
+        """
+        remaining = list(self.providers)
+        while remaining:
+            provider = self._acquire_any(remaining)
+            remaining.remove(provider)
+            try:
+                result = provider.geocode(address)
+            except Exception as e:
+                logger.warning(
+                    "Batch geocoding provider error",
+                    provider=provider.name,
+                    address=address[:50],
+                    error=str(e),
+                )
+                result = None
+            if result:
+                return result, provider.name
+        return None, None
+
+    def geocode_many(
+        self, addresses: Sequence[str]
+    ) -> dict[str, Tuple[Optional[Coordinates], Optional[str]]]:
+        """Geocode distinct addresses concurrently.
+
+        Args:
+            addresses: Distinct address strings
+
+        Returns:
+            Mapping of address to (coordinates or None, provider name)
+        """
+        if not addresses:
+            return {}
+        if not self.providers:
+            return {address: (None, None) for address in addresses}
+
+        workers = min(self.max_workers, len(addresses))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="batch-geocode"
+        ) as executor:
+            results = executor.map(self.geocode_one, addresses)
+            return dict(zip(addresses, results, strict=False))
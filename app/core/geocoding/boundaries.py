@@ -0,0 +1,237 @@
+"""Offline point-in-polygon state lookup.
+
+State bounding boxes in ``constants.STATE_BOUNDS`` overlap heavily, so a
+bounds check cannot tell, for example, a Kansas City, KS point from a Kansas
+City, MO one. This module loads simplified state outlines bundled in
+``data/us_state_boundaries.json`` into a grid index and answers
+``state_for_point(lat, lon)`` without any network call.
+
+Index layout:
+- A coarse 1-degree grid maps each cell to the states whose outline bounding
+  box touches it, so a query only considers a handful of states.
+- Each state's edges are bucketed into horizontal latitude bands. A ray-cast
+  for a point only walks the edges in that point's band, which keeps a lookup
+  in the tens of microseconds.
+
+The bundled outlines cover the lower 48 states and DC. States without an
+outline (AK, HI, territories) fall back to their bounding box, and points
+just outside every outline (coastlines lost to simplification) return None so
+callers can fall back to bounds checks.
+"""
+
+import json
+import math
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+from app.core.geocoding.constants import STATE_BOUNDS
+
+DATA_PATH = Path(__file__).parent / "data" / "us_state_boundaries.json"
+
+# Grid resolution in degrees
+CELL_SIZE = 1.0
+BAND_SIZE = 0.25
+
+# Edge: (x1, y1, x2, y2) in (lon, lat) degrees
+Edge = tuple[float, float, float, float]
+
+
+class StateBoundaryIndex:
+    """Grid-indexed state polygons for offline point-in-state lookups."""
+
+    def __init__(self, states: dict[str, list[list[float]]]) -> None:
+        """Build the index.
+
+        Args:
+            states: State code mapped to rings, each a flat
+                [lon, lat, lon, lat, ...] list
+        """
+        self._bboxes: dict[str, tuple[float, float, float, float]] = {}
+        self._bands: dict[str, dict[int, list[Edge]]] = {}
+        self._edges: dict[str, list[Edge]] = {}
+        self._areas: dict[str, float] = {}
+        self._cells: dict[tuple[int, int], list[str]] = defaultdict(list)
+
+        for state, rings in states.items():
+            bands: dict[int, list[Edge]] = defaultdict(list)
+            edges: list[Edge] = []
+            min_x = min_y = math.inf
+            max_x = max_y = -math.inf
+            area = 0.0
+            for ring in rings:
+                xs = ring[0::2]
+                ys = ring[1::2]
+                min_x, max_x = min(min_x, *xs), max(max_x, *xs)
+                min_y, max_y = min(min_y, *ys), max(max_y, *ys)
+                count = len(xs)
+                for i in range(count):
+                    x1, y1 = xs[i], ys[i]
+                    x2, y2 = xs[(i + 1) % count], ys[(i + 1) % count]
+                    area += x1 * y2 - x2 * y1
+                    edges.append((x1, y1, x2, y2))
+                    if y1 == y2:
+                        continue  # horizontal edges never cross a ray
+                    low, high = min(y1, y2), max(y1, y2)
+                    for band in range(
+                        math.floor(low / BAND_SIZE), math.floor(high / BAND_SIZE) + 1
+                    ):
+                        bands[band].append((x1, y1, x2, y2))
+
+            self._bboxes[state] = (min_x, min_y, max_x, max_y)
+            self._bands[state] = dict(bands)
+            self._edges[state] = edges
+            self._areas[state] = abs(area) / 2
+            for cx in range(
+                math.floor(min_x / CELL_SIZE), math.floor(max_x / CELL_SIZE) + 1
+            ):
+                for cy in range(
+                    math.floor(min_y / CELL_SIZE), math.floor(max_y / CELL_SIZE) + 1
+                ):
+                    self._cells[(cx, cy)].append(state)
+
+        # Smallest states first so enclaves (e.g. DC) win over neighbors
+        for cell_states in self._cells.values():
+            cell_states.sort(key=lambda s: self._areas[s])
+        self._states = frozenset(self._bboxes)
+
+    @property
+    def states(self) -> frozenset[str]:
+        """State codes that have an outline in the index."""
+        return self._states
+
+    def contains(self, state: str, lat: float, lon: float) -> bool:
+        """Check whether a point lies inside a state's outline.
+
+        Args:
+            state: Two-letter state code
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            True if inside (even-odd rule across the state's rings)
+        """
+        bbox = self._bboxes.get(state)
+        if bbox is None:
+            return False
+        min_x, min_y, max_x, max_y = bbox
+        if not (min_x <= lon <= max_x and min_y <= lat <= max_y):
+            return False
+
+        inside = False
+        for x1, y1, x2, y2 in self._bands[state].get(math.floor(lat / BAND_SIZE), ()):
+            if (y1 > lat) != (y2 > lat):
+                cross_x = x1 + (lat - y1) * (x2 - x1) / (y2 - y1)
+                if lon < cross_x:
+                    inside = not inside
+        return inside
+
+    def state_for_point(self, lat: float, lon: float) -> Optional[str]:
+        """Find the state whose outline contains a point.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Two-letter state code, or None if no outline contains the point
+        """
+        cell = (math.floor(lon / CELL_SIZE), math.floor(lat / CELL_SIZE))
+        for state in self._cells.get(cell, ()):
+            if self.contains(state, lat, lon):
+                return state
+        return None
+
+    def distance_to_state(self, state: str, lat: float, lon: float) -> float:
+        """Approximate distance in degrees from a point to a state's outline.
+
+        Used to tolerate simplification error along shared borders. Returns
+        0.0 for points inside the outline and ``math.inf`` for unknown states.
+
+        Args:
+            state: Two-letter state code
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Distance in degrees (longitude scaled by cos(latitude))
+        """
+        if state not in self._edges:
+            return math.inf
+        if self.contains(state, lat, lon):
+            return 0.0
+
+        scale = math.cos(math.radians(lat))
+        best = math.inf
+        for x1, y1, x2, y2 in self._edges[state]:
+            ax, ay = (x1 - lon) * scale, y1 - lat
+            bx, by = (x2 - lon) * scale, y2 - lat
+            dx, dy = bx - ax, by - ay
+            length_sq = dx * dx + dy * dy
+            t = 0.0
+            if length_sq:
+                t = max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+            px, py = ax + t * dx, ay + t * dy
+            best = min(best, px * px + py * py)
+        return math.sqrt(best)
+
+
+def resolve_state_for_point(
+    index: StateBoundaryIndex, lat: float, lon: float
+) -> Optional[str]:
+    """Find the state for a point, using bounding boxes for unindexed states.
+
+    Args:
+        index: Loaded state boundary index
+        lat: Latitude
+        lon: Longitude
+
+    Returns:
+        Two-letter state code or None
+    """
+    state = index.state_for_point(lat, lon)
+    if state:
+        return state
+    for code, bounds in STATE_BOUNDS.items():
+        if code in index.states:
+            continue
+        if (
+            bounds["min_lat"] <= lat <= bounds["max_lat"]
+            and bounds["min_lon"] <= lon <= bounds["max_lon"]
+        ):
+            return code
+    return None
+
+
+_index: Optional[StateBoundaryIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_state_boundary_index() -> StateBoundaryIndex:
+    """Get or build the singleton state boundary index.
+
+    Returns:
+        StateBoundaryIndex loaded from the bundled dataset
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                with open(DATA_PATH) as f:
+                    data = json.load(f)
+                _index = StateBoundaryIndex(data["states"])
+    return _index
+
+
+def state_for_point(lat: float, lon: float) -> Optional[str]:
+    """Look up the US state containing a coordinate, with no network call.
+
+    Args:
+        lat: Latitude
+        lon: Longitude
+
+    Returns:
+        Two-letter state code or None
+    """
+    return resolve_state_for_point(get_state_boundary_index(), lat, lon)
@@ -3,17 +3,31 @@
 Provides a pluggable cache backend following Principle XV (Dual Environment
 Compatibility). A factory selects the appropriate implementation based on
 environment: GEOCODING_CACHE_TABLE -> DynamoDB, REDIS_URL -> Redis, else None.
+
+Backends support single-key ``get``/``set`` plus ``get_many``/``set_many`` so
+batch callers can resolve all their cache hits in one round trip. A result of
+``{"negative": True}`` marks an address that no provider could geocode.
 """
 
 import hashlib
 import json
 import os
-from typing import Any, Optional, Protocol, runtime_checkable
+from typing import Any, Iterable, Optional, Protocol, runtime_checkable
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Cached value recorded for addresses that no provider could geocode
+NEGATIVE_CACHE_VALUE = {"negative": True}
+
+
+def is_negative_cache_value(data: Optional[dict]) -> bool:
+    """Return True when a cached value records a failed geocoding lookup."""
+    if not data:
+        return False
+    return bool(data.get("negative"))
+
 
 @runtime_checkable
 class GeocodingCacheBackend(Protocol):
@@ -41,6 +55,26 @@ class GeocodingCacheBackend(Protocol):
         """
         ...
 
+    def get_many(self, cache_keys: Iterable[str]) -> dict[str, dict]:
+        """Retrieve several cached results in one round trip.
+
+        Args:
+            cache_keys: Cache keys to look up
+
+        Returns:
+            Dict of cache key to cached value, containing only the hits
+        """
+        ...
+
+    def set_many(self, items: dict[str, dict], ttl: int) -> None:
+        """Store several results in one round trip.
+
+        Args:
+            items: Dict of cache key to value
+            ttl: Time-to-live in seconds
+        """
+        ...
+
 
 class RedisGeocodingCache:
     """Redis-backed geocoding cache."""
@@ -85,6 +119,49 @@ class RedisGeocodingCache:
                 error=str(e),
             )
 
+    def get_many(self, cache_keys: Iterable[str]) -> dict[str, dict]:
+        keys = list(dict.fromkeys(cache_keys))
+        if not keys:
+            return {}
+        try:
+            raw_values = self._redis.mget(keys)
+        except Exception as e:
+            logger.error(
+                "Geocoding cache infrastructure error on get_many",
+                keys=len(keys),
+                error=str(e),
+            )
+            return {}
+
+        results: dict[str, dict] = {}
+        for cache_key, raw in zip(keys, raw_values, strict=False):
+            if not raw:
+                continue
+            try:
+                results[cache_key] = json.loads(raw)
+            except json.JSONDecodeError as e:
+                logger.warning(
+                    "Geocoding cache data corruption on get_many",
+                    cache_key=cache_key,
+                    error=str(e),
+                )
+        return results
+
+    def set_many(self, items: dict[str, dict], ttl: int) -> None:
+        if not items:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for cache_key, data in items.items():
+                pipe.setex(cache_key, ttl, json.dumps(data))
+            pipe.execute()
+        except Exception as e:
+            logger.error(
+                "Geocoding cache infrastructure error on set_many",
+                keys=len(items),
+                error=str(e),
+            )
+
 
 def make_geocoding_cache_key(provider: str, address: str) -> str:
     """Generate a canonical cache key for a forward geocoding request.
@@ -2,16 +2,23 @@
 
 Uses the DynamoDB table provisioned by DatabaseStack._create_geocoding_cache_table
 with schema: PK=address, latitude, longitude, provider, cached_at, ttl.
+Multi-key reads and writes use BatchGetItem / BatchWriteItem.
 """
 
 import json
 import time
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# DynamoDB per-request limits
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+# Attempts at resubmitting UnprocessedKeys / UnprocessedItems
+BATCH_MAX_ATTEMPTS = 3
+
 
 class DynamoDBGeocodingCache:
     """DynamoDB-backed geocoding cache.
@@ -45,6 +52,62 @@ class DynamoDBGeocodingCache:
             self._client = boto3.client("dynamodb", **kwargs)
         return self._client
 
+    def _item_to_result(self, cache_key: str, item: dict) -> Optional[dict]:
+        """Convert a DynamoDB item into a cached value, honoring TTL."""
+        # Check TTL (DynamoDB TTL cleanup is eventually consistent)
+        ttl_val = item.get("ttl", {}).get("N")
+        if ttl_val and int(ttl_val) < int(time.time()):
+            return None
+
+        result: dict = {}
+        if "latitude" in item:
+            result["lat"] = float(item["latitude"]["N"])
+        if "longitude" in item:
+            result["lon"] = float(item["longitude"]["N"])
+
+        # Include any extra data stored as JSON
+        if "data" in item:
+            try:
+                extra = json.loads(item["data"]["S"])
+                result.update(extra)
+            except json.JSONDecodeError as e:
+                logger.warning(
+                    "DynamoDB geocoding cache data corruption",
+                    cache_key=cache_key,
+                    error=str(e),
+                )
+
+        if ("lat" in result and "lon" in result) or result.get("negative"):
+            return result
+        return None
+
+    def _build_item(self, cache_key: str, data: dict, ttl: int, now: int) -> dict:
+        """Build a DynamoDB item for a cached value."""
+        # Extract provider from cache key if present
+        provider = ""
+        parts = cache_key.split(":")
+        if len(parts) >= 2:
+            provider = parts[1]
+
+        item: dict = {
+            "address": {"S": cache_key},
+            "ttl": {"N": str(now + ttl)},
+            "cached_at": {"N": str(now)},
+        }
+
+        if "lat" in data:
+            item["latitude"] = {"N": str(data["lat"])}
+        if "lon" in data:
+            item["longitude"] = {"N": str(data["lon"])}
+        if provider:
+            item["provider"] = {"S": provider}
+
+        # Store any extra keys beyond lat/lon as JSON blob
+        extra = {k: v for k, v in data.items() if k not in ("lat", "lon")}
+        if extra:
+            item["data"] = {"S": json.dumps(extra)}
+        return item
+
     def get(self, cache_key: str) -> Optional[dict]:
         """Retrieve a cached geocoding result from DynamoDB.
 
@@ -63,33 +126,7 @@ class DynamoDBGeocodingCache:
             item = response.get("Item")
             if not item:
                 return None
-
-            # Check TTL (DynamoDB TTL cleanup is eventually consistent)
-            ttl_val = item.get("ttl", {}).get("N")
-            if ttl_val and int(ttl_val) < int(time.time()):
-                return None
-
-            result: dict = {}
-            if "latitude" in item:
-                result["lat"] = float(item["latitude"]["N"])
-            if "longitude" in item:
-                result["lon"] = float(item["longitude"]["N"])
-
-            # Include any extra data stored as JSON
-            if "data" in item:
-                try:
-                    extra = json.loads(item["data"]["S"])
-                    result.update(extra)
-                except json.JSONDecodeError as e:
-                    logger.warning(
-                        "DynamoDB geocoding cache data corruption",
-                        cache_key=cache_key,
-                        error=str(e),
-                    )
-
-            if "lat" in result and "lon" in result:
-                return result
-            return None
+            return self._item_to_result(cache_key, item)
 
         except json.JSONDecodeError as e:
             logger.warning(
@@ -116,33 +153,7 @@ class DynamoDBGeocodingCache:
         """
         try:
             client = self._get_client()
-            now = int(time.time())
-            ttl_timestamp = now + ttl
-
-            # Extract provider from cache key if present
-            provider = ""
-            parts = cache_key.split(":")
-            if len(parts) >= 2:
-                provider = parts[1]
-
-            item: dict = {
-                "address": {"S": cache_key},
-                "ttl": {"N": str(ttl_timestamp)},
-                "cached_at": {"N": str(now)},
-            }
-
-            if "lat" in data:
-                item["latitude"] = {"N": str(data["lat"])}
-            if "lon" in data:
-                item["longitude"] = {"N": str(data["lon"])}
-            if provider:
-                item["provider"] = {"S": provider}
-
-            # Store any extra keys beyond lat/lon as JSON blob
-            extra = {k: v for k, v in data.items() if k not in ("lat", "lon")}
-            if extra:
-                item["data"] = {"S": json.dumps(extra)}
-
+            item = self._build_item(cache_key, data, ttl, int(time.time()))
             client.put_item(TableName=self._table_name, Item=item)
 
         except json.JSONDecodeError as e:
@@ -157,3 +168,79 @@ class DynamoDBGeocodingCache:
                 cache_key=cache_key,
                 error=str(e),
             )
+
+    def get_many(self, cache_keys: Iterable[str]) -> dict[str, dict]:
+        """Retrieve several cached results with BatchGetItem.
+
+        Args:
+            cache_keys: Cache keys (partition key ``address``)
+
+        Returns:
+            Dict of cache key to cached value, containing only the hits
+        """
+        keys = list(dict.fromkeys(cache_keys))
+        results: dict[str, dict] = {}
+        if not keys:
+            return results
+
+        try:
+            client = self._get_client()
+            for start in range(0, len(keys), BATCH_GET_LIMIT):
+                request: dict = {
+                    self._table_name: {
+                        "Keys": [
+                            {"address": {"S": key}}
+                            for key in keys[start : start + BATCH_GET_LIMIT]
+                        ]
+                    }
+                }
+                for _ in range(BATCH_MAX_ATTEMPTS):
+                    response = client.batch_get_item(RequestItems=request)
+                    for item in response.get("Responses", {}).get(self._table_name, []):
+                        cache_key = item["address"]["S"]
+                        result = self._item_to_result(cache_key, item)
+                        if result is not None:
+                            results[cache_key] = result
+                    request = response.get("UnprocessedKeys") or {}
+                    if not request:
+                        break
+        except Exception as e:
+            logger.error(
+                "DynamoDB geocoding cache infrastructure error on get_many",
+                keys=len(keys),
+                error=str(e),
+            )
+        return results
+
+    def set_many(self, items: dict[str, dict], ttl: int) -> None:
+        """Store several results with BatchWriteItem.
+
+        Args:
+            items: Dict of cache key to value
+            ttl: Time-to-live in seconds (converted to Unix timestamp)
+        """
+        if not items:
+            return
+
+        try:
+            client = self._get_client()
+            now = int(time.time())
+            requests = [
+                {"PutRequest": {"Item": self._build_item(key, data, ttl, now)}}
+                for key, data in items.items()
+            ]
+            for start in range(0, len(requests), BATCH_WRITE_LIMIT):
+                request: dict = {
+                    self._table_name: requests[start : start + BATCH_WRITE_LIMIT]
+                }
+                for _ in range(BATCH_MAX_ATTEMPTS):
+                    response = client.batch_write_item(RequestItems=request)
+                    request = response.get("UnprocessedItems") or {}
+                    if not request:
+                        break
+        except Exception as e:
+            logger.error(
+                "DynamoDB geocoding cache infrastructure error on set_many",
+                keys=len(items),
+                error=str(e),
+            )
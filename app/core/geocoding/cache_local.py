@@ -0,0 +1,138 @@
+"""In-process LRU tier for the geocoding cache.
+
+Sits in front of the shared Redis or DynamoDB backend so addresses a worker
+resolved recently are answered without a network round trip. Entries expire
+after ``min(ttl, local_ttl)`` seconds (``negative_ttl`` caps negative results
+read back from the backend); the shared backend stays the source of truth
+across workers.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Iterable, Optional
+
+import structlog
+
+from app.core.geocoding.cache_backend import (
+    GeocodingCacheBackend,
+    is_negative_cache_value,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class TieredGeocodingCache:
+    """Bounded in-process LRU with TTL in front of a shared cache backend.
+
+    Args:
+        backend: Shared cache backend (Redis or DynamoDB)
+        max_size: Maximum number of entries held in process
+        local_ttl: Upper bound in seconds on how long an entry stays local
+        negative_ttl: Upper bound for negative results promoted from the backend
+        clock: Time source (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        backend: GeocodingCacheBackend,
+        max_size: int = 10000,
+        local_ttl: int = 3600,
+        negative_ttl: int = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.backend = backend
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_local(self, cache_key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= self._clock():
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return data
+
+    def _set_local(self, cache_key: str, data: dict, ttl: int) -> None:
+        expires_at = self._clock() + min(ttl, self.local_ttl)
+        with self._lock:
+            self._entries[cache_key] = (expires_at, data)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _promoted_ttl(self, data: dict) -> int:
+        # The backend does not report the remaining TTL, so a negative result
+        # must not outlive the negative-cache window once it is held locally.
+        if is_negative_cache_value(data):
+            return min(self.local_ttl, self.negative_ttl)
+        return self.local_ttl
+
+    def get(self, cache_key: str) -> Optional[dict]:
+        data = self._get_local(cache_key)
+        if data is not None:
+            return data
+        data = self.backend.get(cache_key)
+        if data:
+            self._set_local(cache_key, data, self._promoted_ttl(data))
+        return data
+
+    def set(self, cache_key: str, data: dict, ttl: int) -> None:
+        self._set_local(cache_key, data, ttl)
+        self.backend.set(cache_key, data, ttl)
+
+    def get_many(self, cache_keys: Iterable[str]) -> dict[str, dict]:
+        results: dict[str, dict] = {}
+        misses = []
+        for cache_key in dict.fromkeys(cache_keys):
+            data = self._get_local(cache_key)
+            if data is not None:
+                results[cache_key] = data
+            else:
+                misses.append(cache_key)
+
+        if misses:
+            for cache_key, data in self.backend.get_many(misses).items():
+                self._set_local(cache_key, data, self._promoted_ttl(data))
+                results[cache_key] = data
+        return results
+
+    def set_many(self, items: dict[str, dict], ttl: int) -> None:
+        for cache_key, data in items.items():
+            self._set_local(cache_key, data, ttl)
+        self.backend.set_many(items, ttl)
+
+
+def with_local_tier(
+    backend: Optional[GeocodingCacheBackend],
+) -> Optional[GeocodingCacheBackend]:
+    """Wrap a shared backend with the in-process LRU tier.
+
+    Controlled by GEOCODING_LOCAL_CACHE_SIZE (0 disables the tier),
+    GEOCODING_LOCAL_CACHE_TTL and GEOCODING_NEGATIVE_CACHE_TTL.
+
+    Args:
+        backend: Shared backend, or None when caching is disabled
+
+    Returns:
+        TieredGeocodingCache, or the backend unchanged when the tier is off
+    """
+    max_size = int(os.getenv("GEOCODING_LOCAL_CACHE_SIZE", "10000"))
+    if backend is None or max_size <= 0:
+        return backend
+    local_ttl = int(os.getenv("GEOCODING_LOCAL_CACHE_TTL", "3600"))
+    negative_ttl = int(os.getenv("GEOCODING_NEGATIVE_CACHE_TTL", "3600"))
+    logger.info("Geocoding cache: in-process LRU tier", max_size=max_size)
+    return TieredGeocodingCache(
+        backend, max_size=max_size, local_ttl=local_ttl, negative_ttl=negative_ttl
+    )
@@ -0,0 +1,259 @@
+"""Hedged multi-provider geocoding.
+
+``GeocodingService.geocode`` normally tries providers strictly in order, so a
+slow or failing primary costs its full timeout before the fallback is even
+started. ``HedgedGeocoder`` starts the primary provider and, if it has not
+produced a valid answer within that provider's latency budget, fires the next
+provider in parallel and takes whichever valid result arrives first.
+
+The budget for each provider is the configured quantile (p95 by default) of
+its observed latencies, tracked in a ``LatencyHistogram``. Until a provider
+has enough samples, a fixed initial budget is used. Because only requests
+slower than the provider's p95 are hedged, the extra provider calls are
+bounded to roughly ``1 - quantile`` of requests for a healthy primary.
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+Coordinates = Tuple[float, float]
+
+# Latency bucket upper bounds in seconds (roughly log-spaced).
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.15,
+    0.25,
+    0.35,
+    0.5,
+    0.75,
+    1.0,
+    1.5,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket latency histogram."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # One extra slot for observations above the largest bucket
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """Number of recorded observations."""
+        return self._total
+
+    def record(self, seconds: float) -> None:
+        """Record one latency observation.
+
+        Args:
+            seconds: Observed latency in seconds
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a latency quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Upper bound of the bucket containing the quantile, or None when
+            nothing has been recorded
+        """
+        with self._lock:
+            if self._total == 0:
+                return None
+            target = q * self._total
+            cumulative = 0
+            index = len(self.buckets)
+            for slot, count in enumerate(self._counts):
+                cumulative += count
+                if cumulative >= target:
+                    index = slot
+                    break
+        if index >= len(self.buckets):
+            return self.buckets[-1]
+        return self.buckets[index]
+
+
+class HedgedGeocoder:
+    """Race geocoding providers, hedging to the next one after a delay."""
+
+    def __init__(
+        self,
+        providers: Sequence[Tuple[str, Callable[[str], Optional[Coordinates]]]],
+        validate: Optional[Callable[[Coordinates], bool]] = None,
+        initial_delay: float = 1.0,
+        quantile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 10.0,
+        min_samples: int = 20,
+        timeout: Optional[float] = None,
+        histograms: Optional[dict[str, LatencyHistogram]] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        pacers: Optional[dict[str, Callable[[], None]]] = None,
+    ) -> None:
+        """Create a hedged geocoder.
+
+        Args:
+            providers: (name, geocode function) pairs in preference order
+            validate: Predicate deciding whether a result is acceptable
+            initial_delay: Hedge delay used until a provider has min_samples
+            quantile: Latency quantile used as the hedge delay
+            min_delay: Lower clamp for the hedge delay
+            max_delay: Upper clamp for the hedge delay
+            min_samples: Observations required before adapting the delay
+            timeout: Overall deadline for one lookup, in seconds
+            histograms: Optional shared per-provider histograms
+            executor: Optional shared thread pool for provider calls
+            pacers: Optional per-provider rate-limit waits, run before the
+                call is timed so pacing delay is not recorded as latency
+        """
+        self.providers = list(providers)
+        self.validate = validate
+        self.initial_delay = initial_delay
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.timeout = timeout
+        self.histograms = histograms if histograms is not None else {}
+        for name, _ in self.providers:
+            self.histograms.setdefault(name, LatencyHistogram())
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max(2, 2 * len(self.providers)),
+            thread_name_prefix="hedged-geocode",
+        )
+        self.pacers = pacers if pacers is not None else {}
+        self.calls = 0
+        self.hedges = 0
+        self._counter_lock = threading.Lock()
+
+    def hedge_delay(self, provider: str) -> float:
+        """Return how long to wait on a provider before hedging.
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            Delay in seconds
+        """
+        histogram = self.histograms[provider]
+        delay = None
+        if histogram.count >= self.min_samples:
+            delay = histogram.quantile(self.quantile)
+        if delay is None:
+            delay = self.initial_delay
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def _timed_call(
+        self,
+        name: str,
+        geocode_fn: Callable[[str], Optional[Coordinates]],
+        address: str,
+    ) -> Optional[Coordinates]:
+        pace = self.pacers.get(name)
+        if pace is not None:
+            pace()
+        start = time.monotonic()
+        try:
+            return geocode_fn(address)
+        except Exception as e:
+            logger.warning(
+                "Hedged geocoding provider error",
+                provider=name,
+                address=address[:50],
+                error=str(e),
+            )
+            return None
+        finally:
+            self.histograms[name].record(time.monotonic() - start)
+
+    def _is_valid(self, result: Optional[Coordinates]) -> bool:
+        if not result:
+            return False
+        if self.validate is None:
+            return True
+        try:
+            return bool(self.validate(result))
+        except Exception:
+            return False
+
+    def geocode(self, address: str) -> Tuple[Optional[Coordinates], Optional[str]]:
+        """Geocode an address, hedging across providers.
+
+        Args:
+            address: Address string to geocode
+
+        Returns:
+            Tuple of (coordinates or None, name of the provider that answered)
+        """
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        queue = list(self.providers)
+        in_flight: dict[Future, str] = {}
+
+        def launch_next() -> None:
+            name, geocode_fn = queue.pop(0)
+            with self._counter_lock:
+                self.calls += 1
+            future = self._executor.submit(self._timed_call, name, geocode_fn, address)
+            in_flight[future] = name
+
+        launch_next()
+        while in_flight:
+            # Wait on the most recently launched provider's budget
+            newest = next(reversed(in_flight.values()))
+            wait_for = self.hedge_delay(newest) if queue else None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+
+            done, _ = wait(
+                list(in_flight), timeout=wait_for, return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                name = in_flight.pop(future)
+                result = future.result()
+                if self._is_valid(result):
+                    return result, name
+
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            if queue and (not done or not in_flight):
+                # Budget expired, or every in-flight provider came back empty
+                if in_flight:
+                    with self._counter_lock:
+                        self.hedges += 1
+                    logger.debug(
+                        "Hedging geocode request",
+                        waiting_on=list(in_flight.values()),
+                        next_provider=queue[0][0],
+                    )
+                launch_next()
+
+        return None, None
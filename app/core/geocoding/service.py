@@ -2,26 +2,39 @@
 
 This module provides a centralized geocoding service that:
 - Supports multiple geocoding providers (ArcGIS, Nominatim)
-- Implements caching to reduce API calls
+- Implements two-tier caching (in-process LRU + shared backend) to reduce
+  API calls, including short-lived negative results
 - Enforces rate limiting to respect API quotas
 - Provides fallback mechanisms for reliability
+- Geocodes batches concurrently across token-bucket rate-limited providers
+- Optionally hedges slow providers by racing the next fallback
 - Maintains backward compatibility with existing scrapers
 """
 
 import os
 import random
 import re
-import time
 from typing import Optional, Tuple
 
 import structlog
 
+from app.core.geocoding.batch import (
+    BatchGeocoder,
+    BatchProvider,
+    TokenBucket,
+    normalize_batch_address,
+    provider_rate_per_second,
+)
 from app.core.geocoding.cache_backend import (
+    NEGATIVE_CACHE_VALUE,
     GeocodingCacheBackend,
     get_geocoding_cache_backend,
+    is_negative_cache_value,
     make_geocoding_cache_key,
     make_reverse_geocoding_cache_key,
 )
+from app.core.geocoding.cache_local import with_local_tier
+from app.core.geocoding.hedging import HedgedGeocoder, LatencyHistogram
 from app.core.geocoding.providers import (
     geocode_with_amazon_location,
     geocode_with_arcgis,
@@ -36,6 +49,14 @@ from app.core.state_mapping import normalize_state_to_code
 
 logger = structlog.get_logger(__name__)
 
+# Provider fallback order used when GEOCODING_ENABLE_FALLBACK is on, matching
+# the sequence geocode() walks for each primary provider.
+_FALLBACK_ORDER = {
+    "amazon-location": ["arcgis", "nominatim"],
+    "arcgis": ["nominatim"],
+    "nominatim": ["arcgis"],
+}
+
 
 class GeocodingService:
     """Unified geocoding service with caching and rate limiting."""
@@ -50,12 +71,36 @@ class GeocodingService:
 
         # Caching configuration
         self.cache_ttl = int(os.getenv("GEOCODING_CACHE_TTL", "2592000"))  # 30 days
-        self._cache: Optional[GeocodingCacheBackend] = get_geocoding_cache_backend()
+        self.negative_cache_ttl = int(
+            os.getenv("GEOCODING_NEGATIVE_CACHE_TTL", "3600")
+        )  # 1 hour
+        self._cache: Optional[GeocodingCacheBackend] = with_local_tier(
+            get_geocoding_cache_backend()
+        )
 
         # Rate limiting configuration
         self.max_retries = int(os.getenv("GEOCODING_MAX_RETRIES", "3"))
         self.timeout = int(os.getenv("GEOCODING_TIMEOUT", "10"))
 
+        # Batch geocoding configuration
+        self.batch_concurrency = int(os.getenv("GEOCODING_BATCH_CONCURRENCY", "4"))
+        self.batch_providers = [
+            p.strip().lower()
+            for p in os.getenv("GEOCODING_BATCH_PROVIDERS", "").split(",")
+            if p.strip()
+        ]
+        self._batch_buckets: dict[str, TokenBucket] = {}
+
+        # Hedged fallback configuration
+        self.hedge_enabled = (
+            os.getenv("GEOCODING_HEDGE_ENABLED", "false").lower() == "true"
+        )
+        self.hedge_delay = float(os.getenv("GEOCODING_HEDGE_DELAY", "1.0"))
+        self.hedge_quantile = float(os.getenv("GEOCODING_HEDGE_QUANTILE", "0.95"))
+        self._latency_histograms: dict[str, LatencyHistogram] = {}
+        self._hedger: Optional[HedgedGeocoder] = None
+        self._validator = None
+
         # Initialize geocoders via provider module
         (
             self.arcgis,
@@ -91,6 +136,22 @@ class GeocodingService:
             self.amazon_location_client, self.amazon_location_index, lat, lon
         )
 
+    def _get_cached_entry(self, address: str, provider: str) -> Optional[dict]:
+        """Get the raw cached value for an address, including negative results.
+
+        Args:
+            address: Address string to geocode
+            provider: Geocoding provider name
+
+        Returns:
+            Cached dict or None if not cached
+        """
+        if not self._cache:
+            return None
+
+        cache_key = make_geocoding_cache_key(provider, address)
+        return self._cache.get(cache_key)
+
     def _get_cached_result(
         self, address: str, provider: str
     ) -> Optional[Tuple[float, float]]:
@@ -103,16 +164,28 @@ class GeocodingService:
         Returns:
             Tuple of (latitude, longitude) or None if not cached
         """
-        if not self._cache:
-            return None
-
-        cache_key = make_geocoding_cache_key(provider, address)
-        result = self._cache.get(cache_key)
+        result = self._get_cached_entry(address, provider)
         if result and "lat" in result and "lon" in result:
             logger.debug("Cache hit for address", address=address[:50])
             return (result["lat"], result["lon"])
         return None
 
+    def _cache_negative_result(self, address: str, provider: str) -> None:
+        """Remember that an address could not be geocoded.
+
+        Stored with GEOCODING_NEGATIVE_CACHE_TTL so repeated lookups of a bad
+        address skip the providers for a short while.
+
+        Args:
+            address: Address string that failed to geocode
+            provider: Primary provider the lookup was keyed on
+        """
+        if not self._cache:
+            return
+
+        cache_key = make_geocoding_cache_key(provider, address)
+        self._cache.set(cache_key, dict(NEGATIVE_CACHE_VALUE), self.negative_cache_ttl)
+
     def _cache_result(
         self,
         address: str,
@@ -172,9 +245,16 @@ class GeocodingService:
         provider = force_provider or self.primary_provider
 
         # Check cache first
-        cached_result = self._get_cached_result(address, provider)
-        if cached_result:
-            return cached_result
+        cached = self._get_cached_entry(address, provider)
+        if is_negative_cache_value(cached):
+            logger.debug("Negative cache hit for address", address=address[:50])
+            return None
+        if cached and "lat" in cached and "lon" in cached:
+            logger.debug("Cache hit for address", address=address[:50])
+            return (cached["lat"], cached["lon"])
+
+        if self.hedge_enabled and self.enable_fallback and not force_provider:
+            return self._geocode_hedged(address)
 
         # Try primary provider
         result = None
@@ -204,14 +284,14 @@ class GeocodingService:
                 if result:
                     self._cache_result(address, "arcgis", result[0], result[1])
                     return result
-                time.sleep(1)
+                self._provider_bucket("nominatim").acquire()
                 result = self._geocode_with_nominatim(address)
                 if result:
                     self._cache_result(address, "nominatim", result[0], result[1])
                     return result
             elif provider == "arcgis" and self.nominatim_geocode:
                 # Add extra delay before fallback to be respectful
-                time.sleep(1)
+                self._provider_bucket("nominatim").acquire()
                 result = self._geocode_with_nominatim(address)
                 if result:
                     self._cache_result(address, "nominatim", result[0], result[1])
@@ -223,6 +303,8 @@ class GeocodingService:
                     return result
 
         logger.warning("Failed to geocode address", address=address[:100])
+        if not force_provider:
+            self._cache_negative_result(address, provider)
         return None
 
     def reverse_geocode(
@@ -350,25 +432,215 @@ class GeocodingService:
 
         return None
 
+    def _provider_bucket(self, provider: str) -> TokenBucket:
+        """Get the shared token bucket pacing a provider.
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            TokenBucket shared by single and batch geocoding
+        """
+        bucket = self._batch_buckets.get(provider)
+        if bucket is None:
+            bucket = self._batch_buckets.setdefault(
+                provider, TokenBucket(provider_rate_per_second(provider))
+            )
+        return bucket
+
+    def _provider_functions(self) -> dict:
+        """Map provider names to geocode callables for configured providers.
+
+        Returns:
+            Dict of provider name to callable, or None when not configured
+        """
+        return {
+            "amazon-location": (
+                self._geocode_with_amazon_location
+                if self.amazon_location_client
+                else None
+            ),
+            "arcgis": self._geocode_with_arcgis if self.arcgis_geocode else None,
+            "nominatim": (
+                self._geocode_with_nominatim if self.nominatim_geocode else None
+            ),
+            "census": self._geocode_with_census,
+        }
+
+    def _provider_chain(self) -> list[str]:
+        """Return the primary provider followed by its fallbacks."""
+        names = [self.primary_provider]
+        if self.enable_fallback:
+            names += _FALLBACK_ORDER.get(self.primary_provider, [])
+        return names
+
+    def _get_batch_providers(self) -> list[BatchProvider]:
+        """Build the provider list used for batch geocoding.
+
+        Uses GEOCODING_BATCH_PROVIDERS when set, otherwise the primary provider
+        followed by its fallbacks. Providers that are not configured are skipped.
+
+        Returns:
+            Providers in preference order
+        """
+        names = self.batch_providers or self._provider_chain()
+        available = self._provider_functions()
+
+        providers = []
+        for name in dict.fromkeys(names):
+            geocode_fn = available.get(name)
+            if geocode_fn is None:
+                continue
+            providers.append(
+                BatchProvider(
+                    name=name,
+                    geocode=geocode_fn,
+                    rate=provider_rate_per_second(name),
+                )
+            )
+        return providers
+
+    def _is_plausible_result(self, result: Tuple[float, float]) -> bool:
+        """Check a provider result with GeocodingValidator."""
+        if self._validator is None:
+            from app.core.geocoding.validator import GeocodingValidator
+
+            self._validator = GeocodingValidator()
+        lat, lon = result
+        return (
+            self._validator.is_valid_coordinates(lat, lon)
+            and self._validator.is_within_us_bounds(lat, lon)
+            and not self._validator.detect_test_data(lat, lon)
+        )
+
+    def _get_hedger(self) -> HedgedGeocoder:
+        """Get or create the hedged geocoder for the provider chain."""
+        if self._hedger is None:
+            available = self._provider_functions()
+            providers = []
+            pacers = {}
+            for name in dict.fromkeys(self._provider_chain()):
+                geocode_fn = available.get(name)
+                if geocode_fn is None:
+                    continue
+                providers.append((name, geocode_fn))
+                pacers[name] = self._provider_bucket(name).acquire
+
+            self._hedger = HedgedGeocoder(
+                providers,
+                pacers=pacers,
+                validate=self._is_plausible_result,
+                initial_delay=self.hedge_delay,
+                quantile=self.hedge_quantile,
+                max_delay=float(self.timeout),
+                timeout=float(self.timeout * max(1, len(providers))),
+                histograms=self._latency_histograms,
+            )
+        return self._hedger
+
+    def _geocode_hedged(self, address: str) -> Optional[Tuple[float, float]]:
+        """Geocode by racing the provider chain with adaptive hedge delays.
+
+        Args:
+            address: Address string to geocode
+
+        Returns:
+            Tuple of (latitude, longitude) or None if geocoding fails
+        """
+        result, provider_name = self._get_hedger().geocode(address)
+        if result and provider_name:
+            self._cache_result(address, provider_name, result[0], result[1])
+            return result
+
+        logger.warning("Failed to geocode address", address=address[:100])
+        self._cache_negative_result(address, self.primary_provider)
+        return None
+
     def batch_geocode(
-        self, addresses: list[str]
+        self, addresses: list[str], max_workers: Optional[int] = None
     ) -> list[Optional[Tuple[float, float]]]:
-        """Geocode multiple addresses.
+        """Geocode multiple addresses concurrently.
+
+        Identical addresses (after whitespace/case normalization) are looked
+        up once. Cache hits are resolved first with a single multi-get; the
+        remaining addresses are spread across the configured providers, each
+        paced by its own token bucket, and written back with one multi-set.
 
         Args:
             addresses: List of address strings
+            max_workers: Concurrent lookups (defaults to
+                GEOCODING_BATCH_CONCURRENCY)
 
         Returns:
-            List of coordinate tuples or None for failed geocoding
+            List of coordinate tuples or None for failed geocoding, in input
+            order
         """
-        results = []
-        for address in addresses:
-            result = self.geocode(address)
-            results.append(result)
-            # Small delay between batch requests to be respectful
-            if result:
-                time.sleep(0.1)
-        return results
+        providers = self._get_batch_providers()
+        keys = [normalize_batch_address(address) for address in addresses]
+
+        unique: dict[str, str] = {}
+        for key, address in zip(keys, addresses, strict=False):
+            if key and key not in unique:
+                unique[key] = address
+
+        # Resolve every cache hit (any provider) in one round trip
+        cached: dict[str, dict] = {}
+        if self._cache and unique:
+            cached = self._cache.get_many(
+                make_geocoding_cache_key(provider.name, address)
+                for address in unique.values()
+                for provider in providers
+            )
+
+        resolved: dict[str, Optional[Tuple[float, float]]] = {}
+        pending: dict[str, str] = {}
+        for key, address in unique.items():
+            for index, provider in enumerate(providers):
+                entry = cached.get(make_geocoding_cache_key(provider.name, address))
+                if index == 0 and is_negative_cache_value(entry):
+                    resolved[key] = None
+                    break
+                if entry and "lat" in entry and "lon" in entry:
+                    resolved[key] = (entry["lat"], entry["lon"])
+                    break
+            else:
+                pending[key] = address
+
+        if pending:
+            geocoder = BatchGeocoder(
+                providers,
+                max_workers=max_workers or self.batch_concurrency,
+                buckets=self._batch_buckets,
+            )
+            lookups = geocoder.geocode_many(list(pending.values()))
+            hits: dict[str, dict] = {}
+            misses: dict[str, dict] = {}
+            for key, address in pending.items():
+                result, provider_name = lookups[address]
+                if result and provider_name:
+                    hits[make_geocoding_cache_key(provider_name, address)] = {
+                        "lat": result[0],
+                        "lon": result[1],
+                    }
+                elif providers:
+                    misses[make_geocoding_cache_key(providers[0].name, address)] = dict(
+                        NEGATIVE_CACHE_VALUE
+                    )
+                resolved[key] = result
+
+            if self._cache:
+                if hits:
+                    self._cache.set_many(hits, self.cache_ttl)
+                if misses:
+                    self._cache.set_many(misses, self.negative_cache_ttl)
+
+        logger.debug(
+            "Batch geocoding complete",
+            total=len(addresses),
+            unique=len(resolved),
+            looked_up=len(pending),
+        )
+        return [resolved.get(key) for key in keys]
 
     def geocode_address(
         self, address: str, county: str | None = None, state: str | None = None
@@ -8,10 +8,18 @@ import logging
 import math
 from typing import Optional, Tuple
 
+from app.core.geocoding.boundaries import (
+    get_state_boundary_index,
+    resolve_state_for_point,
+)
 from app.core.geocoding.constants import US_BOUNDS, STATE_BOUNDS
 
 logger = logging.getLogger(__name__)
 
+# How far (in degrees) a point inside a neighboring state's simplified outline
+# may sit from the claimed state's outline and still count as in-state.
+BORDER_TOLERANCE_DEGREES = 0.05
+
 
 class GeocodingValidator:
     """Validates and corrects geographic coordinates.
@@ -146,12 +154,30 @@ class GeocodingValidator:
     def is_within_state_bounds(
         self, latitude: float, longitude: float, state_code: str
     ) -> bool:
-        """Check if coordinates are within a state's bounds."""
+        """Check if coordinates are within a state.
+
+        Uses the offline state outline index where available: a point inside
+        another state's outline is rejected unless it is within
+        BORDER_TOLERANCE_DEGREES of the claimed state. Points outside every
+        outline (coastlines, water) and states without an outline fall back to
+        the state's bounding box.
+        """
         state_code = state_code.upper()
         if state_code not in self.STATE_BOUNDS:
             logger.warning(f"Unknown state code: {state_code}")
             return False
 
+        index = get_state_boundary_index()
+        if state_code in index.states:
+            owner = index.state_for_point(latitude, longitude)
+            if owner == state_code:
+                return True
+            if owner is not None:
+                return (
+                    index.distance_to_state(state_code, latitude, longitude)
+                    <= BORDER_TOLERANCE_DEGREES
+                )
+
         bounds = self.STATE_BOUNDS[state_code]
         return (
             bounds["min_lat"] <= latitude <= bounds["max_lat"]
@@ -317,12 +343,11 @@ class GeocodingValidator:
             latitude, longitude, state_code
         ):
             # Find which state the coordinates actually fall in
-            for state, bounds in self.STATE_BOUNDS.items():
-                if (
-                    bounds["min_lat"] <= latitude <= bounds["max_lat"]
-                    and bounds["min_lon"] <= longitude <= bounds["max_lon"]
-                ):
-                    return f"Coordinates are in {state}, not {state_code}"
+            state = resolve_state_for_point(
+                get_state_boundary_index(), latitude, longitude
+            )
+            if state:
+                return f"Coordinates are in {state}, not {state_code}"
 
             return f"Coordinates are outside {state_code} bounds"
 
@@ -182,6 +182,26 @@ def get_state_from_city(city_name: Optional[str]) -> Optional[str]:
     return MAJOR_CITIES_TO_STATE.get(city_clean)
 
 
+def get_state_from_coordinates(
+    latitude: Optional[float], longitude: Optional[float]
+) -> Optional[str]:
+    """Get state code from coordinates using the offline state outline index.
+
+    Args:
+        latitude: Latitude
+        longitude: Longitude
+
+    Returns:
+        Two-letter state code or None if the point is not in a known state
+    """
+    if latitude is None or longitude is None:
+        return None
+
+    from app.core.geocoding.boundaries import state_for_point
+
+    return state_for_point(latitude, longitude)
+
+
 def validate_state_zip_match(state_code: str, postal_code: str) -> bool:
     """Check if state code matches ZIP code.
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Migration: add beacon_sync_state and its change-sequence triggers.
+
+/api/v1/partners/beacon/sync ran an ETag aggregate and a total count over
+location + address on every partner poll. This adds beacon_sync_state,
+a set of counter slots whose summed change_seq moves once per committing
+transaction that writes location, address, organization, phone, schedule,
+language, accessibility or location_source, so the API can cache the ETag
+and count per sequence value and answer repeat polls with one small
+aggregate.
+
+Each transaction bumps the slot picked by its backend pid, from a deferred
+constraint trigger, so concurrent reconciler workers neither hold a lock
+for the length of their transaction nor queue behind one shared row.
+
+Re-runnable: the table and seed row are IF NOT EXISTS / ON CONFLICT DO
+NOTHING and the triggers are dropped and recreated, so this is safe on
+environments already initialized from init-scripts/20-beacon-sync-state.sql
+(fresh envs) — this module is for existing databases that predate it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+import asyncpg
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Kept in sync with init-scripts/20-beacon-sync-state.sql (minus BEGIN/COMMIT).
+CREATE_BEACON_SYNC_STATE_SQL = r"""
+    CREATE TABLE IF NOT EXISTS public.beacon_sync_state (
+        slot        SMALLINT PRIMARY KEY,
+        change_seq  BIGINT NOT NULL DEFAULT 0,
+        changed_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+
+    -- BEACON_SYNC_SLOTS = 32; must match the modulus in beacon_sync_bump().
+    INSERT INTO public.beacon_sync_state (slot)
+    SELECT generate_series(0, 31)
+    ON CONFLICT (slot) DO NOTHING;
+
+    CREATE OR REPLACE FUNCTION public.beacon_sync_bump()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF current_setting('beacon_sync.bumped', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+        PERFORM set_config('beacon_sync.bumped', 'on', true);
+        UPDATE public.beacon_sync_state
+        SET change_seq = change_seq + 1,
+            changed_at = now()
+        WHERE slot = pg_backend_pid() % 32;
+        RETURN NULL;
+    END;
+    $$;
+
+    DO $$
+    DECLARE
+        tbl TEXT;
+    BEGIN
+        FOREACH tbl IN ARRAY ARRAY[
+            'location', 'address', 'organization', 'phone', 'schedule',
+            'language', 'accessibility', 'location_source'
+        ] LOOP
+            EXECUTE format(
+                'DROP TRIGGER IF EXISTS beacon_sync_bump ON public.%I', tbl
+            );
+            EXECUTE format(
+                'CREATE CONSTRAINT TRIGGER beacon_sync_bump '
+                'AFTER INSERT OR UPDATE OR DELETE ON public.%I '
+                'DEFERRABLE INITIALLY DEFERRED '
+                'FOR EACH ROW EXECUTE FUNCTION public.beacon_sync_bump()',
+                tbl
+            );
+        END LOOP;
+    END;
+    $$;
+"""
+
+VERIFY_SQL = """
+    SELECT count(*) AS slots, sum(change_seq) AS change_seq
+    FROM public.beacon_sync_state
+"""
+
+
+def _to_asyncpg_dsn(database_url: str) -> str:
+    """Strip SQLAlchemy driver prefix; asyncpg wants a plain libpq URL."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://").replace(
+        "postgresql+psycopg2://", "postgresql://"
+    )
+
+
+async def create_table(database_url: str) -> None:
+    dsn = _to_asyncpg_dsn(database_url)
+    conn = await asyncpg.connect(dsn)
+    try:
+        async with conn.transaction():
+            logger.info("Creating beacon_sync_state and change triggers...")
+            await conn.execute(CREATE_BEACON_SYNC_STATE_SQL)
+        row = await conn.fetchrow(VERIFY_SQL)
+        if row is not None and row["slots"] > 0:
+            logger.info(
+                "Verified: beacon_sync_state slots=%s change_seq=%s",
+                row["slots"],
+                row["change_seq"],
+            )
+        else:
+            logger.error("Verification failed: beacon_sync_state rows missing")
+            raise RuntimeError("beacon_sync_state rows missing after migration")
+    finally:
+        await conn.close()
+
+
+async def _main() -> None:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise SystemExit("DATABASE_URL environment variable not set")
+    await create_table(database_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Migration: create the federation_outbox table.
+
+Locations whose federation Update is deferred to the outbox publisher
+(app/federation/outbox.py). The reconciler inserts one row per committed
+location; the publisher claims rows in id order, coalesces repeats for the
+same location into one log entry and deletes them as it goes. The BIGSERIAL
+id is the drain order only — unlike federation_log.sequence, gaps are fine.
+
+Re-runnable: CREATE ... IF NOT EXISTS makes this safe on environments already
+initialized from init-scripts/24-federation-outbox.sql (fresh envs) — this
+module is for applying the table to existing databases that predate it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+import asyncpg
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Kept in sync with init-scripts/24-federation-outbox.sql (minus BEGIN/COMMIT).
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS public.federation_outbox (
+        id          BIGSERIAL   PRIMARY KEY,
+        location_id TEXT        NOT NULL,
+        reason      TEXT        NOT NULL DEFAULT 'update',
+        enqueued_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    )
+"""
+
+VERIFY_SQL = """
+    SELECT to_regclass('public.federation_outbox') AS tbl
+"""
+
+
+def _to_asyncpg_dsn(database_url: str) -> str:
+    """Strip SQLAlchemy driver prefix; asyncpg wants a plain libpq URL."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://").replace(
+        "postgresql+psycopg2://", "postgresql://"
+    )
+
+
+async def create_table(database_url: str) -> None:
+    dsn = _to_asyncpg_dsn(database_url)
+    conn = await asyncpg.connect(dsn)
+    try:
+        async with conn.transaction():
+            logger.info("Creating federation_outbox table...")
+            await conn.execute(CREATE_TABLE_SQL)
+        row = await conn.fetchrow(VERIFY_SQL)
+        if row and row["tbl"]:
+            logger.info("Verified: %s exists", row["tbl"])
+        else:
+            logger.error("Verification failed: federation_outbox not found")
+            raise RuntimeError("federation_outbox missing after CREATE TABLE returned")
+    finally:
+        await conn.close()
+
+
+async def _main() -> None:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise SystemExit("DATABASE_URL environment variable not set")
+    await create_table(database_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Migration: add service / language facet arrays to location_search.
+
+/api/v1/map/search accepted `services` and `languages` filters but only
+checked that they were non-empty, so clients over-fetched and filtered on
+their side. This adds GIN-indexed `service_tokens` (folded service names)
+and `language_codes` (folded language codes, or names when no code is
+recorded) arrays to each canonical location's location_search row, kept
+current by triggers on service_at_location, service and language, so the
+filters become `&&` / `@>` array predicates.
+
+Requires add_location_search (init-scripts/17-location-search.sql) to have
+been applied first.
+
+Re-runnable: every statement is IF NOT EXISTS / CREATE OR REPLACE and the
+backfill only touches rows whose facets differ, so this is safe on
+environments already initialized from init-scripts/18-location-facets.sql
+(fresh envs) — this module is for applying the columns to existing
+databases that predate them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+import asyncpg
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Kept in sync with init-scripts/18-location-facets.sql (minus BEGIN/COMMIT).
+CREATE_LOCATION_FACETS_SQL = r"""
+    -- Must stay identical to normalize_facet_token() in
+    -- app/api/v1/map/search_service.py.
+    CREATE OR REPLACE FUNCTION public.location_facet_token(value TEXT)
+    RETURNS TEXT
+    LANGUAGE sql
+    IMMUTABLE
+    AS $$
+        SELECT NULLIF(
+            btrim(regexp_replace(lower(COALESCE(value, '')), '[^a-z0-9]+', '_', 'g'), '_'),
+            ''
+        )
+    $$;
+
+    ALTER TABLE public.location_search
+        ADD COLUMN IF NOT EXISTS service_tokens TEXT[] NOT NULL DEFAULT '{}',
+        ADD COLUMN IF NOT EXISTS language_codes TEXT[] NOT NULL DEFAULT '{}';
+
+    CREATE INDEX IF NOT EXISTS location_search_service_tokens_idx
+        ON public.location_search USING gin (service_tokens);
+
+    CREATE INDEX IF NOT EXISTS location_search_language_codes_idx
+        ON public.location_search USING gin (language_codes);
+
+    CREATE OR REPLACE VIEW public.location_facet_source AS
+    SELECT
+        l.id AS location_id,
+        ARRAY(
+            SELECT DISTINCT public.location_facet_token(s.name)
+            FROM public.service_at_location sal
+            JOIN public.service s ON s.id = sal.service_id
+            WHERE sal.location_id = l.id
+              AND public.location_facet_token(s.name) IS NOT NULL
+            ORDER BY 1
+        ) AS service_tokens,
+        ARRAY(
+            SELECT DISTINCT public.location_facet_token(
+                COALESCE(NULLIF(btrim(lg.code), ''), lg.name)
+            )
+            FROM public.language lg
+            WHERE (
+                lg.location_id = l.id
+                OR lg.service_id IN (
+                    SELECT sal.service_id
+                    FROM public.service_at_location sal
+                    WHERE sal.location_id = l.id
+                )
+            )
+              AND public.location_facet_token(
+                COALESCE(NULLIF(btrim(lg.code), ''), lg.name)
+              ) IS NOT NULL
+            ORDER BY 1
+        ) AS language_codes
+    FROM public.location l;
+
+    CREATE OR REPLACE FUNCTION public.refresh_location_facets(p_location_id TEXT)
+    RETURNS void
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF p_location_id IS NULL THEN
+            RETURN;
+        END IF;
+
+        UPDATE public.location_search ls
+        SET service_tokens = src.service_tokens,
+            language_codes = src.language_codes
+        FROM public.location_facet_source src
+        WHERE src.location_id = p_location_id
+          AND ls.location_id = p_location_id
+          AND (ls.service_tokens IS DISTINCT FROM src.service_tokens
+               OR ls.language_codes IS DISTINCT FROM src.language_codes);
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION public.location_facets_search_row_trigger()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        PERFORM public.refresh_location_facets(NEW.location_id);
+        RETURN NULL;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION public.location_facets_sal_trigger()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM public.refresh_location_facets(OLD.location_id);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM public.refresh_location_facets(NEW.location_id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION public.location_facets_service_trigger()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        PERFORM public.refresh_location_facets(sal.location_id)
+        FROM public.service_at_location sal
+        WHERE sal.service_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION public.location_facets_language_trigger()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        lang RECORD;
+    BEGIN
+        FOR lang IN
+            SELECT OLD.location_id AS location_id, OLD.service_id AS service_id
+            WHERE TG_OP IN ('UPDATE', 'DELETE')
+            UNION
+            SELECT NEW.location_id, NEW.service_id
+            WHERE TG_OP IN ('INSERT', 'UPDATE')
+        LOOP
+            PERFORM public.refresh_location_facets(lang.location_id);
+            PERFORM public.refresh_location_facets(sal.location_id)
+            FROM public.service_at_location sal
+            WHERE sal.service_id = lang.service_id;
+        END LOOP;
+        RETURN NULL;
+    END;
+    $$;
+
+    DROP TRIGGER IF EXISTS location_facets_search_row_sync ON public.location_search;
+    CREATE TRIGGER location_facets_search_row_sync
+        AFTER INSERT
+        ON public.location_search
+        FOR EACH ROW EXECUTE FUNCTION public.location_facets_search_row_trigger();
+
+    DROP TRIGGER IF EXISTS location_facets_sal_sync ON public.service_at_location;
+    CREATE TRIGGER location_facets_sal_sync
+        AFTER INSERT OR UPDATE OR DELETE
+        ON public.service_at_location
+        FOR EACH ROW EXECUTE FUNCTION public.location_facets_sal_trigger();
+
+    DROP TRIGGER IF EXISTS location_facets_service_sync ON public.service;
+    CREATE TRIGGER location_facets_service_sync
+        AFTER UPDATE OF name
+        ON public.service
+        FOR EACH ROW EXECUTE FUNCTION public.location_facets_service_trigger();
+
+    DROP TRIGGER IF EXISTS location_facets_language_sync ON public.language;
+    CREATE TRIGGER location_facets_language_sync
+        AFTER INSERT OR UPDATE OR DELETE
+        ON public.language
+        FOR EACH ROW EXECUTE FUNCTION public.location_facets_language_trigger();
+
+    -- Backfill existing location_search rows
+    UPDATE public.location_search ls
+    SET service_tokens = src.service_tokens,
+        language_codes = src.language_codes
+    FROM public.location_facet_source src
+    WHERE src.location_id = ls.location_id
+      AND (ls.service_tokens IS DISTINCT FROM src.service_tokens
+           OR ls.language_codes IS DISTINCT FROM src.language_codes);
+
+    ANALYZE public.location_search;
+"""
+
+VERIFY_SQL = """
+    SELECT COUNT(*) AS columns
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+      AND table_name = 'location_search'
+      AND column_name IN ('service_tokens', 'language_codes')
+"""
+
+
+def _to_asyncpg_dsn(database_url: str) -> str:
+    """Strip SQLAlchemy driver prefix; asyncpg wants a plain libpq URL."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://").replace(
+        "postgresql+psycopg2://", "postgresql://"
+    )
+
+
+async def add_facets(database_url: str) -> None:
+    dsn = _to_asyncpg_dsn(database_url)
+    conn = await asyncpg.connect(dsn)
+    try:
+        async with conn.transaction():
+            logger.info("Adding location_search facet columns, indexes, triggers...")
+            await conn.execute(CREATE_LOCATION_FACETS_SQL)
+        row = await conn.fetchrow(VERIFY_SQL)
+        if row and row["columns"] == 2:
+            logger.info("Verified: location_search facet columns exist")
+        else:
+            logger.error("Verification failed: location_search facet columns missing")
+            raise RuntimeError("facet columns missing after ALTER TABLE returned")
+    finally:
+        await conn.close()
+
+
+async def _main() -> None:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise SystemExit("DATABASE_URL environment variable not set")
+    await add_facets(database_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Migration: add idx_location_geog for /api/v1/map/search radius queries.
+
+Radius searches used a 3959 * acos(...) great-circle expression that no
+index can serve, so every radius search scanned `location`. The search now
+filters with ST_DWithin on the location point cast to geography; this GiST
+index over the same expression lets the radius filter run as an index scan
+(the expression must match _LOCATION_GEOGRAPHY in
+app/api/v1/map/search_service.py exactly).
+
+Uses CREATE INDEX CONCURRENTLY so the build doesn't take a table lock on
+live prod traffic. CONCURRENTLY can't run inside a transaction block, so we
+open a dedicated raw asyncpg connection.
+
+Re-runnable: IF NOT EXISTS makes this safe on environments where the index
+has already been added (e.g. fresh envs initialized from
+init-scripts/19-location-geography-index.sql).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+import asyncpg
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+CREATE_INDEX_SQL = """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_location_geog
+    ON public.location USING gist (
+        CAST(
+            ST_SetSRID(
+                ST_MakePoint(
+                    CAST(longitude AS float8),
+                    CAST(latitude AS float8)
+                ),
+                4326
+            ) AS geography
+        )
+    )
+"""
+
+VERIFY_SQL = """
+    SELECT indexname
+    FROM pg_indexes
+    WHERE schemaname = 'public'
+      AND tablename = 'location'
+      AND indexname = 'idx_location_geog'
+"""
+
+
+def _to_asyncpg_dsn(database_url: str) -> str:
+    """Strip SQLAlchemy driver prefix; asyncpg wants a plain libpq URL."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://").replace(
+        "postgresql+psycopg2://", "postgresql://"
+    )
+
+
+async def create_index(database_url: str) -> None:
+    dsn = _to_asyncpg_dsn(database_url)
+    conn = await asyncpg.connect(dsn)
+    try:
+        logger.info("Creating idx_location_geog (CONCURRENTLY)...")
+        await conn.execute(CREATE_INDEX_SQL)
+        await conn.execute("ANALYZE public.location")
+        row = await conn.fetchrow(VERIFY_SQL)
+        if row:
+            logger.info("Verified: %s exists", row["indexname"])
+        else:
+            logger.error("Verification failed: idx_location_geog not found")
+            raise RuntimeError("index missing after CREATE INDEX returned success")
+    finally:
+        await conn.close()
+
+
+async def _main() -> None:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise SystemExit("DATABASE_URL environment variable not set")
+    await create_index(database_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Migration: create location_search for indexed /api/v1/map/search `q` lookups.
+
+The map search endpoint matched `q` with LIKE '%q%' over LOWER(location
+name), which can't use a btree index and forced a sequential scan (plus the
+address/organization joins) on every keystroke-driven search. location_search
+keeps one pre-folded search document per canonical location: a generated,
+weighted tsvector with a GIN index for websearch_to_tsquery / prefix matches,
+and a pg_trgm GIN index over the folded name + address text for substring
+matches. Triggers on location, address and organization keep it current.
+
+Re-runnable: every statement is IF NOT EXISTS / CREATE OR REPLACE, and the
+backfill is ON CONFLICT DO NOTHING, so this is safe on environments already
+initialized from init-scripts/17-location-search.sql (fresh envs) — this
+module is for applying the table to existing databases that predate it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+import asyncpg
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Kept in sync with init-scripts/17-location-search.sql (minus BEGIN/COMMIT).
+CREATE_LOCATION_SEARCH_SQL = r"""
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+    CREATE OR REPLACE FUNCTION public.location_search_fold(value TEXT)
+    RETURNS TEXT
+    LANGUAGE sql
+    IMMUTABLE
+    AS $$
+        SELECT btrim(regexp_replace(lower(COALESCE(value, '')), '\s+', ' ', 'g'))
+    $$;
+
+    CREATE TABLE IF NOT EXISTS public.location_search (
+        location_id      character varying(250) PRIMARY KEY
+                         REFERENCES public.location(id) ON DELETE CASCADE,
+        name_text        TEXT NOT NULL DEFAULT '',
+        address_text     TEXT NOT NULL DEFAULT '',
+        description_text TEXT NOT NULL DEFAULT '',
+        folded_text      TEXT GENERATED ALWAYS AS (
+            name_text || ' ' || address_text
+        ) STORED,
+        search_vector    tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', name_text), 'A')
+            || setweight(to_tsvector('english', address_text), 'B')
+            || setweight(to_tsvector('english', description_text), 'C')
+        ) STORED,
+        updated_at       TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+
+    CREATE INDEX IF NOT EXISTS location_search_vector_idx
+        ON public.location_search USING gin (search_vector);
+
+    CREATE INDEX IF NOT EXISTS location_search_folded_trgm_idx
+        ON public.location_search USING gin (folded_text gin_trgm_ops);
+
+    -- Source rows for the search document of every canonical location.
+    CREATE OR REPLACE VIEW public.location_search_source AS
+    SELECT
+        l.id AS location_id,
+        public.location_search_fold(concat_ws(' ', l.name, l.alternate_name, o.name))
+            AS name_text,
+        public.location_search_fold((
+            SELECT string_agg(
+                concat_ws(' ', a.address_1, a.address_2, a.city,
+                          a.state_province, a.postal_code),
+                ' '
+            )
+            FROM public.address a
+            WHERE a.location_id = l.id
+        )) AS address_text,
+        public.location_search_fold(concat_ws(' ', l.description, o.description))
+            AS description_text
+    FROM public.location l
+    LEFT JOIN public.organization o ON o.id = l.organization_id
+    WHERE l.is_canonical = true;
+
+    CREATE OR REPLACE FUNCTION public.refresh_location_search(p_location_id TEXT)
+    RETURNS void
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF p_location_id IS NULL THEN
+            RETURN;
+        END IF;
+
+        INSERT INTO public.location_search (
+            location_id, name_text, address_text, description_text, updated_at
+        )
+        SELECT location_id, name_text, address_text, description_text, now()
+        FROM public.location_search_source
+        WHERE location_id = p_location_id
+        ON CONFLICT (location_id) DO UPDATE SET
+            name_text = EXCLUDED.name_text,
+            address_text = EXCLUDED.address_text,
+            description_text = EXCLUDED.description_text,
+            updated_at = EXCLUDED.updated_at;
+
+        IF NOT FOUND THEN
+            -- No longer canonical (or gone): drop it from the search table
+            DELETE FROM public.location_search WHERE location_id = p_location_id;
+        END IF;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION public.location_search_location_trigger()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        PERFORM public.refresh_location_search(NEW.id);
+        RETURN NULL;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION public.location_search_address_trigger()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM public.refresh_location_search(OLD.location_id);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE')
+           AND NEW.location_id IS DISTINCT FROM
+               CASE WHEN TG_OP = 'UPDATE' THEN OLD.location_id END THEN
+            PERFORM public.refresh_location_search(NEW.location_id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+
+    CREATE OR REPLACE FUNCTION public.location_search_organization_trigger()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        PERFORM public.refresh_location_search(l.id)
+        FROM public.location l
+        WHERE l.organization_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$;
+
+    DROP TRIGGER IF EXISTS location_search_location_sync ON public.location;
+    CREATE TRIGGER location_search_location_sync
+        AFTER INSERT OR UPDATE OF name, alternate_name, description,
+            organization_id, is_canonical
+        ON public.location
+        FOR EACH ROW EXECUTE FUNCTION public.location_search_location_trigger();
+
+    DROP TRIGGER IF EXISTS location_search_address_sync ON public.address;
+    CREATE TRIGGER location_search_address_sync
+        AFTER INSERT OR UPDATE OR DELETE
+        ON public.address
+        FOR EACH ROW EXECUTE FUNCTION public.location_search_address_trigger();
+
+    DROP TRIGGER IF EXISTS location_search_organization_sync ON public.organization;
+    CREATE TRIGGER location_search_organization_sync
+        AFTER UPDATE OF name, description
+        ON public.organization
+        FOR EACH ROW EXECUTE FUNCTION public.location_search_organization_trigger();
+
+    -- Backfill existing canonical locations
+    INSERT INTO public.location_search (
+        location_id, name_text, address_text, description_text
+    )
+    SELECT location_id, name_text, address_text, description_text
+    FROM public.location_search_source
+    ON CONFLICT (location_id) DO NOTHING;
+
+    ANALYZE public.location_search;
+"""
+
+VERIFY_SQL = """
+    SELECT to_regclass('public.location_search') AS tbl,
+           (SELECT COUNT(*) FROM public.location_search) AS documents
+"""
+
+
+def _to_asyncpg_dsn(database_url: str) -> str:
+    """Strip SQLAlchemy driver prefix; asyncpg wants a plain libpq URL."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://").replace(
+        "postgresql+psycopg2://", "postgresql://"
+    )
+
+
+async def create_table(database_url: str) -> None:
+    dsn = _to_asyncpg_dsn(database_url)
+    conn = await asyncpg.connect(dsn)
+    try:
+        async with conn.transaction():
+            logger.info("Creating location_search table, indexes and triggers...")
+            await conn.execute(CREATE_LOCATION_SEARCH_SQL)
+        row = await conn.fetchrow(VERIFY_SQL)
+        if row and row["tbl"]:
+            logger.info(
+                "Verified: %s exists with %d documents", row["tbl"], row["documents"]
+            )
+        else:
+            logger.error("Verification failed: location_search not found")
+            raise RuntimeError("location_search missing after CREATE TABLE returned")
+    finally:
+        await conn.close()
+
+
+async def _main() -> None:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise SystemExit("DATABASE_URL environment variable not set")
+    await create_table(database_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Migration: add ptf_location_cluster, the precomputed PTF dedup clusters.
+
+The PTF /locations feed ran a recursive connected-components walk over
+near-duplicate candidates on every request. This adds the table the feed
+now joins instead: one row per candidate location with its cluster id.
+
+The table starts empty — until it is populated the feed serves every
+candidate as its own cluster. Populate it once after migrating with:
+
+    python scripts/rebuild_ptf_location_clusters.py --apply
+
+Re-runnable: table and index are IF NOT EXISTS, so this is safe on
+environments already initialized from init-scripts/22-ptf-location-cluster.sql
+(fresh envs) — this module is for existing databases that predate it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+import asyncpg
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Kept in sync with init-scripts/22-ptf-location-cluster.sql (minus BEGIN/COMMIT).
+CREATE_PTF_LOCATION_CLUSTER_SQL = """
+    CREATE TABLE IF NOT EXISTS public.ptf_location_cluster (
+        location_id   character varying(250) PRIMARY KEY,
+        cluster_id    character varying(250) NOT NULL,
+        refreshed_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+
+    CREATE INDEX IF NOT EXISTS ptf_location_cluster_cluster_idx
+        ON public.ptf_location_cluster(cluster_id);
+"""
+
+VERIFY_SQL = """
+    SELECT to_regclass('public.ptf_location_cluster') IS NOT NULL AS present
+"""
+
+
+def _to_asyncpg_dsn(database_url: str) -> str:
+    """Strip SQLAlchemy driver prefix; asyncpg wants a plain libpq URL."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://").replace(
+        "postgresql+psycopg2://", "postgresql://"
+    )
+
+
+async def create_table(database_url: str) -> None:
+    dsn = _to_asyncpg_dsn(database_url)
+    conn = await asyncpg.connect(dsn)
+    try:
+        async with conn.transaction():
+            logger.info("Creating ptf_location_cluster...")
+            await conn.execute(CREATE_PTF_LOCATION_CLUSTER_SQL)
+        row = await conn.fetchrow(VERIFY_SQL)
+        if row is not None and row["present"]:
+            logger.info(
+                "Verified: ptf_location_cluster exists — populate it with "
+                "scripts/rebuild_ptf_location_clusters.py --apply"
+            )
+        else:
+            logger.error("Verification failed: ptf_location_cluster missing")
+            raise RuntimeError("ptf_location_cluster missing after migration")
+    finally:
+        await conn.close()
+
+
+async def _main() -> None:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise SystemExit("DATABASE_URL environment variable not set")
+    await create_table(database_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
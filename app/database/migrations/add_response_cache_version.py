@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Migration: bump beacon_sync_state.change_seq for service-side writes.
+
+The API response cache keys cached read responses on
+beacon_sync_state.change_seq. The triggers from
+init-scripts/20-beacon-sync-state.sql only cover the tables behind the
+Beacon feed; this adds the same deferred bump trigger to service,
+service_at_location, organization_source, ptf_location_cluster and
+feeding_america_zip_coverage so /services, /service-at-location, /map,
+/consumer and the PTF feed invalidate too.
+
+Re-runnable: the triggers are dropped and recreated, so this is safe on
+environments already initialized from init-scripts/23-response-cache-version.sql
+(fresh envs) — this module is for existing databases that predate it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+import asyncpg
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Kept in sync with init-scripts/23-response-cache-version.sql (minus BEGIN/COMMIT).
+CREATE_RESPONSE_CACHE_VERSION_SQL = r"""
+    DO $$
+    DECLARE
+        tbl TEXT;
+    BEGIN
+        FOREACH tbl IN ARRAY ARRAY[
+            'service', 'service_at_location', 'organization_source',
+            'ptf_location_cluster', 'feeding_america_zip_coverage'
+        ] LOOP
+            EXECUTE format(
+                'DROP TRIGGER IF EXISTS beacon_sync_bump ON public.%I', tbl
+            );
+            EXECUTE format(
+                'CREATE CONSTRAINT TRIGGER beacon_sync_bump '
+                'AFTER INSERT OR UPDATE OR DELETE ON public.%I '
+                'DEFERRABLE INITIALLY DEFERRED '
+                'FOR EACH ROW EXECUTE FUNCTION public.beacon_sync_bump()',
+                tbl
+            );
+        END LOOP;
+    END;
+    $$;
+"""
+
+VERIFY_SQL = """
+    SELECT count(*) AS triggers
+    FROM pg_trigger t
+    JOIN pg_class c ON c.oid = t.tgrelid
+    WHERE t.tgname = 'beacon_sync_bump'
+      AND c.relname IN (
+          'service', 'service_at_location', 'organization_source',
+          'ptf_location_cluster', 'feeding_america_zip_coverage'
+      )
+"""
+
+
+def _to_asyncpg_dsn(database_url: str) -> str:
+    """Strip SQLAlchemy driver prefix; asyncpg wants a plain libpq URL."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://").replace(
+        "postgresql+psycopg2://", "postgresql://"
+    )
+
+
+async def create_table(database_url: str) -> None:
+    dsn = _to_asyncpg_dsn(database_url)
+    conn = await asyncpg.connect(dsn)
+    try:
+        async with conn.transaction():
+            logger.info("Creating service-side change_seq triggers...")
+            await conn.execute(CREATE_RESPONSE_CACHE_VERSION_SQL)
+        row = await conn.fetchrow(VERIFY_SQL)
+        if row is not None and row["triggers"] == 5:
+            logger.info("Verified: beacon_sync_bump on 5 service-side tables")
+        else:
+            logger.error("Verification failed: beacon_sync_bump triggers missing")
+            raise RuntimeError("beacon_sync_bump triggers missing after migration")
+    finally:
+        await conn.close()
+
+
+async def _main() -> None:
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise SystemExit("DATABASE_URL environment variable not set")
+    await create_table(database_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
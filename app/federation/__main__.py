@@ -1,7 +1,9 @@
 """CLI entry point for federation maintenance (the Docker / bouy realization).
 
 Usage:
-    python -m app.federation prune   # archive over-SLA leaves, then trim the live log
+    python -m app.federation prune            # archive over-SLA leaves, then trim the live log
+    python -m app.federation publish-outbox   # publisher loop for FEDERATION_PUBLISH_MODE=outbox
+    python -m app.federation publish-outbox --once   # drain the current backlog and exit
 
 The AWS realization is an EventBridge-scheduled Lambda; both drivers call the same
 :func:`app.federation.retention.prune_to_horizon`, so the prune logic is identical
@@ -12,6 +14,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 
 import structlog
 
@@ -64,6 +67,39 @@ def _prune() -> int:
     return 0
 
 
+def _publish_outbox(*, once: bool) -> int:
+    """Drain federation_outbox in batches; with ``once``, stop when it is empty.
+
+    The loop only sleeps when a drain comes back empty, so a backlog is worked
+    off at full speed. A failed drain (e.g. the database restarting) is logged
+    and retried after the poll interval rather than ending the loop.
+    """
+    from app.core.config import settings
+    from app.federation.outbox import drain
+
+    session = _session()
+    try:
+        while True:
+            try:
+                result = drain(
+                    session, batch_size=settings.FEDERATION_OUTBOX_BATCH_SIZE
+                )
+            except Exception as exc:
+                session.rollback()
+                logger.warning("federation_outbox_drain_failed", error=str(exc))
+                if once:
+                    return 1
+                time.sleep(settings.FEDERATION_OUTBOX_POLL_SECONDS)
+                continue
+            if result.claimed:
+                continue
+            if once:
+                return 0
+            time.sleep(settings.FEDERATION_OUTBOX_POLL_SECONDS)
+    finally:
+        session.close()
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Federation maintenance commands")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -71,9 +107,18 @@ def main() -> int:
         "prune",
         help="Archive over-SLA leaves to the archive tier, then trim the live log window",
     )
+    outbox = subparsers.add_parser(
+        "publish-outbox",
+        help="Publish the Updates queued in federation_outbox (FEDERATION_PUBLISH_MODE=outbox)",
+    )
+    outbox.add_argument(
+        "--once", action="store_true", help="Drain the current backlog and exit"
+    )
     args = parser.parse_args()
     if args.command == "prune":
         return _prune()
+    if args.command == "publish-outbox":
+        return _publish_outbox(once=args.once)
     parser.print_help()
     return 1
 
@@ -5,6 +5,9 @@ object that becomes the ``object`` field of a federation activity envelope
 (``app/federation/envelope.py::build_preimage(obj=...)``). It is called at the
 reconciler commit hook (PR-C) and from the offline dedup scripts — both of which
 hold a plain *sync* ``sqlalchemy.orm.Session`` — so this module is sync-only.
+``build_location_aggregates(session, ids)`` is the batch form (three queries for
+any number of locations); the single-location builder is that with one id, so
+the two produce identical objects and identical JCS bytes.
 
 HSDS 3.1.1-curated field set (DELIBERATE — Principle II, NON-NEGOTIABLE)
 -----------------------------------------------------------------------
@@ -43,6 +46,8 @@ Schedules are read from the RAW ``schedule`` table by ``location_id`` — NOT th
 from __future__ import annotations
 
 import math
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 
 import structlog
@@ -59,7 +64,7 @@ from app.models.hsds.response import (
 logger = structlog.get_logger(__name__)
 
 # Raw location scalar fields that map 1:1 onto LocationResponse.
-_LOCATION_SQL = text(
+_LOCATIONS_SQL = text(
     """
     SELECT
         id,
@@ -73,7 +78,7 @@ _LOCATION_SQL = text(
         external_identifier_type,
         location_type
     FROM location
-    WHERE id = :location_id
+    WHERE id = ANY(:location_ids)
     """
 )
 
@@ -85,9 +90,11 @@ _LOCATION_SQL = text(
 # the SIGNED source_count. One deterministic representative satellite per
 # location (ORDER BY id), NULLIF-wrapped so an all-absent address is NULL (and
 # omitted by exclude_none), never an empty string in the signed bytes.
+# `ls.id` breaks scraper_id ties so the signed order never depends on the plan.
 _SOURCES_SQL = text(
     """
     SELECT
+        ls.location_id,
         ls.scraper_id,
         ls.name,
         ls.created_at AS first_seen,
@@ -114,8 +121,8 @@ _SOURCES_SQL = text(
     FROM location_source ls
     LEFT JOIN location l ON l.id = ls.location_id
     LEFT JOIN organization o ON o.id = l.organization_id
-    WHERE ls.location_id = :location_id
-    ORDER BY ls.scraper_id
+    WHERE ls.location_id = ANY(:location_ids)
+    ORDER BY ls.location_id, ls.scraper_id, ls.id
     """
 )
 
@@ -125,6 +132,7 @@ _SOURCES_SQL = text(
 _SCHEDULES_SQL = text(
     """
     SELECT
+        location_id,
         opens_at,
         closes_at,
         byday,
@@ -135,39 +143,31 @@ _SCHEDULES_SQL = text(
         valid_to,
         notes
     FROM schedule
-    WHERE location_id = :location_id
-    ORDER BY id
+    WHERE location_id = ANY(:location_ids)
+    ORDER BY location_id, id
     """
 )
 
 
-def _build_sources(session: Session, location_id: str) -> list[SourceInfo]:
-    """Assemble per-scraper ``SourceInfo`` rows for a location."""
-    rows = session.execute(_SOURCES_SQL, {"location_id": location_id}).fetchall()
-    sources: list[SourceInfo] = []
-    for row in rows:
-        sources.append(
-            SourceInfo(
-                scraper=row.scraper_id,
-                name=row.name,
-                phone=row.phone,
-                email=row.email,
-                website=row.website,
-                address=row.address,
-                confidence_score=(
-                    row.confidence_score if row.confidence_score is not None else 50
-                ),
-                first_seen=row.first_seen.isoformat() if row.first_seen else None,
-                last_updated=(
-                    row.last_updated.isoformat() if row.last_updated else None
-                ),
-            )
-        )
-    return sources
+def _source_info(row: Any) -> SourceInfo:
+    """One per-scraper ``SourceInfo`` from a ``_SOURCES_SQL`` row."""
+    return SourceInfo(
+        scraper=row.scraper_id,
+        name=row.name,
+        phone=row.phone,
+        email=row.email,
+        website=row.website,
+        address=row.address,
+        confidence_score=(
+            row.confidence_score if row.confidence_score is not None else 50
+        ),
+        first_seen=row.first_seen.isoformat() if row.first_seen else None,
+        last_updated=(row.last_updated.isoformat() if row.last_updated else None),
+    )
 
 
-def _build_schedules(session: Session, location_id: str) -> list[ScheduleInfo]:
-    """Assemble distinct ``ScheduleInfo`` windows from the raw schedule table.
+def _schedule_info(row: Any) -> ScheduleInfo | None:
+    """One ``ScheduleInfo`` window from a ``_SCHEDULES_SQL`` row, or None.
 
     Fail-soft per row: ``ScheduleInfo``'s byday/bymonthday validators RAISE on a
     value the RFC 5545 normalizer cannot parse. A single corrupt row (written by
@@ -175,34 +175,80 @@ def _build_schedules(session: Session, location_id: str) -> list[ScheduleInfo]:
     it and log, mirroring the HSDS read path and the reconciler/submarine
     fail-soft posture (Principle XI).
     """
-    rows = session.execute(_SCHEDULES_SQL, {"location_id": location_id}).fetchall()
-    schedules: list[ScheduleInfo] = []
-    for row in rows:
-        try:
-            schedules.append(
-                ScheduleInfo(
-                    opens_at=str(row.opens_at) if row.opens_at else None,
-                    closes_at=str(row.closes_at) if row.closes_at else None,
-                    byday=row.byday,
-                    bymonthday=row.bymonthday,
-                    freq=row.freq,
-                    description=row.description,
-                    valid_from=row.valid_from.isoformat() if row.valid_from else None,
-                    valid_to=row.valid_to.isoformat() if row.valid_to else None,
-                    notes=row.notes,
-                )
-            )
-        except (ValidationError, ValueError, TypeError) as exc:
-            logger.warning(
-                "federation_aggregate_schedule_dropped_invalid",
-                location_id=location_id,
-                byday=row.byday,
-                bymonthday=row.bymonthday,
-                freq=row.freq,
-                error=str(exc),
-            )
-            continue
-    return schedules
+    try:
+        return ScheduleInfo(
+            opens_at=str(row.opens_at) if row.opens_at else None,
+            closes_at=str(row.closes_at) if row.closes_at else None,
+            byday=row.byday,
+            bymonthday=row.bymonthday,
+            freq=row.freq,
+            description=row.description,
+            valid_from=row.valid_from.isoformat() if row.valid_from else None,
+            valid_to=row.valid_to.isoformat() if row.valid_to else None,
+            notes=row.notes,
+        )
+    except (ValidationError, ValueError, TypeError) as exc:
+        logger.warning(
+            "federation_aggregate_schedule_dropped_invalid",
+            location_id=str(row.location_id),
+            byday=row.byday,
+            bymonthday=row.bymonthday,
+            freq=row.freq,
+            error=str(exc),
+        )
+        return None
+
+
+def build_location_aggregates(
+    session: Session, location_ids: Iterable[str]
+) -> dict[str, dict[str, Any]]:
+    """Build the HSDS Location objects for many locations in three queries.
+
+    The location rows, their sources and their schedules are each fetched once
+    for the whole batch (``= ANY(:location_ids)``) and grouped in memory, so
+    the round trips don't grow with the batch. Each object is exactly what
+    :func:`build_location_aggregate` returns for that id — that function is
+    this one with a single id. Callers with very large id sets (backfills)
+    should chunk them; the arrays are bound as query parameters.
+
+    Args:
+        session: a *sync* SQLAlchemy ``Session`` (reconciler / dedup scripts).
+        location_ids: canonical location ids; duplicates are ignored.
+
+    Returns:
+        ``{location_id: HSDS Location dict}`` in first-seen input order.
+
+    Raises:
+        ValueError: if any id has no location row, a non-finite coordinate, or
+            fails HSDS conformance — the same contract as the single-location
+            builder, raised for the first offending id in input order.
+    """
+    ids = list(dict.fromkeys(str(location_id) for location_id in location_ids))
+    if not ids:
+        return {}
+    params = {"location_ids": ids}
+
+    rows = {
+        str(row.id): row for row in session.execute(_LOCATIONS_SQL, params).fetchall()
+    }
+    sources: dict[str, list[SourceInfo]] = defaultdict(list)
+    for row in session.execute(_SOURCES_SQL, params).fetchall():
+        sources[str(row.location_id)].append(_source_info(row))
+    schedules: dict[str, list[ScheduleInfo]] = defaultdict(list)
+    for row in session.execute(_SCHEDULES_SQL, params).fetchall():
+        schedule = _schedule_info(row)
+        if schedule is not None:
+            schedules[str(row.location_id)].append(schedule)
+
+    aggregates: dict[str, dict[str, Any]] = {}
+    for location_id in ids:
+        location_row = rows.get(location_id)
+        if location_row is None:
+            raise ValueError(f"location not found: {location_id!r}")
+        aggregates[location_id] = _assemble(
+            location_row, sources[location_id], schedules[location_id]
+        )
+    return aggregates
 
 
 def build_location_aggregate(session: Session, location_id: str) -> dict[str, Any]:
@@ -227,12 +273,14 @@ def build_location_aggregate(session: Session, location_id: str) -> dict[str, An
             always pass an id they just wrote, so a miss is a real error, not an
             expected empty result.
     """
-    row = session.execute(_LOCATION_SQL, {"location_id": location_id}).fetchone()
-    if row is None:
-        raise ValueError(f"location not found: {location_id!r}")
+    return build_location_aggregates(session, [location_id])[str(location_id)]
+
 
-    sources = _build_sources(session, location_id)
-    schedules = _build_schedules(session, location_id)
+def _assemble(
+    row: Any, sources: list[SourceInfo], schedules: list[ScheduleInfo]
+) -> dict[str, Any]:
+    """Validate one location row + its children into the HSDS Location dict."""
+    location_id = str(row.id)
     # source_count = number of DISTINCT scrapers (matches the read/export paths),
     # not len(sources): never inflated by satellite rows. Falls back to the model
     # default (1) when there are no sources — the read API's "at least itself".
@@ -9,10 +9,26 @@ with no envelope-specific assumptions.
 
 Number formatting follows the ECMAScript ``Number.prototype.toString()`` algorithm
 (RFC 8785 §3.2.2.3); string escaping follows §3.2.2.2.
+
+Fast path: most documents (envelopes, Location aggregates) only need what a C
+JSON encoder already does the JCS way — exact ``str``/``int``/``bool``/``None``,
+BMP-only object keys (so code-point order IS UTF-16 order) and floats whose
+shortest ``repr`` is already the ECMAScript form (non-integral, in
+``[1e-4, 1e15)``). ``_fast_path_safe`` checks that in one walk; such documents
+go to ``orjson`` (when installed — it is optional) or the stdlib C encoder, and
+everything else to the reference serializer below. The output is byte-identical
+either way; ``tests/test_federation/test_canonical_fast_path.py`` fuzzes the two
+against each other.
 """
 
+import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib C encoder is the fallback
+    orjson = None  # type: ignore[assignment]
+
 # Control characters with JSON short-form escapes (RFC 8785 §3.2.2.2).
 _SHORT_ESCAPES = {
     0x08: "\\b",
@@ -25,11 +41,65 @@ _SHORT_ESCAPES = {
 }
 
 
+# ensure_ascii=False selects c_encode_basestring, whose escaping (short forms,
+# other controls as lowercase \u00XX, everything else raw) is exactly §3.2.2.2.
+_STDLIB_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    sort_keys=True,
+    separators=(",", ":"),
+    allow_nan=False,
+    check_circular=False,
+)
+
+# Floats in this range that are not integral print identically under Python's
+# shortest repr (no exponent below 1e16) and ECMAScript (no exponent below 1e21).
+_FAST_FLOAT_MIN = 1e-4
+_FAST_FLOAT_MAX = 1e15
+_MAX_BMP = "\uffff"
+
+
 def jcs_bytes(obj: Any) -> bytes:
     """Serialize ``obj`` to canonical RFC 8785 JSON bytes (UTF-8)."""
+    if _fast_path_safe(obj):
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+            except orjson.JSONEncodeError:
+                # Integers beyond 64 bits, nesting beyond orjson's depth limit,
+                # lone surrogates: the stdlib encoder handles (or raises on)
+                # them exactly as the reference does.
+                pass
+        return _STDLIB_ENCODER.encode(obj).encode("utf-8")
+    return jcs_bytes_reference(obj)
+
+
+def jcs_bytes_reference(obj: Any) -> bytes:
+    """The reference serializer: every value formatted in Python, per the RFC."""
     return _serialize(obj).encode("utf-8")
 
 
+def _fast_path_safe(obj: Any) -> bool:
+    """True when a C encoder with sorted keys emits exactly the JCS bytes."""
+    kind = type(obj)
+    if kind is str or kind is int or kind is bool or obj is None:
+        return True
+    if kind is float:
+        magnitude = abs(obj)
+        return _FAST_FLOAT_MIN <= magnitude < _FAST_FLOAT_MAX and not obj.is_integer()
+    if kind is dict:
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                return False
+            if not key.isascii() and max(key) > _MAX_BMP:
+                return False
+            if not _fast_path_safe(value):
+                return False
+        return True
+    if kind is list or kind is tuple:
+        return all(_fast_path_safe(item) for item in obj)
+    return False
+
+
 def _serialize(obj: Any) -> str:
     if obj is None:
         return "null"
@@ -39,21 +39,31 @@ _MAIN_KEY_PRIORITY = 1
 _RECOVERY_KEY_PRIORITY_BASE = 10
 
 
+# The codec works on the whole value as one integer, like the textbook
+# algorithm, but peels and folds _B58_CHUNK digits per big-integer operation
+# (58**10 < 2**59) and does the per-digit work on small ints, two digits per
+# step when encoding: a 64-byte signature costs 9 big-int divisions instead
+# of 88.
+_B58_INDEX = {char: digit for digit, char in enumerate(_B58_ALPHABET)}
+_B58_PAIRS = [high + low for high in _B58_ALPHABET for low in _B58_ALPHABET]
+_B58_CHUNK = 10
+_B58_CHUNK_BASE = 58**_B58_CHUNK
+
+
 def _b58encode(data: bytes) -> str:
     """Encode bytes as base58btc. Used only when ``base58`` is unavailable."""
-    num = int.from_bytes(data, "big")
-    encoded = ""
-    while num > 0:
-        num, rem = divmod(num, 58)
-        encoded = _B58_ALPHABET[rem] + encoded
+    stripped = data.lstrip(b"\x00")
     # Each leading zero byte maps to a leading '1'.
-    pad = 0
-    for byte in data:
-        if byte == 0:
-            pad += 1
-        else:
-            break
-    return "1" * pad + encoded
+    pad = len(data) - len(stripped)
+    num = int.from_bytes(stripped, "big")
+    pairs: list[str] = []
+    while num:
+        num, chunk = divmod(num, _B58_CHUNK_BASE)
+        for _ in range(_B58_CHUNK // 2):
+            chunk, pair = divmod(chunk, 58 * 58)
+            pairs.append(_B58_PAIRS[pair])
+    # The top chunk is zero-padded to _B58_CHUNK digits; drop that padding.
+    return "1" * pad + "".join(reversed(pairs)).lstrip("1")
 
 
 def _b58decode(data: str) -> bytes:
@@ -62,20 +72,20 @@ def _b58decode(data: str) -> bytes:
     Used only when the ``base58`` package is unavailable. Raises ``ValueError`` on
     any character outside the base58btc alphabet (so a malformed multibase fails
     loudly rather than decoding to garbage)."""
+    stripped = data.lstrip("1")
+    # Each leading '1' restores a leading zero byte (inverse of _b58encode).
+    pad = len(data) - len(stripped)
     num = 0
-    for char in data:
-        digit = _B58_ALPHABET.find(char)
-        if digit < 0:
-            raise ValueError(f"invalid base58 character {char!r}")
-        num = num * 58 + digit
+    for start in range(0, len(stripped), _B58_CHUNK):
+        chunk = stripped[start : start + _B58_CHUNK]
+        value = 0
+        for char in chunk:
+            digit = _B58_INDEX.get(char)
+            if digit is None:
+                raise ValueError(f"invalid base58 character {char!r}")
+            value = value * 58 + digit
+        num = num * 58 ** len(chunk) + value
     body = num.to_bytes((num.bit_length() + 7) // 8, "big") if num else b""
-    # Each leading '1' restores a leading zero byte (inverse of _b58encode).
-    pad = 0
-    for char in data:
-        if char == "1":
-            pad += 1
-        else:
-            break
     return b"\x00" * pad + body
 
 
@@ -14,6 +14,11 @@ P1 implements it unchanged (memo Proof 1/4):
     *allocated* until the lower one commits (the M5 hazard is impossible by
     construction), ``safe_high_water`` — the top of the gap-free committed
     prefix — is simply ``MAX(sequence)`` over committed rows.
+  - ``append_many`` is the group commit: one lock acquisition, one contiguous
+    sequence range, one multi-row INSERT and one COMMIT for a whole batch of
+    envelopes (``append`` is its one-entry case). The reconciler publishes a
+    job's locations through it, so N publishes cost one trip through the
+    critical section rather than N.
   - ``append`` takes a **plain sync Session** so the offline dedup scripts
     (the §6.2e ``Delete`` hook sites) can call it outside the reconciler.
   - Kill switch (§6.2d, Principle XI): ``FEDERATION_ENABLED=False`` makes both
@@ -32,6 +37,8 @@ correctness substrate).
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
@@ -46,19 +53,41 @@ from app.federation.checkpoint import build_checkpoint
 #: but MUST stay stable forever — all writers must contend on the same key).
 _APPEND_LOCK_KEY = 0x46454445_0001  # "FEDE" + 1
 
-_INSERT_SQL = text(
+# One statement for the whole batch: the columns travel as parallel arrays.
+_INSERT_MANY_SQL = text(
     """
     INSERT INTO federation_log
         (leaf_hash, sequence, type, federation_id, object_canonical,
          preimage_canonical, published_at, origin_did)
-    VALUES
-        (:leaf_hash, :sequence, :type, :federation_id,
-         CAST(:object_canonical AS jsonb), :preimage_canonical,
-         CAST(:published_at AS timestamptz), :origin_did)
+    SELECT leaf_hash, sequence, type, federation_id,
+           CAST(object_canonical AS jsonb), preimage_canonical,
+           CAST(published_at AS timestamptz), :origin_did
+    FROM unnest(
+        CAST(:leaf_hashes AS text[]),
+        CAST(:sequences AS bigint[]),
+        CAST(:types AS text[]),
+        CAST(:federation_ids AS text[]),
+        CAST(:objects AS text[]),
+        CAST(:preimages AS bytea[]),
+        CAST(:published AS text[])
+    ) AS batch(leaf_hash, sequence, type, federation_id, object_canonical,
+               preimage_canonical, published_at)
     """
 )
 
 
+@dataclass(frozen=True)
+class PendingAppend:
+    """One activity waiting for its sequence in :func:`append_many`."""
+
+    activity_type: str
+    federation_id: str
+    obj: dict[str, Any]
+    published: str | None = None
+    actor: str | None = None
+    attributed_to: str | None = None
+
+
 def append(
     session: Session,
     *,
@@ -80,59 +109,106 @@ def append(
     AFTER the resource commit, never inside the caller's open transaction.
     For our own publishes ``actor``/``attributedTo`` default to ``origin_did``.
     """
+    sequences = append_many(
+        session,
+        [
+            PendingAppend(
+                activity_type=activity_type,
+                federation_id=federation_id,
+                obj=obj,
+                published=published,
+                actor=actor,
+                attributed_to=attributed_to,
+            )
+        ],
+        origin_did=origin_did,
+        signing_key=signing_key,
+        context=context,
+        license=license,
+    )
+    return None if sequences is None else sequences[0]
+
+
+def append_many(
+    session: Session,
+    entries: Sequence[PendingAppend],
+    *,
+    origin_did: str,
+    signing_key: Ed25519PrivateKey,
+    context: str,
+    license: str,
+) -> list[int] | None:
+    """Group commit: append several envelopes under ONE lock acquisition.
+
+    The batch gets the contiguous range ``MAX+1 .. MAX+len(entries)`` in input
+    order, every envelope is signed with ``signing_key`` and the rows go in
+    with one multi-row INSERT, then one COMMIT releases the lock. A writer
+    publishing N locations therefore pays for the serialized critical section
+    once instead of N times; the density argument is unchanged (the whole
+    range is allocated and committed atomically).
+
+    All-or-nothing: if any envelope cannot be built (e.g. an integer outside
+    the I-JSON range) nothing is written and the error propagates — the
+    caller decides whether to retry entries one by one. Returns the sequences
+    in input order, or ``None`` when ``FEDERATION_ENABLED`` is off.
+    """
     from app.core.config import settings  # late import: kill-switch reads live value
 
     if not settings.FEDERATION_ENABLED:
         return None
+    if not entries:
+        return []
 
-    import json
-
-    actor = actor or origin_did
-    attributed_to = attributed_to or origin_did
-    published = published or envelope_mod.published_now()
+    fallback_published = envelope_mod.published_now()
 
     # ---- critical section: lock -> MAX+1 -> INSERT -> COMMIT (lock released)
     session.execute(
         text("SELECT pg_advisory_xact_lock(:key)"), {"key": _APPEND_LOCK_KEY}
     )
-    sequence = session.execute(
+    first = session.execute(
         text("SELECT COALESCE(MAX(sequence), 0) + 1 FROM federation_log")
     ).scalar_one()
-    preimage = envelope_mod.build_preimage(
-        context=context,
-        activity_type=activity_type,
-        actor=actor,
-        attributed_to=attributed_to,
-        origin=origin_did,
-        federation_id=federation_id,
-        obj=obj,
-        sequence=sequence,
-        published=published,
-        license=license,
-    )
-    env, preimage_bytes = envelope_mod.finalize_with_bytes(preimage, signing_key)
-    session.execute(
-        _INSERT_SQL,
-        {
-            "leaf_hash": env["id"],
-            "sequence": sequence,
-            "type": activity_type,
-            "federation_id": federation_id,
-            # object_canonical is for QUERYABILITY ONLY and is NOT byte-faithful:
-            # a JSONB round-trip normalizes extreme-magnitude floats (>=1e21), so
-            # verify_envelope over an envelope reconstructed from object_canonical
-            # can fail. The PR-C /export surface MUST serve the signed bytes from
-            # preimage_canonical (+ the proof), never re-serialize object_canonical.
-            "object_canonical": json.dumps(env),
-            # The exact signed bytes, stored verbatim (see leaf_data): the leaf
-            # must never depend on JSONB number normalization.
-            "preimage_canonical": preimage_bytes,
-            "published_at": published,
-            "origin_did": origin_did,
-        },
-    )
+    sequences = [int(first) + offset for offset in range(len(entries))]
+    columns: dict[str, list[Any]] = {
+        "leaf_hashes": [],
+        "sequences": sequences,
+        "types": [],
+        "federation_ids": [],
+        "objects": [],
+        "preimages": [],
+        "published": [],
+    }
+    for entry, sequence in zip(entries, sequences, strict=True):
+        published = entry.published or fallback_published
+        preimage = envelope_mod.build_preimage(
+            context=context,
+            activity_type=entry.activity_type,
+            actor=entry.actor or origin_did,
+            attributed_to=entry.attributed_to or origin_did,
+            origin=origin_did,
+            federation_id=entry.federation_id,
+            obj=entry.obj,
+            sequence=sequence,
+            published=published,
+            license=license,
+        )
+        env, preimage_bytes = envelope_mod.finalize_with_bytes(preimage, signing_key)
+        columns["leaf_hashes"].append(env["id"])
+        columns["types"].append(entry.activity_type)
+        columns["federation_ids"].append(entry.federation_id)
+        # object_canonical is for QUERYABILITY ONLY and is NOT byte-faithful:
+        # a JSONB round-trip normalizes extreme-magnitude floats (>=1e21), so
+        # verify_envelope over an envelope reconstructed from object_canonical
+        # can fail. The PR-C /export surface MUST serve the signed bytes from
+        # preimage_canonical (+ the proof), never re-serialize object_canonical.
+        columns["objects"].append(json.dumps(env))
+        # The exact signed bytes, stored verbatim (see leaf_data): the leaf
+        # must never depend on JSONB number normalization.
+        columns["preimages"].append(preimage_bytes)
+        columns["published"].append(published)
+    session.execute(_INSERT_MANY_SQL, {**columns, "origin_did": origin_did})
     session.commit()
-    return int(sequence)
+    return sequences
 
 
 def safe_high_water(session: Session) -> int:
@@ -0,0 +1,183 @@
+"""Deferred federation publishing: the ``federation_outbox`` table and its drain.
+
+With ``FEDERATION_PUBLISH_MODE=outbox`` the reconciler does not build, sign or
+append anything. Once a job's canonical state is committed it calls
+:func:`enqueue_location_updates`, which writes one tiny row per location in a
+single INSERT, and returns. The publisher loop (``python -m app.federation
+publish-outbox``) calls :func:`drain`, which:
+
+  1. claims the oldest ``batch_size`` rows with ``FOR UPDATE SKIP LOCKED``
+     (several publishers never claim the same row) by deleting them, without
+     committing;
+  2. coalesces them by location, so a burst of edits to one location between
+     drains becomes ONE ``Update`` — built from the state at drain time, which
+     is the latest committed state anyway;
+  3. publishes the distinct locations through
+     :func:`app.federation.publish.publish_location_updates` (publish gate,
+     batched aggregates, group-committed append), whose COMMIT also commits
+     the claim.
+
+The guards that depend on the committing job — the kill switch and §10 echo
+suppression — are applied at enqueue time, so a federated-peer commit never
+reaches the outbox. The kill switch is re-checked before a drain.
+
+A crash before the append commits rolls the claim back with it, so the rows
+are drained again rather than lost. An Update the publish path skips (not
+canonical, or failing on its own) is dropped with its row, exactly as an inline
+failure would be; the next edit to the location enqueues it again. If the batch
+append falls back to per-item appends, the claim was rolled back with the batch
+and is deleted again afterwards, so a crash in that window can repeat an Update
+but never loses one.
+
+Until the ``federation_outbox`` migration has run, :func:`enqueue_location_updates`
+publishes inline instead, so outbox mode on an unmigrated database degrades to
+the inline path rather than dropping Updates.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = structlog.get_logger(__name__)
+
+#: ``federation_outbox.reason`` for a committed (new or changed) location.
+REASON_UPDATE = "update"
+
+_ENQUEUE_SQL = text(
+    """
+    INSERT INTO federation_outbox (location_id, reason)
+    SELECT location_id, :reason
+    FROM unnest(CAST(:location_ids AS text[])) AS pending(location_id)
+    """
+)
+
+_CLAIM_SQL = text(
+    """
+    DELETE FROM federation_outbox
+    WHERE id IN (
+        SELECT id FROM federation_outbox
+        ORDER BY id
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, location_id
+    """
+)
+
+_DELETE_SQL = text("DELETE FROM federation_outbox WHERE id = ANY(:ids)")
+
+# Set once federation_outbox has been seen, so later enqueues skip the probe.
+_OUTBOX_PRESENT = False
+
+
+@dataclass
+class DrainResult:
+    """What one :func:`drain` call did."""
+
+    claimed: int = 0
+    locations: int = 0
+    published: int = 0
+
+
+def _outbox_table_exists(db: Session) -> bool:
+    global _OUTBOX_PRESENT
+    if not _OUTBOX_PRESENT:
+        _OUTBOX_PRESENT = (
+            db.execute(text("SELECT to_regclass('public.federation_outbox')")).scalar()
+            is not None
+        )
+    return _OUTBOX_PRESENT
+
+
+def enqueue_location_updates(
+    db: Session, location_ids: Iterable[str], *, source_type: str | None
+) -> int:
+    """Queue a federation ``Update`` for each just-committed location.
+
+    One INSERT + COMMIT, no reads. Returns the number of rows enqueued (0 when
+    federation is disabled, the commit is a federated echo, or on failure).
+    Without the ``federation_outbox`` table the Updates are published inline
+    instead and 0 is returned. Never raises — like the inline publish, a
+    failure here must not abort the reconciler job that called it.
+    """
+    from app.core.config import settings
+    from app.federation.publish import (
+        FEDERATED_SOURCE_TYPE,
+        publish_location_updates,
+    )
+
+    ids = [str(location_id) for location_id in location_ids]
+    if not ids or not settings.FEDERATION_ENABLED:
+        return 0
+    if source_type == FEDERATED_SOURCE_TYPE:  # §10 echo suppression
+        return 0
+    try:
+        queued = _outbox_table_exists(db)
+        if queued:
+            db.execute(_ENQUEUE_SQL, {"location_ids": ids, "reason": REASON_UPDATE})
+            db.commit()
+    except Exception as exc:  # never abort the caller (Principle XI)
+        with contextlib.suppress(Exception):
+            db.rollback()
+        logger.warning("federation_outbox_enqueue_failed", error=str(exc))
+        return 0
+    if not queued:
+        logger.warning("federation_outbox_missing_publishing_inline", count=len(ids))
+        publish_location_updates(db, ids, source_type=source_type)
+        return 0
+    return len(ids)
+
+
+def coalesce(location_ids: Iterable[str]) -> list[str]:
+    """Distinct location ids in order of first appearance."""
+    return list(dict.fromkeys(location_ids))
+
+
+def drain(db: Session, *, batch_size: int) -> DrainResult:
+    """Claim up to ``batch_size`` outbox rows and publish them, coalesced.
+
+    Returns how many rows were claimed (0 means the outbox is empty), how
+    many distinct locations they covered and how many Updates were appended.
+    Publish failures are logged and skipped inside ``publish_location_updates``;
+    a failure to claim or delete propagates to the caller's loop, which rolls
+    back and so returns any uncommitted claim to the outbox.
+    """
+    from app.core.config import settings
+    from app.federation.publish import publish_location_updates
+
+    if not settings.FEDERATION_ENABLED:
+        return DrainResult()
+    # Left uncommitted: the append's COMMIT makes the claim permanent.
+    rows = db.execute(_CLAIM_SQL, {"limit": batch_size}).fetchall()
+    if not rows:
+        db.commit()
+        return DrainResult()
+
+    # RETURNING does not preserve the subquery's order; restore FIFO by id.
+    ordered = [str(row.location_id) for row in sorted(rows, key=lambda r: r.id)]
+    location_ids = coalesce(ordered)
+    # source_type=None: echo suppression already happened at enqueue time.
+    sequences = publish_location_updates(db, location_ids, source_type=None)
+    # A no-op when the append committed the claim; otherwise (nothing to
+    # append, or a rolled-back batch that fell back to per-item appends) this
+    # is what removes the drained rows.
+    db.execute(_DELETE_SQL, {"ids": [row.id for row in rows]})
+    db.commit()
+    result = DrainResult(
+        claimed=len(rows),
+        locations=len(location_ids),
+        published=sum(seq is not None for seq in sequences),
+    )
+    logger.info(
+        "federation_outbox_drained",
+        claimed=result.claimed,
+        locations=result.locations,
+        published=result.published,
+    )
+    return result
@@ -18,13 +18,17 @@ Guards (in order):
 from __future__ import annotations
 
 import contextlib
+from collections.abc import Iterable
 
 import structlog
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.federation import identity, log
-from app.federation.aggregate import build_location_aggregate
+from app.federation.aggregate import (
+    build_location_aggregate,
+    build_location_aggregates,
+)
 from app.federation.grammar import normalize_federation_id
 
 logger = structlog.get_logger(__name__)
@@ -74,6 +78,16 @@ def _is_canonical(db: Session, location_id: str) -> bool:
     return row is not None and row[0] is not False
 
 
+def _canonical_ids(db: Session, location_ids: list[str]) -> set[str]:
+    """Batch publish gate: the subset of ``location_ids`` that ``_is_canonical``
+    would pass, in one query."""
+    rows = db.execute(
+        text("SELECT id, is_canonical FROM location WHERE id = ANY(:ids)"),
+        {"ids": location_ids},
+    ).fetchall()
+    return {str(r.id) for r in rows if r.is_canonical is not False}
+
+
 def _append(
     db: Session, *, activity_type: str, federation_id: str, obj: dict
 ) -> int | None:
@@ -117,6 +131,56 @@ def _append(
         return None
 
 
+def _append_many(
+    db: Session, *, activity_type: str, items: list[tuple[str, dict]]
+) -> list[int | None]:
+    """Group-commit ``(federation_id, obj)`` appends; one result per item.
+
+    Same identity / kill-switch / fail-soft contract as :func:`_append`, with
+    the key loaded once and the whole batch signed and sequenced under one
+    lock acquisition (``log.append_many``). The batch is all-or-nothing, so on
+    failure it is retried item by item through ``_append`` — only the items
+    that fail on their own are skipped.
+    """
+    from app.core.config import settings
+
+    skipped: list[int | None] = [None] * len(items)
+    if not items or not settings.FEDERATION_ENABLED:
+        return skipped
+    if settings.FEDERATION_DID is None or _node_host() is None:
+        return skipped
+    try:
+        key = identity.load_signing_key(settings.FEDERATION_SIGNING_KEY)
+        if key is None:
+            return skipped
+        sequences = log.append_many(
+            db,
+            [
+                log.PendingAppend(
+                    activity_type=activity_type, federation_id=fid, obj=obj
+                )
+                for fid, obj in items
+            ],
+            origin_did=settings.FEDERATION_DID,
+            signing_key=key,
+            context=settings.FEDERATION_PROFILE_URI,
+            license=settings.FEDERATION_LICENSE,
+        )
+    except Exception as exc:
+        with contextlib.suppress(Exception):
+            db.rollback()
+        logger.warning(
+            "federation_batch_append_failed", count=len(items), error=str(exc)
+        )
+        return [
+            _append(db, activity_type=activity_type, federation_id=fid, obj=obj)
+            for fid, obj in items
+        ]
+    if sequences is None:
+        return skipped
+    return list(sequences)
+
+
 def publish_location_update(
     db: Session, location_id: str, *, source_type: str | None
 ) -> int | None:
@@ -153,6 +217,92 @@ def publish_location_update(
     )
 
 
+def publish_location_updates(
+    db: Session, location_ids: Iterable[str], *, source_type: str | None
+) -> list[int | None]:
+    """Append an ``Update`` for each of several just-committed locations.
+
+    Same guards and result as calling :func:`publish_location_update` per id,
+    but the publish gate and the aggregates are read in a fixed number of
+    queries for the whole batch (``build_location_aggregates``) and the
+    Updates are group-committed to the log (``_append_many``). If the batch
+    read fails — typically one id that is missing or fails conformance — it
+    falls back to the per-id path so that only the bad id is skipped.
+
+    Returns one sequence-or-``None`` per input id, in order. Never raises.
+    """
+    from app.core.config import settings
+
+    ids = [str(location_id) for location_id in location_ids]
+    skipped: list[int | None] = [None] * len(ids)
+    if not ids or not settings.FEDERATION_ENABLED:
+        return skipped
+    if source_type == FEDERATED_SOURCE_TYPE:  # §10 echo suppression
+        return skipped
+    host = _node_host()
+    if host is None or settings.FEDERATION_DID is None:
+        return skipped
+    try:
+        canonical = _canonical_ids(db, ids)  # publish gate
+        objs = build_location_aggregates(
+            db, [location_id for location_id in ids if location_id in canonical]
+        )
+    except Exception as exc:
+        with contextlib.suppress(Exception):
+            db.rollback()
+        logger.warning("federation_batch_aggregate_failed", error=str(exc))
+        return [
+            publish_location_update(db, location_id, source_type=source_type)
+            for location_id in ids
+        ]
+    publishable = [location_id for location_id in ids if location_id in objs]
+    sequences = dict(
+        zip(
+            publishable,
+            _append_many(
+                db,
+                activity_type="Update",
+                items=[
+                    (_canonical_fid(host, location_id), objs[location_id])
+                    for location_id in publishable
+                ],
+            ),
+            strict=True,
+        )
+    )
+    return [sequences.get(location_id) for location_id in ids]
+
+
+#: One indexed lookup against the path-compressed ``location_redirect`` table
+#: (init-scripts/21-location-redirect.sql): the dead id's pre-walked terminal,
+#: else the fallback survivor's, else the fallback survivor itself — kept only
+#: if that terminal is still canonical.
+_REDIRECT_TERMINAL_SQL = text(
+    """
+    SELECT l.id
+    FROM (
+        SELECT CASE
+            WHEN d.old_id IS NOT NULL THEN d.canonical_id
+            WHEN f.old_id IS NOT NULL THEN f.canonical_id
+            ELSE CAST(:fallback AS text)
+        END AS terminal_id
+        FROM (SELECT 1) AS one
+        LEFT JOIN location_redirect d ON d.old_id = :dead
+        LEFT JOIN location_redirect f ON f.old_id = CAST(:fallback AS text)
+    ) t
+    JOIN location l
+      ON l.id = t.terminal_id AND l.is_canonical IS DISTINCT FROM FALSE
+    """
+)
+
+
+def _redirect_table_exists(db: Session) -> bool:
+    return (
+        db.execute(text("SELECT to_regclass('public.location_redirect')")).scalar()
+        is not None
+    )
+
+
 def _load_soft_delete_chain(db: Session) -> dict[str, str]:
     """Build the dead->survivor map from ``dedup_run_audit`` (latest per dead).
 
@@ -184,10 +334,20 @@ def _resolve_terminal_survivor(
     terminal id only if it is still canonical; otherwise ``None`` (→ redirectTo
     null) on a cycle, excessive depth, or a non-canonical/missing terminal.
 
-    ``chain`` may be supplied pre-loaded (batch replay) to avoid an O(N^2)
-    full-table scan per Delete; otherwise it is loaded once here.
+    Where the ``location_redirect`` table exists (maintained transactionally by
+    the dedup scripts, path-compressed) this is one indexed lookup, and cycles
+    come back as a NULL terminal. Databases that predate it walk the
+    ``dedup_run_audit`` chain instead: ``chain`` may be supplied pre-loaded
+    (batch replay) to avoid an O(N^2) full-table scan per Delete; otherwise it
+    is loaded once here.
     """
     if chain is None:
+        if _redirect_table_exists(db):
+            row = db.execute(
+                _REDIRECT_TERMINAL_SQL,
+                {"dead": dead_id, "fallback": fallback_survivor_id},
+            ).first()
+            return str(row[0]) if row else None
         chain = _load_soft_delete_chain(db)
 
     def _walk(start: str) -> str | None:
@@ -286,7 +446,8 @@ def publish_pending_deletes(db: Session, deletes: list[tuple[str, str | None]])
     savepoints; an inline append (which commits) would fold that transaction and
     abort the run (Gauntlet CRITICAL). So the scripts COLLECT pairs during the run
     and call this once post-commit. The survivor chain is loaded ONCE here (not
-    per Delete — avoids the O(N^2) scan). Never raises (Principle XI).
+    per Delete — avoids the O(N^2) scan), and not at all where the
+    ``location_redirect`` index exists. Never raises (Principle XI).
 
     KNOWN CRASH WINDOW (documented, follow-on): the soft-delete is committed before
     this replay, so a process death (OOM/SIGKILL) between the commit and the append
@@ -300,7 +461,7 @@ def publish_pending_deletes(db: Session, deletes: list[tuple[str, str | None]])
     if not deletes:
         return
     try:
-        chain = _load_soft_delete_chain(db)
+        chain = None if _redirect_table_exists(db) else _load_soft_delete_chain(db)
     except Exception as exc:  # never raise post-commit into the dedup script
         with contextlib.suppress(Exception):
             db.rollback()
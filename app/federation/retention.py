@@ -9,6 +9,12 @@ reads below-floor leaves back from that tier — so root@N and consistency proof
 across the trim boundary stay valid forever, while ``/export`` serves only the
 live window (below the floor it 410s and points at the archive snapshot).
 
+Archived leaves start out as one loose object per sequence; once a full aligned
+run of :data:`SEGMENT_SIZE` leaves is below the floor the prune seals it into one
+segment carrying a sparse offset index and its precomputed subtree hashes, so a
+reader fetches an entry — or its in-segment audit path — with a single ranged
+read (``pread`` locally, an S3 ``Range`` GET on AWS) instead of whole objects.
+
 Dual-env (Principle XV): the archive tier is a bouy-mounted local filesystem path
 in Docker (``FEDERATION_ARCHIVE_BACKEND=file``) and an S3 bucket with no lifecycle
 expiry on AWS (``=s3``). One ``prune_to_horizon`` is shared by both the bouy worker
@@ -18,8 +24,11 @@ and the EventBridge-scheduled Lambda.
 from __future__ import annotations
 
 import os
+import struct
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
@@ -27,7 +36,7 @@ import structlog
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.federation import log
+from app.federation import log, merkle
 
 logger = structlog.get_logger(__name__)
 
@@ -51,50 +60,412 @@ class ArchiveBackend(Protocol):
         ...
 
 
-class LocalFsArchiveBackend:
-    """Filesystem archive (the Docker realization). One file per sequence; writes
-    are atomic (temp + ``os.replace``) so a crash mid-write never leaves a partial
-    leaf that would corrupt a read-back."""
+@runtime_checkable
+class SegmentedArchiveBackend(ArchiveBackend, Protocol):
+    """An archive that packs full runs of leaves into indexed segments."""
+
+    def seal(self, below: int) -> int:
+        """Pack every full segment lying entirely below sequence ``below``;
+        return how many were sealed."""
+        ...
+
+
+# --- Segments -----------------------------------------------------------------
+#
+# ``put`` stores one loose object per leaf, so the prune's write-ahead contract
+# is unchanged. Once a whole aligned run of ``SEGMENT_SIZE`` leaves is below the
+# live floor, ``seal`` packs it into ONE segment object and drops the loose
+# copies. Segment ``n`` holds sequences ``n*S+1 .. (n+1)*S`` — leaf indices
+# ``n*S .. (n+1)*S-1``, an aligned perfect subtree that is a node of every
+# RFC-6962 tree containing it. Layout (big-endian):
+#
+#     magic b"PPRSEG1\n" | first_sequence u64 | count u32 | stride u32
+#     offsets  (count/stride + 1) x u64   data offset of every stride-th leaf
+#                                         (the sparse index; last = data length)
+#     hashes   (2*count/stride - 1) x 32B subtree roots of each stride-leaf block,
+#                                         then each level above it, bottom-up;
+#                                         the last is the segment root
+#     data     count x (len u32 | preimage bytes)
+#
+# The header is read once per segment (one ranged read, then cached). After
+# that an entry costs ONE ranged read of its stride-leaf block, and so does its
+# in-segment audit path: the block is re-hashed for the lower levels and the
+# upper levels are already in the header.
+
+#: Leaves per sealed segment (a power of two, so a segment is a perfect subtree).
+SEGMENT_SIZE = 1024
+#: Leaves per sparse-index block (a power of two dividing ``SEGMENT_SIZE``).
+INDEX_STRIDE = 16
+
+_SEGMENT_MAGIC = b"PPRSEG1\n"
+_SEGMENT_PREAMBLE = struct.Struct(">8sQII")
+_LEAF_LEN = struct.Struct(">I")
+_HASH_LEN = 32
+
+
+def _is_power_of_two(n: int) -> bool:
+    return n > 0 and n & (n - 1) == 0
+
+
+def _check_geometry(segment_size: int, stride: int) -> None:
+    if not (_is_power_of_two(segment_size) and _is_power_of_two(stride)):
+        raise ValueError("segment size and index stride must be powers of two")
+    if stride > segment_size:
+        raise ValueError("index stride must not exceed the segment size")
+
+
+def segment_header_len(segment_size: int, stride: int) -> int:
+    """Byte length of a segment header for the given geometry."""
+    blocks = segment_size // stride
+    return _SEGMENT_PREAMBLE.size + 8 * (blocks + 1) + _HASH_LEN * (2 * blocks - 1)
+
+
+@dataclass(frozen=True)
+class SegmentHeader:
+    """A parsed segment header: the sparse offset index and subtree hashes."""
+
+    first_sequence: int
+    count: int
+    stride: int
+    offsets: tuple[int, ...]
+    #: ``levels[0]`` are the block roots; ``levels[-1] == (segment root,)``.
+    levels: tuple[tuple[bytes, ...], ...]
+
+    @property
+    def header_len(self) -> int:
+        return segment_header_len(self.count, self.stride)
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    def block_range(self, block: int) -> tuple[int, int]:
+        """``(start, length)`` of ``block``'s leaves within the segment object."""
+        start = self.offsets[block]
+        return self.header_len + start, self.offsets[block + 1] - start
+
+
+@dataclass(frozen=True)
+class SegmentProof:
+    """A leaf and the lower ``log2(count)`` hashes of its RFC-6962 audit path.
+
+    ``path`` proves ``leaf`` at index ``sequence - first_sequence`` in the
+    segment's perfect subtree with root ``root``
+    (``merkle.verify_inclusion(leaf, index, count, path, root)``); in any larger
+    tree the rest of the audit path continues above ``root``.
+    """
+
+    sequence: int
+    leaf: bytes
+    path: list[bytes]
+    root: bytes
+
+
+def encode_segment(first_sequence: int, leaves: list[bytes], stride: int) -> bytes:
+    """Serialize one full, aligned segment (header + length-prefixed leaves)."""
+    count = len(leaves)
+    _check_geometry(count, stride)
+    if (first_sequence - 1) % count:
+        raise ValueError(f"segment start {first_sequence} is not aligned to {count}")
+    offsets: list[int] = []
+    data = bytearray()
+    for i, leaf in enumerate(leaves):
+        if i % stride == 0:
+            offsets.append(len(data))
+        data += _LEAF_LEN.pack(len(leaf)) + leaf
+    offsets.append(len(data))
+
+    level = [
+        merkle.merkle_root(leaves[i : i + stride]) for i in range(0, count, stride)
+    ]
+    hashes = list(level)
+    while len(level) > 1:
+        level = [
+            merkle.node_hash(level[i], level[i + 1]) for i in range(0, len(level), 2)
+        ]
+        hashes.extend(level)
+    return b"".join(
+        (
+            _SEGMENT_PREAMBLE.pack(_SEGMENT_MAGIC, first_sequence, count, stride),
+            struct.pack(f">{len(offsets)}Q", *offsets),
+            *hashes,
+            data,
+        )
+    )
+
+
+def parse_segment_header(raw: bytes, segment_size: int, stride: int) -> SegmentHeader:
+    """Parse a header written by :func:`encode_segment` with this geometry.
+
+    Raises ``ValueError`` on a bad magic, a geometry mismatch or a short read.
+    """
+    if len(raw) < segment_header_len(segment_size, stride):
+        raise ValueError("truncated segment header")
+    magic, first, count, header_stride = _SEGMENT_PREAMBLE.unpack_from(raw)
+    if magic != _SEGMENT_MAGIC:
+        raise ValueError("not a federation log segment")
+    if (count, header_stride) != (segment_size, stride):
+        raise ValueError(
+            f"segment geometry {count}/{header_stride} != {segment_size}/{stride}"
+        )
+    blocks = count // stride
+    pos = _SEGMENT_PREAMBLE.size
+    offsets = struct.unpack_from(f">{blocks + 1}Q", raw, pos)
+    pos += 8 * (blocks + 1)
+    levels: list[tuple[bytes, ...]] = []
+    width = blocks
+    while width:
+        end = pos + width * _HASH_LEN
+        levels.append(tuple(raw[i : i + _HASH_LEN] for i in range(pos, end, _HASH_LEN)))
+        pos = end
+        width //= 2
+    return SegmentHeader(first, count, stride, offsets, tuple(levels))
+
+
+def _decode_block(raw: bytes) -> list[bytes]:
+    """Split a block's ``len | bytes`` records back into leaves."""
+    leaves: list[bytes] = []
+    pos = 0
+    while pos < len(raw):
+        (size,) = _LEAF_LEN.unpack_from(raw, pos)
+        pos += _LEAF_LEN.size
+        if pos + size > len(raw):
+            raise ValueError("truncated segment block")
+        leaves.append(bytes(raw[pos : pos + size]))
+        pos += size
+    return leaves
+
+
+class _SegmentedArchive(ABC):
+    """Loose-leaf + sealed-segment logic shared by the archive backends.
+
+    Subclasses supply the storage primitives (``_put_leaf`` / ``_get_leaf`` /
+    ``_has_leaf`` / ``_delete_leaf`` and ``_put_segment`` / ``_read_segment`` /
+    ``_has_segment``); a backend missing one cannot be instantiated.
+    ``reads`` / ``bytes_read`` count ranged segment reads.
+    """
 
-    def __init__(self, root: str) -> None:
+    segment_size: int = SEGMENT_SIZE
+    index_stride: int = INDEX_STRIDE
+    reads: int = 0
+    bytes_read: int = 0
+
+    def _set_geometry(self, segment_size: int | None, index_stride: int | None) -> None:
+        # Resolved at construction (not as defaults) so the module constants stay
+        # the single source of truth for resolve_archive_backend().
+        self.segment_size = segment_size or SEGMENT_SIZE
+        self.index_stride = index_stride or INDEX_STRIDE
+        _check_geometry(self.segment_size, self.index_stride)
+
+    @abstractmethod
+    def _put_leaf(self, sequence: int, preimage: bytes) -> None: ...
+
+    @abstractmethod
+    def _get_leaf(self, sequence: int) -> bytes: ...
+
+    @abstractmethod
+    def _has_leaf(self, sequence: int) -> bool: ...
+
+    @abstractmethod
+    def _delete_leaf(self, sequence: int) -> None: ...
+
+    @abstractmethod
+    def _put_segment(self, index: int, data: bytes) -> None: ...
+
+    @abstractmethod
+    def _read_segment(self, index: int, start: int, length: int) -> bytes: ...
+
+    @abstractmethod
+    def _has_segment(self, index: int) -> bool: ...
+
+    @cached_property
+    def _headers(self) -> dict[int, SegmentHeader | None]:
+        return {}
+
+    @cached_property
+    def _last_block(self) -> dict[tuple[int, int], list[bytes]]:
+        return {}
+
+    def _segment_of(self, sequence: int) -> int:
+        return (sequence - 1) // self.segment_size
+
+    def _ranged_read(self, index: int, start: int, length: int) -> bytes:
+        raw = self._read_segment(index, start, length)
+        if len(raw) != length:
+            raise ValueError(f"short read from segment {index}")
+        self.reads += 1
+        self.bytes_read += length
+        return raw
+
+    def _header(self, index: int) -> SegmentHeader | None:
+        if index not in self._headers:
+            header = None
+            if self._has_segment(index):
+                raw = self._ranged_read(
+                    index, 0, segment_header_len(self.segment_size, self.index_stride)
+                )
+                header = parse_segment_header(raw, self.segment_size, self.index_stride)
+            self._headers[index] = header
+        return self._headers[index]
+
+    def _block(self, header: SegmentHeader, sequence: int) -> list[bytes]:
+        index = self._segment_of(sequence)
+        block = (sequence - header.first_sequence) // header.stride
+        key = (index, block)
+        if key not in self._last_block:
+            leaves = _decode_block(self._ranged_read(index, *header.block_range(block)))
+            # One-slot cache: sequential reads (leaf_data) hit each block once.
+            self._last_block.clear()
+            self._last_block[key] = leaves
+        return self._last_block[key]
+
+    def put(self, sequence: int, preimage: bytes) -> None:
+        self._put_leaf(sequence, preimage)
+
+    def get(self, sequence: int) -> bytes:
+        header = self._header(self._segment_of(sequence))
+        if header is None:
+            return self._get_leaf(sequence)
+        return self._block(header, sequence)[
+            (sequence - header.first_sequence) % header.stride
+        ]
+
+    def has(self, sequence: int) -> bool:
+        return self._header(self._segment_of(sequence)) is not None or self._has_leaf(
+            sequence
+        )
+
+    def segment_proof(self, sequence: int) -> SegmentProof | None:
+        """``sequence``'s leaf and in-segment audit path, or ``None`` if its
+        segment is not sealed. One ranged read once the header is cached."""
+        header = self._header(self._segment_of(sequence))
+        if header is None:
+            return None
+        leaves = self._block(header, sequence)
+        position = sequence - header.first_sequence
+        path = merkle.inclusion_proof(leaves, position % header.stride)
+        node = position // header.stride
+        for level in header.levels[:-1]:
+            path.append(level[node ^ 1])
+            node //= 2
+        return SegmentProof(
+            sequence=sequence,
+            leaf=leaves[position % header.stride],
+            path=path,
+            root=header.root,
+        )
+
+    def seal(self, below: int) -> int:
+        """Pack every full, not-yet-sealed segment lying entirely below sequence
+        ``below`` (the live floor). Write-ahead like the prune: the segment is
+        stored durably BEFORE its loose leaves are deleted, and ``get`` prefers
+        the segment, so a crash in between only leaves redundant loose copies.
+        Segments are sealed in order, so the scan stops at the first sealed one.
+        """
+        pending: list[int] = []
+        index = (below - 1) // self.segment_size - 1
+        while index >= 0 and not self._has_segment(index):
+            pending.append(index)
+            index -= 1
+        for index in reversed(pending):
+            first = index * self.segment_size + 1
+            sequences = range(first, first + self.segment_size)
+            data = encode_segment(
+                first, [self._get_leaf(seq) for seq in sequences], self.index_stride
+            )
+            self._put_segment(index, data)
+            self._headers.pop(index, None)
+            for seq in sequences:
+                self._delete_leaf(seq)
+        return len(pending)
+
+
+class LocalFsArchiveBackend(_SegmentedArchive):
+    """Filesystem archive (the Docker realization). One file per loose sequence
+    plus ``segments/<size>/<n>.seg`` per sealed segment, read with ``pread``.
+    Writes are atomic (temp + ``os.replace``) so a crash mid-write never leaves
+    a partial leaf or segment that would corrupt a read-back."""
+
+    def __init__(
+        self,
+        root: str,
+        *,
+        segment_size: int | None = None,
+        index_stride: int | None = None,
+    ) -> None:
+        self._set_geometry(segment_size, index_stride)
         self._root = Path(root)
         self._root.mkdir(parents=True, exist_ok=True)
+        self._segments = self._root / "segments" / str(self.segment_size)
+        self._segments.mkdir(parents=True, exist_ok=True)
 
     def _path(self, sequence: int) -> Path:
         return self._root / f"{sequence}.jsonl"
 
-    def put(self, sequence: int, preimage: bytes) -> None:
-        path = self._path(sequence)
-        tmp = path.with_suffix(".jsonl.tmp")
+    def _segment_path(self, index: int) -> Path:
+        return self._segments / f"{index}.seg"
+
+    @staticmethod
+    def _write_durably(path: Path, data: bytes) -> None:
+        tmp = path.with_name(path.name + ".tmp")
         with open(tmp, "wb") as fh:
-            fh.write(preimage)
+            fh.write(data)
             fh.flush()
             os.fsync(fh.fileno())
         os.replace(tmp, path)
         # fsync the directory so the RENAME (not just the file content) is durable
         # before put() returns — prune_to_horizon DELETEs the live row trusting this
         # put as proof of durability, so a crash here must not lose the rename.
-        dir_fd = os.open(str(self._root), os.O_RDONLY)
+        dir_fd = os.open(str(path.parent), os.O_RDONLY)
         try:
             os.fsync(dir_fd)
         finally:
             os.close(dir_fd)
 
-    def get(self, sequence: int) -> bytes:
+    def _put_leaf(self, sequence: int, preimage: bytes) -> None:
+        self._write_durably(self._path(sequence), preimage)
+
+    def _get_leaf(self, sequence: int) -> bytes:
         return self._path(sequence).read_bytes()
 
-    def has(self, sequence: int) -> bool:
+    def _has_leaf(self, sequence: int) -> bool:
         return self._path(sequence).is_file()
 
+    def _delete_leaf(self, sequence: int) -> None:
+        self._path(sequence).unlink(missing_ok=True)
+
+    def _put_segment(self, index: int, data: bytes) -> None:
+        self._write_durably(self._segment_path(index), data)
+
+    def _read_segment(self, index: int, start: int, length: int) -> bytes:
+        fd = os.open(str(self._segment_path(index)), os.O_RDONLY)
+        try:
+            return os.pread(fd, length, start)
+        finally:
+            os.close(fd)
+
+    def _has_segment(self, index: int) -> bool:
+        return self._segment_path(index).is_file()
 
-class S3ArchiveBackend:
-    """S3 archive (the AWS realization). The bucket MUST have no lifecycle expiry
-    (§6.2g: never destroyed). ``boto3`` is imported lazily so the slim read Lambda
-    and local Docker do not pay for it unless this backend is selected."""
 
-    def __init__(self, bucket: str, prefix: str = "federation-log-archive") -> None:
+class S3ArchiveBackend(_SegmentedArchive):
+    """S3 archive (the AWS realization). The bucket MUST have no lifecycle expiry
+    (§6.2g: never destroyed). Sealed segments live under
+    ``<prefix>/segments/<size>/<n>.seg`` and are read with ``Range`` GETs.
+    ``boto3`` is imported lazily so the slim read Lambda and local Docker do not
+    pay for it unless this backend is selected."""
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "federation-log-archive",
+        *,
+        segment_size: int | None = None,
+        index_stride: int | None = None,
+    ) -> None:
         import boto3
 
+        self._set_geometry(segment_size, index_stride)
         self._bucket = bucket
         self._prefix = prefix.rstrip("/")
         self._s3 = boto3.client("s3")
@@ -102,18 +473,14 @@ class S3ArchiveBackend:
     def _key(self, sequence: int) -> str:
         return f"{self._prefix}/{sequence}.jsonl"
 
-    def put(self, sequence: int, preimage: bytes) -> None:
-        self._s3.put_object(Bucket=self._bucket, Key=self._key(sequence), Body=preimage)
-
-    def get(self, sequence: int) -> bytes:
-        resp = self._s3.get_object(Bucket=self._bucket, Key=self._key(sequence))
-        return resp["Body"].read()
+    def _segment_key(self, index: int) -> str:
+        return f"{self._prefix}/segments/{self.segment_size}/{index}.seg"
 
-    def has(self, sequence: int) -> bool:
+    def _exists(self, key: str) -> bool:
         from botocore.exceptions import ClientError
 
         try:
-            self._s3.head_object(Bucket=self._bucket, Key=self._key(sequence))
+            self._s3.head_object(Bucket=self._bucket, Key=key)
             return True
         except ClientError as exc:
             # Only a genuine 404 means "absent". A transient/permission error must
@@ -125,6 +492,35 @@ class S3ArchiveBackend:
                 return False
             raise
 
+    def _put_leaf(self, sequence: int, preimage: bytes) -> None:
+        self._s3.put_object(Bucket=self._bucket, Key=self._key(sequence), Body=preimage)
+
+    def _get_leaf(self, sequence: int) -> bytes:
+        resp = self._s3.get_object(Bucket=self._bucket, Key=self._key(sequence))
+        return resp["Body"].read()
+
+    def _has_leaf(self, sequence: int) -> bool:
+        return self._exists(self._key(sequence))
+
+    def _delete_leaf(self, sequence: int) -> None:
+        self._s3.delete_object(Bucket=self._bucket, Key=self._key(sequence))
+
+    def _put_segment(self, index: int, data: bytes) -> None:
+        self._s3.put_object(
+            Bucket=self._bucket, Key=self._segment_key(index), Body=data
+        )
+
+    def _read_segment(self, index: int, start: int, length: int) -> bytes:
+        resp = self._s3.get_object(
+            Bucket=self._bucket,
+            Key=self._segment_key(index),
+            Range=f"bytes={start}-{start + length - 1}",
+        )
+        return resp["Body"].read()
+
+    def _has_segment(self, index: int) -> bool:
+        return self._exists(self._segment_key(index))
+
 
 def resolve_archive_backend() -> ArchiveBackend | None:
     """The configured archive tier, or ``None`` when unconfigured (pre-prune
@@ -165,8 +561,10 @@ def prune_to_horizon(
     an archive-put failure the prune halts at that sequence (no leaf loss, no wedge —
     the still-live rows are returned by visibility on the next run). The live window
     keeps a contiguous-suffix shape, so ``retention_horizon_sequence`` (= the new
-    ``live_window_floor``) is well-defined. No-op when federation is disabled
-    (kill switch §6.2d) or when nothing is older than the SLA.
+    ``live_window_floor``) is well-defined. Full segments below the new floor are
+    then sealed; a seal failure is only logged (the loose leaves stay readable).
+    No-op when federation is disabled (kill switch §6.2d) or when nothing is older
+    than the SLA.
     """
     from app.core.config import settings
 
@@ -215,9 +613,16 @@ def prune_to_horizon(
         session.commit()
 
     horizon = log.live_window_floor(session)
+    sealed = 0
+    if isinstance(backend, SegmentedArchiveBackend) and horizon > 1:
+        try:
+            sealed = backend.seal(horizon)
+        except Exception as exc:  # noqa: BLE001 — loose leaves stay readable
+            logger.warning("federation_archive_seal_failed", error=str(exc))
     logger.info(
         "federation_archive_tiered",
         archived_count=len(archived),
         retention_horizon_sequence=horizon,
+        sealed_segments=sealed,
     )
     return PruneResult(len(archived), horizon)
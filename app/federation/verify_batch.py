@@ -0,0 +1,133 @@
+"""Batch verification of federation envelopes across a process pool.
+
+Ingesting or auditing a peer's export means checking every envelope with
+:func:`app.federation.envelope.verify_envelope`: two JCS canonicalizations, two
+SHA-256s and one Ed25519 verify each. All of it is pure CPU work that holds the
+GIL, so :func:`verify_envelopes` splits a page into chunks and hands them to a
+process pool, one chunk per task, and returns the results in input order.
+
+The verdicts are exactly those of ``verify_envelope`` — the per-envelope checks
+are not re-implemented here, so the batch path cannot drift from the serial
+one. ``cryptography`` exposes no batch Ed25519 verification (and RFC 8032 batch
+verification is not guaranteed to agree with single verification on
+adversarial signatures), so each signature is still verified on its own; the
+speed-up comes from running the workers on separate cores.
+
+The trust anchor crosses the process boundary as its ``publicKeyMultibase``
+string. Each process resolves it once through
+:func:`app.federation.identity.public_key_from_multibase` and keeps the parsed
+key in :func:`resolve_public_key`'s cache, so a page (or a whole export) signed
+by one node decodes its key once per worker, not once per envelope.
+
+A page smaller than ``min_parallel`` — or ``workers=1`` — is verified in the
+calling process: pickling a handful of envelopes costs more than it saves.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from app.federation.envelope import verify_envelope
+from app.federation.identity import public_key_from_multibase
+
+#: Envelopes per pool task. Large enough to amortize pickling and task dispatch,
+#: small enough that a page still spreads over every worker.
+DEFAULT_CHUNK_SIZE = 256
+#: Pages smaller than this are verified serially in the calling process.
+DEFAULT_MIN_PARALLEL = 512
+
+
+@lru_cache(maxsize=64)
+def resolve_public_key(public_key_multibase: str) -> Ed25519PublicKey:
+    """Parse a ``publicKeyMultibase`` once per process.
+
+    Raises ``ValueError`` on a malformed key, exactly like
+    ``identity.public_key_from_multibase`` (failures are not cached).
+    """
+    return public_key_from_multibase(public_key_multibase)
+
+
+def _verify_chunk(
+    public_key_multibase: str, envelopes: Sequence[dict[str, Any]]
+) -> list[bool]:
+    """Pool task: verify one chunk under the (cached) resolved key."""
+    public_key = resolve_public_key(public_key_multibase)
+    return [verify_envelope(env, public_key) for env in envelopes]
+
+
+def default_workers() -> int:
+    """Worker count for a pool the caller does not supply: the usable cores."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def make_pool(workers: int | None = None) -> ProcessPoolExecutor:
+    """A verification pool to reuse across pages.
+
+    Uses the ``spawn`` start method: callers run inside threaded/async services,
+    where forking a live interpreter is unsafe.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers or default_workers(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def verify_envelopes(
+    envelopes: Sequence[dict[str, Any]],
+    public_key_multibase: str,
+    *,
+    executor: Executor | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_parallel: int = DEFAULT_MIN_PARALLEL,
+) -> list[bool]:
+    """``[verify_envelope(env, key) for env in envelopes]``, across processes.
+
+    ``public_key_multibase`` is the signing node's ``publicKeyMultibase`` (as
+    published in its DID document); it is resolved once up front, so a
+    malformed key raises ``ValueError`` here rather than inside the pool.
+
+    Pass ``executor`` (e.g. from :func:`make_pool`) to reuse one pool across
+    pages; otherwise a pool of ``workers`` processes (default: the usable
+    cores) is created for this call and shut down afterwards. Like
+    ``verify_envelope``, a malformed envelope yields ``False`` — it never
+    raises.
+    """
+    public_key = resolve_public_key(public_key_multibase)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if executor is None and workers is None:
+        workers = default_workers()
+    if len(envelopes) < min_parallel or (executor is None and workers == 1):
+        return [verify_envelope(env, public_key) for env in envelopes]
+
+    chunks = [
+        envelopes[offset : offset + chunk_size]
+        for offset in range(0, len(envelopes), chunk_size)
+    ]
+    if executor is not None:
+        return _map_chunks(executor, public_key_multibase, chunks)
+    with make_pool(workers) as pool:
+        return _map_chunks(pool, public_key_multibase, chunks)
+
+
+def _map_chunks(
+    executor: Executor,
+    public_key_multibase: str,
+    chunks: list[Sequence[dict[str, Any]]],
+) -> list[bool]:
+    results: list[bool] = []
+    for verdicts in executor.map(
+        _verify_chunk, [public_key_multibase] * len(chunks), chunks
+    ):
+        results.extend(verdicts)
+    return results
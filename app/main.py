@@ -13,6 +13,7 @@ from app.federation.routes_public import register_federation_public_routes
 from app.middleware.correlation import CorrelationMiddleware
 from app.middleware.errors import ErrorHandlingMiddleware
 from app.middleware.metrics import MetricsMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
 from app.middleware.security import SecurityHeadersMiddleware
 
 # Load settings
@@ -36,7 +37,10 @@ app = FastAPI(
 # 4. Metrics (tracks all requests)
 # 3. Correlation (adds request ID)
 # 2. Security headers
-# 1. CORS (innermost — handles preflight)
+# 1. CORS (handles preflight)
+# 0. Response cache (innermost — so CORS, security and request-ID headers are
+#    applied per request rather than stored with the cached body)
+app.add_middleware(ResponseCacheMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -0,0 +1,389 @@
+"""Conditional-GET response cache for the public read endpoints.
+
+Identical GETs against /locations, /organizations, /map, /consumer and the
+PTF partner feed (CDN misses, polling clients) used to recompute the same
+response every time. This middleware keys each cacheable GET on
+(origin, path, normalized query string, data version), where the origin is
+the scheme, host and root path the client used (paginated responses embed
+absolute links built from it) and the data version is
+the summed ``beacon_sync_state.change_seq`` — bumped once per committing
+transaction that writes any table those endpoints read (init-scripts/20
+and 23). So:
+
+* a request whose ``If-None-Match`` matches the current ETag gets a 304
+  without running the route;
+* a repeat request with no data change in between is served from the
+  cache backend;
+* any reconciler commit moves the version, which changes every key, so
+  stale entries are simply never looked up again and age out by TTL/LRU.
+
+Backends are pluggable: ``InMemoryResponseCache`` (per process, the
+default) or ``RedisResponseCache`` (shared across API workers). Routes that
+manage their own ETag (Beacon, PTF /sync) and anything whose response
+depends on the caller rather than the URL are left alone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol, cast
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request, Response
+from sqlalchemy import text
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import StreamingResponse
+from starlette.types import ASGIApp
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger()
+
+VersionSource = Callable[[], Awaitable[str | None]]
+
+# Path prefixes (below settings.api_prefix) whose GET responses depend only
+# on the URL and the data.
+CACHEABLE_PREFIXES = (
+    "/locations",
+    "/organizations",
+    "/services",
+    "/service-at-location",
+    "/map",
+    "/consumer",
+    "/partners/ptf",
+)
+
+# Caller-dependent (geolocate), self-ETagged (PTF /sync) or bulk exports.
+EXCLUDED_PREFIXES = (
+    "/map/geolocate",
+    "/partners/ptf/sync",
+    "/locations/export",
+)
+
+_VERSION_SQL = "SELECT COALESCE(SUM(change_seq), 0) FROM beacon_sync_state"
+
+# Response headers that belong to one exchange rather than the resource.
+_PER_REQUEST_HEADERS = frozenset(
+    {"content-length", "date", "etag", "x-cache", "x-request-id"}
+)
+
+
+class ResponseCacheBackend(Protocol):
+    """Storage for serialized responses."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None: ...
+
+
+class InMemoryResponseCache:
+    """Per-process LRU of serialized responses with a TTL.
+
+    Bounded by the total size of the stored responses, so the memory a
+    worker (or Lambda container) spends on it is capped at ``max_bytes``
+    however large individual responses are.
+    """
+
+    def __init__(self, max_bytes: int = 64_000_000):
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """Total bytes currently stored."""
+        return self._size
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self._discard(key)
+        if len(value) > self._max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._size += len(value)
+        while self._size > self._max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class RedisResponseCache:
+    """Response cache shared by every API worker through Redis.
+
+    Fails open: a Redis error is logged and treated as a miss, so an outage
+    only costs the cache, never the request.
+    """
+
+    def __init__(self, client: Any, prefix: str = "api-response:"):
+        self._client = client
+        self._prefix = prefix
+
+    @classmethod
+    def from_settings(cls) -> RedisResponseCache:
+        # Imported here: the Lambda API image doesn't ship redis and uses the
+        # in-memory backend.
+        from redis import asyncio as aioredis
+
+        return cls(
+            aioredis.from_url(
+                settings.REDIS_URL, max_connections=settings.REDIS_POOL_SIZE
+            )
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            value = await self._client.get(self._prefix + key)
+        except Exception as e:
+            logger.warning("response_cache_redis_get_failed", error=str(e))
+            return None
+        return bytes(value) if value is not None else None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        try:
+            await self._client.set(self._prefix + key, value, ex=ttl_seconds)
+        except Exception as e:
+            logger.warning("response_cache_redis_set_failed", error=str(e))
+
+
+def create_backend() -> ResponseCacheBackend:
+    """Build the backend selected by RESPONSE_CACHE_BACKEND."""
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisResponseCache.from_settings()
+    return InMemoryResponseCache(max_bytes=settings.RESPONSE_CACHE_MAX_BYTES)
+
+
+class DataVersion:
+    """The summed ``beacon_sync_state.change_seq``, memoized briefly.
+
+    Re-reading the counter on every request would cost a round trip per hit,
+    so it is held for ``ttl_seconds``; a commit becomes visible to the cache
+    at most that much later. Returns None (cache bypassed) when no database
+    is configured, as in tests, or the lookup fails.
+    """
+
+    def __init__(self, ttl_seconds: float = 1.0):
+        self._ttl_seconds = ttl_seconds
+        self._value: str | None = None
+        self._expires_at = 0.0
+
+    async def __call__(self) -> str | None:
+        now = time.monotonic()
+        if now < self._expires_at:
+            return self._value
+        self._value = await self._fetch()
+        self._expires_at = now + self._ttl_seconds
+        return self._value
+
+    async def _fetch(self) -> str | None:
+        from app.core import db
+
+        db._initialize_database()
+        if db.async_session_factory is None:
+            return None
+        try:
+            async with db.async_session_factory() as session:
+                result = await session.execute(text(_VERSION_SQL))
+                value = result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning("response_cache_version_lookup_failed", error=str(e))
+            return None
+        return None if value is None else str(value)
+
+
+def cache_key(path: str, query_string: str, version: str, origin: str = "") -> str:
+    """Key for a request: origin + path + sorted query params + data version."""
+    params = sorted(parse_qsl(query_string, keep_blank_values=True))
+    raw = f"{origin}{path}?{urlencode(params)}#{version}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _origin(request: Request) -> str:
+    # Pagination links are absolute (str(request.url)), so a body rendered
+    # for one host must never be replayed to another.
+    root_path = request.scope.get("root_path", "")
+    return f"{request.url.scheme}://{request.url.netloc}{root_path}"
+
+
+def _etag(version: str, key: str) -> str:
+    return f'"v{version}-{key[:16]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _serialize(response: Response, body: bytes) -> bytes:
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name not in _PER_REQUEST_HEADERS
+    }
+    meta = json.dumps({"status": response.status_code, "headers": headers})
+    return meta.encode() + b"\n" + body
+
+
+def _deserialize(entry: bytes) -> tuple[int, dict[str, str], bytes]:
+    meta, _, body = entry.partition(b"\n")
+    parsed = json.loads(meta)
+    return parsed["status"], parsed["headers"], body
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware answering repeat GETs from a version-keyed response cache.
+
+    Sets ``ETag`` and ``X-Cache: HIT|MISS`` on every response it manages.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: ResponseCacheBackend | None = None,
+        version_source: VersionSource | None = None,
+        enabled: bool | None = None,
+        api_prefix: str | None = None,
+        ttl_seconds: int | None = None,
+        max_body_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize middleware.
+
+        Args:
+        ----
+            app: The ASGI application
+            backend: Cache storage; defaults to RESPONSE_CACHE_BACKEND
+            version_source: Returns the current data version, or None to
+                bypass the cache; defaults to beacon_sync_state.change_seq
+            enabled: Overrides RESPONSE_CACHE_ENABLED
+            api_prefix: Overrides settings.api_prefix
+            ttl_seconds: Overrides RESPONSE_CACHE_TTL_SECONDS
+            max_body_bytes: Overrides RESPONSE_CACHE_MAX_BODY_BYTES
+        """
+        super().__init__(app)
+        self.enabled = settings.RESPONSE_CACHE_ENABLED if enabled is None else enabled
+        self.backend = backend or create_backend()
+        self.version_source = version_source or DataVersion()
+        prefix = settings.api_prefix if api_prefix is None else api_prefix
+        self.cacheable = tuple(prefix + p for p in CACHEABLE_PREFIXES)
+        self.excluded = tuple(prefix + p for p in EXCLUDED_PREFIXES)
+        self.ttl_seconds = ttl_seconds or settings.RESPONSE_CACHE_TTL_SECONDS
+        self.max_body_bytes = (
+            settings.RESPONSE_CACHE_MAX_BODY_BYTES
+            if max_body_bytes is None
+            else max_body_bytes
+        )
+
+    def _is_cacheable_request(self, request: Request) -> bool:
+        path = request.url.path
+        return (
+            self.enabled
+            and request.method in ("GET", "HEAD")
+            and path.startswith(self.cacheable)
+            and not path.startswith(self.excluded)
+            and "no-cache" not in request.headers.get("cache-control", "")
+        )
+
+    def _is_storable(self, response: Response) -> bool:
+        if response.status_code != 200 or "etag" in response.headers:
+            return False
+        if "set-cookie" in response.headers:
+            return False
+        cache_control = response.headers.get("cache-control", "")
+        if "no-store" in cache_control or "private" in cache_control:
+            return False
+        length = response.headers.get("content-length")
+        return length is not None and int(length) <= self.max_body_bytes
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """
+        Serve from cache or run the route and store its response.
+
+        Args:
+        ----
+            request: The incoming request
+            call_next: The next middleware/handler
+
+        Returns:
+        -------
+            The response
+        """
+        if not self._is_cacheable_request(request):
+            return await call_next(request)
+
+        version = await self.version_source()
+        if version is None:
+            return await call_next(request)
+
+        key = cache_key(
+            request.url.path, request.url.query, version, origin=_origin(request)
+        )
+        etag = _etag(version, key)
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        entry = await self.backend.get(key)
+        if entry is not None:
+            status, headers, body = _deserialize(entry)
+            response = Response(content=body, status_code=status, headers=headers)
+            response.headers["ETag"] = etag
+            response.headers["X-Cache"] = "HIT"
+            return response
+
+        response = await call_next(request)
+        if request.method != "GET" or not self._is_storable(response):
+            return response
+
+        # call_next always returns a streaming response
+        body_iterator = cast(StreamingResponse, response).body_iterator
+        body = b"".join(
+            [
+                chunk.encode() if isinstance(chunk, str) else bytes(chunk)
+                async for chunk in body_iterator
+            ]
+        )
+        await self.backend.set(key, _serialize(response, body), self.ttl_seconds)
+
+        cached = Response(
+            content=body,
+            status_code=response.status_code,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name != "content-length"
+            },
+            background=response.background,
+        )
+        cached.headers["ETag"] = etag
+        cached.headers["X-Cache"] = "MISS"
+        return cached
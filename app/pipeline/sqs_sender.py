@@ -19,7 +19,7 @@ import threading
 import time
 import uuid
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 import structlog
 
@@ -44,6 +44,9 @@ _RETRYABLE_ERROR_CODES = frozenset(
     }
 )
 
+# SendMessageBatch accepts at most this many entries per call
+_MAX_BATCH_SIZE = 10
+
 # Module-level SQS client cache with thread safety
 _sqs_client: Any = None
 _sqs_client_lock = threading.Lock()
@@ -161,6 +164,112 @@ def send_to_sqs(
     raise RuntimeError("Unexpected retry loop exit")
 
 
+class SqsMessage(NamedTuple):
+    """One message for send_batch_to_sqs."""
+
+    body: dict[str, Any]
+    message_group_id: str = "default"
+    deduplication_id: str | None = None
+
+
+def send_batch_to_sqs(
+    queue_url: str,
+    messages: list[SqsMessage],
+    source: str = "pipeline",
+) -> list[str | None]:
+    """Send messages to an SQS queue, up to 10 per SendMessageBatch call.
+
+    Each message gets the same envelope and FIFO attributes as send_to_sqs.
+    A failed call is retried like send_to_sqs; entries SQS rejects within a
+    successful call are logged and reported as None.
+
+    Args:
+        queue_url: Full SQS queue URL
+        messages: Messages to send
+        source: Source service name for tracing
+
+    Returns:
+        SQS message ID for each message, in order (None where rejected)
+
+    Raises:
+        ValueError: If queue_url is empty
+    """
+    if not queue_url:
+        raise ValueError("queue_url is required")
+
+    sqs = _get_sqs_client()
+    fifo = queue_url.endswith(".fifo")
+    message_ids: list[str | None] = [None] * len(messages)
+
+    for start in range(0, len(messages), _MAX_BATCH_SIZE):
+        entries = []
+        for index in range(start, min(start + _MAX_BATCH_SIZE, len(messages))):
+            message = messages[index]
+            job_id = message.body.get("job_id", str(uuid.uuid4()))
+            envelope = {
+                "job_id": job_id,
+                "data": message.body,
+                "source": source,
+                "enqueued_at": datetime.now(UTC).isoformat(),
+            }
+            entry = {
+                "Id": str(index),
+                "MessageBody": json.dumps(envelope, default=str),
+            }
+            if fifo:
+                entry["MessageDeduplicationId"] = message.deduplication_id or job_id
+                entry["MessageGroupId"] = message.message_group_id
+            entries.append(entry)
+
+        response = _send_batch_with_retry(sqs, queue_url, entries)
+        for sent in response.get("Successful", []):
+            message_ids[int(sent["Id"])] = sent["MessageId"]
+        for failed in response.get("Failed", []):
+            logger.error(
+                "sqs_batch_entry_failed",
+                queue_url=queue_url,
+                entry_index=int(failed["Id"]),
+                code=failed.get("Code"),
+                error=failed.get("Message"),
+                source=source,
+            )
+
+    sent_count = sum(1 for message_id in message_ids if message_id)
+    logger.info(
+        "sqs_batch_sent",
+        queue_url=queue_url,
+        sent=sent_count,
+        failed=len(messages) - sent_count,
+        source=source,
+    )
+    return message_ids
+
+
+def _send_batch_with_retry(
+    sqs: Any, queue_url: str, entries: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """One SendMessageBatch call, retried on transient errors."""
+    for attempt in range(_MAX_RETRIES + 1):
+        try:
+            return sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        except Exception as e:
+            if not _is_retryable(e) or attempt == _MAX_RETRIES:
+                raise
+
+            delay = _BASE_DELAY * (_BACKOFF_FACTOR**attempt)
+            logger.warning(
+                "sqs_send_batch_retrying",
+                queue_url=queue_url,
+                entries=len(entries),
+                attempt=attempt + 1,
+                max_retries=_MAX_RETRIES,
+                delay=delay,
+                error=str(e),
+            )
+            time.sleep(delay)
+    raise RuntimeError("Unexpected retry loop exit")
+
+
 def _is_retryable(exc: Exception) -> bool:
     """Check whether an exception is a transient AWS error worth retrying.
 
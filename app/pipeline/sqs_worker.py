@@ -29,6 +29,7 @@ import signal
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
 import structlog
@@ -128,6 +129,8 @@ class PipelineWorker:
         wait_time_seconds: Long polling wait time (0-20)
         visibility_timeout: SQS visibility timeout in seconds
         max_consecutive_errors: Max errors before shutdown
+        concurrency: Messages from one poll processed in parallel threads
+            (1 = one at a time). process_fn must be thread-safe when > 1.
     """
 
     def __init__(
@@ -140,6 +143,7 @@ class PipelineWorker:
         wait_time_seconds: int = 20,
         visibility_timeout: int = 300,
         max_consecutive_errors: int = 10,
+        concurrency: int = 1,
     ) -> None:
         # C3: Validate queue URLs at startup (fail fast)
         if not queue_url:
@@ -156,6 +160,7 @@ class PipelineWorker:
         self.wait_time_seconds = wait_time_seconds
         self.visibility_timeout = visibility_timeout
         self.max_consecutive_errors = max_consecutive_errors
+        self.concurrency = max(1, concurrency)
 
         self._running = False
         self._shutdown_requested = False
@@ -388,6 +393,17 @@ class PipelineWorker:
                     )
                     continue
 
+                if self.concurrency > 1 and len(messages) > 1:
+                    with ThreadPoolExecutor(
+                        max_workers=min(self.concurrency, len(messages))
+                    ) as pool:
+                        outcomes = list(
+                            pool.map(self._process_single_message, messages)
+                        )
+                    processed_count += sum(outcomes)
+                    failed_count += len(outcomes) - sum(outcomes)
+                    continue
+
                 for message in messages:
                     if self._shutdown_requested:
                         logger.info(
@@ -1311,6 +1311,7 @@ class JobProcessor:
             # fail-soft, so it can never abort the (already-succeeded) job.
             if "location" in data:
                 location_commit_handler.publish_pending_updates()
+                location_commit_handler.refresh_ptf_clusters()
 
             # Update success metric and return result
             scraper_id = job_result.job.metadata.get("scraper_id", "unknown")
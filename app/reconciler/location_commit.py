@@ -165,27 +165,50 @@ class LocationCommitHandler:
         self.committed_location_ids.append(location_id)
         return location_id
 
-    def _publish_federation_update(self, location_id: uuid.UUID) -> None:
-        """Append a federation-log ``Update`` for a committed canonical location
-        (kill-switch / echo / gate / fail-soft all inside the guarded
-        ``publish_location_update``). Called AFTER the resource commit — including
-        the schedule write — so the published aggregate is complete and the append
-        never folds the caller's transaction."""
-        from app.federation.publish import publish_location_update
-
-        publish_location_update(
-            self.db,
-            str(location_id),
-            source_type=self.metadata.get("source_type"),
-        )
-
     def publish_pending_updates(self) -> None:
         """Publish a federation Update for every location committed this job —
         called by the caller ONCE the full canonical state (schedules/services
         included) is committed (§9 completeness). Each publish is independently
-        guarded + fail-soft, so one failure never affects the others or the job."""
-        for location_id in self.committed_location_ids:
-            self._publish_federation_update(location_id)
+        guarded + fail-soft, so one failure never affects the others or the job.
+        The aggregates are read in one batch rather than per location.
+
+        With ``FEDERATION_PUBLISH_MODE=outbox`` this only enqueues the ids in
+        ``federation_outbox``; the publisher loop builds, signs and appends."""
+        if not self.committed_location_ids:
+            return
+        from app.core.config import settings
+
+        location_ids = [str(location_id) for location_id in self.committed_location_ids]
+        source_type = self.metadata.get("source_type")
+        if settings.FEDERATION_PUBLISH_MODE == "outbox":
+            from app.federation.outbox import enqueue_location_updates
+
+            enqueue_location_updates(self.db, location_ids, source_type=source_type)
+            return
+
+        from app.federation.publish import publish_location_updates
+
+        publish_location_updates(self.db, location_ids, source_type=source_type)
+
+    def refresh_ptf_clusters(self) -> None:
+        """Recompute the PTF feed's precomputed dedup clusters around every
+        location committed this job, so new near-duplicates collapse (and
+        moved ones split) without a full rebuild. Called after
+        ``publish_pending_updates``. Fail-soft: on error the affected
+        locations keep their previous clusters until the next refresh or
+        rebuild, and the (already-succeeded) job is unaffected."""
+        if not self.committed_location_ids:
+            return
+        from app.api.v1.partners.ptf.location_clusters import (
+            refresh_location_clusters,
+        )
+
+        try:
+            refresh_location_clusters(self.db, self.committed_location_ids)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"PTF cluster refresh failed: {e}")
 
     def _commit_matched_location(
         self,
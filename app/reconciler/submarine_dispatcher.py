@@ -68,11 +68,8 @@ class SubmarineDispatcher:
             {"id": location_id},
         ).first()
 
-        if cooldown_row:
-            last_crawled, last_status = cooldown_row
-            cooldown_days = self._get_cooldown_days(last_status)
-            if self._is_in_cooldown(last_crawled, cooldown_days):
-                return None
+        if cooldown_row and self.in_cooldown(*cooldown_row):
+            return None
 
         # --- Gap detection ---
         missing_fields = self._detect_missing_fields(location_id)
@@ -85,29 +82,44 @@ class SubmarineDispatcher:
             {"id": location_id},
         ).first()
 
-        location_name = ""
-        latitude = None
-        longitude = None
-        if loc_row:
-            location_name = loc_row[0] or ""
-            latitude = float(loc_row[1]) if loc_row[1] is not None else None
-            longitude = float(loc_row[2]) if loc_row[2] is not None else None
-
         # --- Build and enqueue job ---
-        job = SubmarineJob(
-            id=str(uuid.uuid4()),
+        job = self.build_job(
             location_id=location_id,
             organization_id=organization_id,
             website_url=website_url,
             missing_fields=missing_fields,
             source_scraper_id=job_metadata.get("scraper_id", "unknown"),
-            location_name=location_name,
-            latitude=latitude,
-            longitude=longitude,
-            max_attempts=settings.SUBMARINE_MAX_ATTEMPTS,
+            location_name=loc_row[0] if loc_row else None,
+            latitude=loc_row[1] if loc_row else None,
+            longitude=loc_row[2] if loc_row else None,
         )
         return self._enqueue(job)
 
+    @staticmethod
+    def build_job(
+        location_id: str,
+        organization_id: str | None,
+        website_url: str,
+        missing_fields: list[str],
+        source_scraper_id: str,
+        location_name: str | None = None,
+        latitude: Any = None,
+        longitude: Any = None,
+    ) -> SubmarineJob:
+        """Build a SubmarineJob from a location's row values."""
+        return SubmarineJob(
+            id=str(uuid.uuid4()),
+            location_id=location_id,
+            organization_id=organization_id,
+            website_url=website_url,
+            missing_fields=missing_fields,
+            source_scraper_id=source_scraper_id,
+            location_name=location_name or "",
+            latitude=float(latitude) if latitude is not None else None,
+            longitude=float(longitude) if longitude is not None else None,
+            max_attempts=settings.SUBMARINE_MAX_ATTEMPTS,
+        )
+
     def _get_website_url(
         self, location_id: str, organization_id: str | None
     ) -> str | None:
@@ -146,23 +158,17 @@ class SubmarineDispatcher:
 
     def _detect_missing_fields(self, location_id: str) -> list[str]:
         """Query DB for which target fields are missing on a location."""
-        missing = []
-
         # Check phone
         phone_row = self.db.execute(
             text("SELECT EXISTS(SELECT 1 FROM phone WHERE location_id = :id)"),
             {"id": location_id},
         ).first()
-        if phone_row and not phone_row[0]:
-            missing.append("phone")
 
         # Check schedules (hours)
         schedule_row = self.db.execute(
             text("SELECT EXISTS(SELECT 1 FROM schedule WHERE location_id = :id)"),
             {"id": location_id},
         ).first()
-        if schedule_row and not schedule_row[0]:
-            missing.append("hours")
 
         # Check email (on parent organization)
         email_row = self.db.execute(
@@ -173,25 +179,50 @@ class SubmarineDispatcher:
             ),
             {"id": location_id},
         ).first()
-        if not email_row or not email_row[0]:
-            missing.append("email")
 
         # Check description (missing or generic)
         desc_row = self.db.execute(
             text("SELECT description FROM location WHERE id = :id"),
             {"id": location_id},
         ).first()
+
+        return self.missing_fields_from(
+            has_phone=not phone_row or bool(phone_row[0]),
+            has_schedule=not schedule_row or bool(schedule_row[0]),
+            email=email_row[0] if email_row else None,
+            description=desc_row[0] if desc_row else None,
+        )
+
+    @staticmethod
+    def missing_fields_from(
+        has_phone: bool,
+        has_schedule: bool,
+        email: str | None,
+        description: str | None,
+    ) -> list[str]:
+        """Which target fields are missing, given a location's current values."""
+        missing = []
+        if not has_phone:
+            missing.append("phone")
+        if not has_schedule:
+            missing.append("hours")
+        if not email:
+            missing.append("email")
         if (
-            not desc_row
-            or not desc_row[0]
+            not description
             # The reconciler generates "Food service location: {name}" as a placeholder
             # when no description is available. Treat as missing.
-            or desc_row[0].startswith("Food service location:")
+            or description.startswith("Food service location:")
         ):
             missing.append("description")
-
         return missing
 
+    def in_cooldown(
+        self, last_crawled: datetime | None, last_status: str | None
+    ) -> bool:
+        """Whether a location crawled at ``last_crawled`` is still cooling down."""
+        return self._is_in_cooldown(last_crawled, self._get_cooldown_days(last_status))
+
     def _get_cooldown_days(self, last_status: str | None) -> int:
         """Get the appropriate cooldown period based on last crawl status."""
         if last_status in (
@@ -222,6 +253,69 @@ class SubmarineDispatcher:
         cutoff = datetime.now(UTC) - timedelta(days=cooldown_days)
         return last_crawled > cutoff
 
+    def enqueue_many(self, jobs: list[SubmarineJob]) -> list[str]:
+        """Enqueue SubmarineJobs in one batch; returns the IDs enqueued.
+
+        One Redis pipeline (RQ ``enqueue_many``) locally, SendMessageBatch
+        calls of up to 10 jobs on SQS. Jobs SQS rejects are logged and left
+        out of the returned IDs.
+        """
+        if not jobs:
+            return []
+
+        if os.environ.get("QUEUE_BACKEND", "redis").lower() == "sqs":
+            from app.pipeline.sqs_sender import SqsMessage, send_batch_to_sqs
+
+            queue_url = os.environ.get("SUBMARINE_QUEUE_URL", "")
+            if not queue_url:
+                logger.error(
+                    "submarine_enqueue_failed",
+                    reason="SUBMARINE_QUEUE_URL not set",
+                    jobs=len(jobs),
+                )
+                return []
+            message_ids = send_batch_to_sqs(
+                queue_url=queue_url,
+                messages=[
+                    SqsMessage(
+                        body=job.model_dump(mode="json"),
+                        message_group_id=job.location_id,
+                        deduplication_id=job.id,
+                    )
+                    for job in jobs
+                ],
+                source="submarine-dispatcher",
+            )
+            enqueued = [
+                job.id
+                for job, message_id in zip(jobs, message_ids, strict=True)
+                if message_id
+            ]
+        else:
+            from rq import Queue
+
+            from app.llm.queue.queues import submarine_queue
+
+            submarine_queue.enqueue_many(
+                [
+                    Queue.prepare_data(
+                        "app.submarine.worker.process_submarine_job",
+                        args=(job.model_dump(mode="json"),),
+                        result_ttl=settings.REDIS_TTL_SECONDS,
+                        failure_ttl=settings.REDIS_TTL_SECONDS,
+                    )
+                    for job in jobs
+                ]
+            )
+            enqueued = [job.id for job in jobs]
+
+        logger.info(
+            "submarine_jobs_enqueued",
+            jobs=len(enqueued),
+            failed=len(jobs) - len(enqueued),
+        )
+        return enqueued
+
     def _enqueue(self, job: SubmarineJob) -> str:
         """Enqueue a SubmarineJob to the submarine queue.
 
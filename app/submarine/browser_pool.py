@@ -0,0 +1,131 @@
+"""Long-lived headless browser shared by submarine crawls.
+
+``SubmarineCrawler.crawl`` without a fetcher launches (and tears down) a
+Chromium per job, which dominates short crawls. ``BrowserPool`` keeps one
+crawl4ai ``AsyncWebCrawler`` running for the life of the worker and hands
+each job its own session: a crawl4ai ``session_id`` of its own (its own page,
+so no navigation state leaks between jobs), killed when the job ends.
+
+At most ``max_sessions`` jobs hold a session at once. If a fetch raises —
+crawl4ai reports ordinary page failures in the result, so an exception means
+the browser itself is in trouble — the browser is retired: new sessions get a
+freshly launched one, and the old one is closed once its last session ends.
+"""
+
+import asyncio
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import structlog
+
+from app.submarine.crawler import (
+    Crawl4aiFetcher,
+    PageFetch,
+    build_browser_config,
+    build_run_config,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class PooledSession:
+    """A job's isolated crawl4ai session on the pooled browser (a PageFetcher)."""
+
+    def __init__(self, crawler: Any, timeout: int):
+        self.session_id = f"submarine-{uuid.uuid4().hex}"
+        self.failed = False
+        self._fetcher = Crawl4aiFetcher(
+            crawler, build_run_config(timeout, session_id=self.session_id)
+        )
+
+    async def fetch(self, url: str) -> PageFetch:
+        try:
+            return await self._fetcher.fetch(url)
+        except Exception:
+            self.failed = True
+            raise
+
+
+class BrowserPool:
+    """One long-lived Chromium, shared by up to ``max_sessions`` concurrent jobs.
+
+    Must be used from a single event loop. Call :meth:`close` on shutdown.
+    """
+
+    def __init__(self, user_agent: str, timeout: int = 30, max_sessions: int = 4):
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.max_sessions = max_sessions
+        self.launches = 0
+        self._crawler: Any = None
+        self._active: dict[int, int] = {}
+        self._retired: dict[int, Any] = {}
+        self._launch_lock: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    async def _current(self) -> Any:
+        """The running browser, launching one if needed."""
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            if self._crawler is None:
+                from crawl4ai import AsyncWebCrawler
+
+                crawler = AsyncWebCrawler(config=build_browser_config(self.user_agent))
+                await crawler.start()
+                self._crawler = crawler
+                self.launches += 1
+                logger.info("submarine_browser_launched", launches=self.launches)
+        return self._crawler
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[PooledSession]:
+        """Borrow an isolated session for one job."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_sessions)
+        async with self._slots:
+            crawler = await self._current()
+            key = id(crawler)
+            self._active[key] = self._active.get(key, 0) + 1
+            session = PooledSession(crawler, self.timeout)
+            try:
+                yield session
+            finally:
+                await self._end_session(crawler, session)
+
+    async def _end_session(self, crawler: Any, session: PooledSession) -> None:
+        key = id(crawler)
+        if session.failed and crawler is self._crawler:
+            logger.warning("submarine_browser_retired", launches=self.launches)
+            self._crawler = None
+            self._retired[key] = crawler
+        elif key not in self._retired:
+            try:
+                await crawler.crawler_strategy.kill_session(session.session_id)
+            except Exception as e:
+                logger.warning("submarine_session_close_failed", error=str(e))
+        self._active[key] -= 1
+        if not self._active[key]:
+            del self._active[key]
+            if key in self._retired:
+                await self._close(self._retired.pop(key))
+
+    @staticmethod
+    async def _close(crawler: Any) -> None:
+        try:
+            await crawler.close()
+        except Exception as e:
+            logger.warning("submarine_browser_close_failed", error=str(e))
+
+    async def close(self) -> None:
+        """Close the browser (and any retired one). Active sessions must be done."""
+        crawlers = [*self._retired.values()]
+        if self._crawler is not None:
+            crawlers.append(self._crawler)
+        self._crawler = None
+        self._retired.clear()
+        self._active.clear()
+        for crawler in crawlers:
+            await self._close(crawler)
@@ -0,0 +1,179 @@
+"""Local cache of what each submarine crawl saw, for cheap re-crawls.
+
+Most sites are unchanged when the dispatcher's cooldown brings them back.
+For every crawl that reached a verdict, the cache keeps (keyed by the job's
+website URL) the ETag / Last-Modified of each page crawled, a hash of the
+combined markdown, and which fields were extracted. A re-crawl then:
+
+1. Revalidates each cached page with a conditional GET. If every page
+   answers 304 Not Modified, the browser is never launched.
+2. Otherwise crawls as usual. If the markdown hashes the same as last time,
+   the LLM is not called.
+
+Either way the job ends as an unchanged NO_DATA result. An entry is only
+trusted for fields it was extracted for; a job asking for a field the last
+crawl didn't covers the site again in full.
+
+The cache is a SQLite file (``SUBMARINE_CRAWL_CACHE_PATH``), shared by the
+worker processes on one host. Entries are only written by inline
+extraction; batch-staged crawls have no verdict yet.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+import structlog
+
+from app.submarine.rate_limiter import (
+    THROTTLE_STATUSES,
+    RateLimitedError,
+    SubmarineRateLimiter,
+    parse_retry_after,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+def content_hash(markdown: str) -> str:
+    """SHA-256 of crawled markdown."""
+    return hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedCrawl:
+    """What the last completed crawl of a website saw."""
+
+    url: str
+    content_hash: str
+    # Fields the cached verdict was extracted for
+    fields: list[str]
+    # Page URL -> cache validators ("etag" / "last-modified")
+    pages: dict[str, dict[str, str]] = field(default_factory=dict)
+    checked_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def covers(self, missing_fields: list[str]) -> bool:
+        """Whether the cached verdict answers a job for ``missing_fields``."""
+        return set(missing_fields) <= set(self.fields)
+
+
+class CrawlCache:
+    """SQLite-backed crawl cache, one row per website URL."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crawl_cache (
+                    url TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    fields TEXT NOT NULL,
+                    pages TEXT NOT NULL,
+                    checked_at TEXT NOT NULL
+                )
+                """
+            )
+
+    def get(self, url: str) -> CachedCrawl | None:
+        with sqlite3.connect(self.path, timeout=30) as conn:
+            row = conn.execute(
+                "SELECT content_hash, fields, pages, checked_at "
+                "FROM crawl_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedCrawl(
+            url=url,
+            content_hash=row[0],
+            fields=json.loads(row[1]),
+            pages=json.loads(row[2]),
+            checked_at=datetime.fromisoformat(row[3]),
+        )
+
+    def put(self, entry: CachedCrawl) -> None:
+        with sqlite3.connect(self.path, timeout=30) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO crawl_cache "
+                "(url, content_hash, fields, pages, checked_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    entry.url,
+                    entry.content_hash,
+                    json.dumps(sorted(entry.fields)),
+                    json.dumps(entry.pages),
+                    entry.checked_at.isoformat(),
+                ),
+            )
+
+
+async def probe_unchanged(
+    cached: CachedCrawl,
+    rate_limiter: SubmarineRateLimiter,
+    timeout: float = 10.0,
+) -> bool:
+    """True if every cached page revalidates as unchanged.
+
+    Sends one conditional GET per page (through the rate limiter, like any
+    crawl request). A page without validators, a 200 with a new ETag, or
+    any error means "changed": the caller crawls as usual.
+    """
+    if not cached.pages or not all(cached.pages.values()):
+        return False
+    async with httpx.AsyncClient(
+        timeout=timeout, headers={"User-Agent": rate_limiter.user_agent}
+    ) as client:
+        for page_url, validators in cached.pages.items():
+            headers = {}
+            if etag := validators.get("etag"):
+                headers["If-None-Match"] = etag
+            if last_modified := validators.get("last-modified"):
+                headers["If-Modified-Since"] = last_modified
+            try:
+                await rate_limiter.wait_and_record(page_url)
+                async with client.stream("GET", page_url, headers=headers) as response:
+                    if response.status_code == 304:
+                        continue
+                    # Some servers ignore If-None-Match but still send the ETag
+                    if (
+                        response.status_code == 200
+                        and etag
+                        and response.headers.get("etag") == etag
+                    ):
+                        continue
+                    if response.status_code in THROTTLE_STATUSES:
+                        await rate_limiter.penalize(
+                            page_url,
+                            parse_retry_after(response.headers.get("retry-after")),
+                        )
+                    return False
+            except (httpx.HTTPError, RateLimitedError) as e:
+                logger.debug(
+                    "submarine_crawl_cache_probe_failed", url=page_url, error=str(e)
+                )
+                return False
+    return True
+
+
+_cache: CrawlCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_crawl_cache() -> CrawlCache | None:
+    """The process-wide crawl cache, or None when SUBMARINE_CRAWL_CACHE_PATH is unset."""
+    from app.core.config import settings
+
+    global _cache
+    if not settings.SUBMARINE_CRAWL_CACHE_PATH:
+        return None
+    with _cache_lock:
+        if _cache is None or str(_cache.path) != settings.SUBMARINE_CRAWL_CACHE_PATH:
+            _cache = CrawlCache(Path(settings.SUBMARINE_CRAWL_CACHE_PATH))
+    return _cache
@@ -8,9 +8,13 @@ phone numbers, hours, email addresses, and descriptions.
 import structlog
 import re
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal, Protocol
 
-from app.submarine.rate_limiter import SubmarineRateLimiter
+from app.submarine.rate_limiter import (
+    THROTTLE_STATUSES,
+    SubmarineRateLimiter,
+    parse_retry_after,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -21,6 +25,9 @@ RELEVANT_LINK_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 
+# Response headers a re-crawl can revalidate with (conditional GET)
+CACHE_VALIDATORS = ("etag", "last-modified")
+
 # Link text patterns to skip (not useful for our extraction)
 SKIP_LINK_PATTERNS = re.compile(
     r"donat|volunt|blog|news|event|career|press|media|"
@@ -39,6 +46,104 @@ class CrawlResult:
     status: Literal["success", "partial", "no_data", "error"]
     links_followed: list[str] = field(default_factory=list)
     error: str | None = None
+    # Cache validators (ETag / Last-Modified) of each crawled page, by URL
+    page_validators: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+@dataclass
+class PageFetch:
+    """One fetched page, reduced to what the crawl strategy needs."""
+
+    success: bool
+    markdown: str = ""
+    # Internal links as (href, text) pairs
+    links: list[tuple[str, str]] = field(default_factory=list)
+    error: str | None = None
+    status_code: int | None = None
+    # Retry-After of a throttle response, in seconds
+    retry_after: float | None = None
+    # Response ETag / Last-Modified headers (lower-cased names), if sent
+    validators: dict[str, str] = field(default_factory=dict)
+
+
+class PageFetcher(Protocol):
+    """Fetches single pages for a crawl (a browser session, or a test double)."""
+
+    async def fetch(self, url: str) -> PageFetch: ...
+
+
+def build_browser_config(user_agent: str) -> Any:
+    """The crawl4ai BrowserConfig every submarine browser is launched with."""
+    from crawl4ai import BrowserConfig
+
+    return BrowserConfig(
+        headless=True,
+        verbose=False,
+        enable_stealth=True,  # playwright-stealth: hides navigator.webdriver
+        text_mode=True,  # Skip images — faster, less memory
+        light_mode=True,  # Disable background features
+        user_agent=user_agent,
+        viewport_width=1366,  # Common laptop resolution
+        viewport_height=768,
+        extra_args=[
+            "--no-sandbox",  # Required when running as root in Docker
+            "--disable-dev-shm-usage",  # Avoid /dev/shm 64MB limit
+            "--disable-gpu",  # No GPU in containers
+            "--disable-blink-features=AutomationControlled",  # Hide automation flag
+        ],
+    )
+
+
+def build_run_config(timeout: int, session_id: str | None = None) -> Any:
+    """The crawl4ai CrawlerRunConfig for one page fetch.
+
+    Args:
+        timeout: Page timeout in seconds.
+        session_id: crawl4ai session to run in (pooled browsers give each
+            job its own session); None for crawl4ai's default page.
+    """
+    from crawl4ai import CacheMode, CrawlerRunConfig
+
+    return CrawlerRunConfig(
+        word_count_threshold=5,  # Low threshold to capture short contact blocks
+        page_timeout=timeout * 1000,  # crawl4ai uses milliseconds
+        cache_mode=CacheMode.BYPASS,  # Always fetch fresh
+        wait_until="load",  # Full load, not just DOM (WordPress JS needs this)
+        delay_before_return_html=1.0,  # Let JS hydrate after load event
+        remove_overlay_elements=True,  # Dismiss cookie banners
+        override_navigator=True,  # Mask navigator properties (cheap, safe)
+        session_id=session_id,
+    )
+
+
+class Crawl4aiFetcher:
+    """PageFetcher over a started crawl4ai AsyncWebCrawler."""
+
+    def __init__(self, crawler: Any, run_config: Any):
+        self.crawler = crawler
+        self.run_config = run_config
+
+    async def fetch(self, url: str) -> PageFetch:
+        result = await self.crawler.arun(url=url, config=self.run_config)
+        # result.markdown is a MarkdownGenerationResult, not a string
+        markdown = result.markdown.raw_markdown if result.markdown else ""
+        links = [
+            (link.get("href", ""), link.get("text", ""))
+            for link in (result.links or {}).get("internal", [])
+            if link.get("href")
+        ]
+        headers = {k.lower(): v for k, v in (result.response_headers or {}).items()}
+        return PageFetch(
+            success=result.success,
+            markdown=markdown or "",
+            links=links,
+            error=result.error_message,
+            status_code=result.status_code,
+            retry_after=parse_retry_after(headers.get("retry-after")),
+            validators={
+                name: headers[name] for name in CACHE_VALIDATORS if headers.get(name)
+            },
+        )
 
 
 class SubmarineCrawler:
@@ -61,22 +166,23 @@ class SubmarineCrawler:
         self.timeout = timeout
         self.rate_limiter = rate_limiter or SubmarineRateLimiter()
 
-    async def crawl(self, url: str) -> CrawlResult:
+    async def crawl(self, url: str, fetcher: PageFetcher | None = None) -> CrawlResult:
         """Crawl a website and return combined markdown content.
 
         Args:
             url: Starting URL to crawl.
+            fetcher: Page fetcher to crawl with (e.g. a pooled browser
+                session). When None, a dedicated Chromium is launched for
+                this crawl and closed afterwards.
 
         Returns:
             CrawlResult with combined markdown from all crawled pages.
         """
+        if fetcher is not None:
+            return await self._crawl_pages(url, fetcher)
+
         try:
-            from crawl4ai import (
-                AsyncWebCrawler,
-                BrowserConfig,
-                CacheMode,
-                CrawlerRunConfig,
-            )
+            from crawl4ai import AsyncWebCrawler
         except ImportError:
             logger.error("crawl4ai not installed — cannot crawl")
             return CrawlResult(
@@ -87,88 +193,87 @@ class SubmarineCrawler:
                 error="crawl4ai not installed",
             )
 
+        try:
+            async with AsyncWebCrawler(
+                config=build_browser_config(self.rate_limiter.user_agent)
+            ) as crawler:
+                return await self._crawl_pages(
+                    url, Crawl4aiFetcher(crawler, build_run_config(self.timeout))
+                )
+        except Exception as e:
+            # Browser launch/teardown failure (page errors are handled per crawl)
+            self._log_error(url, e)
+            return CrawlResult(
+                url=url,
+                markdown="",
+                pages_crawled=0,
+                status="error",
+                error=str(e),
+            )
+
+    async def _crawl_pages(self, url: str, fetcher: PageFetcher) -> CrawlResult:
+        """Run the crawl strategy for one site over ``fetcher``."""
         all_markdown: list[str] = []
         links_followed: list[str] = []
+        page_validators: dict[str, dict[str, str]] = {}
         pages_crawled = 0
 
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False,
-            enable_stealth=True,  # playwright-stealth: hides navigator.webdriver
-            text_mode=True,  # Skip images — faster, less memory
-            light_mode=True,  # Disable background features
-            user_agent=self.rate_limiter.user_agent,
-            viewport_width=1366,  # Common laptop resolution
-            viewport_height=768,
-            extra_args=[
-                "--no-sandbox",  # Required when running as root in Docker
-                "--disable-dev-shm-usage",  # Avoid /dev/shm 64MB limit
-                "--disable-gpu",  # No GPU in containers
-                "--disable-blink-features=AutomationControlled",  # Hide automation flag
-            ],
-        )
-        run_config = CrawlerRunConfig(
-            word_count_threshold=5,  # Low threshold to capture short contact blocks
-            page_timeout=self.timeout * 1000,  # crawl4ai uses milliseconds
-            cache_mode=CacheMode.BYPASS,  # Always fetch fresh
-            wait_until="load",  # Full load, not just DOM (WordPress JS needs this)
-            delay_before_return_html=1.0,  # Let JS hydrate after load event
-            remove_overlay_elements=True,  # Dismiss cookie banners
-            override_navigator=True,  # Mask navigator properties (cheap, safe)
-        )
-
         try:
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                # --- Page 1: Main page ---
-                await self.rate_limiter.wait_and_record(url)
-                result = await crawler.arun(url=url, config=run_config)
-
-                if not result.success:
-                    return CrawlResult(
-                        url=url,
-                        markdown="",
-                        pages_crawled=0,
-                        status="error",
-                        error=result.error_message or "Crawl failed",
-                    )
-
-                # result.markdown is a MarkdownGenerationResult, not a string
-                page_md = result.markdown.raw_markdown if result.markdown else ""
-                all_markdown.append(f"# Page: {url}\n\n{page_md}")
-                pages_crawled = 1
-
-                # --- Extract and follow relevant links ---
-                if pages_crawled < self.max_pages and result.links:
-                    page_links = [
-                        (link.get("href", ""), link.get("text", ""))
-                        for link in result.links.get("internal", [])
-                        if link.get("href")
-                    ]
-                    relevant = self._filter_relevant_links(page_links)
-
-                    for link_url, _link_text in relevant:
-                        if pages_crawled >= self.max_pages:
-                            break
-
-                        await self.rate_limiter.wait_and_record(link_url)
-                        sub_result = await crawler.arun(url=link_url, config=run_config)
-
-                        if sub_result.success and sub_result.markdown:
-                            sub_md = sub_result.markdown.raw_markdown
-                            if sub_md and sub_md.strip():
-                                all_markdown.append(
-                                    f"\n\n# Page: {link_url}\n\n{sub_md}"
-                                )
-                                links_followed.append(link_url)
-                                pages_crawled += 1
+            # --- Page 1: Main page ---
+            await self.rate_limiter.wait_and_record(url)
+            page = await fetcher.fetch(url)
+
+            if page.status_code in THROTTLE_STATUSES:
+                pause = await self.rate_limiter.penalize(url, page.retry_after)
+                return CrawlResult(
+                    url=url,
+                    markdown="",
+                    pages_crawled=0,
+                    status="error",
+                    error=f"HTTP {page.status_code}: site throttled us, "
+                    f"domain paused {pause:.0f}s",
+                )
+
+            if not page.success:
+                return CrawlResult(
+                    url=url,
+                    markdown="",
+                    pages_crawled=0,
+                    status="error",
+                    error=page.error or "Crawl failed",
+                )
+
+            all_markdown.append(f"# Page: {url}\n\n{page.markdown}")
+            page_validators[url] = page.validators
+            pages_crawled = 1
+
+            # --- Extract and follow relevant links ---
+            if pages_crawled < self.max_pages and page.links:
+                relevant = self._filter_relevant_links(page.links)
+
+                for link_url, _link_text in relevant:
+                    if pages_crawled >= self.max_pages:
+                        break
+
+                    await self.rate_limiter.wait_and_record(link_url)
+                    sub_page = await fetcher.fetch(link_url)
+
+                    if sub_page.status_code in THROTTLE_STATUSES:
+                        # Keep what we have; don't push a site asking us to stop
+                        await self.rate_limiter.penalize(link_url, sub_page.retry_after)
+                        break
+
+                    if sub_page.success and sub_page.markdown.strip():
+                        all_markdown.append(
+                            f"\n\n# Page: {link_url}\n\n{sub_page.markdown}"
+                        )
+                        links_followed.append(link_url)
+                        page_validators[link_url] = sub_page.validators
+                        pages_crawled += 1
 
         except Exception as e:
             error_msg = str(e)
-            logger.error(
-                "submarine_crawl_error",
-                extra={"url": url, "error": error_msg, "error_type": type(e).__name__},
-                exc_info=True,
-            )
+            self._log_error(url, e)
             if pages_crawled > 0:
                 return CrawlResult(
                     url=url,
@@ -177,6 +282,7 @@ class SubmarineCrawler:
                     status="partial" if all_markdown else "error",
                     links_followed=links_followed,
                     error=error_msg,
+                    page_validators=page_validators,
                 )
             return CrawlResult(
                 url=url,
@@ -193,6 +299,15 @@ class SubmarineCrawler:
             pages_crawled=pages_crawled,
             status="success" if combined.strip() else "no_data",
             links_followed=links_followed,
+            page_validators=page_validators,
+        )
+
+    @staticmethod
+    def _log_error(url: str, error: Exception) -> None:
+        logger.error(
+            "submarine_crawl_error",
+            extra={"url": url, "error": str(error), "error_type": type(error).__name__},
+            exc_info=True,
         )
 
     @staticmethod
@@ -10,6 +10,7 @@ from typing import Any
 
 from app.llm.providers.base import BaseLLMProvider
 from app.llm.providers.types import GenerateConfig
+from app.submarine.reducer import DEFAULT_TOKEN_BUDGET, reduce_markdown
 
 logger = structlog.get_logger(__name__)
 
@@ -129,23 +130,34 @@ class SubmarineExtractor:
         return self.parse_response(response.text, missing_fields)  # type: ignore[union-attr]
 
     @staticmethod
-    def build_prompt(markdown: str, missing_fields: list[str]) -> str:
-        """Build the extraction prompt for the LLM."""
+    def build_prompt(
+        markdown: str,
+        missing_fields: list[str],
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+    ) -> str:
+        """Build the extraction prompt for the LLM.
+
+        The crawled markdown is first reduced to the blocks most likely to
+        hold the missing fields, within ``token_budget`` (see reducer.py).
+        """
         # Always include is_food_related alongside the requested fields
         all_fields = [*missing_fields, "is_food_related"]
         fields_desc = "\n".join(
             FIELD_DESCRIPTIONS.get(f, f'"{f}": "value or null"') for f in all_fields
         )
 
-        # ~3000 tokens at ~4 chars/token, leaving headroom for system prompt + response
-        max_content_len = 12000
-        content = markdown[:max_content_len]
-        if len(markdown) > max_content_len:
-            content += "\n\n[... content truncated ...]"
+        reduced = reduce_markdown(markdown, missing_fields, token_budget)
+        logger.debug(
+            "submarine_prompt_content_reduced",
+            tokens_before=reduced.tokens_before,
+            tokens_after=reduced.tokens_after,
+            blocks_kept=reduced.blocks_kept,
+            blocks_total=reduced.blocks_total,
+        )
 
         return EXTRACTION_USER_PROMPT.format(
             fields_description=fields_desc,
-            content=content,
+            content=reduced.text,
         )
 
     @staticmethod
@@ -51,12 +51,23 @@ def main() -> int:
             logger.error("RECONCILER_QUEUE_URL environment variable is required")
             sys.exit(1)
 
+        from app.core.config import settings
+
+        # With the browser pool on, crawl a poll's jobs concurrently; the shared
+        # crawl scheduler still serializes each domain and keeps its delay.
+        concurrency = (
+            settings.SUBMARINE_CRAWL_CONCURRENCY
+            if settings.SUBMARINE_BROWSER_POOL
+            else 1
+        )
         worker = PipelineWorker(
             queue_url=queue_url,
             process_fn=process_submarine_message,
             service_name="submarine",
             next_queue_url=next_queue_url,
+            max_messages=concurrency,
             visibility_timeout=600,  # Crawling + LLM extraction can be slow
+            concurrency=concurrency,
         )
         worker.run()
         return 0
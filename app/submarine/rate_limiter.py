@@ -2,18 +2,288 @@
 
 Enforces minimum delays between requests to the same domain to avoid
 overwhelming food bank websites (typically small-org shared hosting).
+
+The per-domain state lives in a ``RateLimitBackend``. With the Redis backend
+it is shared by every submarine worker, so the limit holds across jobs and
+across workers: each request atomically reserves the domain's next free slot
+in a Lua token bucket (GCRA form — one "theoretical arrival time" per
+domain, on Redis' own clock). The in-memory backend does the same within
+one process, and is what the Redis backend falls back to if Redis errors.
+
+A 429/503 from a site pauses its domain for the larger of its
+``Retry-After`` and an adaptive backoff that doubles on consecutive
+throttles (up to ``max_backoff_seconds``) and resets once the site stops
+throttling.
 """
 
 import asyncio
+import ipaddress
+import threading
 import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Protocol
 from urllib.parse import urlparse
 
+import structlog
+import tldextract
+
+logger = structlog.get_logger(__name__)
+
+# Site builders that give each pantry its own subdomain but are missing from
+# the private section of the public suffix list. Treated as suffixes, so
+# pantry.wordpress.com and church.wordpress.com are separate sites.
+_HOSTED_SITE_SUFFIXES = (
+    "business.site",
+    "godaddysites.com",
+    "squarespace.com",
+    "weebly.com",
+    "wordpress.com",
+)
+
+# Hosts whose sites live under a path rather than a subdomain, mapped to how
+# many leading path segments name one site (sites.google.com/view/<site>).
+_PATH_HOSTED_SITES = {"sites.google.com": 2}
+
+# Bundled PSL snapshot, private suffixes included (wixsite.com, blogspot.com,
+# github.io...): no download at runtime and no cache directory needed.
+_PSL = tldextract.TLDExtract(
+    cache_dir=None,
+    suffix_list_urls=(),
+    include_psl_private_domains=True,
+    extra_suffixes=_HOSTED_SITE_SUFFIXES,
+)
+
+# Responses that mean "slow down" rather than "this page is broken"
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def registrable_domain(url: str) -> str:
+    """The rate-limit key for a URL: its registrable domain (plus port).
+
+    ``www.foodbank.org``, ``hours.foodbank.org`` and ``foodbank.org`` share a
+    key — they are one site on one host. Registrable means under the public
+    suffix list including its private suffixes, so pantries on a shared site
+    builder (``a.wixsite.com``, ``b.wordpress.com``) are separate sites, and
+    ``sites.google.com`` sites are keyed by their path. IP literals,
+    single-label hosts and bare suffixes are used as-is. An explicit port is
+    kept, since it names another server.
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").rstrip(".")
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    depth = _PATH_HOSTED_SITES.get(host)
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        if not depth:
+            host = _PSL.extract_str(host).top_domain_under_public_suffix or host
+    else:
+        if ip.version == 6:
+            host = f"[{host}]"
+    key = f"{host}:{port}" if port else host
+    if depth:
+        segments = [segment for segment in parsed.path.split("/") if segment]
+        # Google Workspace sites add the domain: /a/<domain>/<site>
+        if segments[:1] == ["a"]:
+            depth += 1
+        if len(segments) >= depth:
+            key += "/" + "/".join(segments[:depth])
+    return key
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RateLimitedError(Exception):
+    """The domain's next free slot is further away than the caller will wait."""
+
+    def __init__(self, domain: str, wait: float):
+        super().__init__(f"{domain} is rate limited for another {wait:.0f}s")
+        self.domain = domain
+        self.wait = wait
+
+
+class RateLimitBackend(Protocol):
+    """Per-domain limiter state, shared however far the backend reaches."""
+
+    def reserve(
+        self, key: str, interval: float, burst: int, max_wait: float, commit: bool
+    ) -> float:
+        """Seconds until ``key``'s next free slot.
+
+        With ``commit`` the slot is taken, unless it is more than
+        ``max_wait`` away (the caller won't wait that long).
+        """
+        ...
+
+    def penalize(
+        self, key: str, backoff: float, retry_after: float, max_backoff: float
+    ) -> float:
+        """Pause ``key`` after a throttle response; returns the pause."""
+        ...
+
+
+class _DomainState:
+    __slots__ = ("backoff", "blocked_until", "tat")
+
+    def __init__(self) -> None:
+        self.tat = 0.0
+        self.blocked_until = 0.0
+        self.backoff = 0.0
+
+
+class InMemoryRateLimitBackend:
+    """Limiter state for one process (every crawl in it, across jobs)."""
+
+    def __init__(self) -> None:
+        self._domains: dict[str, _DomainState] = {}
+        self._lock = threading.Lock()
+
+    def reserve(
+        self, key: str, interval: float, burst: int, max_wait: float, commit: bool
+    ) -> float:
+        with self._lock:
+            now = time.monotonic()
+            state = self._domains.get(key) or _DomainState()
+            tat = max(state.tat, now)
+            start = max(tat - (burst - 1) * interval, state.blocked_until, now)
+            wait = start - now
+            if commit and wait <= max_wait:
+                state.tat = max(tat, start) + interval
+                self._domains[key] = state
+            return wait
+
+    def penalize(
+        self, key: str, backoff: float, retry_after: float, max_backoff: float
+    ) -> float:
+        with self._lock:
+            now = time.monotonic()
+            state = self._domains.setdefault(key, _DomainState())
+            # Throttled again within one backoff of the last pause ending:
+            # the site is still unhappy, so back off harder.
+            if state.backoff and now < state.blocked_until + state.backoff:
+                backoff = min(state.backoff * 2, max_backoff)
+            pause = max(backoff, retry_after)
+            state.backoff = backoff
+            state.blocked_until = max(state.blocked_until, now + pause)
+            return pause
+
+
+# KEYS[1] = domain state hash
+# ARGV = interval, burst, max_wait, commit (1/0), idle ttl seconds
+_RESERVE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local state = redis.call('HMGET', KEYS[1], 'tat', 'blocked_until')
+local tat = math.max(tonumber(state[1]) or 0, now)
+local start = math.max(
+    tat - (tonumber(ARGV[2]) - 1) * interval, tonumber(state[2]) or 0, now)
+local wait = start - now
+if ARGV[4] == '1' and wait <= tonumber(ARGV[3]) then
+    tat = math.max(tat, start) + interval
+    redis.call('HSET', KEYS[1], 'tat', tostring(tat))
+    redis.call('EXPIRE', KEYS[1], math.ceil(tat - now) + tonumber(ARGV[5]))
+end
+return tostring(wait)
+"""
+
+# KEYS[1] = domain state hash
+# ARGV = base backoff, retry_after, max_backoff, idle ttl seconds
+_PENALIZE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'backoff', 'blocked_until')
+local backoff = tonumber(ARGV[1])
+local last = tonumber(state[1]) or 0
+local blocked = tonumber(state[2]) or 0
+if last > 0 and now < blocked + last then
+    backoff = math.min(last * 2, tonumber(ARGV[3]))
+end
+local pause = math.max(backoff, tonumber(ARGV[2]))
+blocked = math.max(blocked, now + pause)
+redis.call('HSET', KEYS[1], 'backoff', tostring(backoff),
+    'blocked_until', tostring(blocked))
+redis.call('EXPIRE', KEYS[1], math.ceil(blocked - now + backoff) + tonumber(ARGV[4]))
+return tostring(pause)
+"""
+
+
+class RedisRateLimitBackend:
+    """Limiter state shared by every worker through Redis.
+
+    Each call is one atomic Lua script, timed by the Redis server's clock so
+    workers on different hosts agree. Fails open to a per-process limiter:
+    a Redis outage loosens the limit to per-worker, never removes it.
+    """
+
+    def __init__(
+        self, client: Any, prefix: str = "submarine:ratelimit:", idle_ttl: int = 3600
+    ):
+        self._client = client
+        self._prefix = prefix
+        self._idle_ttl = idle_ttl
+        self._reserve = client.register_script(_RESERVE_LUA)
+        self._penalize = client.register_script(_PENALIZE_LUA)
+        self._fallback = InMemoryRateLimitBackend()
+
+    @classmethod
+    def from_settings(cls) -> "RedisRateLimitBackend":
+        import redis
+
+        from app.core.config import settings
+
+        return cls(redis.Redis.from_url(settings.REDIS_URL, socket_timeout=5))
+
+    def reserve(
+        self, key: str, interval: float, burst: int, max_wait: float, commit: bool
+    ) -> float:
+        try:
+            return float(
+                self._reserve(
+                    keys=[self._prefix + key],
+                    args=[interval, burst, max_wait, int(commit), self._idle_ttl],
+                )
+            )
+        except Exception as e:
+            logger.warning("submarine_rate_limit_redis_failed", error=str(e))
+            return self._fallback.reserve(key, interval, burst, max_wait, commit)
+
+    def penalize(
+        self, key: str, backoff: float, retry_after: float, max_backoff: float
+    ) -> float:
+        try:
+            return float(
+                self._penalize(
+                    keys=[self._prefix + key],
+                    args=[backoff, retry_after, max_backoff, self._idle_ttl],
+                )
+            )
+        except Exception as e:
+            logger.warning("submarine_rate_limit_redis_failed", error=str(e))
+            return self._fallback.penalize(key, backoff, retry_after, max_backoff)
+
 
 class SubmarineRateLimiter:
     """Per-domain request throttling for polite web crawling.
 
-    Tracks the last request timestamp per domain and enforces a minimum
-    delay between consecutive requests to the same domain.
+    Spaces requests to the same registrable domain at least
+    ``min_delay_seconds`` apart (after an initial ``burst``), and pauses a
+    domain that answers with a throttle response.
     """
 
     user_agent: str = (
@@ -22,9 +292,19 @@ class SubmarineRateLimiter:
         "food-bank-data-aggregator)"
     )
 
-    def __init__(self, min_delay_seconds: float = 5.0):
+    def __init__(
+        self,
+        min_delay_seconds: float = 5.0,
+        backend: RateLimitBackend | None = None,
+        burst: int = 1,
+        max_backoff_seconds: float = 600.0,
+        max_wait_seconds: float = 120.0,
+    ):
         self.min_delay_seconds = min_delay_seconds
-        self._domain_timestamps: dict[str, float] = {}
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.burst = max(1, burst)
+        self.max_backoff_seconds = max_backoff_seconds
+        self.max_wait_seconds = max_wait_seconds
 
     def get_delay(self, url: str) -> float:
         """Get the delay needed before requesting this URL.
@@ -32,31 +312,82 @@ class SubmarineRateLimiter:
         Returns:
             Seconds to wait (0 if no delay needed).
         """
-        domain = self._extract_domain(url)
-        last_request = self._domain_timestamps.get(domain)
-        if last_request is None:
-            return 0
-        elapsed = time.monotonic() - last_request
-        remaining = self.min_delay_seconds - elapsed
-        return max(0, remaining)
+        return self._reserve(url, commit=False)
 
     def record_request(self, url: str) -> None:
         """Record that a request was made to this URL's domain."""
-        domain = self._extract_domain(url)
-        self._domain_timestamps[domain] = time.monotonic()
+        self._reserve(url, commit=True)
 
     async def wait_and_record(self, url: str) -> None:
-        """Wait for the rate limit then record the request.
+        """Reserve this domain's next slot and wait for it.
 
-        Convenience method that combines get_delay + sleep + record.
+        Raises:
+            RateLimitedError: The slot is more than ``max_wait_seconds`` away
+                (e.g. the site sent a long ``Retry-After``).
         """
-        delay = self.get_delay(url)
+        delay = await asyncio.to_thread(self._reserve, url, True)
+        if delay > self.max_wait_seconds:
+            raise RateLimitedError(self._extract_domain(url), delay)
         if delay > 0:
             await asyncio.sleep(delay)
-        self.record_request(url)
+
+    async def penalize(self, url: str, retry_after: float | None = None) -> float:
+        """Pause this URL's domain after a 429/503; returns the pause."""
+        domain = self._extract_domain(url)
+        pause = await asyncio.to_thread(
+            self.backend.penalize,
+            domain,
+            max(self.min_delay_seconds, 1.0),
+            retry_after or 0.0,
+            self.max_backoff_seconds,
+        )
+        logger.warning(
+            "submarine_domain_throttled",
+            domain=domain,
+            retry_after=retry_after,
+            pause_seconds=round(pause, 1),
+        )
+        return pause
+
+    def _reserve(self, url: str, commit: bool) -> float:
+        wait = self.backend.reserve(
+            self._extract_domain(url),
+            self.min_delay_seconds,
+            self.burst,
+            self.max_wait_seconds,
+            commit,
+        )
+        return max(0.0, wait)
 
     @staticmethod
     def _extract_domain(url: str) -> str:
-        """Extract the domain (netloc) from a URL."""
-        parsed = urlparse(url)
-        return parsed.netloc
+        """Extract the rate-limit domain from a URL."""
+        return registrable_domain(url)
+
+
+_backend: RateLimitBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def create_rate_limiter() -> SubmarineRateLimiter:
+    """A limiter on the process-wide backend selected by settings.
+
+    Every job's limiter shares the backend, so per-domain state outlives the
+    job: across the process with the memory backend, across all workers with
+    SUBMARINE_RATE_LIMIT_BACKEND=redis.
+    """
+    from app.core.config import settings
+
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if settings.SUBMARINE_RATE_LIMIT_BACKEND == "redis":
+                _backend = RedisRateLimitBackend.from_settings()
+            else:
+                _backend = InMemoryRateLimitBackend()
+    return SubmarineRateLimiter(
+        min_delay_seconds=settings.SUBMARINE_MIN_CRAWL_DELAY,
+        backend=_backend,
+        max_backoff_seconds=settings.SUBMARINE_RATE_LIMIT_MAX_BACKOFF,
+        max_wait_seconds=settings.SUBMARINE_RATE_LIMIT_MAX_WAIT,
+    )
@@ -0,0 +1,269 @@
+"""Trims crawled markdown to what the extraction LLM actually needs.
+
+The crawler hands over up to ``max_pages`` pages of raw markdown, most of
+it navigation, cookie banners, footers and prose that can't yield a phone
+number or opening hours. ``reduce_markdown`` cuts that down before the
+prompt is built:
+
+1. Split the combined markdown into pages (the crawler's ``# Page:``
+   headers) and each page into blocks (blank-line separated, with a
+   heading kept together with the block under it).
+2. Drop navigation (blocks that are mostly link text) and keep only the
+   first copy of any block repeated across pages (site-wide headers and
+   footers — the first copy stays, since a footer is often the only place
+   the phone number appears).
+3. Score each block by the density of patterns for the requested fields
+   (phones, emails, days and times) plus the food keywords the worker's
+   relevance check uses, and keep the best blocks that fit the token budget,
+   in their original order.
+
+Tokens are estimated at ~4 characters each, like the rest of the prompt
+budgeting.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+
+CHARS_PER_TOKEN = 4
+
+# Content budget for one extraction prompt. The handful of contact and hours
+# fields rarely needs more than a few hundred tokens of well-chosen text.
+DEFAULT_TOKEN_BUDGET = 1500
+
+# Keywords that indicate food-related content. The worker's relevance check
+# requires 2 distinct matches; here each match raises a block's score.
+FOOD_KEYWORDS = [
+    "food bank",
+    "food pantry",
+    "food distribution",
+    "food assistance",
+    "food shelf",
+    "food closet",
+    "food program",
+    "food insecurity",
+    "free food",
+    "food box",
+    "pantry",
+    "grocery",
+    "hunger",
+    "feeding",
+    "snap",
+    "wic",
+    "meal program",
+]
+
+PAGE_HEADER_RE = re.compile(r"^# Page: (\S+)[ \t]*$", re.MULTILINE)
+PHONE_RE = re.compile(r"(?<![\d-])(?:\+?1[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]\d{4}\b")
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+TIME_RE = re.compile(
+    r"\b\d{1,2}(?::\d{2})?\s*(?:a\.?m\b\.?|p\.?m\b\.?)|\b\d{1,2}:\d{2}\b|\bnoon\b",
+    re.IGNORECASE,
+)
+DAY_RE = re.compile(
+    r"\b(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+    r"|mon|tues?|wed|thu(?:rs?)?|fri|sat|sun)s?\b",
+    re.IGNORECASE,
+)
+HOURS_WORD_RE = re.compile(
+    r"\b(?:hours|open|closed|schedule|distribution|weekly|monthly|every)\b",
+    re.IGNORECASE,
+)
+_FOOD_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(kw) for kw in FOOD_KEYWORDS) + r")\b",
+    re.IGNORECASE,
+)
+
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)\s]*)[^)]*\)")
+_BLOCK_SPLIT_RE = re.compile(r"\n[ \t]*\n")
+_NORMALIZE_RE = re.compile(r"\W+")
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# Blocks whose visible text is at least this much link text are navigation
+_NAV_LINK_RATIO = 0.6
+
+
+@dataclass
+class ReducedContent:
+    """Markdown cut down for an extraction prompt."""
+
+    text: str
+    tokens_before: int
+    tokens_after: int
+    blocks_total: int
+    blocks_kept: int
+
+
+@dataclass
+class _Block:
+    page: int
+    text: str
+    tokens: int
+    score: float = 0.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def reduce_markdown(
+    markdown: str,
+    missing_fields: list[str],
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+) -> ReducedContent:
+    """Keep the blocks of ``markdown`` most likely to hold ``missing_fields``.
+
+    Args:
+        markdown: Combined crawler markdown (``# Page: <url>`` per page).
+        missing_fields: Fields the LLM will be asked for; patterns for other
+            fields don't count towards a block's score.
+        token_budget: Upper bound on the returned text's estimated tokens.
+
+    Returns:
+        The reduced text (page headers kept for pages that contribute a
+        block) with before/after token estimates.
+    """
+    pages = _split_pages(markdown)
+    blocks: list[_Block] = []
+    seen: set[str] = set()
+    total = 0
+    for page_index, (_url, body) in enumerate(pages):
+        for raw in _split_blocks(body):
+            total += 1
+            text, link_chars = _clean(raw)
+            key = _NORMALIZE_RE.sub(" ", text.lower()).strip()
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            block = _Block(page=page_index, text=text, tokens=estimate_tokens(text))
+            if link_chars >= _NAV_LINK_RATIO * len(text) and not (
+                PHONE_RE.search(text) or EMAIL_RE.search(text)
+            ):
+                continue
+            block.score = _score(text, missing_fields)
+            if block.score > 0:
+                blocks.append(block)
+
+    # Densest first. Dividing by sqrt(tokens) rather than tokens keeps a
+    # paragraph with several hits ahead of a bare one-hit line.
+    ranked = sorted(
+        range(len(blocks)),
+        key=lambda i: blocks[i].score / math.sqrt(blocks[i].tokens),
+        reverse=True,
+    )
+    kept: set[int] = set()
+    used = 0
+    for i in ranked:
+        block = blocks[i]
+        # A page's first kept block also brings its "# Page: <url>" line.
+        new_page = pages[block.page][0] is not None and not any(
+            blocks[k].page == block.page for k in kept
+        )
+        header = (
+            estimate_tokens(f"# Page: {pages[block.page][0]}\n\n") if new_page else 0
+        )
+        if used + block.tokens + header <= token_budget:
+            kept.add(i)
+            used += block.tokens + header
+
+    if kept:
+        parts: list[str] = []
+        current_page: int | None = None
+        for i in sorted(kept):
+            block = blocks[i]
+            url = pages[block.page][0]
+            if block.page != current_page and url is not None:
+                parts.append(f"# Page: {url}")
+            current_page = block.page
+            parts.append(block.text)
+        text = "\n\n".join(parts)
+    else:
+        # Nothing recognisable: fall back to the start of the content.
+        text = markdown[: token_budget * CHARS_PER_TOKEN]
+
+    return ReducedContent(
+        text=text,
+        tokens_before=estimate_tokens(markdown),
+        tokens_after=estimate_tokens(text),
+        blocks_total=total,
+        blocks_kept=len(kept),
+    )
+
+
+def _split_pages(markdown: str) -> list[tuple[str | None, str]]:
+    """(url, body) per crawled page; url is None for headerless content."""
+    headers = list(PAGE_HEADER_RE.finditer(markdown))
+    if not headers:
+        return [(None, markdown)]
+    pages: list[tuple[str | None, str]] = []
+    if markdown[: headers[0].start()].strip():
+        pages.append((None, markdown[: headers[0].start()]))
+    for n, header in enumerate(headers):
+        end = headers[n + 1].start() if n + 1 < len(headers) else len(markdown)
+        pages.append((header.group(1), markdown[header.end() : end]))
+    return pages
+
+
+def _split_blocks(body: str) -> list[str]:
+    """Blank-line separated blocks, each heading joined to the block below."""
+    blocks: list[str] = []
+    heading: list[str] = []
+    for chunk in _BLOCK_SPLIT_RE.split(body):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        if all(line.lstrip().startswith("#") for line in chunk.splitlines()):
+            heading.append(chunk)
+            continue
+        blocks.append("\n".join([*heading, chunk]))
+        heading = []
+    if heading:
+        blocks.append("\n".join(heading))
+    return blocks
+
+
+def _clean(block: str) -> tuple[str, int]:
+    """Strip images and link targets; returns (text, chars of link text).
+
+    ``mailto:``/``tel:`` targets are kept when the link text doesn't already
+    show them — "[Email us](mailto:x@y.org)" may be the only email on a site.
+    """
+    link_chars = 0
+
+    def _link(match: re.Match[str]) -> str:
+        nonlocal link_chars
+        label, target = match.group(1).strip(), match.group(2)
+        link_chars += len(label)
+        scheme, _, value = target.partition(":")
+        if scheme == "tel":
+            shown = _NON_DIGIT_RE.sub("", label)
+            if not shown or not _NON_DIGIT_RE.sub("", value).endswith(shown):
+                return f"{label} ({value})" if label else value
+        elif scheme == "mailto" and value and value not in label:
+            return f"{label} ({value})" if label else value
+        return label
+
+    text = _LINK_RE.sub(_link, _IMAGE_RE.sub("", block))
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    return "\n".join(line for line in lines if line), link_chars
+
+
+def _score(text: str, missing_fields: list[str]) -> float:
+    """Weighted pattern hits for the requested fields (plus food keywords)."""
+    score = 0.0
+    if "phone" in missing_fields:
+        score += 3 * len(PHONE_RE.findall(text))
+    if "email" in missing_fields:
+        score += 3 * len(EMAIL_RE.findall(text))
+    if "hours" in missing_fields:
+        times = len(TIME_RE.findall(text))
+        days = len(DAY_RE.findall(text))
+        if times or days:
+            score += 2 * times + 2 * days + len(HOURS_WORD_RE.findall(text))
+    # Food keywords always count: the prompt also asks is_food_related, and
+    # they mark the paragraphs a description comes from.
+    food = len(_FOOD_RE.findall(text))
+    score += 2 * food if "description" in missing_fields else food
+    return score
@@ -3,6 +3,13 @@
 Queries the database for locations with website URLs and missing fields,
 then enqueues SubmarineJobs. Used by `./bouy submarine scan` for manual
 or Step Functions-triggered scans independent of the automatic dispatch pipeline.
+
+Candidates are streamed in keyset-paged batches (``WHERE l.id > :after ORDER
+BY l.id LIMIT :page_size``). One query per page returns everything the
+dispatcher would otherwise look up per location — website URL, cooldown
+columns, and gap-detection inputs — so the same rules run in memory and
+each page's jobs go out in one batched enqueue. A national scan costs two
+round trips per page instead of several queries per location.
 """
 
 import structlog
@@ -13,21 +20,59 @@ from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 from app.reconciler.submarine_dispatcher import SubmarineDispatcher
+from app.submarine.models import SubmarineJob
 
 logger = structlog.get_logger(__name__)
 
+# Candidates fetched (and jobs enqueued) per round trip
+SCAN_PAGE_SIZE = 500
+
+# Website resolution matches SubmarineDispatcher._get_website_url: the
+# organization's website, then the location URL, then a linked service URL.
+_PAGE_SQL = """
+SELECT
+    l.id,
+    l.organization_id,
+    l.name,
+    l.latitude,
+    l.longitude,
+    l.submarine_last_crawled_at,
+    l.submarine_last_status,
+    COALESCE(
+        NULLIF(o.website, ''),
+        NULLIF(l.url, ''),
+        NULLIF((
+            SELECT s.url FROM service s
+            JOIN service_at_location sal ON s.id = sal.service_id
+            WHERE sal.location_id = l.id AND s.url IS NOT NULL
+            LIMIT 1
+        ), '')
+    ) AS website_url,
+    EXISTS(SELECT 1 FROM phone p WHERE p.location_id = l.id) AS has_phone,
+    EXISTS(SELECT 1 FROM schedule sc WHERE sc.location_id = l.id) AS has_schedule,
+    o.email,
+    l.description
+FROM location l
+LEFT JOIN organization o ON l.organization_id = o.id
+WHERE {where}
+ORDER BY l.id
+LIMIT :page_size
+"""
+
 
 def scan_and_enqueue(
     limit: int | None = None,
     location_id: str | None = None,
     scraper_id: str | None = None,
+    page_size: int = SCAN_PAGE_SIZE,
 ) -> dict[str, Any]:
     """Scan DB for locations needing submarine enrichment and enqueue jobs.
 
     Args:
-        limit: Maximum number of jobs to enqueue (None = no limit).
+        limit: Maximum number of candidate locations to scan (None = no limit).
         location_id: Target a specific location ID (overrides other filters).
         scraper_id: Filter to locations produced by this scraper.
+        page_size: Candidates per keyset page (one query and one enqueue batch).
 
     Returns:
         Summary dict with counts of scanned/enqueued/skipped locations.
@@ -35,85 +80,96 @@ def scan_and_enqueue(
     engine = create_engine(settings.DATABASE_URL)
     session_factory = sessionmaker(bind=engine)
 
+    total = 0
     enqueued = 0
     skipped = 0
     errors = 0
+    pages = 0
+
+    if location_id:
+        # Target a specific location
+        conditions = ["l.id = :location_id"]
+        params: dict[str, Any] = {"location_id": location_id}
+    else:
+        conditions = [
+            "o.website IS NOT NULL",
+            "l.validation_status != 'rejected'",
+        ]
+        params = {}
+        if scraper_id:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM location_source ls "
+                "WHERE ls.location_id = l.id AND ls.scraper_id = :scraper_id)"
+            )
+            params["scraper_id"] = scraper_id
+    conditions.append("l.id > :after")
+    page_sql = text(_PAGE_SQL.format(where=" AND ".join(conditions)))  # nosec B608
+
+    logger.info("submarine_scan_started", limit=limit, page_size=page_size)
 
     with session_factory() as session:
         dispatcher = SubmarineDispatcher(db=session)
+        after = ""
 
-        if location_id:
-            # Target a specific location
+        while limit is None or total < limit:
+            batch = page_size if limit is None else min(page_size, limit - total)
             rows = session.execute(
-                text("SELECT l.id, l.organization_id FROM location l WHERE l.id = :id"),
-                {"id": location_id},
+                page_sql, {**params, "after": after, "page_size": batch}
             ).fetchall()
-        else:
-            # Build query with optional scraper filter
-            params: dict[str, Any] = {}
-            if scraper_id:
-                base_sql = (
-                    "SELECT DISTINCT l.id, l.organization_id "
-                    "FROM location l "
-                    "JOIN organization o ON l.organization_id = o.id "
-                    "JOIN location_source ls ON ls.location_id = l.id "
-                    "WHERE o.website IS NOT NULL "
-                    "AND l.validation_status != 'rejected' "
-                    "AND ls.scraper_id = :scraper_id "
-                    "ORDER BY l.id"
-                )
-                params["scraper_id"] = scraper_id
-            else:
-                base_sql = (
-                    "SELECT DISTINCT l.id, l.organization_id "
-                    "FROM location l "
-                    "JOIN organization o ON l.organization_id = o.id "
-                    "WHERE o.website IS NOT NULL "
-                    "AND l.validation_status != 'rejected' "
-                    "ORDER BY l.id"
-                )
-            if limit:
-                params["lim"] = int(limit)
-                rows = session.execute(
-                    text(base_sql + " LIMIT :lim"), params
-                ).fetchall()
-            else:
-                rows = session.execute(text(base_sql), params).fetchall()
-
-        total = len(rows)
-        logger.info("submarine_scan_started", total_candidates=total)
-
-        for row in rows:
-            loc_id, org_id = row[0], row[1]
-            try:
-                # Use the dispatcher with SUBMARINE_ENABLED override
-                # (scanner works even when auto-dispatch is off)
-                result = _dispatch_for_scan(
-                    dispatcher, str(loc_id), str(org_id) if org_id else None
-                )
-                if result:
-                    enqueued += 1
-                    logger.info(
-                        "submarine_scan_enqueued",
-                        location_id=str(loc_id),
-                        job_id=result,
+            if not rows:
+                break
+            pages += 1
+            total += len(rows)
+            after = rows[-1][0]
+
+            jobs: list[SubmarineJob] = []
+            for row in rows:
+                try:
+                    job = _job_for_row(dispatcher, row)
+                except Exception as e:
+                    errors += 1
+                    logger.error(
+                        "submarine_scan_error",
+                        location_id=str(row[0]),
+                        error=str(e),
+                        exc_info=True,
                     )
-                else:
+                    continue
+                if job is None:
                     skipped += 1
+                else:
+                    jobs.append(job)
+
+            try:
+                job_ids = dispatcher.enqueue_many(jobs)
             except Exception as e:
-                errors += 1
+                errors += len(jobs)
                 logger.error(
-                    "submarine_scan_error",
-                    location_id=str(loc_id),
+                    "submarine_scan_enqueue_error",
+                    jobs=len(jobs),
                     error=str(e),
                     exc_info=True,
                 )
+                continue
+            enqueued += len(job_ids)
+            errors += len(jobs) - len(job_ids)
+            logger.info(
+                "submarine_scan_page",
+                page=pages,
+                candidates=len(rows),
+                enqueued=len(job_ids),
+                last_location_id=str(after),
+            )
+
+            if len(rows) < batch:
+                break
 
     summary: dict[str, Any] = {
         "total_candidates": total,
         "enqueued": enqueued,
         "skipped": skipped,
         "errors": errors,
+        "pages": pages,
     }
     if scraper_id:
         summary["scraper_id"] = scraper_id
@@ -121,19 +177,52 @@ def scan_and_enqueue(
     return summary
 
 
-def _dispatch_for_scan(
-    dispatcher: SubmarineDispatcher,
-    location_id: str,
-    organization_id: str | None,
-) -> str | None:
-    """Dispatch a submarine job from the scanner (bypasses SUBMARINE_ENABLED check).
+def _job_for_row(dispatcher: SubmarineDispatcher, row: Any) -> SubmarineJob | None:
+    """Apply the dispatcher's rules to one candidate row.
 
-    The scanner is the manual trigger — it should work even when
-    automatic dispatch is disabled.
+    Same checks as SubmarineDispatcher.check_and_enqueue with force=True (the
+    scanner is the manual trigger and works even when automatic dispatch is
+    disabled), evaluated on the page query's columns instead of per-location
+    queries.
+
+    Returns:
+        The job to enqueue, or None if the location doesn't need one.
     """
-    return dispatcher.check_and_enqueue(
-        location_id=location_id,
-        organization_id=organization_id,
-        job_metadata={"scraper_id": "scanner"},
-        force=True,  # Bypass SUBMARINE_ENABLED for manual scans
+    (
+        loc_id,
+        org_id,
+        name,
+        latitude,
+        longitude,
+        last_crawled,
+        last_status,
+        website_url,
+        has_phone,
+        has_schedule,
+        email,
+        description,
+    ) = row
+
+    if not website_url:
+        return None
+    if dispatcher.in_cooldown(last_crawled, last_status):
+        return None
+    missing_fields = dispatcher.missing_fields_from(
+        has_phone=has_phone,
+        has_schedule=has_schedule,
+        email=email,
+        description=description,
+    )
+    if not missing_fields:
+        return None
+
+    return dispatcher.build_job(
+        location_id=str(loc_id),
+        organization_id=str(org_id) if org_id else None,
+        website_url=website_url,
+        missing_fields=missing_fields,
+        source_scraper_id="scanner",
+        location_name=name,
+        latitude=latitude,
+        longitude=longitude,
     )
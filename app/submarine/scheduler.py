@@ -0,0 +1,128 @@
+"""Concurrent, per-domain-polite crawl scheduling for the submarine worker.
+
+``CrawlScheduler.crawl`` may be awaited by many jobs at once. It runs up to
+``concurrency`` crawls in parallel, but never two crawls of the same domain:
+jobs for one domain queue (FIFO) on that domain's lock without holding a
+concurrency slot. All crawls share one ``SubmarineRateLimiter``, so the
+per-domain politeness delay now also spaces consecutive jobs for a domain,
+not just the pages within one job (and, on the Redis rate-limit backend,
+requests from other workers too). With a ``BrowserPool`` every crawl runs in
+an isolated session on the shared browser instead of launching its own.
+
+The worker entry points are synchronous (RQ / SQS handlers), so
+``CrawlRuntime`` runs the scheduler, pool and job coroutines on one
+long-lived event loop in a background thread. Handler threads submit whole
+job coroutines to it; the loop interleaves them.
+"""
+
+import asyncio
+import atexit
+import threading
+from collections.abc import Coroutine, Sequence
+from typing import Any, TypeVar
+
+import structlog
+
+from app.submarine.browser_pool import BrowserPool
+from app.submarine.crawler import CrawlResult, SubmarineCrawler
+from app.submarine.rate_limiter import create_rate_limiter, registrable_domain
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class CrawlScheduler:
+    """Bounded-concurrency crawls, one at a time per domain."""
+
+    def __init__(
+        self,
+        crawler: SubmarineCrawler,
+        pool: BrowserPool | None = None,
+        concurrency: int = 1,
+    ):
+        self.crawler = crawler
+        self.pool = pool
+        self.concurrency = concurrency
+        self._domain_locks: dict[str, asyncio.Lock] = {}
+        self._slots: asyncio.Semaphore | None = None
+
+    async def crawl(self, url: str) -> CrawlResult:
+        """Crawl ``url`` once its domain is free and a slot is available."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        domain = registrable_domain(url)
+        lock = self._domain_locks.setdefault(domain, asyncio.Lock())
+        async with lock, self._slots:
+            if self.pool is None:
+                return await self.crawler.crawl(url)
+            async with self.pool.session() as session:
+                return await self.crawler.crawl(url, fetcher=session)
+
+    async def crawl_many(self, urls: Sequence[str]) -> list[CrawlResult]:
+        """Crawl every URL, concurrently where domains allow; results in order."""
+        return list(await asyncio.gather(*(self.crawl(url) for url in urls)))
+
+
+class CrawlRuntime:
+    """A background event loop owning a ``CrawlScheduler`` and its browser pool."""
+
+    def __init__(self, scheduler: CrawlScheduler):
+        self.scheduler = scheduler
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="submarine-crawl-loop", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the runtime loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """Close the browser pool and stop the loop."""
+        if self._loop.is_closed():
+            return
+        if self.scheduler.pool is not None:
+            try:
+                self.run(self.scheduler.pool.close())
+            except Exception as e:
+                logger.warning("submarine_runtime_close_failed", error=str(e))
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._loop.close()
+
+
+_runtime: CrawlRuntime | None = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> CrawlRuntime:
+    """The process-wide crawl runtime, built from settings on first use."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            from app.core.config import settings
+
+            rate_limiter = create_rate_limiter()
+            crawler = SubmarineCrawler(
+                max_pages=settings.SUBMARINE_MAX_PAGES_PER_SITE,
+                timeout=settings.SUBMARINE_CRAWL_TIMEOUT,
+                rate_limiter=rate_limiter,
+            )
+            pool = BrowserPool(
+                user_agent=rate_limiter.user_agent,
+                timeout=settings.SUBMARINE_CRAWL_TIMEOUT,
+                max_sessions=settings.SUBMARINE_CRAWL_CONCURRENCY,
+            )
+            _runtime = CrawlRuntime(
+                CrawlScheduler(
+                    crawler, pool, concurrency=settings.SUBMARINE_CRAWL_CONCURRENCY
+                )
+            )
+            atexit.register(_runtime.close)
+            logger.info(
+                "submarine_crawl_runtime_started",
+                concurrency=settings.SUBMARINE_CRAWL_CONCURRENCY,
+            )
+        return _runtime
@@ -13,43 +13,35 @@ reconciler's update path handles merge logic. See constitution.md v1.5.0.
 import asyncio
 import os
 import structlog
+from dataclasses import replace
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 from app.llm.providers.factory import create_provider
-from app.submarine.crawler import SubmarineCrawler
+from app.submarine.crawl_cache import (
+    CachedCrawl,
+    CrawlCache,
+    content_hash,
+    get_crawl_cache,
+    probe_unchanged,
+)
+from app.submarine.crawler import CrawlResult, SubmarineCrawler
 from app.submarine.extractor import ExtractionError, SubmarineExtractor
 from app.submarine.models import SubmarineJob, SubmarineResult, SubmarineStatus
-from app.submarine.rate_limiter import SubmarineRateLimiter
+from app.submarine.rate_limiter import create_rate_limiter
+from app.submarine.reducer import FOOD_KEYWORDS
 from app.submarine.result_builder import SubmarineResultBuilder
 
-logger = structlog.get_logger(__name__)
+if TYPE_CHECKING:
+    from app.submarine.scheduler import CrawlScheduler
 
-# Keywords that indicate food-related content. At least 2 distinct matches required.
-_FOOD_KEYWORDS = [
-    "food bank",
-    "food pantry",
-    "food distribution",
-    "food assistance",
-    "food shelf",
-    "food closet",
-    "food program",
-    "food insecurity",
-    "free food",
-    "food box",
-    "pantry",
-    "grocery",
-    "hunger",
-    "feeding",
-    "snap",
-    "wic",
-    "meal program",
-]
+logger = structlog.get_logger(__name__)
 
+# Distinct FOOD_KEYWORDS matches required for content to count as food-related.
 _FOOD_RELEVANCE_THRESHOLD = 2
 
 
@@ -61,7 +53,7 @@ def _check_content_relevance(markdown: str) -> bool:
     not sufficient.
     """
     text_lower = markdown.lower()
-    matches = sum(1 for kw in _FOOD_KEYWORDS if kw in text_lower)
+    matches = sum(1 for kw in FOOD_KEYWORDS if kw in text_lower)
     return matches >= _FOOD_RELEVANCE_THRESHOLD
 
 
@@ -139,7 +131,13 @@ def _process_job(
         },
     )
 
-    result = asyncio.run(_process_async(job))
+    if settings.SUBMARINE_BROWSER_POOL:
+        from app.submarine.scheduler import get_runtime
+
+        runtime = get_runtime()
+        result = runtime.run(_process_async(job, scheduler=runtime.scheduler))
+    else:
+        result = asyncio.run(_process_async(job))
 
     if result.status == SubmarineStatus.STAGED:
         # Crawl succeeded, extraction staged for batch inference.
@@ -188,26 +186,49 @@ def _process_job(
     return job_result.model_dump(mode="json"), job.location_id, result.status
 
 
-async def _process_async(job: SubmarineJob) -> SubmarineResult:
+async def _process_async(
+    job: SubmarineJob, scheduler: "CrawlScheduler | None" = None
+) -> SubmarineResult:
     """Async pipeline: crawl website, extract fields with LLM.
 
     Args:
         job: The SubmarineJob to process.
+        scheduler: Shared crawl scheduler (pooled browser, per-domain
+            politeness across jobs). When None, the job crawls with its own
+            browser and rate limiter.
 
     Returns:
         SubmarineResult with extracted fields or error info.
     """
-    rate_limiter = SubmarineRateLimiter(
-        min_delay_seconds=settings.SUBMARINE_MIN_CRAWL_DELAY,
-    )
-    crawler = SubmarineCrawler(
-        max_pages=settings.SUBMARINE_MAX_PAGES_PER_SITE,
-        timeout=settings.SUBMARINE_CRAWL_TIMEOUT,
-        rate_limiter=rate_limiter,
+    rate_limiter = (
+        scheduler.crawler.rate_limiter
+        if scheduler is not None
+        else create_rate_limiter()
     )
+    inline = os.environ.get("QUEUE_BACKEND", "redis").lower() != "sqs"
+
+    # --- Re-crawl of an unchanged site: skip the browser ---
+    # Only inline extraction reaches a verdict to cache (the batch path stages).
+    cache = get_crawl_cache() if inline else None
+    cached = await _read_cache(cache, job.website_url)
+    if cached is not None and not cached.covers(job.missing_fields):
+        cached = None
+    if cached is not None and await probe_unchanged(
+        cached, rate_limiter, timeout=settings.SUBMARINE_CRAWL_TIMEOUT
+    ):
+        await _write_cache(cache, replace(cached, checked_at=datetime.now(UTC)))
+        return _unchanged_result(job, "not_modified", pages_crawled=0)
 
     # --- Crawl ---
-    crawl_result = await crawler.crawl(job.website_url)
+    if scheduler is not None:
+        crawl_result = await scheduler.crawl(job.website_url)
+    else:
+        crawler = SubmarineCrawler(
+            max_pages=settings.SUBMARINE_MAX_PAGES_PER_SITE,
+            timeout=settings.SUBMARINE_CRAWL_TIMEOUT,
+            rate_limiter=rate_limiter,
+        )
+        crawl_result = await crawler.crawl(job.website_url)
 
     if crawl_result.status == "error":
         return SubmarineResult(
@@ -232,6 +253,14 @@ async def _process_async(job: SubmarineJob) -> SubmarineResult:
             },
         )
 
+    # --- Same content as last time: skip the LLM ---
+    markdown_hash = content_hash(crawl_result.markdown)
+    if cached is not None and cached.content_hash == markdown_hash:
+        await _remember_crawl(cache, job, crawl_result, markdown_hash, cached.fields)
+        return _unchanged_result(
+            job, "content_hash", pages_crawled=crawl_result.pages_crawled
+        )
+
     # --- Content relevance gate ---
     if not _check_content_relevance(crawl_result.markdown):
         logger.info(
@@ -242,6 +271,7 @@ async def _process_async(job: SubmarineJob) -> SubmarineResult:
                 "website_url": job.website_url,
             },
         )
+        await _remember_crawl(cache, job, crawl_result, markdown_hash)
         return SubmarineResult(
             job_id=job.id,
             location_id=job.location_id,
@@ -260,7 +290,7 @@ async def _process_async(job: SubmarineJob) -> SubmarineResult:
     }
 
     # --- AWS batch path: stage for batch inference (50% cheaper) ---
-    if os.environ.get("QUEUE_BACKEND", "redis").lower() == "sqs":
+    if not inline:
         return _stage_for_batch_extraction(job, crawl_result, crawl_metadata)
 
     # --- Local/Redis path: extract inline ---
@@ -286,6 +316,8 @@ async def _process_async(job: SubmarineJob) -> SubmarineResult:
             error=f"LLM extraction failed: {e}",
         )
 
+    await _remember_crawl(cache, job, crawl_result, markdown_hash)
+
     if not extracted:
         return SubmarineResult(
             job_id=job.id,
@@ -309,6 +341,78 @@ async def _process_async(job: SubmarineJob) -> SubmarineResult:
     )
 
 
+def _unchanged_result(
+    job: SubmarineJob, unchanged_by: str, pages_crawled: int
+) -> SubmarineResult:
+    """NO_DATA for a site whose content is the same as its last crawl."""
+    logger.info(
+        "submarine_site_unchanged",
+        job_id=job.id,
+        location_id=job.location_id,
+        website_url=job.website_url,
+        unchanged_by=unchanged_by,
+    )
+    return SubmarineResult(
+        job_id=job.id,
+        location_id=job.location_id,
+        status=SubmarineStatus.NO_DATA,
+        crawl_metadata={
+            "url": job.website_url,
+            "pages_crawled": pages_crawled,
+            "unchanged": True,
+            "unchanged_by": unchanged_by,
+        },
+    )
+
+
+async def _read_cache(cache: CrawlCache | None, url: str) -> CachedCrawl | None:
+    """The cached crawl of ``url``, or None on a miss or a cache error.
+
+    SQLite calls run in a thread so a busy cache file never blocks the
+    event loop other crawls are running on.
+    """
+    if cache is None:
+        return None
+    try:
+        return await asyncio.to_thread(cache.get, url)
+    except Exception as e:
+        # The cache only saves work; never fail a job over it
+        logger.warning("submarine_crawl_cache_read_failed", url=url, error=str(e))
+        return None
+
+
+async def _write_cache(cache: CrawlCache | None, entry: CachedCrawl) -> None:
+    """Store ``entry``, logging (not raising) a cache error."""
+    if cache is None:
+        return
+    try:
+        await asyncio.to_thread(cache.put, entry)
+    except Exception as e:
+        # The cache only saves work; never fail a job over it
+        logger.warning(
+            "submarine_crawl_cache_write_failed", url=entry.url, error=str(e)
+        )
+
+
+async def _remember_crawl(
+    cache: CrawlCache | None,
+    job: SubmarineJob,
+    crawl_result: CrawlResult,
+    markdown_hash: str,
+    fields: list[str] | None = None,
+) -> None:
+    """Record a crawl that reached a verdict, for the next re-crawl."""
+    await _write_cache(
+        cache,
+        CachedCrawl(
+            url=job.website_url,
+            content_hash=markdown_hash,
+            fields=fields if fields is not None else job.missing_fields,
+            pages=crawl_result.page_validators,
+        ),
+    )
+
+
 def _stage_for_batch_extraction(
     job: SubmarineJob,
     crawl_result: Any,
@@ -2,10 +2,12 @@
 
 import logging
 import random
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.core.geocoding.cache_backend import (
     GeocodingCacheBackend,
@@ -15,6 +17,7 @@ from app.core.geocoding.cache_backend import (
 from app.core.geocoding.service import GeocodingService
 from app.core.state_mapping import normalize_state_to_code
 from app.core.zip_state_mapping import (
+    get_state_from_coordinates,
     get_state_from_zip,
     get_state_from_city,
     resolve_state_conflict,
@@ -65,6 +68,15 @@ class GeocodingEnricher:
         self.provider_config = self.config.get(
             "provider_config", getattr(settings, "ENRICHMENT_PROVIDER_CONFIG", {})
         )
+        self.concurrency = max(
+            1,
+            int(
+                self.config.get(
+                    "enrichment_concurrency",
+                    getattr(settings, "ENRICHMENT_CONCURRENCY", 4),
+                )
+            ),
+        )
 
         # Cache backend (pluggable: Redis local, DynamoDB on AWS)
         self._cache: Optional[GeocodingCacheBackend] = (
@@ -77,6 +89,11 @@ class GeocodingEnricher:
         self._circuit_state: Dict[str, Dict[str, Any]] = {}
         # In-memory metrics counters
         self._metrics: Dict[str, int] = defaultdict(int)
+        # Guards circuit breaker state and counters shared by lookup workers
+        self._lock = threading.Lock()
+        # Lookup results resolved up front by enrich_job_data, keyed by
+        # ("geocode", address) or ("reverse", lat, lon)
+        self._prefetched_lookups: Dict[Tuple[Any, ...], Tuple[Any, Any]] = {}
 
         # Track enrichment details for reporting
         self._enrichment_details: Dict[str, Any] = {
@@ -90,6 +107,52 @@ class GeocodingEnricher:
             "provider_failures": {},
         }
 
+    @staticmethod
+    def _name_as_address(location_name: str) -> Dict[str, Any]:
+        """Build a temporary address from a location name.
+
+        Many NYC locations have addresses in the name like
+        "58-25 LITTLE NECK PKWY (LITTLE NECK)".
+
+        Args:
+            location_name: Location name
+
+        Returns:
+            Address dictionary using the name as address_1
+        """
+        return {
+            "address_1": location_name,
+            "city": "",
+            "state_province": "",
+            "postal_code": "",
+            "country": "US",
+            "address_type": "physical",
+        }
+
+    @staticmethod
+    def _enrichment_needs(location_data: Dict[str, Any]) -> Tuple[bool, bool, bool]:
+        """Work out which lookups a location needs.
+
+        Args:
+            location_data: Location dictionary
+
+        Returns:
+            Tuple of (needs geocoding, needs reverse geocoding,
+            needs postal enrichment)
+        """
+        needs_geocoding = (
+            location_data.get("latitude") is None
+            or location_data.get("longitude") is None
+        )
+        # Check for both "address" and "addresses" keys
+        addresses = location_data.get("addresses") or location_data.get("address") or []
+
+        needs_reverse_geocoding = not needs_geocoding and addresses == []
+        needs_postal_enrichment = any(
+            not address.get("postal_code") for address in addresses
+        )
+        return needs_geocoding, needs_reverse_geocoding, needs_postal_enrichment
+
     def enrich_location(
         self, location_data: Dict[str, Any], scraper_id: Optional[str] = None
     ) -> Tuple[Dict[str, Any], Optional[str]]:
@@ -104,42 +167,36 @@ class GeocodingEnricher:
         """
         location_name = location_data.get("name", "Unknown Location")
         location_type = location_data.get("location_type", "physical")
-        logger.info(f"🌟 ENRICHER: Starting enrichment for location: {location_name}")
-        logger.info(f"🌟 ENRICHER: Location type: {location_type}")
-        logger.info(f"🌟 ENRICHER: Enabled: {self.enabled}")
-        logger.info(f"🌟 ENRICHER: Location data: {location_data}")
+        logger.debug(
+            "🌟 ENRICHER: Starting enrichment for location %r (type=%s, enabled=%s)",
+            location_name,
+            location_type,
+            self.enabled,
+        )
 
         if not self.enabled:
-            logger.info("🌟 ENRICHER: Enrichment disabled, returning original data")
+            logger.debug("🌟 ENRICHER: Enrichment disabled, returning original data")
             return location_data, None
 
         # Skip enrichment for virtual locations
         if location_type == "virtual":
-            logger.info(
-                f"🌟 ENRICHER: Skipping enrichment for virtual location: {location_name}"
+            logger.debug(
+                "🌟 ENRICHER: Skipping enrichment for virtual location %r",
+                location_name,
             )
             return location_data, None
 
         # Check if location needs enrichment
-        needs_geocoding = (
-            location_data.get("latitude") is None
-            or location_data.get("longitude") is None
+        needs_geocoding, needs_reverse_geocoding, needs_postal_enrichment = (
+            self._enrichment_needs(location_data)
+        )
+        logger.debug(
+            "📍 ENRICHER: %r needs geocoding=%s reverse=%s postal=%s",
+            location_name,
+            needs_geocoding,
+            needs_reverse_geocoding,
+            needs_postal_enrichment,
         )
-        # Check for both "address" and "addresses" keys
-        addresses = location_data.get("addresses") or location_data.get("address") or []
-
-        needs_reverse_geocoding = not needs_geocoding and addresses == []
-        needs_postal_enrichment = False
-
-        if addresses:
-            for address in addresses:
-                if not address.get("postal_code"):
-                    needs_postal_enrichment = True
-                    break
-
-        logger.info(f"📍 ENRICHER: Needs geocoding: {needs_geocoding}")
-        logger.info(f"📍 ENRICHER: Needs reverse geocoding: {needs_reverse_geocoding}")
-        logger.info(f"📍 ENRICHER: Needs postal enrichment: {needs_postal_enrichment}")
 
         # If location has complete data, no enrichment needed
         if (
@@ -147,8 +204,9 @@ class GeocodingEnricher:
             and not needs_reverse_geocoding
             and not needs_postal_enrichment
         ):
-            logger.info(
-                f"✅ ENRICHER: Location '{location_name}' has complete data, no enrichment needed"
+            logger.debug(
+                "✅ ENRICHER: Location %r has complete data, no enrichment needed",
+                location_name,
             )
             return location_data, None
 
@@ -163,40 +221,31 @@ class GeocodingEnricher:
 
                 # If no addresses array, try to create one from the name
                 if not has_addresses and location_name:
-                    logger.info(
-                        f"🔍 ENRICHER: No address array found, attempting to extract from name: '{location_name}'"
-                    )
-                    # Create a temporary address from the name
-                    # Many NYC locations have addresses in the name like "58-25 LITTLE NECK PKWY (LITTLE NECK)"
-                    enriched["addresses"] = [
-                        {
-                            "address_1": location_name,
-                            "city": "",
-                            "state_province": "",
-                            "postal_code": "",
-                            "country": "US",
-                            "address_type": "physical",
-                        }
-                    ]
-                    logger.info(
-                        "🔍 ENRICHER: Created temporary address from name for geocoding"
+                    logger.debug(
+                        "🔍 ENRICHER: No address array found, extracting from name %r",
+                        location_name,
                     )
+                    enriched["addresses"] = [self._name_as_address(location_name)]
 
                 # Normalize to "addresses" if we have "address"
                 if enriched.get("address") and not enriched.get("addresses"):
                     enriched["addresses"] = enriched["address"]
 
                 if enriched.get("addresses"):
-                    logger.info(
-                        f"🔍 ENRICHER: Geocoding missing coordinates for '{location_name}'"
+                    logger.debug(
+                        "🔍 ENRICHER: Geocoding missing coordinates for %r",
+                        location_name,
                     )
                     result = self._geocode_missing_coordinates(enriched, scraper_id)
                     if result:
                         coords, source = result
                         # Check if we got valid coordinates (not None, None)
                         if coords and coords[0] is not None and coords[1] is not None:
-                            logger.info(
-                                f"✅ ENRICHER: Successfully geocoded '{location_name}' to {coords} using {source}"
+                            logger.debug(
+                                "✅ ENRICHER: Geocoded %r to %s using %s",
+                                location_name,
+                                coords,
+                                source,
                             )
                             enriched["latitude"], enriched["longitude"] = coords
                             enriched["geocoding_source"] = source  # Track the source
@@ -208,8 +257,10 @@ class GeocodingEnricher:
                                 if not addr.get("city") or not addr.get(
                                     "state_province"
                                 ):
-                                    logger.info(
-                                        f"🔍 ENRICHER: Reverse geocoding to fill missing address fields for '{location_name}'"
+                                    logger.debug(
+                                        "🔍 ENRICHER: Reverse geocoding to fill missing "
+                                        "address fields for %r",
+                                        location_name,
                                     )
                                     reverse_result = (
                                         self._reverse_geocode_missing_address(enriched)
@@ -250,46 +301,57 @@ class GeocodingEnricher:
                                             ] += 1
                         else:
                             logger.warning(
-                                f"❌ ENRICHER: Geocoding returned invalid coordinates for '{location_name}': {coords}"
+                                "❌ ENRICHER: Geocoding returned invalid coordinates "
+                                "for %r: %s",
+                                location_name,
+                                coords,
                             )
                     else:
                         logger.warning(
-                            f"❌ ENRICHER: All geocoding attempts failed for '{location_name}'"
+                            "❌ ENRICHER: All geocoding attempts failed for %r",
+                            location_name,
                         )
                 else:
                     logger.warning(
-                        f"❌ ENRICHER: Cannot geocode '{location_name}' - no address information available"
+                        "❌ ENRICHER: Cannot geocode %r - no address information available",
+                        location_name,
                     )
 
             # Reverse geocode missing address
             elif needs_reverse_geocoding:
-                logger.info(
-                    f"🔍 ENRICHER: Reverse geocoding missing address for '{location_name}'"
-                )
-                logger.info(
-                    f"🔍 ENRICHER: Using coordinates: {enriched.get('latitude')}, {enriched.get('longitude')}"
+                logger.debug(
+                    "🔍 ENRICHER: Reverse geocoding missing address for %r at %s, %s",
+                    location_name,
+                    enriched.get("latitude"),
+                    enriched.get("longitude"),
                 )
                 reverse_result = self._reverse_geocode_missing_address(enriched)
                 if reverse_result:
                     address_data, source = reverse_result
                     if address_data:
-                        logger.info(
-                            f"✅ ENRICHER: Successfully reverse geocoded '{location_name}' using {source}"
+                        logger.debug(
+                            "✅ ENRICHER: Reverse geocoded %r using %s: %s",
+                            location_name,
+                            source,
+                            address_data,
                         )
-                        logger.info(f"✅ ENRICHER: Address data: {address_data}")
                         # Normalize state to 2-letter code
                         state_value = address_data.get("state") or ""
                         normalized_state = normalize_state_to_code(state_value)
                         if not normalized_state and state_value:
                             logger.warning(
-                                f"Could not normalize state '{state_value}' to 2-letter code"
+                                "Could not normalize state %r to 2-letter code",
+                                state_value,
                             )
                             # Prevent corrupted state data - only use if it's 2 chars
                             if len(state_value) == 2 and state_value.isalpha():
                                 normalized_state = state_value.upper()
                             else:
                                 logger.error(
-                                    f"Rejecting invalid state value with length {len(state_value)}: '{state_value[:50]}...'"
+                                    "Rejecting invalid state value with length %d: "
+                                    "'%s...'",
+                                    len(state_value),
+                                    state_value[:50],
                                 )
                                 normalized_state = (
                                     ""  # Use empty string rather than corrupted data
@@ -307,25 +369,29 @@ class GeocodingEnricher:
                         ]
                     else:
                         logger.warning(
-                            f"❌ ENRICHER: Reverse geocoding returned empty address data for '{location_name}'"
+                            "❌ ENRICHER: Reverse geocoding returned empty address data "
+                            "for %r",
+                            location_name,
                         )
                 else:
                     logger.warning(
-                        f"❌ ENRICHER: Reverse geocoding failed for '{location_name}'"
+                        "❌ ENRICHER: Reverse geocoding failed for %r", location_name
                     )
 
             # Enrich postal code if missing
             # Check for both "address" and "addresses" keys
             addresses_for_postal = enriched.get("addresses") or enriched.get("address")
             if needs_postal_enrichment and addresses_for_postal:
-                logger.info(f"🔍 ENRICHER: Enriching postal code for '{location_name}'")
+                logger.debug("🔍 ENRICHER: Enriching postal code for %r", location_name)
                 postal_result = self._enrich_postal_code(enriched)
                 if postal_result:
                     enriched, postal_source = postal_result
                     if postal_source and not source:
                         source = postal_source
-                        logger.info(
-                            f"✅ ENRICHER: Successfully enriched postal code for '{location_name}' using {postal_source}"
+                        logger.debug(
+                            "✅ ENRICHER: Enriched postal code for %r using %s",
+                            location_name,
+                            postal_source,
                         )
 
             # Auto-correct state mismatches before returning
@@ -333,12 +399,14 @@ class GeocodingEnricher:
 
         except Exception as e:
             logger.error(
-                f"❌ ENRICHER: Failed to enrich location '{location_name}': {e}",
+                "❌ ENRICHER: Failed to enrich location %r: %s",
+                location_name,
+                e,
                 exc_info=True,
             )
 
-        logger.info(
-            f"🎯 ENRICHER: Finished enriching '{location_name}', source: {source}"
+        logger.debug(
+            "🎯 ENRICHER: Finished enriching %r, source: %s", location_name, source
         )
         return enriched, source
 
@@ -380,14 +448,18 @@ class GeocodingEnricher:
 
                 validator = GeocodingValidator()
                 if not validator.is_within_state_bounds(lat, lng, claimed_state):
-                    # Coordinates don't match claimed state
-                    # Try to find which state they're actually in
-                    for state in (
-                        [zip_state, city_state] if zip_state or city_state else []
-                    ):
-                        if state and validator.is_within_state_bounds(lat, lng, state):
-                            coord_state = state
-                            break
+                    # Coordinates don't match claimed state; find which state
+                    # they're actually in from the offline outline index
+                    coord_state = get_state_from_coordinates(lat, lng)
+                    if coord_state is None:
+                        for state in (
+                            [zip_state, city_state] if zip_state or city_state else []
+                        ):
+                            if state and validator.is_within_state_bounds(
+                                lat, lng, state
+                            ):
+                                coord_state = state
+                                break
 
             # Resolve conflicts
             resolved_state, reason = resolve_state_conflict(
@@ -431,31 +503,64 @@ class GeocodingEnricher:
 
         return location_data
 
-    def _geocode_missing_coordinates(
+    def _geocoding_address_string(
         self, location_data: Dict[str, Any], scraper_id: Optional[str] = None
-    ) -> Tuple[Optional[Tuple[float, float]], Optional[str]]:
-        """Geocode address to get coordinates.
+    ) -> Optional[str]:
+        """Format a location's first address for forward geocoding.
 
         Args:
             location_data: Location data with address
             scraper_id: Optional scraper identifier for context
 
         Returns:
-            Tuple of (coordinates, provider source) or (None, None) if all attempts fail
+            Address string, or None if the location has no addresses
         """
         if not location_data.get("addresses"):
-            return None, None
+            return None
 
         address = location_data["addresses"][0]
 
         # Enhance address with scraper context if available
         if scraper_id:
             address = enhance_address_with_context(address, scraper_id)
-            address_str = format_address_for_geocoding(address, scraper_id)
-        else:
-            address_str = self._format_address(address)
+            return format_address_for_geocoding(address, scraper_id)
+        return self._format_address(address)
 
-        logger.debug(f"Attempting to geocode: {address_str}")
+    def _geocode_missing_coordinates(
+        self, location_data: Dict[str, Any], scraper_id: Optional[str] = None
+    ) -> Tuple[Optional[Tuple[float, float]], Optional[str]]:
+        """Geocode address to get coordinates.
+
+        Args:
+            location_data: Location data with address
+            scraper_id: Optional scraper identifier for context
+
+        Returns:
+            Tuple of (coordinates, provider source) or (None, None) if all attempts fail
+        """
+        address_str = self._geocoding_address_string(location_data, scraper_id)
+        if address_str is None:
+            return None, None
+
+        prefetched = self._prefetched_lookups.get(("geocode", address_str))
+        if prefetched is not None:
+            return prefetched
+        return self._geocode_address(address_str)
+
+    def _geocode_address(
+        self, address_str: str
+    ) -> Tuple[Optional[Tuple[float, float]], Optional[str]]:
+        """Geocode an address string through the provider fallback chain.
+
+        Safe to call from the enrichment worker pool.
+
+        Args:
+            address_str: Formatted address string
+
+        Returns:
+            Tuple of (coordinates, provider source) or (None, None) if all attempts fail
+        """
+        logger.debug("Attempting to geocode: %s", address_str)
 
         # Ensure we try ALL configured providers including census
         all_providers = ["amazon-location", "arcgis", "nominatim", "census"]
@@ -470,42 +575,46 @@ class GeocodingEnricher:
             cached_coords = self._get_cached_coordinates(provider, address_str)
             if cached_coords:
                 self._increment_cache_metric("hits")
-                self._enrichment_details["cache_hits"] += 1
+                with self._lock:
+                    self._enrichment_details["cache_hits"] += 1
                 # Validate cached coordinates are not None
                 if cached_coords[0] is not None and cached_coords[1] is not None:
                     return cached_coords, provider
                 else:
                     logger.debug(
-                        f"Cached coordinates invalid for {provider}: {cached_coords}"
+                        "Cached coordinates invalid for %s: %s",
+                        provider,
+                        cached_coords,
                     )
 
             self._increment_cache_metric("misses")
 
             # Check if provider is in circuit breaker open state
             if self._is_circuit_open(provider):
-                logger.debug(f"Circuit breaker open for {provider}, skipping")
+                logger.debug("Circuit breaker open for %s, skipping", provider)
                 continue
 
             # Try with minimal retry logic for provider fallback
             # Each provider gets one attempt in the fallback chain
             # Only retry on specific network/timeout errors, not general failures
-            logger.info(f"Trying {provider} for: {address_str[:50]}...")
+            logger.debug("Trying %s for: %s...", provider, address_str[:50])
             coords = self._geocode_with_retry(provider, address_str, max_retries=2)
-            self._enrichment_details["geocoding_calls"] += 1
+            with self._lock:
+                self._enrichment_details["geocoding_calls"] += 1
 
             if coords and coords[0] is not None and coords[1] is not None:
                 # Cache the result in Redis
                 self._cache_coordinates(provider, address_str, coords)
                 self._increment_provider_metric(provider, "success")
                 self._reset_circuit_breaker(provider)
-                logger.info(f"✅ Successfully geocoded with {provider}: {coords}")
+                logger.debug("Successfully geocoded with %s: %s", provider, coords)
                 return coords, provider
             else:
                 self._increment_provider_metric(provider, "failure")
                 self._record_circuit_failure(provider)
-                logger.debug(f"Failed to geocode with {provider}")
+                logger.debug("Failed to geocode with %s", provider)
 
-        logger.error(f"All geocoding providers failed for address: {address_str}")
+        logger.error("All geocoding providers failed for address: %s", address_str)
         return None, None
 
     def _reverse_geocode_missing_address(
@@ -525,12 +634,31 @@ class GeocodingEnricher:
         if lat is None or lon is None:
             return None, None
 
+        prefetched = self._prefetched_lookups.get(("reverse", lat, lon))
+        if prefetched is not None:
+            return prefetched
+        return self._reverse_geocode_coordinates(lat, lon)
+
+    def _reverse_geocode_coordinates(
+        self, lat: float, lon: float
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Reverse geocode a coordinate pair.
+
+        Safe to call from the enrichment worker pool.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Tuple of (address data, provider source)
+        """
         try:
             address_data = self.geocoding_service.reverse_geocode(lat, lon)
             if address_data:
                 return address_data, "arcgis"
         except Exception as e:
-            logger.warning(f"Reverse geocoding failed: {e}")
+            logger.warning("Reverse geocoding failed: %s", e)
 
         return None, None
 
@@ -608,11 +736,120 @@ class GeocodingEnricher:
 
         return ", ".join(parts)
 
+    def _run_lookups(
+        self, lookup: Callable[..., Tuple[Any, Any]], keys: List[Tuple[Any, ...]]
+    ) -> Dict[Tuple[Any, ...], Tuple[Any, Any]]:
+        """Resolve distinct lookups on a worker pool scoped to this batch.
+
+        Args:
+            lookup: Function called with each key's arguments
+            keys: Distinct argument tuples
+
+        Returns:
+            Mapping of argument tuple to lookup result
+        """
+        if not keys:
+            return {}
+        if self.concurrency == 1 or len(keys) == 1:
+            return {key: lookup(*key) for key in keys}
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(keys)),
+            thread_name_prefix="enrichment",
+        ) as executor:
+            futures = {key: executor.submit(lookup, *key) for key in keys}
+            return {key: future.result() for key, future in futures.items()}
+
+    def _prefetch_lookups(
+        self, locations: List[Dict[str, Any]], scraper_id: Optional[str] = None
+    ) -> None:
+        """Resolve every geocoding lookup a job needs before applying them.
+
+        Forward geocodes are collected and deduplicated first. Reverse
+        geocodes depend on their coordinates, so they are collected in a
+        second pass from the original and newly geocoded coordinates. Both
+        passes run concurrently on the worker pool, and the results are
+        stored in ``_prefetched_lookups`` for ``enrich_location`` to consume.
+
+        Args:
+            locations: Location dictionaries from the job
+            scraper_id: Optional scraper identifier for context
+        """
+        plans = []
+        addresses: Dict[str, None] = {}
+        for location in locations:
+            if not isinstance(location, dict):
+                continue
+            if location.get("location_type", "physical") == "virtual":
+                continue
+            needs_geocoding, needs_reverse, needs_postal = self._enrichment_needs(
+                location
+            )
+            address_str = None
+            first_address: Dict[str, Any] = {}
+            if needs_geocoding:
+                location_addresses = location.get("addresses") or location.get(
+                    "address"
+                )
+                if not location_addresses and location.get("name"):
+                    location_addresses = [
+                        self._name_as_address(location.get("name", ""))
+                    ]
+                if location_addresses:
+                    first_address = location_addresses[0]
+                    address_str = self._geocoding_address_string(
+                        {"addresses": location_addresses}, scraper_id
+                    )
+                    if address_str is not None:
+                        addresses[address_str] = None
+            plans.append(
+                (location, address_str, first_address, needs_reverse, needs_postal)
+            )
+
+        geocoded = self._run_lookups(
+            self._geocode_address, [(address,) for address in addresses]
+        )
+        for (address,), result in geocoded.items():
+            self._prefetched_lookups[("geocode", address)] = result
+
+        coordinates: Dict[Tuple[float, float], None] = {}
+        for location, address_str, first_address, needs_reverse, needs_postal in plans:
+            if address_str is not None:
+                coords = geocoded[(address_str,)][0]
+                if not coords or coords[0] is None or coords[1] is None:
+                    continue
+                backfill = not first_address.get("city") or not first_address.get(
+                    "state_province"
+                )
+                if backfill or needs_postal:
+                    coordinates[(coords[0], coords[1])] = None
+            elif needs_reverse or needs_postal:
+                lat, lon = location.get("latitude"), location.get("longitude")
+                if lat is not None and lon is not None:
+                    coordinates[(lat, lon)] = None
+
+        reversed_ = self._run_lookups(
+            self._reverse_geocode_coordinates, list(coordinates)
+        )
+        for (lat, lon), result in reversed_.items():
+            self._prefetched_lookups[("reverse", lat, lon)] = result
+
+        logger.info(
+            "🌟 ENRICHER: Prefetched %d geocode and %d reverse geocode lookups "
+            "with concurrency %d",
+            len(geocoded),
+            len(reversed_),
+            self.concurrency,
+        )
+
     def enrich_job_data(
         self, job_data: Dict[str, Any], scraper_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Enrich all locations in job data.
 
+        All needed lookups are resolved concurrently up front, then applied
+        to each location in order.
+
         Args:
             job_data: Job data with organization, service, and location arrays
             scraper_id: Optional scraper identifier for context
@@ -620,18 +857,17 @@ class GeocodingEnricher:
         Returns:
             Enriched job data
         """
-        logger.info("🌟 ENRICHER: Starting enrichment process")
-        logger.info(f"🌟 ENRICHER: Enabled: {self.enabled}")
-        logger.info(f"🌟 ENRICHER: Providers: {self.providers}")
-        if scraper_id:
-            logger.info(f"🌟 ENRICHER: Using scraper context: {scraper_id}")
+        logger.debug(
+            "🌟 ENRICHER: Starting enrichment (enabled=%s, providers=%s, scraper=%s)",
+            self.enabled,
+            self.providers,
+            scraper_id,
+        )
 
         if not self.enabled:
-            logger.info("🌟 ENRICHER: Enrichment disabled, returning original data")
+            logger.debug("🌟 ENRICHER: Enrichment disabled, returning original data")
             return job_data
 
-        logger.info(f"🌟 ENRICHER: Input data keys: {list(job_data.keys())}")
-
         enriched_data = job_data.copy()
         self._enrichment_details = {
             "locations_enriched": 0,
@@ -657,36 +893,44 @@ class GeocodingEnricher:
             location_key = "locations"
             location_count = len(enriched_data["locations"])
 
-        logger.info(
-            f"🌟 ENRICHER: Found {location_count} locations in key '{location_key}'"
+        logger.debug(
+            "🌟 ENRICHER: Found %d locations in key %r", location_count, location_key
         )
 
         if location_key and location_count > 0:
-            # Enrich each location
-            for i, location in enumerate(enriched_data[location_key]):
-                logger.info(f"📍 ENRICHER: Processing location {i+1}/{location_count}")
-                logger.info(f"📍 ENRICHER: Location data: {location}")
-
-                enriched_location, source = self.enrich_location(location, scraper_id)
-                enriched_data[location_key][i] = enriched_location
-
-                if source:
-                    self._enrichment_details["locations_enriched"] += 1
-                    location_name = location.get("name", f"Location {i+1}")
-                    self._enrichment_details["sources"][location_name] = source
-                    logger.info(
-                        f"✨ ENRICHER: Location '{location_name}' enriched using {source}"
+            try:
+                self._prefetch_lookups(enriched_data[location_key], scraper_id)
+
+                # Apply the resolved lookups to each location
+                for i, location in enumerate(enriched_data[location_key]):
+                    logger.debug(
+                        "📍 ENRICHER: Processing location %d/%d", i + 1, location_count
                     )
-                else:
-                    logger.info(
-                        f"📍 ENRICHER: Location {i+1} did not require enrichment"
+
+                    enriched_location, source = self.enrich_location(
+                        location, scraper_id
                     )
+                    enriched_data[location_key][i] = enriched_location
+
+                    if source:
+                        self._enrichment_details["locations_enriched"] += 1
+                        location_name = location.get("name", f"Location {i+1}")
+                        self._enrichment_details["sources"][location_name] = source
+                        logger.debug(
+                            "✨ ENRICHER: Location %r enriched using %s",
+                            location_name,
+                            source,
+                        )
+            finally:
+                self._prefetched_lookups = {}
 
         logger.info(
-            f"🎯 ENRICHER: Enrichment complete - {self._enrichment_details['locations_enriched']} locations enriched"
+            "🎯 ENRICHER: Enrichment complete - %d of %d locations enriched",
+            self._enrichment_details["locations_enriched"],
+            location_count,
         )
-        logger.info(
-            f"🎯 ENRICHER: Final enrichment details: {self._enrichment_details}"
+        logger.debug(
+            "🎯 ENRICHER: Final enrichment details: %s", self._enrichment_details
         )
 
         return enriched_data
@@ -764,16 +1008,17 @@ class GeocodingEnricher:
         Returns:
             True if circuit is open (provider should be skipped)
         """
-        state = self._circuit_state.get(provider)
-        if not state or state.get("state") != "open":
-            return False
+        with self._lock:
+            state = self._circuit_state.get(provider)
+            if not state or state.get("state") != "open":
+                return False
 
-        cooldown_until = state.get("cooldown_until", 0)
-        if cooldown_until > time.time():
-            return True
+            cooldown_until = state.get("cooldown_until", 0)
+            if cooldown_until > time.time():
+                return True
 
-        # Cooldown expired, reset
-        self._circuit_state.pop(provider, None)
+            # Cooldown expired, reset
+            self._circuit_state.pop(provider, None)
         logger.info(f"Circuit breaker for {provider} reset after cooldown")
         return False
 
@@ -787,13 +1032,16 @@ class GeocodingEnricher:
         threshold = provider_cfg.get("circuit_breaker_threshold", 5)
         cooldown = provider_cfg.get("circuit_breaker_cooldown", 300)
 
-        state = self._circuit_state.setdefault(provider, {"failures": 0})
-        state["failures"] = state.get("failures", 0) + 1
+        with self._lock:
+            state = self._circuit_state.setdefault(provider, {"failures": 0})
+            state["failures"] = state.get("failures", 0) + 1
+            opened = state["failures"] >= threshold
+            if opened:
+                state["state"] = "open"
+                state["cooldown_until"] = time.time() + cooldown
+                state["failures"] = 0
 
-        if state["failures"] >= threshold:
-            state["state"] = "open"
-            state["cooldown_until"] = time.time() + cooldown
-            state["failures"] = 0
+        if opened:
             logger.warning(
                 f"Circuit breaker opened for {provider} after {threshold} failures"
             )
@@ -804,7 +1052,8 @@ class GeocodingEnricher:
         Args:
             provider: Provider name
         """
-        self._circuit_state.pop(provider, None)
+        with self._lock:
+            self._circuit_state.pop(provider, None)
 
     def _get_cached_coordinates(
         self, provider: str, address: str
@@ -849,7 +1098,8 @@ class GeocodingEnricher:
         Args:
             metric_type: Type of metric (hits or misses)
         """
-        self._metrics[f"cache:{metric_type}"] += 1
+        with self._lock:
+            self._metrics[f"cache:{metric_type}"] += 1
 
     def _increment_provider_metric(self, provider: str, result: str) -> None:
         """Increment provider metric counter (in-memory).
@@ -858,7 +1108,8 @@ class GeocodingEnricher:
             provider: Provider name
             result: Result type (success or failure)
         """
-        self._metrics[f"{provider}:{result}"] += 1
+        with self._lock:
+            self._metrics[f"{provider}:{result}"] += 1
 
     def get_enrichment_details(self) -> Dict[str, Any]:
         """Get details about the last enrichment operation.
@@ -0,0 +1,175 @@
+-- Migration: location_search — indexed search document per canonical location.
+--
+-- /api/v1/map/search used to match `q` with LIKE '%q%' over LOWER(location
+-- name), which can't use a btree and forced a sequential scan (plus the
+-- address/organization joins) on every keystroke-driven search. This table
+-- keeps one pre-folded search document per canonical location:
+--
+--   * name_text / address_text / description_text hold lowercased,
+--     whitespace-collapsed text assembled from location, organization and
+--     address rows.
+--   * search_vector is a generated, weighted tsvector (names A, address B,
+--     descriptions C) backed by a GIN index, queried with
+--     websearch_to_tsquery plus a prefix to_tsquery fallback for the word
+--     still being typed, ranked with ts_rank.
+--   * folded_text (names + address) carries a pg_trgm GIN index so substring
+--     matches ("ave" inside "5th avenue") stay indexed too.
+--
+-- Rows are maintained by triggers on location, address and organization, so
+-- no batch refresh is needed after the initial backfill.
+--
+-- Idempotent: safe to re-run.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION public.location_search_fold(value TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT btrim(regexp_replace(lower(COALESCE(value, '')), '\s+', ' ', 'g'))
+$$;
+
+CREATE TABLE IF NOT EXISTS public.location_search (
+    location_id      character varying(250) PRIMARY KEY
+                     REFERENCES public.location(id) ON DELETE CASCADE,
+    name_text        TEXT NOT NULL DEFAULT '',
+    address_text     TEXT NOT NULL DEFAULT '',
+    description_text TEXT NOT NULL DEFAULT '',
+    folded_text      TEXT GENERATED ALWAYS AS (
+        name_text || ' ' || address_text
+    ) STORED,
+    search_vector    tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', name_text), 'A')
+        || setweight(to_tsvector('english', address_text), 'B')
+        || setweight(to_tsvector('english', description_text), 'C')
+    ) STORED,
+    updated_at       TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS location_search_vector_idx
+    ON public.location_search USING gin (search_vector);
+
+CREATE INDEX IF NOT EXISTS location_search_folded_trgm_idx
+    ON public.location_search USING gin (folded_text gin_trgm_ops);
+
+-- Source rows for the search document of every canonical location.
+CREATE OR REPLACE VIEW public.location_search_source AS
+SELECT
+    l.id AS location_id,
+    public.location_search_fold(concat_ws(' ', l.name, l.alternate_name, o.name))
+        AS name_text,
+    public.location_search_fold((
+        SELECT string_agg(
+            concat_ws(' ', a.address_1, a.address_2, a.city,
+                      a.state_province, a.postal_code),
+            ' '
+        )
+        FROM public.address a
+        WHERE a.location_id = l.id
+    )) AS address_text,
+    public.location_search_fold(concat_ws(' ', l.description, o.description))
+        AS description_text
+FROM public.location l
+LEFT JOIN public.organization o ON o.id = l.organization_id
+WHERE l.is_canonical = true;
+
+CREATE OR REPLACE FUNCTION public.refresh_location_search(p_location_id TEXT)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_location_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO public.location_search (
+        location_id, name_text, address_text, description_text, updated_at
+    )
+    SELECT location_id, name_text, address_text, description_text, now()
+    FROM public.location_search_source
+    WHERE location_id = p_location_id
+    ON CONFLICT (location_id) DO UPDATE SET
+        name_text = EXCLUDED.name_text,
+        address_text = EXCLUDED.address_text,
+        description_text = EXCLUDED.description_text,
+        updated_at = EXCLUDED.updated_at;
+
+    IF NOT FOUND THEN
+        -- No longer canonical (or gone): drop it from the search table
+        DELETE FROM public.location_search WHERE location_id = p_location_id;
+    END IF;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.location_search_location_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM public.refresh_location_search(NEW.id);
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.location_search_address_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM public.refresh_location_search(OLD.location_id);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.location_id IS DISTINCT FROM
+           CASE WHEN TG_OP = 'UPDATE' THEN OLD.location_id END THEN
+        PERFORM public.refresh_location_search(NEW.location_id);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.location_search_organization_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM public.refresh_location_search(l.id)
+    FROM public.location l
+    WHERE l.organization_id = NEW.id;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS location_search_location_sync ON public.location;
+CREATE TRIGGER location_search_location_sync
+    AFTER INSERT OR UPDATE OF name, alternate_name, description,
+        organization_id, is_canonical
+    ON public.location
+    FOR EACH ROW EXECUTE FUNCTION public.location_search_location_trigger();
+
+DROP TRIGGER IF EXISTS location_search_address_sync ON public.address;
+CREATE TRIGGER location_search_address_sync
+    AFTER INSERT OR UPDATE OR DELETE
+    ON public.address
+    FOR EACH ROW EXECUTE FUNCTION public.location_search_address_trigger();
+
+DROP TRIGGER IF EXISTS location_search_organization_sync ON public.organization;
+CREATE TRIGGER location_search_organization_sync
+    AFTER UPDATE OF name, description
+    ON public.organization
+    FOR EACH ROW EXECUTE FUNCTION public.location_search_organization_trigger();
+
+-- Backfill existing canonical locations
+INSERT INTO public.location_search (
+    location_id, name_text, address_text, description_text
+)
+SELECT location_id, name_text, address_text, description_text
+FROM public.location_search_source
+ON CONFLICT (location_id) DO NOTHING;
+
+ANALYZE public.location_search;
+
+COMMIT;
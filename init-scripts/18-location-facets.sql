@@ -0,0 +1,195 @@
+-- Migration: service / language facets on location_search.
+--
+-- /api/v1/map/search accepted `services` and `languages` filters but only
+-- checked that they were non-empty, so clients over-fetched and filtered on
+-- their side. This adds two denormalized, GIN-indexed token arrays to each
+-- canonical location's location_search row:
+--
+--   * service_tokens  folded names of the services offered at the location
+--                     ("Food Pantry" -> 'food_pantry')
+--   * language_codes  folded language codes, falling back to the folded
+--                     language name when no code is recorded; includes
+--                     languages attached to the location and to its services
+--
+-- Filters become `&&` (any) / `@>` (all) array predicates, and facet counts
+-- come from unnest() over the same filtered rows.
+--
+-- The facet columns have their own view and refresh function (rather than
+-- extending location_search_source) so re-running 17-location-search.sql
+-- stays safe. Rows inserted by the location_search triggers pick up their
+-- facets through an AFTER INSERT trigger on location_search itself.
+--
+-- Idempotent: safe to re-run.
+
+BEGIN;
+
+-- Must stay identical to normalize_facet_token() in
+-- app/api/v1/map/search_service.py.
+CREATE OR REPLACE FUNCTION public.location_facet_token(value TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT NULLIF(
+        btrim(regexp_replace(lower(COALESCE(value, '')), '[^a-z0-9]+', '_', 'g'), '_'),
+        ''
+    )
+$$;
+
+ALTER TABLE public.location_search
+    ADD COLUMN IF NOT EXISTS service_tokens TEXT[] NOT NULL DEFAULT '{}',
+    ADD COLUMN IF NOT EXISTS language_codes TEXT[] NOT NULL DEFAULT '{}';
+
+CREATE INDEX IF NOT EXISTS location_search_service_tokens_idx
+    ON public.location_search USING gin (service_tokens);
+
+CREATE INDEX IF NOT EXISTS location_search_language_codes_idx
+    ON public.location_search USING gin (language_codes);
+
+CREATE OR REPLACE VIEW public.location_facet_source AS
+SELECT
+    l.id AS location_id,
+    ARRAY(
+        SELECT DISTINCT public.location_facet_token(s.name)
+        FROM public.service_at_location sal
+        JOIN public.service s ON s.id = sal.service_id
+        WHERE sal.location_id = l.id
+          AND public.location_facet_token(s.name) IS NOT NULL
+        ORDER BY 1
+    ) AS service_tokens,
+    ARRAY(
+        SELECT DISTINCT public.location_facet_token(
+            COALESCE(NULLIF(btrim(lg.code), ''), lg.name)
+        )
+        FROM public.language lg
+        WHERE (
+            lg.location_id = l.id
+            OR lg.service_id IN (
+                SELECT sal.service_id
+                FROM public.service_at_location sal
+                WHERE sal.location_id = l.id
+            )
+        )
+          AND public.location_facet_token(
+            COALESCE(NULLIF(btrim(lg.code), ''), lg.name)
+          ) IS NOT NULL
+        ORDER BY 1
+    ) AS language_codes
+FROM public.location l;
+
+CREATE OR REPLACE FUNCTION public.refresh_location_facets(p_location_id TEXT)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_location_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    UPDATE public.location_search ls
+    SET service_tokens = src.service_tokens,
+        language_codes = src.language_codes
+    FROM public.location_facet_source src
+    WHERE src.location_id = p_location_id
+      AND ls.location_id = p_location_id
+      AND (ls.service_tokens IS DISTINCT FROM src.service_tokens
+           OR ls.language_codes IS DISTINCT FROM src.language_codes);
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.location_facets_search_row_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM public.refresh_location_facets(NEW.location_id);
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.location_facets_sal_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM public.refresh_location_facets(OLD.location_id);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM public.refresh_location_facets(NEW.location_id);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.location_facets_service_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM public.refresh_location_facets(sal.location_id)
+    FROM public.service_at_location sal
+    WHERE sal.service_id = NEW.id;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.location_facets_language_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    lang RECORD;
+BEGIN
+    FOR lang IN
+        SELECT OLD.location_id AS location_id, OLD.service_id AS service_id
+        WHERE TG_OP IN ('UPDATE', 'DELETE')
+        UNION
+        SELECT NEW.location_id, NEW.service_id
+        WHERE TG_OP IN ('INSERT', 'UPDATE')
+    LOOP
+        PERFORM public.refresh_location_facets(lang.location_id);
+        PERFORM public.refresh_location_facets(sal.location_id)
+        FROM public.service_at_location sal
+        WHERE sal.service_id = lang.service_id;
+    END LOOP;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS location_facets_search_row_sync ON public.location_search;
+CREATE TRIGGER location_facets_search_row_sync
+    AFTER INSERT
+    ON public.location_search
+    FOR EACH ROW EXECUTE FUNCTION public.location_facets_search_row_trigger();
+
+DROP TRIGGER IF EXISTS location_facets_sal_sync ON public.service_at_location;
+CREATE TRIGGER location_facets_sal_sync
+    AFTER INSERT OR UPDATE OR DELETE
+    ON public.service_at_location
+    FOR EACH ROW EXECUTE FUNCTION public.location_facets_sal_trigger();
+
+DROP TRIGGER IF EXISTS location_facets_service_sync ON public.service;
+CREATE TRIGGER location_facets_service_sync
+    AFTER UPDATE OF name
+    ON public.service
+    FOR EACH ROW EXECUTE FUNCTION public.location_facets_service_trigger();
+
+DROP TRIGGER IF EXISTS location_facets_language_sync ON public.language;
+CREATE TRIGGER location_facets_language_sync
+    AFTER INSERT OR UPDATE OR DELETE
+    ON public.language
+    FOR EACH ROW EXECUTE FUNCTION public.location_facets_language_trigger();
+
+-- Backfill existing location_search rows
+UPDATE public.location_search ls
+SET service_tokens = src.service_tokens,
+    language_codes = src.language_codes
+FROM public.location_facet_source src
+WHERE src.location_id = ls.location_id
+  AND (ls.service_tokens IS DISTINCT FROM src.service_tokens
+       OR ls.language_codes IS DISTINCT FROM src.language_codes);
+
+ANALYZE public.location_search;
+
+COMMIT;
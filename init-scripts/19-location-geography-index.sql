@@ -0,0 +1,31 @@
+-- Migration: geography GiST index for map search radius queries.
+--
+-- /api/v1/map/search used to filter radius searches with
+-- 3959 * acos(sin·sin + cos·cos·cos) over every location row. Nothing can
+-- index that expression, so each radius search scanned the whole table.
+-- The search now filters with ST_DWithin on the location point cast to
+-- geography; this functional index over the exact same expression lets the
+-- planner answer the radius filter from GiST.
+--
+-- The expression must stay identical to _LOCATION_GEOGRAPHY in
+-- app/api/v1/map/search_service.py or the planner will not match it.
+--
+-- Idempotent: safe to re-run.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_location_geog ON public.location USING gist (
+    CAST(
+        ST_SetSRID(
+            ST_MakePoint(
+                CAST(longitude AS float8),
+                CAST(latitude AS float8)
+            ),
+            4326
+        ) AS geography
+    )
+);
+
+ANALYZE public.location;
+
+COMMIT;
@@ -0,0 +1,78 @@
+-- Migration: beacon_sync_state — change sequence for the Beacon sync feed.
+--
+-- /api/v1/partners/beacon/sync ran an ETag aggregate and a total count over
+-- location + address on every poll, even when nothing had changed, and
+-- partners poll it frequently. This keeps a monotonic change sequence that
+-- moves once per committing transaction that writes any table feeding the
+-- sync output (location, address, organization, phone, schedule, language,
+-- accessibility, location_source). The API caches the ETag and count per
+-- filter and sequence value, so a repeat poll with no changes costs one
+-- small aggregate over this table.
+--
+-- The sequence is the sum of BEACON_SYNC_SLOTS counter rows. Each writing
+-- transaction bumps the slot picked by its backend pid, so reconciler
+-- workers on different connections update different rows and don't queue
+-- behind one hot row lock. The sum only grows, and like any row update a
+-- bump is visible only once its transaction commits, so a reader can never
+-- see the new value without the rows that caused it (a nextval() sequence
+-- would be).
+--
+-- The bump runs from DEFERRABLE INITIALLY DEFERRED constraint triggers, so
+-- the slot lock is only taken at commit time. A transaction-local flag
+-- keeps it to one UPDATE per transaction however many rows were written.
+--
+-- Idempotent: safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.beacon_sync_state (
+    slot        SMALLINT PRIMARY KEY,
+    change_seq  BIGINT NOT NULL DEFAULT 0,
+    changed_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- BEACON_SYNC_SLOTS = 32; must match the modulus in beacon_sync_bump().
+INSERT INTO public.beacon_sync_state (slot)
+SELECT generate_series(0, 31)
+ON CONFLICT (slot) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION public.beacon_sync_bump()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF current_setting('beacon_sync.bumped', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    PERFORM set_config('beacon_sync.bumped', 'on', true);
+    UPDATE public.beacon_sync_state
+    SET change_seq = change_seq + 1,
+        changed_at = now()
+    WHERE slot = pg_backend_pid() % 32;
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY[
+        'location', 'address', 'organization', 'phone', 'schedule',
+        'language', 'accessibility', 'location_source'
+    ] LOOP
+        EXECUTE format(
+            'DROP TRIGGER IF EXISTS beacon_sync_bump ON public.%I', tbl
+        );
+        EXECUTE format(
+            'CREATE CONSTRAINT TRIGGER beacon_sync_bump '
+            'AFTER INSERT OR UPDATE OR DELETE ON public.%I '
+            'DEFERRABLE INITIALLY DEFERRED '
+            'FOR EACH ROW EXECUTE FUNCTION public.beacon_sync_bump()',
+            tbl
+        );
+    END LOOP;
+END;
+$$;
+
+COMMIT;
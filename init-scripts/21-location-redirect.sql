@@ -0,0 +1,202 @@
+-- Migration: location_redirect — flattened retired-id -> canonical map.
+--
+-- The Beacon redirects endpoint (and federation Tombstones) resolved every
+-- soft-deleted location id to its surviving canonical by loading the whole
+-- dedup_run_audit soft-delete chain and walking it in Python on each call.
+-- This table keeps the chain pre-walked:
+--
+--   * old_id        retired (soft-deleted / merged) location id
+--   * survivor_id   the location it was merged into (the chain edge)
+--   * canonical_id  terminal survivor after following survivor_id links;
+--                   NULL when the chain loops back on itself
+--   * merged_at     when old_id was merged (latest merge wins)
+--
+-- Path compression runs whenever an edge is added or changed: every row
+-- whose chain passes through the changed id is re-pointed at the new
+-- terminal, so a lookup is a single primary-key read.
+--
+-- Edges come from dedup_run_audit soft_delete rows (trigger below; the audit
+-- table is created here with the same DDL the dedup scripts use lazily) and
+-- from scripts that write no audit row calling location_redirect_record()
+-- directly. rebuild_location_redirect() re-syncs edges from the audit table
+-- and recomputes every canonical_id (scripts/rebuild_location_redirects.py).
+--
+-- Idempotent: safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.dedup_run_audit (
+    id BIGSERIAL PRIMARY KEY,
+    run_id UUID NOT NULL,
+    cluster_id TEXT NOT NULL,
+    survivor_id UUID NOT NULL,
+    duplicate_id UUID,
+    table_name TEXT NOT NULL,
+    row_id TEXT NOT NULL,
+    action TEXT NOT NULL
+        CHECK (action IN ('repoint', 'delete', 'soft_delete')),
+    old_value JSONB,
+    new_value JSONB,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+CREATE INDEX IF NOT EXISTS idx_dedup_run_audit_run_id
+    ON public.dedup_run_audit(run_id);
+
+CREATE TABLE IF NOT EXISTS public.location_redirect (
+    old_id        character varying(250) PRIMARY KEY,
+    survivor_id   character varying(250) NOT NULL,
+    canonical_id  character varying(250),
+    merged_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS location_redirect_survivor_idx
+    ON public.location_redirect(survivor_id);
+
+CREATE INDEX IF NOT EXISTS location_redirect_canonical_idx
+    ON public.location_redirect(canonical_id);
+
+-- Re-resolve p_id and every row whose survivor chain reaches it. Rows that
+-- don't pass through p_id keep their (already compressed) canonical_id.
+CREATE OR REPLACE FUNCTION public.location_redirect_resolve(p_id TEXT)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_affected TEXT[];
+    v_survivor TEXT;
+    v_terminal TEXT;
+BEGIN
+    WITH RECURSIVE affected(old_id) AS (
+        SELECT p_id
+        UNION
+        SELECT r.old_id
+        FROM public.location_redirect r
+        JOIN affected a ON r.survivor_id = a.old_id
+    )
+    SELECT array_agg(old_id) INTO v_affected FROM affected;
+
+    SELECT survivor_id INTO v_survivor
+    FROM public.location_redirect
+    WHERE old_id = p_id;
+
+    IF NOT FOUND THEN
+        -- p_id is not retired: it is the terminal for everything above it
+        v_terminal := p_id;
+    ELSIF v_survivor = ANY(v_affected) THEN
+        -- p_id's survivor leads back to p_id: no terminal for any of them
+        v_terminal := NULL;
+    ELSE
+        SELECT canonical_id INTO v_terminal
+        FROM public.location_redirect
+        WHERE old_id = v_survivor;
+        IF NOT FOUND THEN
+            v_terminal := v_survivor;
+        END IF;
+    END IF;
+
+    UPDATE public.location_redirect
+    SET canonical_id = v_terminal
+    WHERE old_id = ANY(v_affected)
+      AND canonical_id IS DISTINCT FROM v_terminal;
+END;
+$$;
+
+-- Record that p_old_id was merged into p_survivor_id. A later merge of the
+-- same id replaces an earlier one (matching the latest-audit-row-wins rule
+-- of the old chain walk); an older one is ignored.
+CREATE OR REPLACE FUNCTION public.location_redirect_record(
+    p_old_id TEXT,
+    p_survivor_id TEXT,
+    p_merged_at TIMESTAMPTZ DEFAULT now()
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO public.location_redirect (old_id, survivor_id, merged_at)
+    VALUES (p_old_id, p_survivor_id, p_merged_at)
+    ON CONFLICT (old_id) DO UPDATE SET
+        survivor_id = EXCLUDED.survivor_id,
+        merged_at = EXCLUDED.merged_at
+    WHERE public.location_redirect.merged_at <= EXCLUDED.merged_at;
+
+    PERFORM public.location_redirect_resolve(p_old_id);
+END;
+$$;
+
+-- Re-sync edges from dedup_run_audit and recompute every canonical_id.
+-- Edges recorded without an audit row (dedupe_same_org_locations.py) are
+-- kept. Returns the number of redirect rows.
+CREATE OR REPLACE FUNCTION public.rebuild_location_redirect()
+RETURNS BIGINT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_rows BIGINT;
+BEGIN
+    INSERT INTO public.location_redirect (old_id, survivor_id, merged_at)
+    SELECT DISTINCT ON (row_id) row_id, survivor_id::text, created_at
+    FROM public.dedup_run_audit
+    WHERE table_name = 'location' AND action = 'soft_delete'
+    ORDER BY row_id, created_at DESC, id DESC
+    ON CONFLICT (old_id) DO UPDATE SET
+        survivor_id = EXCLUDED.survivor_id,
+        merged_at = EXCLUDED.merged_at
+    WHERE public.location_redirect.merged_at <= EXCLUDED.merged_at;
+
+    WITH RECURSIVE walk(start_id, current_id, path, cyclic) AS (
+        SELECT old_id, survivor_id, ARRAY[old_id::text],
+               survivor_id = old_id
+        FROM public.location_redirect
+        UNION ALL
+        SELECT w.start_id, r.survivor_id, w.path || r.old_id::text,
+               r.survivor_id = ANY(w.path || r.old_id::text)
+        FROM walk w
+        JOIN public.location_redirect r ON r.old_id = w.current_id
+        WHERE NOT w.cyclic
+    ),
+    terminal AS (
+        SELECT w.start_id,
+               CASE WHEN w.cyclic THEN NULL ELSE w.current_id END AS canonical_id
+        FROM walk w
+        WHERE w.cyclic
+           OR NOT EXISTS (
+               SELECT 1 FROM public.location_redirect r
+               WHERE r.old_id = w.current_id
+           )
+    )
+    UPDATE public.location_redirect lr
+    SET canonical_id = t.canonical_id
+    FROM terminal t
+    WHERE lr.old_id = t.start_id
+      AND lr.canonical_id IS DISTINCT FROM t.canonical_id;
+
+    SELECT COUNT(*) INTO v_rows FROM public.location_redirect;
+    RETURN v_rows;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.location_redirect_audit_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM public.location_redirect_record(
+        NEW.row_id, NEW.survivor_id::text, NEW.created_at
+    );
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS location_redirect_audit_sync ON public.dedup_run_audit;
+CREATE TRIGGER location_redirect_audit_sync
+    AFTER INSERT
+    ON public.dedup_run_audit
+    FOR EACH ROW
+    WHEN (NEW.table_name = 'location' AND NEW.action = 'soft_delete')
+    EXECUTE FUNCTION public.location_redirect_audit_trigger();
+
+-- Backfill from any existing audit history
+SELECT public.rebuild_location_redirect();
+
+COMMIT;
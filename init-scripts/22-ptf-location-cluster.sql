@@ -0,0 +1,31 @@
+-- Migration: ptf_location_cluster — precomputed near-duplicate clusters.
+--
+-- /api/v1/partners/ptf/locations used to run ST_ClusterDBSCAN, a pairwise
+-- similarity() self-join and a recursive connected-components walk over
+-- every candidate on every feed request before it could page. The
+-- components are now computed ahead of time: one row per PTF candidate
+-- location holding the id of its cluster (the smallest member id), and
+-- the feed joins on location_id.
+--
+-- Populated and maintained from Python because the tier rule lives with
+-- the feed SQL (app/api/v1/partners/ptf/locations_queries.py):
+--   * the reconciler refreshes the clusters around each location it
+--     commits (app/api/v1/partners/ptf/location_clusters.py);
+--   * scripts/rebuild_ptf_location_clusters.py recomputes every cluster.
+-- Candidates with no row yet are served as singletons, so an empty table
+-- only disables the collapse; it never hides a location.
+--
+-- Idempotent: safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.ptf_location_cluster (
+    location_id   character varying(250) PRIMARY KEY,
+    cluster_id    character varying(250) NOT NULL,
+    refreshed_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ptf_location_cluster_cluster_idx
+    ON public.ptf_location_cluster(cluster_id);
+
+COMMIT;
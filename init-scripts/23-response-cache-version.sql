@@ -0,0 +1,44 @@
+-- Migration: extend beacon_sync_state.change_seq to every table behind the
+-- cached public read endpoints.
+--
+-- The API response cache (app/middleware/response_cache.py) keys cached
+-- /locations, /organizations, /services, /service-at-location, /map,
+-- /consumer and /partners/ptf responses on beacon_sync_state.change_seq, so
+-- that counter has to move whenever anything those endpoints read changes.
+-- 20-beacon-sync-state.sql already bumps it for the location-side tables;
+-- this adds the same deferred trigger to service, service_at_location,
+-- organization_source (source counts and scrapers on /map and /consumer),
+-- ptf_location_cluster (which decides how the PTF feed collapses
+-- near-duplicates) and feeding_america_zip_coverage (PTF FA enrichment).
+--
+-- The trigger function is shared, so a transaction that writes any of these
+-- tables still costs one UPDATE of a beacon_sync_state slot, at commit time.
+--
+-- Idempotent: safe to re-run. Requires 13-feeding-america-zip-coverage.sql,
+-- 20-beacon-sync-state.sql and 22-ptf-location-cluster.sql.
+
+BEGIN;
+
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY[
+        'service', 'service_at_location', 'organization_source',
+        'ptf_location_cluster', 'feeding_america_zip_coverage'
+    ] LOOP
+        EXECUTE format(
+            'DROP TRIGGER IF EXISTS beacon_sync_bump ON public.%I', tbl
+        );
+        EXECUTE format(
+            'CREATE CONSTRAINT TRIGGER beacon_sync_bump '
+            'AFTER INSERT OR UPDATE OR DELETE ON public.%I '
+            'DEFERRABLE INITIALLY DEFERRED '
+            'FOR EACH ROW EXECUTE FUNCTION public.beacon_sync_bump()',
+            tbl
+        );
+    END LOOP;
+END;
+$$;
+
+COMMIT;
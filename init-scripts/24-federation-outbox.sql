@@ -0,0 +1,23 @@
+-- Migration: federation_outbox — locations awaiting a federation Update.
+--
+-- The reconciler no longer publishes inline (FEDERATION_PUBLISH_MODE=outbox):
+-- once a job's canonical state is committed it inserts one row per location
+-- here and returns. The federation publisher (`python -m app.federation
+-- publish-outbox`, app/federation/outbox.py) claims rows in id order with
+-- FOR UPDATE SKIP LOCKED, coalesces repeated rows for the same location into
+-- one Update, and group-commits them to federation_log. The claim deletes the
+-- rows in the same transaction as that append, so the table only ever holds
+-- the backlog and a crashed publisher leaves its rows to be drained again.
+--
+-- Idempotent: safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.federation_outbox (
+    id          BIGSERIAL   PRIMARY KEY,
+    location_id TEXT        NOT NULL,
+    reason      TEXT        NOT NULL DEFAULT 'update',
+    enqueued_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMIT;
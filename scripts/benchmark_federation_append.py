@@ -0,0 +1,159 @@
+"""Benchmark federation log append throughput against the number of writers.
+
+Every append serializes on one advisory lock (app/federation/log.py), so with
+one row per lock acquisition the log's throughput stays flat no matter how
+many reconciler workers are publishing. This spawns W writer processes
+(default 1, 2, 4 and 8), each appending --rows envelopes, in two modes:
+
+  single  log.append per row — one lock/MAX/INSERT/COMMIT trip per envelope
+          (what every location publish used to cost).
+  group   log.append_many in batches of --batch-size — one trip per batch
+          (what publish_location_updates now does for a reconciler job).
+
+and reports rows/second per (mode, writers), then checks the sequences are
+still dense. Signing happens inside the lock in both modes, so the group
+mode's scaling comes from amortizing the round trips and commit.
+
+Runs against a throwaway `federation_log` in its own schema
+(`federation_append_bench` by default), dropped at the end unless --keep.
+
+Usage:
+    ./bouy exec app python scripts/benchmark_federation_append.py
+    ./bouy exec app python scripts/benchmark_federation_append.py --writers 1 4 16 --rows 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import sys
+import time
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+_CONTEXT = "https://hsds-federation.pantrypirateradio.org/profile"
+_LICENSE = "sandia-ftgg-nc-os-1.0"
+_ORIGIN = "did:web:bench.example"
+
+
+def _sync_url() -> str:
+    return settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+
+
+def _engine(schema: str) -> Engine:
+    return create_engine(
+        _sync_url(), connect_args={"options": f"-csearch_path={schema},public"}
+    )
+
+
+def _writer(schema: str, writer_id: int, rows: int, batch_size: int) -> float:
+    """Append `rows` envelopes; batch_size 0 means one log.append per row.
+
+    Returns the seconds spent appending (excludes process startup).
+    """
+    from sqlalchemy.orm import sessionmaker
+
+    from app.federation import log
+
+    settings.FEDERATION_ENABLED = True
+    engine = _engine(schema)
+    session = sessionmaker(bind=engine)()
+    key = Ed25519PrivateKey.from_private_bytes(bytes(range(32)))
+    entries = [
+        log.PendingAppend(
+            activity_type="Update",
+            federation_id=f"bench.example:w{writer_id}-{i}",
+            obj={"id": f"w{writer_id}-{i}", "name": "Benchmark Pantry"},
+        )
+        for i in range(rows)
+    ]
+    common = {
+        "origin_did": _ORIGIN,
+        "signing_key": key,
+        "context": _CONTEXT,
+        "license": _LICENSE,
+    }
+    start = time.perf_counter()
+    if batch_size:
+        for offset in range(0, rows, batch_size):
+            log.append_many(session, entries[offset : offset + batch_size], **common)
+    else:
+        for entry in entries:
+            log.append(
+                session,
+                activity_type=entry.activity_type,
+                federation_id=entry.federation_id,
+                obj=entry.obj,
+                **common,
+            )
+    elapsed = time.perf_counter() - start
+    session.close()
+    engine.dispose()
+    return elapsed
+
+
+def run(schema: str, writers: int, rows: int, batch_size: int) -> float:
+    """Rows/second for `writers` concurrent processes; verifies density."""
+    engine = _engine(schema)
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE federation_log"))
+
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(writers) as pool:
+        start = time.perf_counter()
+        pool.starmap(_writer, [(schema, w, rows, batch_size) for w in range(writers)])
+        wall = time.perf_counter() - start
+
+    with engine.connect() as conn:
+        count, top = conn.execute(
+            text("SELECT COUNT(*), COALESCE(MAX(sequence), 0) FROM federation_log")
+        ).one()
+    engine.dispose()
+    if count != writers * rows or top != count:
+        raise RuntimeError(f"sequence not dense: {count} rows, max {top}")
+    return count / wall
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--rows", type=int, default=200, help="Rows per writer")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--schema", default="federation_append_bench")
+    parser.add_argument("--keep", action="store_true", help="Keep the schema")
+    args = parser.parse_args()
+
+    if not args.schema.isidentifier():
+        parser.error("--schema must be a plain identifier")
+
+    engine = create_engine(_sync_url())
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP SCHEMA IF EXISTS {args.schema} CASCADE")
+        conn.exec_driver_sql(f"CREATE SCHEMA {args.schema}")
+        conn.exec_driver_sql(
+            f"CREATE TABLE {args.schema}.federation_log"
+            " (LIKE public.federation_log INCLUDING ALL)"
+        )
+    try:
+        for mode, batch_size in (("single", 0), ("group", args.batch_size)):
+            for writers in args.writers:
+                rate = run(args.schema, writers, args.rows, batch_size)
+                logger.info("%-6s writers=%-3d %8.0f rows/s", mode, writers, rate)
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(f"DROP SCHEMA IF EXISTS {args.schema} CASCADE")
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Benchmark federation envelope verification throughput against worker count.
+
+Generates a local log of --entries signed envelopes (default 100,000) with a
+throwaway key — no database, no network — then verifies the whole log with
+app/federation/verify_batch.py in pages of --page-size, once per worker count
+(default 1, 2, 4 and the usable cores), and reports envelopes/second.
+
+  workers=1  verify_envelope in the calling process (the serial baseline).
+  workers=N  verify_envelopes over a reused N-process pool.
+
+Each pool is warmed before timing so the figures exclude process spawn and
+import. A fraction of entries (--tamper) is corrupted so the run also checks
+the parallel verdicts agree with the expected ones.
+
+Usage:
+    ./bouy exec app python scripts/benchmark_federation_verify.py
+    ./bouy exec app python scripts/benchmark_federation_verify.py --entries 20000 --workers 1 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from app.federation import envelope, verify_batch
+from app.federation.identity import public_key_multibase
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+_CONTEXT = "https://hsds-federation.pantrypirateradio.org/profile"
+_LICENSE = "sandia-ftgg-nc-os-1.0"
+_ORIGIN = "did:web:bench.example"
+
+
+def generate(entries: int, tamper_every: int) -> tuple[list[dict], list[bool], str]:
+    """Signed envelopes, their expected verdicts, and the signer's multibase."""
+    key = Ed25519PrivateKey.generate()
+    log: list[dict] = []
+    expected: list[bool] = []
+    for sequence in range(1, entries + 1):
+        preimage = envelope.build_preimage(
+            context=_CONTEXT,
+            activity_type="Update",
+            actor=_ORIGIN,
+            attributed_to=_ORIGIN,
+            origin=_ORIGIN,
+            federation_id=f"bench.example:loc-{sequence}",
+            obj={
+                "id": f"loc-{sequence}",
+                "name": "Benchmark Pantry",
+                "latitude": 40.7128,
+                "longitude": -74.006,
+                "description": "Open weekdays 9-5; bring ID.",
+            },
+            sequence=sequence,
+            published="2026-06-05T00:00:00Z",
+            license=_LICENSE,
+        )
+        env = envelope.finalize(preimage, key)
+        tampered = bool(tamper_every) and sequence % tamper_every == 0
+        if tampered:
+            env["object"]["name"] = "Tampered Pantry"
+        log.append(env)
+        expected.append(not tampered)
+    return log, expected, public_key_multibase(key.public_key())
+
+
+def run(
+    log: list[dict], multibase: str, workers: int, page_size: int
+) -> tuple[float, list[bool]]:
+    """Envelopes/second verifying ``log`` page by page with ``workers``."""
+    verdicts: list[bool] = []
+    if workers == 1:
+        start = time.perf_counter()
+        for offset in range(0, len(log), page_size):
+            verdicts.extend(
+                verify_batch.verify_envelopes(
+                    log[offset : offset + page_size], multibase, workers=1
+                )
+            )
+        return len(log) / (time.perf_counter() - start), verdicts
+
+    with verify_batch.make_pool(workers) as pool:
+        # Warm every worker (spawn + import + key resolution) before timing.
+        verify_batch.verify_envelopes(
+            log[: workers * 2], multibase, executor=pool, chunk_size=1, min_parallel=0
+        )
+        start = time.perf_counter()
+        for offset in range(0, len(log), page_size):
+            verdicts.extend(
+                verify_batch.verify_envelopes(
+                    log[offset : offset + page_size], multibase, executor=pool
+                )
+            )
+        return len(log) / (time.perf_counter() - start), verdicts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, verify_batch.default_workers()}),
+    )
+    parser.add_argument("--page-size", type=int, default=10_000)
+    parser.add_argument(
+        "--tamper", type=int, default=1000, help="Corrupt every Nth entry (0: none)"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    log, expected, multibase = generate(args.entries, args.tamper)
+    logger.info(
+        "generated %d envelopes in %.1fs", len(log), time.perf_counter() - start
+    )
+
+    baseline = None
+    for workers in args.workers:
+        rate, verdicts = run(log, multibase, workers, args.page_size)
+        if verdicts != expected:
+            raise RuntimeError(f"workers={workers}: verdicts differ from expected")
+        baseline = baseline or rate
+        logger.info(
+            "workers=%-3d %9.0f envelopes/s  x%.2f", workers, rate, rate / baseline
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
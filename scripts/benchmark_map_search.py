@@ -0,0 +1,318 @@
+"""Benchmark /api/v1/map/search `q` matching on a synthetic dataset.
+
+Builds a throwaway schema with N synthetic canonical locations (default
+100k), each with an organization and an address, then times two ways of
+answering a typeahead-style `q`:
+
+  before  LOWER(...) LIKE '%q%' over location name, organization name,
+          description and address columns (what the endpoint used to do).
+  after   the location_search join from app/api/v1/map/search_service.py:
+          websearch_to_tsquery + prefix to_tsquery on the GIN-indexed
+          tsvector, plus the pg_trgm-indexed folded text, ranked by ts_rank.
+
+Each mode runs the same randomly drawn queries (whole words, partial words
+and two-word phrases) and reports p50/p95/p99 latency in milliseconds.
+
+The schema (`map_search_bench` by default) is dropped at the end unless
+--keep is given. Requires the pg_trgm extension to be available.
+
+Usage:
+    ./bouy exec app python scripts/benchmark_map_search.py
+    ./bouy exec app python scripts/benchmark_map_search.py --locations 100000 --queries 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from app.api.v1.map.search_service import _TEXT_SEARCH_JOIN, build_text_search_params
+from app.core.config import settings
+from app.database.migrations.add_location_search import CREATE_LOCATION_SEARCH_SQL
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+NAME_WORDS = [
+    "community",
+    "food",
+    "pantry",
+    "church",
+    "kitchen",
+    "mission",
+    "harvest",
+    "bread",
+    "hope",
+    "grace",
+    "st marys",
+    "salvation",
+    "family",
+    "neighborhood",
+    "outreach",
+    "shelter",
+    "fellowship",
+    "united",
+    "helping hands",
+    "open door",
+]
+STREET_WORDS = [
+    "main",
+    "oak",
+    "maple",
+    "washington",
+    "lincoln",
+    "park",
+    "elm",
+    "pine",
+    "cedar",
+    "lake",
+    "hill",
+    "river",
+]
+CITIES = [
+    ("springfield", "IL"),
+    ("columbus", "OH"),
+    ("austin", "TX"),
+    ("denver", "CO"),
+    ("portland", "OR"),
+    ("albany", "NY"),
+    ("raleigh", "NC"),
+    ("tampa", "FL"),
+    ("fresno", "CA"),
+    ("omaha", "NE"),
+]
+
+SCHEMA_SQL = """
+    CREATE TABLE {schema}.organization (
+        id character varying(250) PRIMARY KEY,
+        name text,
+        description text
+    );
+    CREATE TABLE {schema}.location (
+        id character varying(250) PRIMARY KEY,
+        organization_id character varying(250),
+        name text,
+        alternate_name text,
+        description text,
+        latitude numeric,
+        longitude numeric,
+        confidence_score integer DEFAULT 50,
+        is_canonical boolean DEFAULT true
+    );
+    CREATE TABLE {schema}.address (
+        id character varying(250) PRIMARY KEY,
+        location_id character varying(250),
+        address_1 text,
+        address_2 text,
+        city text,
+        state_province text,
+        postal_code text
+    );
+    CREATE INDEX ON {schema}.address(location_id);
+"""
+
+BEFORE_SQL = """
+    SELECT l.id
+    FROM location l
+    LEFT JOIN organization o ON o.id = l.organization_id
+    LEFT JOIN address a ON a.location_id = l.id
+    WHERE l.is_canonical = true
+      AND (
+        LOWER(l.name) LIKE :search_pattern
+        OR LOWER(o.name) LIKE :search_pattern
+        OR LOWER(COALESCE(o.description, l.description)) LIKE :search_pattern
+        OR LOWER(CONCAT_WS(' ', a.address_1, a.city, a.state_province,
+                           a.postal_code)) LIKE :search_pattern
+      )
+    ORDER BY l.confidence_score DESC, l.name
+    LIMIT 100
+"""
+
+AFTER_SQL = (
+    "SELECT l.id\n"
+    "FROM location l\n"
+    + _TEXT_SEARCH_JOIN
+    + "\nWHERE l.is_canonical = true\n"
+    + "ORDER BY sm.search_rank DESC, l.confidence_score DESC, l.name\n"
+    + "LIMIT 100"
+)
+
+
+def _words(rng: random.Random, pool: list[str], count: int) -> str:
+    return " ".join(rng.choice(pool) for _ in range(count))
+
+
+def populate(conn: Connection, schema: str, count: int, seed: int) -> None:
+    """Create the synthetic tables and load `count` locations.
+
+    Expects the connection's search_path to start with `schema`.
+    """
+    rng = random.Random(seed)
+    conn.exec_driver_sql(SCHEMA_SQL.format(schema=schema))
+
+    batch = 5000
+    for start in range(0, count, batch):
+        orgs, locations, addresses = [], [], []
+        for i in range(start, min(start + batch, count)):
+            city, state = rng.choice(CITIES)
+            name = f"{_words(rng, NAME_WORDS, 2)} pantry {i}".title()
+            orgs.append(
+                {
+                    "id": f"org-{i}",
+                    "name": f"{_words(rng, NAME_WORDS, 2)} ministries".title(),
+                    "description": f"Serving {city.title()} {_words(rng, NAME_WORDS, 6)}",
+                }
+            )
+            locations.append(
+                {
+                    "id": f"loc-{i}",
+                    "org": f"org-{i}",
+                    "name": name,
+                    "description": _words(rng, NAME_WORDS, 8),
+                    "lat": rng.uniform(25, 49),
+                    "lng": rng.uniform(-124, -67),
+                    "confidence": rng.randint(10, 100),
+                }
+            )
+            addresses.append(
+                {
+                    "id": f"addr-{i}",
+                    "loc": f"loc-{i}",
+                    "address_1": (
+                        f"{rng.randint(1, 9999)} {rng.choice(STREET_WORDS)} st".title()
+                    ),
+                    "city": city.title(),
+                    "state": state,
+                    "zip": f"{rng.randint(10000, 99999)}",
+                }
+            )
+        conn.execute(
+            text(
+                "INSERT INTO organization (id, name, description) "
+                "VALUES (:id, :name, :description)"
+            ),
+            orgs,
+        )
+        conn.execute(
+            text(
+                "INSERT INTO location "
+                "(id, organization_id, name, description, latitude, longitude,"
+                " confidence_score) "
+                "VALUES (:id, :org, :name, :description, :lat, :lng, :confidence)"
+            ),
+            locations,
+        )
+        conn.execute(
+            text(
+                "INSERT INTO address "
+                "(id, location_id, address_1, city, state_province, postal_code) "
+                "VALUES (:id, :loc, :address_1, :city, :state, :zip)"
+            ),
+            addresses,
+        )
+        logger.info("Loaded %d/%d locations", min(start + batch, count), count)
+
+    # Same DDL, triggers and backfill as the production migration
+    conn.exec_driver_sql(CREATE_LOCATION_SEARCH_SQL.replace("public.", f"{schema}."))
+    conn.exec_driver_sql(f"ANALYZE {schema}.location, {schema}.address")
+
+
+def sample_queries(count: int, seed: int) -> list[str]:
+    """Draw typeahead-style queries: words, partial words and phrases."""
+    rng = random.Random(seed + 1)
+    vocabulary = NAME_WORDS + STREET_WORDS + [city for city, _ in CITIES]
+    queries = []
+    for _ in range(count):
+        word = rng.choice(vocabulary)
+        roll = rng.random()
+        if roll < 0.4:
+            queries.append(word)
+        elif roll < 0.8:
+            queries.append(word[: max(3, len(word) - rng.randint(1, 3))])
+        else:
+            queries.append(f"{word} {rng.choice(vocabulary)[:4]}")
+    return queries
+
+
+def run(conn: Connection, sql: str, queries: list[str]) -> list[float]:
+    """Time each query; returns latencies in milliseconds."""
+    statement = text(sql)
+    latencies = []
+    for query in queries:
+        params = build_text_search_params(query)
+        if not params:
+            continue
+        start = time.perf_counter()
+        conn.execute(statement, params).fetchall()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(label: str, latencies: list[float]) -> dict[str, float]:
+    ordered = sorted(latencies)
+
+    def pct(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    summary = {
+        "p50": statistics.median(ordered),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+    }
+    logger.info(
+        "%-7s n=%d  p50=%.1fms  p95=%.1fms  p99=%.1fms",
+        label,
+        len(ordered),
+        summary["p50"],
+        summary["p95"],
+        summary["p99"],
+    )
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--locations", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--schema", default="map_search_bench")
+    parser.add_argument("--keep", action="store_true", help="Keep the schema")
+    args = parser.parse_args()
+
+    if not args.schema.isidentifier():
+        parser.error("--schema must be a plain identifier")
+
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as conn:
+        conn.exec_driver_sql(f"DROP SCHEMA IF EXISTS {args.schema} CASCADE")
+        conn.exec_driver_sql(f"CREATE SCHEMA {args.schema}")
+        conn.exec_driver_sql(f"SET search_path TO {args.schema}, public")
+        try:
+            populate(conn, args.schema, args.locations, args.seed)
+            conn.commit()
+
+            queries = sample_queries(args.queries, args.seed)
+            # Warm the buffer cache for both plans before timing
+            run(conn, BEFORE_SQL, queries[:10])
+            run(conn, AFTER_SQL, queries[:10])
+
+            before = summarize("before", run(conn, BEFORE_SQL, queries))
+            after = summarize("after", run(conn, AFTER_SQL, queries))
+            logger.info("p95 speedup: %.1fx", before["p95"] / max(after["p95"], 1e-6))
+        finally:
+            conn.rollback()
+            if not args.keep:
+                conn.exec_driver_sql(f"DROP SCHEMA IF EXISTS {args.schema} CASCADE")
+                conn.commit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
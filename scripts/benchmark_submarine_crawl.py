@@ -0,0 +1,135 @@
+"""Benchmark submarine crawl throughput with and without the browser pool.
+
+Serves the submarine fixture site from --domains local HTTP servers (each on
+its own port, so each is its own domain for rate limiting), then crawls
+--jobs URLs spread round-robin across them, and reports jobs per minute.
+
+  before  one job at a time, each launching and closing its own Chromium
+          (what the RQ worker does with SUBMARINE_BROWSER_POOL off).
+  after   a BrowserPool + CrawlScheduler at --concurrency: one Chromium,
+          a session per job, domains crawled in parallel.
+
+Both modes honour --delay between requests to the same domain, so the
+"after" figure is what the worker can do while staying polite. Needs
+crawl4ai and Chromium, so run it in the submarine container.
+
+Usage:
+    ./bouy exec submarine python scripts/benchmark_submarine_crawl.py
+    ./bouy exec submarine python scripts/benchmark_submarine_crawl.py --jobs 40 --domains 8 --concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from app.submarine.browser_pool import BrowserPool
+from app.submarine.crawler import SubmarineCrawler
+from app.submarine.rate_limiter import SubmarineRateLimiter
+from app.submarine.scheduler import CrawlScheduler
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+FIXTURE_SITE = (
+    Path(__file__).resolve().parent.parent
+    / "tests"
+    / "test_submarine"
+    / "fixtures"
+    / "test_site"
+)
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):  # noqa: A002 - http.server API
+        pass
+
+
+def serve(domains: int) -> tuple[list[ThreadingHTTPServer], list[str]]:
+    """Start ``domains`` fixture servers; returns them and their index URLs."""
+    handler = partial(_QuietHandler, directory=str(FIXTURE_SITE))
+    servers = [ThreadingHTTPServer(("127.0.0.1", 0), handler) for _ in range(domains)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return servers, [f"http://127.0.0.1:{s.server_port}/index.html" for s in servers]
+
+
+def _crawler(max_pages: int, delay: float) -> SubmarineCrawler:
+    return SubmarineCrawler(
+        max_pages=max_pages,
+        timeout=30,
+        rate_limiter=SubmarineRateLimiter(min_delay_seconds=delay),
+    )
+
+
+async def before(urls: list[str], max_pages: int, delay: float) -> list[str]:
+    crawler = _crawler(max_pages, delay)
+    return [(await crawler.crawl(url)).status for url in urls]
+
+
+async def after(
+    urls: list[str], max_pages: int, delay: float, concurrency: int
+) -> list[str]:
+    crawler = _crawler(max_pages, delay)
+    pool = BrowserPool(
+        user_agent=crawler.rate_limiter.user_agent, max_sessions=concurrency
+    )
+    scheduler = CrawlScheduler(crawler, pool, concurrency=concurrency)
+    try:
+        return [r.status for r in await scheduler.crawl_many(urls)]
+    finally:
+        await pool.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=24)
+    parser.add_argument("--domains", type=int, default=6)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-pages", type=int, default=3)
+    parser.add_argument("--delay", type=float, default=1.0)
+    parser.add_argument("--mode", choices=["before", "after", "both"], default="both")
+    args = parser.parse_args()
+
+    servers, sites = serve(args.domains)
+    urls = [sites[n % len(sites)] for n in range(args.jobs)]
+    modes = ["before", "after"] if args.mode == "both" else [args.mode]
+    baseline = None
+    try:
+        for mode in modes:
+            start = time.perf_counter()
+            if mode == "before":
+                statuses = asyncio.run(before(urls, args.max_pages, args.delay))
+            else:
+                statuses = asyncio.run(
+                    after(urls, args.max_pages, args.delay, args.concurrency)
+                )
+            elapsed = time.perf_counter() - start
+            failed = sum(status == "error" for status in statuses)
+            rate = len(urls) / elapsed * 60
+            baseline = baseline or rate
+            logger.info(
+                "%-6s %3d jobs in %6.1fs  %7.1f jobs/min  x%.2f  (%d errors)",
+                mode,
+                len(urls),
+                elapsed,
+                rate,
+                rate / baseline,
+                failed,
+            )
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -236,6 +236,22 @@ def repoint_child_rows(
     return summary
 
 
+def record_location_redirect(db: Session, duplicate_id: str, survivor_id: str) -> None:
+    """Add duplicate -> survivor to location_redirect.
+
+    This script writes no dedup_run_audit rows, so the audit trigger that
+    maintains location_redirect (init-scripts/21-location-redirect.sql)
+    never sees its merges. Skipped on databases that predate the table.
+    """
+    exists = db.execute(text("SELECT to_regclass('public.location_redirect')")).scalar()
+    if exists is None:
+        return
+    db.execute(
+        text("SELECT location_redirect_record(:old_id, :survivor_id)"),
+        {"old_id": duplicate_id, "survivor_id": survivor_id},
+    )
+
+
 def soft_delete_duplicate(
     db: Session,
     duplicate_id: str,
@@ -260,6 +276,8 @@ def soft_delete_duplicate(
         ),
         {"id": duplicate_id},
     )
+    if (result.rowcount or 0) > 0 and survivor_id is not None:
+        record_location_redirect(db, duplicate_id, survivor_id)
     # Federation Delete hook (PR-C Task 5, §6.2e/§9). COLLECT only — the Delete is
     # published AFTER the run's outer commit (an inline append commits the
     # session, folding the run's savepoint — Gauntlet CRITICAL). This older script
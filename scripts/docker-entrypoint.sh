@@ -59,6 +59,9 @@ case "$SERVICE" in
         echo "Starting submarine worker..."
         if [ "$QUEUE_BACKEND" = "sqs" ]; then
             exec python -m app.submarine.fargate_worker
+        elif [ "$SUBMARINE_BROWSER_POOL" = "true" ]; then
+            # Non-forking worker: the pooled browser must outlive each job
+            exec rq worker --worker-class rq.worker.SimpleWorker submarine
         else
             exec rq worker submarine
         fi
@@ -103,6 +106,11 @@ case "$SERVICE" in
         exec python -m app.haarrrvest_publisher.service
         ;;
     
+    federation-publisher)
+        echo "Starting federation outbox publisher..."
+        exec python -m app.federation publish-outbox
+        ;;
+    
     content-store-dashboard|dashboard)
         echo "Starting content store dashboard..."
         exec python -m app.content_store.dashboard
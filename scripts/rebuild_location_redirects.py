@@ -0,0 +1,78 @@
+"""Rebuild `location_redirect` from `dedup_run_audit`.
+
+`location_redirect` (init-scripts/21-location-redirect.sql) is maintained
+incrementally: a trigger on `dedup_run_audit` records every location
+soft_delete, and `scripts/dedupe_same_org_locations.py` records its merges
+directly. This re-syncs every edge from the audit table (latest merge per
+retired id wins) and recomputes each row's path-compressed `canonical_id`
+in one set-based pass — use it after bulk-loading or hand-editing audit
+rows, or to repair the table if it drifts.
+
+Dry-run by default (the rebuild runs and reports, then rolls back). Pass
+`--apply` to commit.
+
+Usage:
+    ./bouy exec app python scripts/rebuild_location_redirects.py
+    ./bouy exec app python scripts/rebuild_location_redirects.py --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Commit the rebuild. Default is dry-run.",
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    session_local = sessionmaker(bind=engine)
+
+    with session_local() as db:
+        exists = db.execute(
+            text("SELECT to_regclass('public.location_redirect')")
+        ).scalar()
+        if exists is None:
+            logger.error(
+                "location_redirect does not exist — run "
+                "app/database/migrations/add_location_redirect.py first."
+            )
+            return 1
+
+        rows = db.execute(text("SELECT rebuild_location_redirect()")).scalar()
+        unresolved = db.execute(
+            text("SELECT COUNT(*) FROM location_redirect WHERE canonical_id IS NULL")
+        ).scalar()
+        logger.info(
+            "location_redirect: %d rows, %d without a terminal (cyclic chains)",
+            rows,
+            unresolved,
+        )
+
+        if args.apply:
+            db.commit()
+            logger.info("COMMITTED location_redirect rebuild")
+        else:
+            db.rollback()
+            logger.info("DRY RUN — no changes committed (re-run with --apply)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
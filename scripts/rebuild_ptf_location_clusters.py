@@ -0,0 +1,81 @@
+"""Rebuild `ptf_location_cluster`, the PTF /locations dedup clusters.
+
+The PTF feed joins precomputed near-duplicate clusters
+(init-scripts/22-ptf-location-cluster.sql) instead of running the tiered
+connected-components walk on each request. The reconciler refreshes the
+clusters around every location it commits; run this after migrating, after
+bulk edits that bypass the reconciler (dedup scripts, admin fixes, a
+Feeding America crosswalk reload), or after changing the tier thresholds.
+
+Dry-run by default (the rebuild runs and reports, then rolls back). Pass
+`--apply` to commit. Feed requests keep reading the previous clusters until
+the commit.
+
+Usage:
+    ./bouy exec app python scripts/rebuild_ptf_location_clusters.py
+    ./bouy exec app python scripts/rebuild_ptf_location_clusters.py --apply
+    ./bouy run-script --aws --prod scripts/rebuild_ptf_location_clusters.py --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.partners.ptf.location_clusters import rebuild_location_clusters
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Commit the rebuild. Default is dry-run.",
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    session_local = sessionmaker(bind=engine)
+
+    with session_local() as db:
+        rows = rebuild_location_clusters(db)
+        clusters, collapsed = db.execute(
+            text(
+                """
+                SELECT COUNT(*), COUNT(*) FILTER (WHERE members > 1)
+                FROM (
+                    SELECT cluster_id, COUNT(*) AS members
+                    FROM ptf_location_cluster
+                    GROUP BY cluster_id
+                ) c
+                """
+            )
+        ).one()
+        logger.info(
+            "ptf_location_cluster: %d candidates in %d clusters "
+            "(%d with near-duplicates)",
+            rows,
+            clusters,
+            collapsed,
+        )
+
+        if args.apply:
+            db.commit()
+            logger.info("COMMITTED ptf_location_cluster rebuild")
+        else:
+            db.rollback()
+            logger.info("DRY RUN — no changes committed (re-run with --apply)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
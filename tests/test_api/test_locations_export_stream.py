@@ -0,0 +1,220 @@
+"""Tests for the streamed locations export (/locations/export-stream)."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import locations_export
+from app.api.v1.locations_export import router
+from app.api.v1.locations_export_formats import (
+    EXPORT_COLUMNS,
+    NdjsonEncoder,
+    accepts_gzip,
+    encode_batches,
+    gzip_chunks,
+)
+from app.core.db import get_session
+
+
+def _row(i: int, state: str = "IL") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"loc-{i:03d}",
+        lat=41.0 + i / 1000,
+        lng=-87.0,
+        name=f"Pantry {i}",
+        org_name="Food Bank",
+        address=f"{i} Main St, Chicago, {state}, 60601",
+        city="Chicago",
+        state=state,
+        zip="60601",
+        phone=None,
+        website=None,
+        email=None,
+        description=None,
+        confidence_score=80,
+        validation_status="verified",
+        sources=[
+            {
+                "scraper": "vivery_api",
+                "last_updated": datetime(2026, 1, 2),
+                "first_seen": "2026-01-01T00:00:00",
+            }
+        ],
+        source_count=1,
+    )
+
+
+class _StreamResult:
+    def __init__(self, rows):
+        self._rows = rows
+        self.closed = False
+
+    async def partitions(self, size):
+        for start in range(0, len(self._rows), size):
+            yield self._rows[start : start + size]
+
+    async def close(self):
+        self.closed = True
+
+
+class _Session:
+    """Records the streamed statement; serves rows as a server-side cursor."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.sql = None
+        self.params = None
+        self.result = None
+
+    async def stream(self, statement, params):
+        self.sql = str(statement)
+        self.params = params
+        self.result = _StreamResult(self.rows)
+        return self.result
+
+
+@pytest.fixture
+def session():
+    return _Session([_row(i) for i in range(5)])
+
+
+@pytest.fixture
+def client(session):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_session] = lambda: session
+    return TestClient(app)
+
+
+class TestExportStream:
+    """The endpoint streams every row in the requested format."""
+
+    def test_ndjson_is_one_record_per_line(self, client, session):
+        response = client.get(
+            "/locations/export-stream", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "content-encoding" not in response.headers
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["id"] for r in records] == [f"loc-{i:03d}" for i in range(5)]
+        assert records[0]["sources"][0]["last_updated"] == "2026-01-02T00:00:00"
+        assert session.result.closed
+
+    def test_csv_has_header_and_json_sources(self, client):
+        response = client.get(
+            "/locations/export-stream?format=csv",
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert tuple(rows[0]) == EXPORT_COLUMNS
+        assert len(rows) == 6
+        sources = json.loads(rows[1][EXPORT_COLUMNS.index("sources")])
+        assert sources[0]["scraper"] == "vivery_api"
+
+    def test_empty_csv_still_has_header(self, client, session):
+        session.rows = []
+
+        response = client.get(
+            "/locations/export-stream?format=csv",
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert response.text.strip() == ",".join(EXPORT_COLUMNS)
+
+    def test_gzip_when_accepted(self, client):
+        response = client.get(
+            "/locations/export-stream",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        # httpx decodes transparently; the decoded body is the NDJSON stream
+        assert len(response.text.splitlines()) == 5
+
+    def test_cursor_and_filters_are_bound(self, client, session):
+        client.get(
+            "/locations/export-stream"
+            "?cursor=loc-002&state=il&min_confidence=60&limit=2"
+        )
+
+        assert "l.id > :cursor" in session.sql
+        assert "a.state_province = :state" in session.sql
+        assert "ORDER BY l.id" in session.sql
+        # One physical address per location, so no location repeats
+        assert "LEFT JOIN address" not in session.sql
+        assert "address_type = 'physical'" in session.sql
+        assert session.sql.rstrip().endswith("LIMIT :limit")
+        assert session.params == {
+            "cursor": "loc-002",
+            "state": "IL",
+            "min_confidence": 60,
+            "limit": 2,
+        }
+
+    def test_parquet_without_pyarrow_is_406(self, client, monkeypatch):
+        monkeypatch.setattr(locations_export, "parquet_available", lambda: False)
+
+        response = client.get("/locations/export-stream?format=parquet")
+
+        assert response.status_code == 406
+
+    def test_parquet_roundtrip(self, client):
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        response = client.get("/locations/export-stream?format=parquet")
+
+        table = pq.read_table(io.BytesIO(response.content))
+        assert table.column_names == list(EXPORT_COLUMNS)
+        assert table.num_rows == 5
+
+
+@pytest.mark.asyncio
+async def test_encoding_starts_before_later_batches_are_read():
+    fetched = []
+
+    async def batches():
+        for i in range(3):
+            fetched.append(i)
+            yield [{"id": str(i)}]
+
+    chunks = encode_batches(batches(), NdjsonEncoder())
+    first = await chunks.__anext__()
+
+    assert first == b'{"id": "0"}\n'
+    assert fetched == [0]
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.8", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("identity", False),
+        ("", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+@pytest.mark.asyncio
+async def test_gzip_output_is_a_single_valid_member():
+    async def chunks():
+        yield b"a" * 10
+        yield b"b" * 10
+
+    body = b"".join([c async for c in gzip_chunks(chunks())])
+
+    assert gzip.decompress(body) == b"a" * 10 + b"b" * 10
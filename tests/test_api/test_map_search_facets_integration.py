@@ -0,0 +1,213 @@
+"""Parity tests for map search service / language facet filtering.
+
+Seeds random locations, services and languages in the live test DB (the
+location_search facet columns are filled by the triggers from
+``init-scripts/18-location-facets.sql``), then checks every filter
+combination against a brute-force Python reference built from the same
+seed data.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import uuid
+from collections import Counter
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.map.search_service import (
+    MapSearchService,
+    OutputFormat,
+    normalize_facet_token,
+)
+
+pytestmark = pytest.mark.integration
+
+# An isolated box in the Pacific so no other test data falls inside it
+BBOX = (10.0, -170.0, 11.0, -169.0)
+
+SERVICE_NAMES = [
+    "Food Pantry",
+    "food pantry",
+    "Hot Meals",
+    "Hot-Meals",
+    "SNAP Assistance",
+    "Mobile Pantry",
+]
+LANGUAGES = [
+    ("es", "Spanish"),
+    ("EN", "English"),
+    ("", "Haitian Creole"),
+    (None, "Vietnamese"),
+    ("zh-Hans", "Chinese"),
+]
+
+
+@pytest_asyncio.fixture
+async def seeded(db_session: AsyncSession):
+    """Insert random locations with services and languages.
+
+    Returns:
+        Mapping of location id to (service tokens, language tokens) computed
+        in Python from the seeded rows
+    """
+    rng = random.Random(1234)
+    org_id = str(uuid.uuid4())
+    await db_session.execute(
+        text(
+            "INSERT INTO organization (id, name, description) "
+            "VALUES (:id, 'Facet Parity Org', 'facet parity')"
+        ),
+        {"id": org_id},
+    )
+
+    expected: dict[str, tuple[set[str], set[str]]] = {}
+    for i in range(40):
+        location_id = str(uuid.uuid4())
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO location (
+                    id, organization_id, name, latitude, longitude,
+                    location_type, confidence_score, is_canonical
+                )
+                VALUES (
+                    :id, :org_id, :name, :lat, :lng, 'physical', 60, TRUE
+                )
+                """
+            ),
+            {
+                "id": location_id,
+                "org_id": org_id,
+                "name": f"Facet Parity {i}",
+                "lat": rng.uniform(BBOX[0], BBOX[2]),
+                "lng": rng.uniform(BBOX[1], BBOX[3]),
+            },
+        )
+
+        service_tokens: set[str] = set()
+        language_tokens: set[str] = set()
+
+        for name in rng.sample(SERVICE_NAMES, rng.randint(0, 3)):
+            service_id = str(uuid.uuid4())
+            await db_session.execute(
+                text(
+                    "INSERT INTO service (id, organization_id, name, status) "
+                    "VALUES (:id, :org_id, :name, 'active')"
+                ),
+                {"id": service_id, "org_id": org_id, "name": name},
+            )
+            await db_session.execute(
+                text(
+                    "INSERT INTO service_at_location (id, service_id, location_id) "
+                    "VALUES (:id, :service_id, :location_id)"
+                ),
+                {
+                    "id": str(uuid.uuid4()),
+                    "service_id": service_id,
+                    "location_id": location_id,
+                },
+            )
+            service_tokens.add(normalize_facet_token(name))
+
+            # Some languages hang off the service rather than the location
+            if rng.random() < 0.3:
+                code, lang_name = rng.choice(LANGUAGES)
+                await db_session.execute(
+                    text(
+                        "INSERT INTO language (id, service_id, name, code) "
+                        "VALUES (:id, :service_id, :name, :code)"
+                    ),
+                    {
+                        "id": str(uuid.uuid4()),
+                        "service_id": service_id,
+                        "name": lang_name,
+                        "code": code,
+                    },
+                )
+                language_tokens.add(normalize_facet_token(code or lang_name))
+
+        for code, lang_name in rng.sample(LANGUAGES, rng.randint(0, 2)):
+            await db_session.execute(
+                text(
+                    "INSERT INTO language (id, location_id, name, code) "
+                    "VALUES (:id, :location_id, :name, :code)"
+                ),
+                {
+                    "id": str(uuid.uuid4()),
+                    "location_id": location_id,
+                    "name": lang_name,
+                    "code": code,
+                },
+            )
+            language_tokens.add(normalize_facet_token(code or lang_name))
+
+        expected[location_id] = (service_tokens, language_tokens)
+
+    await db_session.flush()
+    return expected
+
+
+def _reference(expected, services, languages, match):
+    """Brute-force filter over the Python-side token sets."""
+    requested_services = {normalize_facet_token(s) for s in services or []}
+    requested_languages = {normalize_facet_token(lang) for lang in languages or []}
+
+    def matches(tokens, requested):
+        if not requested:
+            return True
+        if match == "all":
+            return requested <= tokens
+        return bool(requested & tokens)
+
+    return {
+        location_id
+        for location_id, (service_tokens, language_tokens) in expected.items()
+        if matches(service_tokens, requested_services)
+        and matches(language_tokens, requested_languages)
+    }
+
+
+FILTER_CASES = list(
+    itertools.product(
+        [None, ["food_pantry"], ["Hot Meals", "snap assistance"]],
+        [None, ["es"], ["en", "haitian_creole", "zh-hans"]],
+        ["any", "all"],
+    )
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("services,languages,match", FILTER_CASES)
+async def test_facet_filters_match_reference(
+    db_session, seeded, services, languages, match
+):
+    service = MapSearchService(db_session)
+    locations, metadata, total = await service.search_locations(
+        bbox=BBOX,
+        services=services,
+        languages=languages,
+        facet_match=match,
+        include_facets=True,
+        output_format=OutputFormat.COMPACT,
+        limit=1000,
+    )
+
+    want = _reference(seeded, services, languages, match)
+    assert {location["id"] for location in locations} == want
+    assert total == len(want)
+
+    service_counts = Counter(
+        token for location_id in want for token in seeded[location_id][0]
+    )
+    language_counts = Counter(
+        token for location_id in want for token in seeded[location_id][1]
+    )
+    assert metadata.facets == {
+        "services": dict(service_counts),
+        "languages": dict(language_counts),
+    }
@@ -0,0 +1,158 @@
+"""Radius / nearest-first map search against PostGIS.
+
+Checks that the ST_DWithin + `<->` radius search returns the same locations
+and distances (within 1 m) as the acos great-circle formula it replaced, and
+that the planner can answer the radius filter from idx_location_geog
+(init-scripts/19-location-geography-index.sql).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.map.search_service import (
+    _CENTER_GEOGRAPHY,
+    _LOCATION_GEOGRAPHY,
+    _METERS_PER_MILE,
+    MapSearchService,
+    OutputFormat,
+)
+
+pytestmark = pytest.mark.integration
+
+# Somewhere in the South Pacific so no other test data is nearby
+CENTER = (-30.0, -140.0)
+RADIUS_MILES = 50.0
+STATUTE_MILE_METERS = 1609.344
+
+
+def _acos_miles(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """The great-circle formula the search used before the geography index."""
+    cos_angle = math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * (
+        math.cos(math.radians(lng2) - math.radians(lng1))
+    ) + math.sin(math.radians(lat1)) * math.sin(math.radians(lat2))
+    return 3959 * math.acos(min(1.0, max(-1.0, cos_angle)))
+
+
+@pytest_asyncio.fixture
+async def seeded(db_session: AsyncSession):
+    """Insert canonical locations scattered up to ~100 miles from CENTER."""
+    rng = random.Random(42)
+    org_id = str(uuid.uuid4())
+    await db_session.execute(
+        text(
+            "INSERT INTO organization (id, name, description) "
+            "VALUES (:id, 'Radius Parity Org', 'radius parity')"
+        ),
+        {"id": org_id},
+    )
+    points = {}
+    for i in range(60):
+        location_id = str(uuid.uuid4())
+        lat = CENTER[0] + rng.uniform(-1.5, 1.5)
+        lng = CENTER[1] + rng.uniform(-1.5, 1.5)
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO location (
+                    id, organization_id, name, latitude, longitude,
+                    location_type, is_canonical
+                )
+                VALUES (:id, :org_id, :name, :lat, :lng, 'physical', TRUE)
+                """
+            ),
+            {
+                "id": location_id,
+                "org_id": org_id,
+                "name": f"Radius Parity {i}",
+                "lat": lat,
+                "lng": lng,
+            },
+        )
+        points[location_id] = (lat, lng)
+    await db_session.flush()
+    return points
+
+
+@pytest.mark.asyncio
+async def test_radius_search_matches_acos_formula(db_session, seeded):
+    service = MapSearchService(db_session)
+    locations, _, total = await service.search_locations(
+        center_lat=CENTER[0],
+        center_lng=CENTER[1],
+        radius_miles=RADIUS_MILES,
+        output_format=OutputFormat.COMPACT,
+        limit=1000,
+    )
+
+    expected = {
+        location_id: _acos_miles(*CENTER, lat, lng)
+        for location_id, (lat, lng) in seeded.items()
+        if _acos_miles(*CENTER, lat, lng) <= RADIUS_MILES
+    }
+    assert expected
+    assert {location["id"] for location in locations} == set(expected)
+    assert total == len(expected)
+
+    distances = [location["distance_miles"] for location in locations]
+    assert distances == sorted(distances)
+    for location in locations:
+        error_miles = abs(location["distance_miles"] - expected[location["id"]])
+        assert error_miles * STATUTE_MILE_METERS < 1.0
+
+
+@pytest.mark.asyncio
+async def test_center_without_radius_returns_nearest_first(db_session, seeded):
+    service = MapSearchService(db_session)
+    locations, _, _ = await service.search_locations(
+        center_lat=CENTER[0],
+        center_lng=CENTER[1],
+        output_format=OutputFormat.COMPACT,
+        limit=5,
+    )
+
+    nearest = sorted(seeded, key=lambda i: _acos_miles(*CENTER, *seeded[i]))[:5]
+    assert [location["id"] for location in locations] == nearest
+
+
+async def _plan(session: AsyncSession, sql: str, params: dict) -> str:
+    # The seeded table is tiny; disable seq scans so the plan shows whether
+    # the index is usable at all rather than whether it is cheaper here.
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    result = await session.execute(text("EXPLAIN " + sql), params)
+    return "\n".join(row[0] for row in result.fetchall())
+
+
+# Sentinels are swapped for the service's geography fragments, so the plan
+# below uses exactly the radius predicate search_locations emits.
+RADIUS_PLAN_SQL = """
+    SELECT l.id FROM location l
+    WHERE ST_DWithin(__LOCATION__, __CENTER__, :radius_meters, false)
+"""
+
+
+def _with_geography(sql: str) -> str:
+    return sql.replace("__LOCATION__", _LOCATION_GEOGRAPHY).replace(
+        "__CENTER__", _CENTER_GEOGRAPHY
+    )
+
+
+@pytest.mark.asyncio
+async def test_radius_filter_plan_uses_geography_index(db_session, seeded):
+    plan = await _plan(
+        db_session,
+        _with_geography(RADIUS_PLAN_SQL),
+        {
+            "center_lat": CENTER[0],
+            "center_lng": CENTER[1],
+            "radius_meters": RADIUS_MILES * _METERS_PER_MILE,
+        },
+    )
+    assert "idx_location_geog" in plan
@@ -5,7 +5,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, UTC
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.map.search_service import MapSearchService, OutputFormat
+from app.api.v1.map.search_service import (
+    _CENTER_GEOGRAPHY,
+    _LOCATION_GEOGRAPHY,
+    _METERS_PER_MILE,
+    MapSearchService,
+    OutputFormat,
+    build_text_search_params,
+    normalize_facet_token,
+)
 
 
 class TestMapSearchService:
@@ -253,6 +261,196 @@ class TestMapSearchService:
         assert total == 100
         assert mock_session.execute.called
 
+    @pytest.mark.asyncio
+    async def test_search_query_uses_indexed_search_document(
+        self, search_service, mock_session
+    ):
+        """Text search joins location_search instead of LIKE-scanning names."""
+        count_result = MagicMock()
+        count_result.scalar.return_value = 0
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute = AsyncMock(side_effect=[count_result, mock_result])
+
+        await search_service.search_locations(query="Food Pan", limit=10)
+
+        main_sql = str(mock_session.execute.call_args_list[1].args[0])
+        params = mock_session.execute.call_args_list[1].args[1]
+        assert "FROM location_search ls" in main_sql
+        assert "websearch_to_tsquery('english', :search_query)" in main_sql
+        assert "LOWER(location_name) LIKE" not in main_sql
+        assert "ORDER BY search_rank DESC" in main_sql
+        assert params["search_query"] == "food pan"
+        assert params["search_prefix"] == "food:* & pan:*"
+        assert params["search_pattern"] == "%food pan%"
+
+    @pytest.mark.asyncio
+    async def test_search_without_query_skips_search_join(
+        self, search_service, mock_session
+    ):
+        """No text search join (and a constant rank) without `q`."""
+        count_result = MagicMock()
+        count_result.scalar.return_value = 0
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute = AsyncMock(side_effect=[count_result, mock_result])
+
+        await search_service.search_locations(limit=10)
+
+        main_sql = str(mock_session.execute.call_args_list[1].args[0])
+        assert "location_search" not in main_sql
+        assert "0 as search_rank" in main_sql
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("  St.  Mary's   Pantry ", "st:* & mary:* & s:* & pantry:*"),
+            ("123 main", "123:* & main:*"),
+        ],
+    )
+    def test_build_text_search_params_prefix(self, query, expected):
+        """Every term becomes a prefix match safe for to_tsquery."""
+        assert build_text_search_params(query)["search_prefix"] == expected
+
+    @pytest.mark.parametrize("query", ["", "   ", "food; DROP TABLE", "---", None])
+    def test_build_text_search_params_rejects(self, query):
+        """Empty, punctuation-only and disallowed queries are ignored."""
+        assert build_text_search_params(query) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("facet_match,operator", [("any", "&&"), ("all", "@>")])
+    async def test_service_and_language_filters_use_facet_arrays(
+        self, search_service, mock_session, facet_match, operator
+    ):
+        """services / languages become array predicates on location_search."""
+        count_result = MagicMock()
+        count_result.scalar.return_value = 0
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute = AsyncMock(side_effect=[count_result, mock_result])
+
+        await search_service.search_locations(
+            services=["Food Pantry", "hot-meals", "food_pantry", " "],
+            languages=["ES"],
+            facet_match=facet_match,
+        )
+
+        main_sql = str(mock_session.execute.call_args_list[1].args[0])
+        params = mock_session.execute.call_args_list[1].args[1]
+        assert "LEFT JOIN location_search lf ON lf.location_id = l.id" in main_sql
+        assert (
+            f"lf.service_tokens {operator} CAST(:service_tokens AS text[])" in main_sql
+        )
+        assert (
+            f"lf.language_codes {operator} CAST(:language_tokens AS text[])" in main_sql
+        )
+        assert "services IS NOT NULL" not in main_sql
+        assert params["service_tokens"] == ["food_pantry", "hot_meals"]
+        assert params["language_tokens"] == ["es"]
+
+    @pytest.mark.asyncio
+    async def test_include_facets_reads_counts_from_count_query(
+        self, search_service, mock_session
+    ):
+        """Facet counts come back from the count query into metadata."""
+        count_row = MagicMock(
+            total=3,
+            service_facet_tokens=["food_pantry", "hot_meals"],
+            service_facet_counts=[3, 1],
+            language_facet_tokens=None,
+            language_facet_counts=None,
+        )
+        count_result = MagicMock()
+        count_result.one.return_value = count_row
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute = AsyncMock(side_effect=[count_result, mock_result])
+
+        _, metadata, total = await search_service.search_locations(
+            include_facets=True, output_format=OutputFormat.COMPACT
+        )
+
+        count_sql = str(mock_session.execute.call_args_list[0].args[0])
+        assert "unnest(service_tokens)" in count_sql
+        assert "FROM searchable_locations" in count_sql
+        assert total == 3
+        assert metadata.facets == {
+            "services": {"food_pantry": 3, "hot_meals": 1},
+            "languages": {},
+        }
+
+    @pytest.mark.asyncio
+    async def test_radius_search_uses_geography_index_predicates(
+        self, search_service, mock_session
+    ):
+        """Radius search is ST_DWithin + `<->` ordering, not the acos formula."""
+        mock_row = MagicMock()
+        mock_row.id = 1
+        mock_row.lat = 40.7128
+        mock_row.lng = -74.0060
+        mock_row.location_name = "Test Location"
+        mock_row.org_name = "Test Org"
+        mock_row.confidence_score = 85
+        mock_row.distance_m = 2 * _METERS_PER_MILE
+        count_result = MagicMock()
+        count_result.scalar.return_value = 1
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [mock_row]
+        mock_session.execute = AsyncMock(side_effect=[count_result, mock_result])
+
+        locations, _, _ = await search_service.search_locations(
+            center_lat=40.7,
+            center_lng=-74.0,
+            radius_miles=5,
+            output_format=OutputFormat.COMPACT,
+        )
+
+        main_sql = str(mock_session.execute.call_args_list[1].args[0])
+        params = mock_session.execute.call_args_list[1].args[1]
+        assert "acos" not in main_sql
+        assert (
+            f"ST_DWithin({_LOCATION_GEOGRAPHY}, {_CENTER_GEOGRAPHY}, :radius_meters"
+            in main_sql
+        )
+        assert f"{_LOCATION_GEOGRAPHY} <-> {_CENTER_GEOGRAPHY} as distance_m" in (
+            main_sql
+        )
+        assert "ORDER BY search_rank DESC, distance_m," in main_sql
+        assert params["radius_meters"] == pytest.approx(5 * _METERS_PER_MILE)
+        assert locations[0]["distance_miles"] == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_center_without_radius_orders_nearest_first(
+        self, search_service, mock_session
+    ):
+        """A center alone sorts by distance without a radius cut-off."""
+        count_result = MagicMock()
+        count_result.scalar.return_value = 0
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute = AsyncMock(side_effect=[count_result, mock_result])
+
+        await search_service.search_locations(center_lat=40.7, center_lng=-74.0)
+
+        main_sql = str(mock_session.execute.call_args_list[1].args[0])
+        assert "ST_DWithin" not in main_sql
+        assert "ORDER BY search_rank DESC, distance_m," in main_sql
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("Food Pantry", "food_pantry"),
+            ("  Hot-Meals!! ", "hot_meals"),
+            ("es", "es"),
+            ("en-US", "en_us"),
+            ("---", None),
+            (None, None),
+        ],
+    )
+    def test_normalize_facet_token(self, value, expected):
+        """Facet tokens fold the same way as location_facet_token() in SQL."""
+        assert normalize_facet_token(value) == expected
+
     def test_output_format_enum(self):
         """Test OutputFormat enum values."""
         assert OutputFormat.FULL == "full"
@@ -984,3 +984,59 @@ class TestBeaconSyncAccessibilityPerLocation:
             "location B lost its accessibility — batch-wide LIMIT 1 "
             "populated only one location per page"
         )
+
+
+class TestBeaconSyncChangeSequence:
+    """beacon_sync_state.change_seq moves once per committing write, and the
+    sync snapshot (ETag + total) follows it."""
+
+    @staticmethod
+    async def _change_seq(session: AsyncSession) -> int:
+        result = await session.execute(
+            text("SELECT COALESCE(SUM(change_seq), 0) FROM beacon_sync_state")
+        )
+        return result.scalar_one()
+
+    @pytest.mark.asyncio
+    async def test_commit_bumps_change_seq_once(self, db_session: AsyncSession) -> None:
+        before = await self._change_seq(db_session)
+        await db_session.commit()
+
+        # One location + three addresses in a single transaction
+        await _seed_location_with_addresses(
+            db_session,
+            loc_id=str(uuid.uuid4()),
+            org_id=str(uuid.uuid4()),
+            name="Change Seq Pantry",
+            lat=40.0,
+            lng=-74.0,
+            confidence=80,
+            address_count=3,
+        )
+
+        assert await self._change_seq(db_session) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_follows_change_seq(self, db_session: AsyncSession) -> None:
+        service = BeaconSyncService(db_session, min_confidence=60)
+        first = await service.snapshot()
+        assert await service.snapshot() == first
+
+        await _seed_location_with_addresses(
+            db_session,
+            loc_id=str(uuid.uuid4()),
+            org_id=str(uuid.uuid4()),
+            name="Snapshot Pantry",
+            lat=40.0,
+            lng=-74.0,
+            confidence=80,
+            address_count=1,
+        )
+
+        second = await service.snapshot()
+        assert second.change_seq > first.change_seq
+        assert second.total == first.total + 1
+        assert second.etag != first.etag
+        assert second.total == await service._count_qualified(
+            updated_since=None, state_filter=None
+        )
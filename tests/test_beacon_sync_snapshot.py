@@ -0,0 +1,222 @@
+"""Tests for the Beacon sync snapshot layer (cached ETag / count per change_seq)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.partners.beacon import services
+from app.api.v1.partners.beacon.services import (
+    BeaconSyncService,
+    BeaconSyncSnapshot,
+    _decode_cursor,
+    _encode_cursor,
+    _SnapshotCache,
+)
+
+
+def _scalar_result(value):
+    result = MagicMock()
+    result.scalar_one.return_value = value
+    return result
+
+
+def _etag_result(updated_at, count):
+    result = MagicMock()
+    result.fetchone.return_value = (updated_at, count)
+    return result
+
+
+def _regclass_result(value):
+    result = MagicMock()
+    result.scalar.return_value = value
+    return result
+
+
+@pytest.fixture(autouse=True)
+def _clear_snapshots(monkeypatch):
+    monkeypatch.setattr(services, "_SYNC_STATE_PRESENT", True)
+    services._SNAPSHOTS.clear()
+    yield
+    services._SNAPSHOTS.clear()
+
+
+@pytest.fixture
+def session():
+    return MagicMock(spec=AsyncSession)
+
+
+class TestSnapshot:
+    """BeaconSyncService.snapshot only recomputes when change_seq moves."""
+
+    @pytest.mark.asyncio
+    async def test_first_poll_computes_etag_and_count(self, session):
+        session.execute = AsyncMock(
+            side_effect=[
+                _scalar_result(7),
+                _etag_result("2026-01-01", 3),
+                _scalar_result(3),
+            ]
+        )
+
+        snapshot = await BeaconSyncService(session).snapshot()
+
+        assert snapshot.change_seq == 7
+        assert snapshot.total == 3
+        assert session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_repeat_poll_without_changes_is_one_lookup(self, session):
+        session.execute = AsyncMock(
+            side_effect=[
+                _scalar_result(7),
+                _etag_result("2026-01-01", 3),
+                _scalar_result(3),
+                _scalar_result(7),
+            ]
+        )
+        service = BeaconSyncService(session)
+
+        first = await service.snapshot()
+        second = await service.snapshot()
+
+        assert second == first
+        assert session.execute.await_count == 4
+        assert "beacon_sync_state" in str(session.execute.await_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_new_change_seq_recomputes(self, session):
+        session.execute = AsyncMock(
+            side_effect=[
+                _scalar_result(7),
+                _etag_result("2026-01-01", 3),
+                _scalar_result(3),
+                _scalar_result(8),
+                _etag_result("2026-01-02", 4),
+                _scalar_result(4),
+            ]
+        )
+        service = BeaconSyncService(session)
+
+        first = await service.snapshot()
+        second = await service.snapshot()
+
+        assert second.change_seq == 8
+        assert second.total == 4
+        assert second.etag != first.etag
+
+    @pytest.mark.asyncio
+    async def test_filters_are_cached_separately(self, session):
+        session.execute = AsyncMock(
+            side_effect=[
+                _scalar_result(7),
+                _etag_result("2026-01-01", 3),
+                _scalar_result(3),
+                _scalar_result(7),
+                _etag_result("2026-01-01", 1),
+                _scalar_result(1),
+            ]
+        )
+        service = BeaconSyncService(session)
+
+        await service.snapshot()
+        by_state = await service.snapshot(state_filter="IL")
+
+        assert by_state.total == 1
+        assert session.execute.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_cursor_resumes_from_its_snapshot(self, session):
+        session.execute = AsyncMock(
+            side_effect=[
+                _scalar_result(7),
+                _etag_result("2026-01-01", 3),
+                _scalar_result(3),
+            ]
+        )
+        service = BeaconSyncService(session)
+        first = await service.snapshot()
+
+        resumed = await service.snapshot(
+            cursor=_encode_cursor(80, "loc-001", first.change_seq)
+        )
+
+        assert resumed == first
+        assert session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_state_probe_runs_once(self, session, monkeypatch):
+        monkeypatch.setattr(services, "_SYNC_STATE_PRESENT", False)
+        session.execute = AsyncMock(
+            side_effect=[
+                _regclass_result("beacon_sync_state"),
+                _scalar_result(7),
+                _etag_result("2026-01-01", 3),
+                _scalar_result(3),
+                _scalar_result(7),
+            ]
+        )
+        service = BeaconSyncService(session)
+
+        first = await service.snapshot()
+        second = await service.snapshot()
+
+        assert second == first
+        assert session.execute.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_missing_sync_state_falls_back_uncached(self, session, monkeypatch):
+        monkeypatch.setattr(services, "_SYNC_STATE_PRESENT", False)
+        session.execute = AsyncMock(
+            side_effect=[
+                _regclass_result(None),
+                _etag_result("2026-01-01", 3),
+                _scalar_result(3),
+                _regclass_result(None),
+                _etag_result("2026-01-01", 3),
+                _scalar_result(3),
+            ]
+        )
+        service = BeaconSyncService(session)
+
+        first = await service.snapshot()
+        second = await service.snapshot()
+
+        assert first.change_seq is None
+        assert first.total == 3
+        assert second == first
+        assert session.execute.await_count == 6
+
+
+class TestCursorEncoding:
+    """Beacon cursors carry the snapshot change_seq."""
+
+    def test_roundtrip_with_change_seq(self):
+        assert _decode_cursor(_encode_cursor(85, "loc-001", 12)) == (
+            85,
+            "loc-001",
+            12,
+        )
+
+    def test_cursor_without_change_seq(self):
+        assert _decode_cursor(_encode_cursor(85, "loc-001")) == (85, "loc-001", None)
+
+    def test_decode_none(self):
+        assert _decode_cursor(None) == (None, None, None)
+
+    def test_decode_invalid_raises_value_error(self):
+        with pytest.raises(ValueError, match="Malformed pagination cursor"):
+            _decode_cursor("not-valid-base64!!!")
+
+
+def test_snapshot_cache_evicts_least_recently_used():
+    cache = _SnapshotCache(max_entries=2)
+    snapshot = BeaconSyncSnapshot(change_seq=1, etag="e", total=0)
+    cache.put(("a", 1), snapshot)
+    cache.put(("b", 1), snapshot)
+    cache.get(("a", 1))
+    cache.put(("c", 1), snapshot)
+
+    assert cache.get(("a", 1)) is snapshot
+    assert cache.get(("b", 1)) is None
+    assert cache.get(("c", 1)) is snapshot
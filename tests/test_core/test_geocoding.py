@@ -187,6 +187,32 @@ class TestGeocodingService:
             # Should not call geocoding API when cache hit
             mock_arcgis.assert_not_called()
 
+    def test_geocode_with_negative_cache_hit(self, mock_env, mock_cache):
+        """Test a cached failure short-circuits the providers."""
+        service = GeocodingService()
+
+        mock_cache.get.return_value = {"negative": True}
+
+        with patch.object(service, "_geocode_with_arcgis") as mock_arcgis:
+            assert service.geocode("Nowhere") is None
+            mock_arcgis.assert_not_called()
+
+    def test_geocode_failure_is_negatively_cached(self, mock_env, mock_cache):
+        """Test a failed lookup is cached with the short negative TTL."""
+        service = GeocodingService()
+        service.negative_cache_ttl = 60
+
+        with patch.object(
+            service, "_geocode_with_arcgis", return_value=None
+        ), patch.object(service, "_geocode_with_nominatim", return_value=None):
+            assert service.geocode("Nowhere") is None
+
+        mock_cache.set.assert_called_once()
+        args = mock_cache.set.call_args[0]
+        assert args[0] == make_geocoding_cache_key("arcgis", "Nowhere")
+        assert args[1] == {"negative": True}
+        assert args[2] == 60
+
     def test_geocode_with_fallback(self, mock_env, mock_cache):
         """Test geocoding with fallback to secondary provider."""
         service = GeocodingService()
@@ -237,15 +263,15 @@ class TestGeocodingService:
         service = GeocodingService()
 
         addresses = ["123 Main St", "456 Oak Ave", "", "789 Pine Rd"]  # Empty address
-
-        with patch.object(service, "geocode") as mock_geocode:
-            mock_geocode.side_effect = [
-                (40.7128, -74.0060),
-                (41.8781, -87.6298),
-                None,
-                (34.0522, -118.2437),
-            ]
-
+        coordinates = {
+            "123 Main St": (40.7128, -74.0060),
+            "456 Oak Ave": (41.8781, -87.6298),
+            "789 Pine Rd": (34.0522, -118.2437),
+        }
+
+        with patch.object(
+            service, "_geocode_with_arcgis", side_effect=coordinates.get
+        ) as mock_arcgis:
             results = service.batch_geocode(addresses)
 
             assert len(results) == 4
@@ -253,7 +279,8 @@ class TestGeocodingService:
             assert results[1] == (41.8781, -87.6298)
             assert results[2] is None
             assert results[3] == (34.0522, -118.2437)
-            assert mock_geocode.call_count == 4
+            # Empty address is never sent to a provider
+            assert mock_arcgis.call_count == 3
 
     def test_singleton_pattern(self, mock_env, mock_cache):
         """Test that get_geocoding_service returns singleton."""
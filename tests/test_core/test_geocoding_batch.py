@@ -0,0 +1,251 @@
+"""Tests for concurrent batch geocoding with token-bucket rate limiting."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core.geocoding.batch import (
+    BatchGeocoder,
+    BatchProvider,
+    TokenBucket,
+    normalize_batch_address,
+    provider_rate_per_second,
+)
+from app.core.geocoding.cache_backend import make_geocoding_cache_key
+from app.core.geocoding.service import GeocodingService
+
+
+class FakeProvider:
+    """Stub geocoder with injectable latency that records its calls."""
+
+    def __init__(self, latency: float = 0.0, fail: bool = False):
+        self.latency = latency
+        self.fail = fail
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, address: str):
+        with self._lock:
+            self.calls.append(address)
+        time.sleep(self.latency)
+        if self.fail:
+            return None
+        return (float(len(address)), -float(len(address)))
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_wait(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0])
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+
+        now[0] = 0.5
+        assert bucket.try_acquire() == 0.0
+
+    def test_refill_capped_at_capacity(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=10.0, capacity=1, clock=lambda: now[0])
+        assert bucket.try_acquire() == 0.0
+
+        now[0] = 100.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() > 0.0
+
+
+class TestBatchHelpers:
+    """Tests for normalization and rate configuration helpers."""
+
+    def test_normalize_batch_address(self):
+        assert normalize_batch_address("  123  Main St ") == "123 main st"
+        assert normalize_batch_address("123 MAIN\tST") == "123 main st"
+        assert normalize_batch_address("") == ""
+        assert normalize_batch_address(None) == ""
+
+    def test_provider_rate_from_env(self, monkeypatch):
+        monkeypatch.setenv("GEOCODING_RATE_LIMIT", "0.25")
+        monkeypatch.setenv("NOMINATIM_RATE_LIMIT", "2")
+
+        assert provider_rate_per_second("arcgis") == pytest.approx(4.0)
+        assert provider_rate_per_second("nominatim") == pytest.approx(0.5)
+
+
+class TestBatchGeocoder:
+    """Tests for BatchGeocoder against fake providers."""
+
+    def test_falls_back_to_next_provider(self):
+        failing = FakeProvider(fail=True)
+        working = FakeProvider()
+        geocoder = BatchGeocoder(
+            [
+                BatchProvider("primary", failing, rate=1000.0),
+                BatchProvider("secondary", working, rate=1000.0),
+            ]
+        )
+
+        result, provider = geocoder.geocode_one("1 Elm St")
+
+        assert result == (8.0, -8.0)
+        assert provider == "secondary"
+        assert failing.calls == ["1 Elm St"]
+
+    def test_provider_exception_is_treated_as_miss(self):
+        def boom(address):
+            raise RuntimeError("provider down")
+
+        working = FakeProvider()
+        geocoder = BatchGeocoder(
+            [
+                BatchProvider("primary", boom, rate=1000.0),
+                BatchProvider("secondary", working, rate=1000.0),
+            ]
+        )
+
+        result, provider = geocoder.geocode_one("1 Elm St")
+        assert result is not None
+        assert provider == "secondary"
+
+    def test_no_providers(self):
+        geocoder = BatchGeocoder([])
+        assert geocoder.geocode_many(["a"]) == {"a": (None, None)}
+
+    def test_throughput_approaches_combined_rate_limit(self):
+        """Rate-limited providers are used in parallel, not one at a time."""
+        fast = FakeProvider(latency=0.01)
+        slow = FakeProvider(latency=0.01)
+        geocoder = BatchGeocoder(
+            [
+                BatchProvider("fast", fast, rate=60.0),
+                BatchProvider("slow", slow, rate=40.0),
+            ],
+            max_workers=8,
+        )
+        addresses = [f"{i} Main St" for i in range(60)]
+
+        start = time.monotonic()
+        results = geocoder.geocode_many(addresses)
+        elapsed = time.monotonic() - start
+
+        assert len(results) == 60
+        assert len(fast.calls) + len(slow.calls) == 60
+        assert fast.calls and slow.calls
+
+        throughput = len(addresses) / elapsed
+        # Combined limit is 100/s; a single provider caps out at 60/s.
+        assert throughput > 60.0
+        assert throughput <= 100.0 * 1.2
+
+
+class InMemoryBackend:
+    """Dict-backed cache backend that counts round trips."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def get(self, cache_key):
+        self.round_trips += 1
+        return self.data.get(cache_key)
+
+    def set(self, cache_key, data, ttl):
+        self.round_trips += 1
+        self.data[cache_key] = data
+
+    def get_many(self, cache_keys):
+        self.round_trips += 1
+        return {k: self.data[k] for k in cache_keys if k in self.data}
+
+    def set_many(self, items, ttl):
+        self.round_trips += 1
+        self.data.update(items)
+
+
+class TestServiceBatchGeocode:
+    """Tests for GeocodingService.batch_geocode."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setenv("GEOCODING_PROVIDER", "arcgis")
+        monkeypatch.setenv("GEOCODING_ENABLE_FALLBACK", "true")
+        monkeypatch.setenv("GEOCODING_RATE_LIMIT", "0.001")
+        monkeypatch.setenv("NOMINATIM_RATE_LIMIT", "0.001")
+        monkeypatch.setenv("GEOCODING_LOCAL_CACHE_SIZE", "0")
+        with patch(
+            "app.core.geocoding.service.get_geocoding_cache_backend"
+        ) as mock_factory:
+            mock_factory.return_value = InMemoryBackend()
+            yield GeocodingService()
+
+    def test_dedups_and_preserves_order(self, service):
+        provider = FakeProvider(latency=0.005)
+        addresses = ["1 Elm St", "22 Oak Ave", " 1  ELM st", "", "1 elm st"]
+
+        with patch.object(service, "_geocode_with_arcgis", side_effect=provider):
+            results = service.batch_geocode(addresses, max_workers=4)
+
+        assert results[0] == (8.0, -8.0)
+        assert results[1] == (10.0, -10.0)
+        assert results[2] == results[0]
+        assert results[3] is None
+        assert results[4] == results[0]
+        assert sorted(provider.calls) == ["1 Elm St", "22 Oak Ave"]
+
+    def test_cache_hits_skip_providers(self, service):
+        service._cache.data[make_geocoding_cache_key("arcgis", "1 Elm St")] = {
+            "lat": 1.0,
+            "lon": 2.0,
+        }
+        service._cache.data[make_geocoding_cache_key("nominatim", "2 Elm St")] = {
+            "lat": 3.0,
+            "lon": 4.0,
+        }
+        provider = FakeProvider()
+
+        with patch.object(service, "_geocode_with_arcgis", side_effect=provider):
+            results = service.batch_geocode(["1 Elm St", "2 Elm St"])
+
+        assert results == [(1.0, 2.0), (3.0, 4.0)]
+        assert provider.calls == []
+        # All hits resolved with a single multi-get
+        assert service._cache.round_trips == 1
+
+    def test_results_are_cached_under_answering_provider(self, service):
+        with patch.object(
+            service, "_geocode_with_arcgis", return_value=None
+        ), patch.object(service, "_geocode_with_nominatim", return_value=(3.0, 4.0)):
+            results = service.batch_geocode(["1 Elm St"])
+
+        assert results == [(3.0, 4.0)]
+        assert service._cache.data[
+            make_geocoding_cache_key("nominatim", "1 Elm St")
+        ] == {"lat": 3.0, "lon": 4.0}
+
+    def test_failures_are_negatively_cached(self, service):
+        with patch.object(
+            service, "_geocode_with_arcgis", return_value=None
+        ) as mock_arcgis, patch.object(
+            service, "_geocode_with_nominatim", return_value=None
+        ):
+            assert service.batch_geocode(["Nowhere"]) == [None]
+            assert service.batch_geocode(["Nowhere"]) == [None]
+
+        assert mock_arcgis.call_count == 1
+        assert service._cache.data[make_geocoding_cache_key("arcgis", "Nowhere")] == {
+            "negative": True
+        }
+
+    def test_batch_provider_override(self, service, monkeypatch):
+        service.batch_providers = ["census"]
+        providers = service._get_batch_providers()
+        assert [p.name for p in providers] == ["census"]
+
+    def test_unconfigured_providers_are_skipped(self, service):
+        service.nominatim_geocode = None
+        providers = service._get_batch_providers()
+        assert [p.name for p in providers] == ["arcgis"]
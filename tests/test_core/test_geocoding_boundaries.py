@@ -0,0 +1,112 @@
+"""Tests for the offline state boundary index."""
+
+import time
+
+import pytest
+
+from app.core.geocoding.boundaries import (
+    StateBoundaryIndex,
+    get_state_boundary_index,
+    state_for_point,
+)
+from app.core.geocoding.validator import GeocodingValidator
+from app.core.zip_state_mapping import get_state_from_coordinates
+
+
+class TestStateBoundaryIndex:
+    """Tests for StateBoundaryIndex on synthetic polygons."""
+
+    @pytest.fixture
+    def index(self):
+        # Square "AA" with a square hole, and a small "BB" inside the hole
+        return StateBoundaryIndex(
+            {
+                "AA": [
+                    [0, 0, 10, 0, 10, 10, 0, 10],
+                    [4, 4, 6, 4, 6, 6, 4, 6],
+                ],
+                "BB": [[4.5, 4.5, 5.5, 4.5, 5.5, 5.5, 4.5, 5.5]],
+            }
+        )
+
+    def test_point_inside(self, index):
+        assert index.state_for_point(1.0, 1.0) == "AA"
+
+    def test_point_outside(self, index):
+        assert index.state_for_point(20.0, 20.0) is None
+
+    def test_hole_is_excluded(self, index):
+        assert not index.contains("AA", 4.2, 4.2)
+        assert index.state_for_point(4.2, 4.2) is None
+
+    def test_enclave_wins(self, index):
+        assert index.state_for_point(5.0, 5.0) == "BB"
+
+    def test_distance_to_state(self, index):
+        assert index.distance_to_state("AA", 1.0, 1.0) == 0.0
+        assert index.distance_to_state("BB", 1.0, 5.0) == pytest.approx(3.5, rel=1e-3)
+        assert index.distance_to_state("ZZ", 1.0, 1.0) == float("inf")
+
+
+class TestBundledStateBoundaries:
+    """Tests against the bundled US state outlines."""
+
+    @pytest.mark.parametrize(
+        "lat,lon,expected",
+        [
+            (39.1141, -94.6275, "KS"),  # Kansas City, KS
+            (39.0997, -94.5786, "MO"),  # Kansas City, MO
+            (40.7128, -74.0060, "NY"),  # New York City
+            (39.9526, -75.1652, "PA"),  # Philadelphia
+            (39.9259, -75.1196, "NJ"),  # Camden
+            (38.9072, -77.0369, "DC"),  # Washington
+            (38.8816, -77.0910, "VA"),  # Arlington
+            (41.8781, -87.6298, "IL"),  # Chicago
+            (47.6062, -122.3321, "WA"),  # Seattle
+            (61.2181, -149.9003, "AK"),  # Anchorage (bounding box fallback)
+            (21.3069, -157.8583, "HI"),  # Honolulu (bounding box fallback)
+            (35.0, -60.0, None),  # Atlantic Ocean
+        ],
+    )
+    def test_state_for_point(self, lat, lon, expected):
+        assert state_for_point(lat, lon) == expected
+
+    def test_index_is_singleton(self):
+        assert get_state_boundary_index() is get_state_boundary_index()
+
+    def test_lookup_is_fast(self):
+        state_for_point(39.1141, -94.6275)  # build index
+        start = time.perf_counter()
+        for _ in range(1000):
+            state_for_point(39.1141, -94.6275)
+        per_lookup = (time.perf_counter() - start) / 1000
+        assert per_lookup < 0.001
+
+    def test_get_state_from_coordinates(self):
+        assert get_state_from_coordinates(39.0997, -94.5786) == "MO"
+        assert get_state_from_coordinates(None, -94.5786) is None
+
+
+class TestValidatorUsesBoundaries:
+    """GeocodingValidator state checks backed by the outline index."""
+
+    @pytest.fixture
+    def validator(self):
+        return GeocodingValidator.__new__(GeocodingValidator)
+
+    def test_overlapping_bounding_boxes_are_disambiguated(self, validator):
+        # Kansas City, MO falls inside the KS bounding box
+        assert validator.is_within_state_bounds(39.0997, -94.5786, "MO")
+        assert not validator.is_within_state_bounds(39.0997, -94.4, "KS")
+
+    def test_coastal_point_falls_back_to_bounds(self, validator):
+        # Miami Beach lies outside the simplified Florida coastline
+        assert validator.is_within_state_bounds(25.7907, -80.1300, "FL")
+
+    def test_border_tolerance(self, validator):
+        # Texarkana, AR sits on the TX/AR line
+        assert validator.is_within_state_bounds(33.4418, -94.0377, "AR")
+
+    def test_suggest_correction_names_actual_state(self, validator):
+        suggestion = validator.suggest_correction(39.0997, -94.4, "KS")
+        assert suggestion == "Coordinates are in MO, not KS"
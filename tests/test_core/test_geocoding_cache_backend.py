@@ -167,3 +167,61 @@ class TestGetGeocodingCacheBackend:
 
         # DynamoDB should win even if REDIS_URL is set
         assert result is mock_instance
+
+
+class TestRedisGeocodingCacheMulti:
+    """Tests for RedisGeocodingCache get_many/set_many."""
+
+    def test_get_many_uses_single_mget(self):
+        mock_redis = MagicMock()
+        mock_redis.mget.return_value = [
+            json.dumps({"lat": 1.0, "lon": 2.0}),
+            None,
+            json.dumps({"negative": True}),
+        ]
+        cache = RedisGeocodingCache(mock_redis)
+
+        result = cache.get_many(["a", "b", "c", "a"])
+
+        mock_redis.mget.assert_called_once_with(["a", "b", "c"])
+        assert result == {"a": {"lat": 1.0, "lon": 2.0}, "c": {"negative": True}}
+
+    def test_get_many_skips_corrupt_values(self):
+        mock_redis = MagicMock()
+        mock_redis.mget.return_value = ["not-json", json.dumps({"lat": 1, "lon": 2})]
+        cache = RedisGeocodingCache(mock_redis)
+
+        assert cache.get_many(["a", "b"]) == {"b": {"lat": 1, "lon": 2}}
+
+    def test_get_many_error_returns_empty(self):
+        mock_redis = MagicMock()
+        mock_redis.mget.side_effect = ConnectionError("lost connection")
+        cache = RedisGeocodingCache(mock_redis)
+
+        assert cache.get_many(["a"]) == {}
+
+    def test_get_many_empty_skips_redis(self):
+        mock_redis = MagicMock()
+        cache = RedisGeocodingCache(mock_redis)
+
+        assert cache.get_many([]) == {}
+        mock_redis.mget.assert_not_called()
+
+    def test_set_many_uses_pipeline(self):
+        mock_redis = MagicMock()
+        pipe = mock_redis.pipeline.return_value
+        cache = RedisGeocodingCache(mock_redis)
+
+        cache.set_many({"a": {"lat": 1.0, "lon": 2.0}, "b": {"negative": True}}, 60)
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.setex.call_count == 2
+        pipe.setex.assert_any_call("b", 60, json.dumps({"negative": True}))
+        pipe.execute.assert_called_once()
+
+    def test_set_many_error_is_swallowed(self):
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value.execute.side_effect = ConnectionError("x")
+        cache = RedisGeocodingCache(mock_redis)
+
+        cache.set_many({"a": {"lat": 1.0, "lon": 2.0}}, 60)
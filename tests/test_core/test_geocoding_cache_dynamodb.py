@@ -142,3 +142,99 @@ class TestDynamoDBGeocodingCache:
         cache.get("test-key")
 
         mock_boto3_client.assert_called_once_with("dynamodb", region_name="us-east-1")
+
+
+class TestDynamoDBGeocodingCacheBatch:
+    """Tests for DynamoDBGeocodingCache get_many/set_many."""
+
+    @pytest.fixture
+    def mock_client(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def cache(self, mock_client):
+        c = DynamoDBGeocodingCache(table_name="test-table")
+        c._client = mock_client
+        return c
+
+    def _item(self, key, lat=None, lon=None, data=None):
+        item = {
+            "address": {"S": key},
+            "ttl": {"N": str(int(time.time()) + 3600)},
+        }
+        if lat is not None:
+            item["latitude"] = {"N": str(lat)}
+            item["longitude"] = {"N": str(lon)}
+        if data is not None:
+            item["data"] = {"S": json.dumps(data)}
+        return item
+
+    def test_get_many_batches_keys(self, cache, mock_client):
+        mock_client.batch_get_item.return_value = {
+            "Responses": {
+                "test-table": [
+                    self._item("k1", 1.0, 2.0),
+                    self._item("k2", data={"negative": True}),
+                ]
+            }
+        }
+
+        result = cache.get_many(["k1", "k2", "k3"])
+
+        assert result == {"k1": {"lat": 1.0, "lon": 2.0}, "k2": {"negative": True}}
+        request = mock_client.batch_get_item.call_args.kwargs["RequestItems"]
+        assert len(request["test-table"]["Keys"]) == 3
+
+    def test_get_many_chunks_at_100_keys(self, cache, mock_client):
+        mock_client.batch_get_item.return_value = {"Responses": {"test-table": []}}
+
+        cache.get_many([f"k{i}" for i in range(250)])
+
+        assert mock_client.batch_get_item.call_count == 3
+
+    def test_get_many_retries_unprocessed_keys(self, cache, mock_client):
+        unprocessed = {"test-table": {"Keys": [{"address": {"S": "k2"}}]}}
+        mock_client.batch_get_item.side_effect = [
+            {
+                "Responses": {"test-table": [self._item("k1", 1.0, 2.0)]},
+                "UnprocessedKeys": unprocessed,
+            },
+            {"Responses": {"test-table": [self._item("k2", 3.0, 4.0)]}},
+        ]
+
+        result = cache.get_many(["k1", "k2"])
+
+        assert set(result) == {"k1", "k2"}
+        assert mock_client.batch_get_item.call_args.kwargs["RequestItems"] == (
+            unprocessed
+        )
+
+    def test_get_many_error_returns_empty(self, cache, mock_client):
+        mock_client.batch_get_item.side_effect = Exception("throttled")
+        assert cache.get_many(["k1"]) == {}
+
+    def test_set_many_chunks_at_25_items(self, cache, mock_client):
+        mock_client.batch_write_item.return_value = {}
+        items = {f"geocode:arcgis:{i}": {"lat": 1.0, "lon": 2.0} for i in range(30)}
+
+        cache.set_many(items, 3600)
+
+        assert mock_client.batch_write_item.call_count == 2
+        first = mock_client.batch_write_item.call_args_list[0].kwargs["RequestItems"]
+        put = first["test-table"][0]["PutRequest"]["Item"]
+        assert put["provider"] == {"S": "arcgis"}
+        assert put["latitude"] == {"N": "1.0"}
+
+    def test_set_many_negative_value(self, cache, mock_client):
+        mock_client.batch_write_item.return_value = {}
+
+        cache.set_many({"geocode:arcgis:x": {"negative": True}}, 60)
+
+        request = mock_client.batch_write_item.call_args.kwargs["RequestItems"]
+        item = request["test-table"][0]["PutRequest"]["Item"]
+        assert "latitude" not in item
+        assert json.loads(item["data"]["S"]) == {"negative": True}
+
+    def test_set_many_error_is_swallowed(self, cache, mock_client):
+        mock_client.batch_write_item.side_effect = Exception("throttled")
+        cache.set_many({"k": {"lat": 1.0, "lon": 2.0}}, 60)
@@ -0,0 +1,140 @@
+"""Tests for the in-process LRU geocoding cache tier."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.geocoding.cache_local import TieredGeocodingCache, with_local_tier
+
+
+class TestTieredGeocodingCache:
+    """Tests for TieredGeocodingCache."""
+
+    @pytest.fixture
+    def clock(self):
+        return [0.0]
+
+    @pytest.fixture
+    def backend(self):
+        backend = MagicMock()
+        backend.get.return_value = None
+        backend.get_many.return_value = {}
+        return backend
+
+    @pytest.fixture
+    def cache(self, backend, clock):
+        return TieredGeocodingCache(
+            backend,
+            max_size=2,
+            local_ttl=100,
+            negative_ttl=10,
+            clock=lambda: clock[0],
+        )
+
+    def test_local_hit_skips_backend(self, cache, backend):
+        cache.set("a", {"lat": 1.0, "lon": 2.0}, 3600)
+
+        assert cache.get("a") == {"lat": 1.0, "lon": 2.0}
+        backend.get.assert_not_called()
+        backend.set.assert_called_once_with("a", {"lat": 1.0, "lon": 2.0}, 3600)
+
+    def test_backend_hit_is_promoted(self, cache, backend):
+        backend.get.return_value = {"lat": 1.0, "lon": 2.0}
+
+        assert cache.get("a") == {"lat": 1.0, "lon": 2.0}
+        assert cache.get("a") == {"lat": 1.0, "lon": 2.0}
+        backend.get.assert_called_once_with("a")
+
+    def test_local_entry_expires(self, cache, backend, clock):
+        cache.set("a", {"lat": 1.0, "lon": 2.0}, 3600)
+        clock[0] = 101.0
+
+        assert cache.get("a") is None
+        backend.get.assert_called_once_with("a")
+
+    def test_short_ttl_is_honored_locally(self, cache, backend, clock):
+        cache.set("a", {"negative": True}, 10)
+        clock[0] = 11.0
+
+        assert cache.get("a") is None
+
+    def test_negative_backend_hit_expires_at_negative_ttl(self, cache, backend, clock):
+        backend.get.return_value = {"negative": True}
+        assert cache.get("a") == {"negative": True}
+
+        backend.get.return_value = None
+        clock[0] = 11.0
+
+        assert cache.get("a") is None
+        assert backend.get.call_count == 2
+
+    def test_get_many_negative_backend_hit_expires_at_negative_ttl(
+        self, cache, backend, clock
+    ):
+        backend.get_many.return_value = {"a": {"negative": True}}
+        assert cache.get_many(["a"]) == {"a": {"negative": True}}
+
+        backend.get_many.return_value = {}
+        clock[0] = 11.0
+
+        assert cache.get_many(["a"]) == {}
+        assert backend.get_many.call_count == 2
+
+    def test_lru_eviction(self, cache, backend):
+        cache.set("a", {"lat": 1.0, "lon": 1.0}, 3600)
+        cache.set("b", {"lat": 2.0, "lon": 2.0}, 3600)
+        cache.get("a")  # "a" is now most recently used
+        cache.set("c", {"lat": 3.0, "lon": 3.0}, 3600)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"lat": 1.0, "lon": 1.0}
+
+    def test_get_many_only_asks_backend_for_local_misses(self, cache, backend):
+        cache.set("a", {"lat": 1.0, "lon": 1.0}, 3600)
+        backend.get_many.return_value = {"b": {"lat": 2.0, "lon": 2.0}}
+
+        result = cache.get_many(["a", "b", "c"])
+
+        assert result == {
+            "a": {"lat": 1.0, "lon": 1.0},
+            "b": {"lat": 2.0, "lon": 2.0},
+        }
+        backend.get_many.assert_called_once_with(["b", "c"])
+
+    def test_get_many_all_local_skips_backend(self, cache, backend):
+        cache.set("a", {"lat": 1.0, "lon": 1.0}, 3600)
+
+        assert cache.get_many(["a"]) == {"a": {"lat": 1.0, "lon": 1.0}}
+        backend.get_many.assert_not_called()
+
+    def test_set_many_writes_through(self, cache, backend):
+        items = {"a": {"lat": 1.0, "lon": 1.0}}
+        cache.set_many(items, 60)
+
+        backend.set_many.assert_called_once_with(items, 60)
+        assert cache.get("a") == {"lat": 1.0, "lon": 1.0}
+
+
+class TestWithLocalTier:
+    """Tests for with_local_tier."""
+
+    def test_none_backend_stays_none(self):
+        assert with_local_tier(None) is None
+
+    def test_wraps_backend(self, monkeypatch):
+        monkeypatch.setenv("GEOCODING_LOCAL_CACHE_SIZE", "5")
+        monkeypatch.setenv("GEOCODING_NEGATIVE_CACHE_TTL", "60")
+        backend = MagicMock()
+
+        cache = with_local_tier(backend)
+
+        assert isinstance(cache, TieredGeocodingCache)
+        assert cache.backend is backend
+        assert cache.max_size == 5
+        assert cache.negative_ttl == 60
+
+    def test_disabled_with_zero_size(self, monkeypatch):
+        monkeypatch.setenv("GEOCODING_LOCAL_CACHE_SIZE", "0")
+        backend = MagicMock()
+
+        assert with_local_tier(backend) is backend
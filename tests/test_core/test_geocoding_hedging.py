@@ -0,0 +1,245 @@
+"""Tests for hedged multi-provider geocoding."""
+
+import random
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.geocoding.hedging import HedgedGeocoder, LatencyHistogram
+from app.core.geocoding.service import GeocodingService
+
+
+class StubProvider:
+    """Stub geocoder whose latency comes from an injected sampler."""
+
+    def __init__(self, latency, result=(40.7, -74.0)):
+        self.latency = latency
+        self.result = result
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, address):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency() if callable(self.latency) else self.latency)
+        return self.result
+
+
+def _percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().quantile(0.95) is None
+
+    def test_quantile_uses_bucket_upper_bound(self):
+        histogram = LatencyHistogram(buckets=(0.01, 0.1, 1.0))
+        for _ in range(95):
+            histogram.record(0.005)
+        for _ in range(5):
+            histogram.record(0.5)
+
+        assert histogram.count == 100
+        assert histogram.quantile(0.5) == 0.01
+        assert histogram.quantile(0.95) == 0.01
+        assert histogram.quantile(0.99) == 1.0
+
+    def test_overflow_reports_largest_bucket(self):
+        histogram = LatencyHistogram(buckets=(0.01, 0.1))
+        histogram.record(5.0)
+        assert histogram.quantile(0.5) == 0.1
+
+
+class TestHedgedGeocoder:
+    """Tests for HedgedGeocoder."""
+
+    def test_fast_primary_does_not_hedge(self):
+        primary = StubProvider(0.0)
+        secondary = StubProvider(0.0)
+        hedger = HedgedGeocoder(
+            [("primary", primary), ("secondary", secondary)], initial_delay=0.5
+        )
+
+        result, provider = hedger.geocode("1 Elm St")
+
+        assert result == (40.7, -74.0)
+        assert provider == "primary"
+        assert secondary.calls == 0
+        assert hedger.hedges == 0
+
+    def test_slow_primary_is_hedged(self):
+        primary = StubProvider(0.5)
+        secondary = StubProvider(0.0, result=(41.0, -75.0))
+        hedger = HedgedGeocoder(
+            [("primary", primary), ("secondary", secondary)],
+            initial_delay=0.05,
+            min_delay=0.01,
+        )
+
+        start = time.monotonic()
+        result, provider = hedger.geocode("1 Elm St")
+
+        assert time.monotonic() - start < 0.4
+        assert result == (41.0, -75.0)
+        assert provider == "secondary"
+        assert hedger.hedges == 1
+
+    def test_invalid_result_moves_on_immediately(self):
+        primary = StubProvider(0.0, result=(0.0, 0.0))
+        secondary = StubProvider(0.0, result=(41.0, -75.0))
+        hedger = HedgedGeocoder(
+            [("primary", primary), ("secondary", secondary)],
+            validate=lambda r: r != (0.0, 0.0),
+            initial_delay=5.0,
+        )
+
+        start = time.monotonic()
+        _, provider = hedger.geocode("1 Elm St")
+
+        assert time.monotonic() - start < 1.0
+        assert provider == "secondary"
+        # An empty answer is a fallback, not a hedge
+        assert hedger.hedges == 0
+
+    def test_all_providers_fail(self):
+        hedger = HedgedGeocoder(
+            [("a", StubProvider(0.0, result=None)), ("b", StubProvider(0.0, None))]
+        )
+        assert hedger.geocode("1 Elm St") == (None, None)
+
+    def test_delay_adapts_to_observed_latency(self):
+        hedger = HedgedGeocoder(
+            [("primary", StubProvider(0.0))],
+            initial_delay=2.0,
+            min_delay=0.001,
+            min_samples=10,
+        )
+        assert hedger.hedge_delay("primary") == 2.0
+
+        for _ in range(10):
+            hedger.histograms["primary"].record(0.02)
+
+        assert hedger.hedge_delay("primary") == pytest.approx(0.025)
+
+    def test_pacing_wait_is_not_recorded_as_latency(self):
+        hedger = HedgedGeocoder(
+            [("primary", StubProvider(0.0))],
+            pacers={"primary": lambda: time.sleep(0.2)},
+            min_delay=0.001,
+            min_samples=1,
+        )
+
+        result, provider = hedger.geocode("1 Elm St")
+
+        assert result == (40.7, -74.0)
+        assert provider == "primary"
+        assert hedger.hedge_delay("primary") <= 0.05
+
+    def test_counters_are_consistent_across_threads(self):
+        hedger = HedgedGeocoder(
+            [("primary", StubProvider(0.0)), ("secondary", StubProvider(0.0))]
+        )
+        threads = [
+            threading.Thread(
+                target=lambda: [hedger.geocode("1 Elm St") for _ in range(50)]
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert hedger.calls == 400
+
+    def test_simulation_reduces_tail_latency_with_bounded_extra_calls(self):
+        """A primary with a slow tail gets a lower p99 when hedged."""
+        rng = random.Random(42)
+        lock = threading.Lock()
+
+        def primary_latency():
+            with lock:
+                return 0.4 if rng.random() < 0.08 else 0.005
+
+        def run(hedge: bool):
+            primary = StubProvider(primary_latency)
+            secondary = StubProvider(0.01)
+            providers = [("primary", primary), ("secondary", secondary)]
+            hedger = HedgedGeocoder(
+                providers,
+                initial_delay=0.05 if hedge else 10.0,
+                min_delay=0.005,
+                min_samples=10,
+                quantile=0.9,
+            )
+            if not hedge:
+                hedger.min_samples = 10**9
+            latencies = []
+            for i in range(150):
+                start = time.monotonic()
+                hedger.geocode(f"{i} Main St")
+                latencies.append(time.monotonic() - start)
+            return latencies, primary.calls, secondary.calls
+
+        baseline, _, baseline_extra = run(hedge=False)
+        hedged, primary_calls, extra_calls = run(hedge=True)
+
+        assert baseline_extra == 0
+        assert _percentile(hedged, 0.99) < _percentile(baseline, 0.99) / 2
+        # Only the slow tail (plus warm-up) pays for a second provider call
+        assert extra_calls <= 0.25 * primary_calls
+
+
+class TestServiceHedgedGeocode:
+    """Tests for GeocodingService hedged mode."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setenv("GEOCODING_PROVIDER", "arcgis")
+        monkeypatch.setenv("GEOCODING_ENABLE_FALLBACK", "true")
+        monkeypatch.setenv("GEOCODING_HEDGE_ENABLED", "true")
+        monkeypatch.setenv("GEOCODING_HEDGE_DELAY", "0.05")
+        monkeypatch.setenv("GEOCODING_RATE_LIMIT", "0.001")
+        monkeypatch.setenv("NOMINATIM_RATE_LIMIT", "0.001")
+        with patch(
+            "app.core.geocoding.service.get_geocoding_cache_backend"
+        ) as mock_factory:
+            cache = MagicMock()
+            cache.get.return_value = None
+            mock_factory.return_value = cache
+            service = GeocodingService()
+            service._validator = MagicMock()
+            service._validator.is_valid_coordinates.return_value = True
+            service._validator.is_within_us_bounds.return_value = True
+            service._validator.detect_test_data.return_value = False
+            yield service
+
+    def test_hedged_geocode_uses_fallback_for_slow_primary(self, service):
+        with patch.object(
+            service, "_geocode_with_arcgis", side_effect=StubProvider(0.5)
+        ), patch.object(
+            service,
+            "_geocode_with_nominatim",
+            side_effect=StubProvider(0.0, result=(41.0, -75.0)),
+        ), patch.object(
+            service, "_cache_result"
+        ) as mock_cache_result:
+            result = service.geocode("1 Elm St")
+
+        assert result == (41.0, -75.0)
+        mock_cache_result.assert_called_once_with("1 Elm St", "nominatim", 41.0, -75.0)
+
+    def test_force_provider_bypasses_hedging(self, service):
+        with patch.object(
+            service, "_geocode_with_nominatim", return_value=(41.0, -75.0)
+        ), patch.object(service, "_get_hedger") as mock_hedger:
+            result = service.geocode("1 Elm St", force_provider="nominatim")
+
+        assert result == (41.0, -75.0)
+        mock_hedger.assert_not_called()
@@ -20,13 +20,17 @@ Load-bearing correctness properties under test:
 
 import os
 import uuid
+from unittest.mock import MagicMock
 
 import pytest
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
-from app.federation.aggregate import build_location_aggregate
+from app.federation.aggregate import (
+    build_location_aggregate,
+    build_location_aggregates,
+)
 from app.models.hsds.response import LocationResponse
 
 _SEED = bytes(range(32))
@@ -534,3 +538,88 @@ def test_non_uuid_location_id_raises_value_error(db_session) -> None:
         build_location_aggregate(db_session, "not-a-uuid")
     assert not isinstance(exc_info.value, ValidationError)
     assert "not-a-uuid" in str(exc_info.value)
+
+
+# --- Batch builder: build_location_aggregates must emit exactly the per-location
+# objects (byte-identical once canonicalized) in a constant number of queries.
+
+
+def _seed_varied_locations(session, count: int) -> list[str]:
+    org_id = _insert_organization(
+        session, website="https://example.org", email="help@example.org"
+    )
+    ids = []
+    for i in range(count):
+        loc_id = _insert_location(
+            session,
+            name=f"Fictional Pantry {i}",
+            latitude=40.0 + i / 100,
+            confidence_score=40 + i,
+            organization_id=org_id if i % 2 else None,
+        )
+        for scraper in ("scraper_a", "scraper_b")[: i % 3]:
+            _insert_source(session, loc_id, scraper_id=scraper)
+        if i % 2:
+            _insert_address(session, loc_id, address_1=f"{i} Main St")
+            _insert_phone(session, loc_id, number=f"555-01{i:02d}")
+        for day in ("MO", "TH")[: i % 3]:
+            _insert_schedule(
+                session, loc_id, byday=day, opens_at="09:00", closes_at="12:00"
+            )
+        ids.append(loc_id)
+    return ids
+
+
+def test_batch_aggregates_are_jcs_identical_to_single(db_session) -> None:
+    from app.federation.canonical import jcs_bytes
+
+    ids = _seed_varied_locations(db_session, 6)
+
+    batch = build_location_aggregates(db_session, ids)
+
+    assert list(batch) == ids
+    for loc_id in ids:
+        single = build_location_aggregate(db_session, loc_id)
+        assert jcs_bytes(batch[loc_id]) == jcs_bytes(single)
+
+
+def test_batch_query_count_is_constant(db_session) -> None:
+    ids = _seed_varied_locations(db_session, 12)
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        build_location_aggregates(db_session, ids[:2])
+        small = len(statements)
+        statements.clear()
+        build_location_aggregates(db_session, ids)
+        large = len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert small == large == 3
+
+
+def test_batch_missing_location_raises(db_session) -> None:
+    loc_id = _insert_location(db_session)
+    missing = str(uuid.uuid4())
+
+    with pytest.raises(ValueError, match="location not found"):
+        build_location_aggregates(db_session, [loc_id, missing])
+
+
+def test_batch_issues_three_queries_without_a_database() -> None:
+    """Query count does not depend on the number of ids (no DB needed)."""
+    session = MagicMock()
+    session.execute.return_value.fetchall.return_value = []
+
+    with pytest.raises(ValueError):
+        build_location_aggregates(session, [str(uuid.uuid4()) for _ in range(50)])
+    assert session.execute.call_count == 3
+
+    assert build_location_aggregates(session, []) == {}
+    assert session.execute.call_count == 3
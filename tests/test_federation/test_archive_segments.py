@@ -0,0 +1,200 @@
+"""Sealed archive segments: sparse offset index + precomputed subtree hashes.
+
+Runs the same contract against the filesystem backend and an S3 backend on a
+moto-mocked bucket. Small geometry (8-leaf segments, 2-leaf index blocks) keeps
+the trees readable; every lookup's cost is pinned through the backend's
+``reads`` / ``bytes_read`` counters — once a segment's header is cached, one
+entry or one in-segment audit path is ONE ranged read of a single block.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.federation import merkle
+from app.federation.retention import (
+    LocalFsArchiveBackend,
+    SegmentedArchiveBackend,
+    _SegmentedArchive,
+    encode_segment,
+    parse_segment_header,
+    segment_header_len,
+)
+
+_SIZE = 8
+_STRIDE = 2
+_BUCKET = "fictional-archive"
+
+
+def _leaf(seq: int) -> bytes:
+    return b'{"sequence":%d,"name":"Fictional Pantry %s"}' % (seq, b"x" * seq)
+
+
+def _leaves(first: int, last: int) -> list[bytes]:
+    return [_leaf(seq) for seq in range(first, last + 1)]
+
+
+@pytest.fixture(params=["file", "s3"])
+def open_backend(request, tmp_path, monkeypatch):
+    """A factory of readers over ONE archive (each with empty caches)."""
+    if request.param == "file":
+        yield lambda: LocalFsArchiveBackend(
+            str(tmp_path), segment_size=_SIZE, index_stride=_STRIDE
+        )
+        return
+    moto = pytest.importorskip("moto")
+    import boto3
+
+    from app.federation.retention import S3ArchiveBackend
+
+    for var, value in (
+        ("AWS_ACCESS_KEY_ID", "testing"),
+        ("AWS_SECRET_ACCESS_KEY", "testing"),
+        ("AWS_DEFAULT_REGION", "us-east-1"),
+    ):
+        monkeypatch.setenv(var, value)
+    with moto.mock_aws():
+        boto3.client("s3").create_bucket(Bucket=_BUCKET)
+        yield lambda: S3ArchiveBackend(
+            _BUCKET, "pref", segment_size=_SIZE, index_stride=_STRIDE
+        )
+
+
+@pytest.fixture()
+def backend(open_backend):
+    return open_backend()
+
+
+def _archive(backend, first: int, last: int) -> None:
+    for seq in range(first, last + 1):
+        backend.put(seq, _leaf(seq))
+
+
+def test_encode_roundtrips_header_and_root():
+    leaves = _leaves(9, 16)
+    data = encode_segment(9, leaves, _STRIDE)
+    header = parse_segment_header(data, _SIZE, _STRIDE)
+
+    assert (header.first_sequence, header.count, header.stride) == (9, 8, 2)
+    assert header.root == merkle.merkle_root(leaves)
+    assert [len(level) for level in header.levels] == [4, 2, 1]
+    assert header.header_len == segment_header_len(_SIZE, _STRIDE)
+    assert len(data) == header.header_len + header.offsets[-1]
+
+
+def test_encode_rejects_unaligned_or_ragged_segments():
+    with pytest.raises(ValueError, match="aligned"):
+        encode_segment(2, _leaves(2, 9), _STRIDE)
+    with pytest.raises(ValueError, match="powers of two"):
+        encode_segment(1, _leaves(1, 6), _STRIDE)
+
+
+def test_parse_rejects_a_geometry_mismatch():
+    data = encode_segment(1, _leaves(1, 8), _STRIDE)
+
+    with pytest.raises(ValueError, match="geometry"):
+        parse_segment_header(data, _SIZE, 4)
+    with pytest.raises(ValueError, match="not a federation log segment"):
+        parse_segment_header(b"X" * len(data), _SIZE, _STRIDE)
+
+
+def test_backends_satisfy_the_segmented_protocol(backend):
+    assert isinstance(backend, SegmentedArchiveBackend)
+
+
+def test_backend_missing_a_primitive_fails_at_construction():
+    class _NoSegments(LocalFsArchiveBackend):
+        _has_segment = _SegmentedArchive._has_segment
+
+    with pytest.raises(TypeError, match="_has_segment"):
+        _NoSegments("unused")
+
+
+def test_seal_packs_full_segments_below_the_floor(backend):
+    _archive(backend, 1, 20)
+
+    # Floor 21: segments 1-8 and 9-16 are full; 17-20 stay loose.
+    assert backend.seal(21) == 2
+    assert backend.seal(21) == 0
+
+    for seq in range(1, 21):
+        assert backend.has(seq)
+        assert backend.get(seq) == _leaf(seq)
+    assert not backend._has_leaf(5)
+    assert backend._has_leaf(17)
+    assert not backend.has(21)
+
+
+def test_seal_stops_at_a_partial_segment(backend):
+    _archive(backend, 1, 8)
+
+    # Floor 8 means sequence 8 is still live: segment 1-8 is not yet sealable.
+    assert backend.seal(8) == 0
+    assert backend.seal(9) == 1
+
+
+def test_entry_lookup_is_one_ranged_read_of_one_block(backend, open_backend):
+    _archive(backend, 1, 16)
+    backend.seal(17)
+    reader = open_backend()
+    header_len = segment_header_len(_SIZE, _STRIDE)
+    block = sum(4 + len(_leaf(seq)) for seq in (11, 12))
+
+    # Cold: the header (once per segment) + the block holding the entry.
+    assert reader.get(12) == _leaf(12)
+    assert (reader.reads, reader.bytes_read) == (2, header_len + block)
+
+    # Warm: exactly one ranged read of two leaves, never the whole segment.
+    reader.reads = reader.bytes_read = 0
+    assert reader.get(15) == _leaf(15)
+    segment_bytes = header_len + sum(4 + len(_leaf(s)) for s in range(9, 17))
+    assert reader.reads == 1
+    assert reader.bytes_read == 4 + len(_leaf(15)) + 4 + len(_leaf(16))
+    assert reader.bytes_read < segment_bytes // 4
+
+
+def test_sequential_reads_fetch_each_block_once(backend, open_backend):
+    _archive(backend, 1, 8)
+    backend.seal(9)
+    reader = open_backend()
+
+    assert [reader.get(seq) for seq in range(1, 9)] == _leaves(1, 8)
+    assert reader.reads == 1 + _SIZE // _STRIDE
+
+
+def test_segment_proof_matches_rfc6962_audit_path(backend, open_backend):
+    _archive(backend, 1, 16)
+    backend.seal(17)
+    leaves = _leaves(9, 16)
+    root = merkle.merkle_root(leaves)
+    reader = open_backend()
+    reader.get(9)  # warm the header
+
+    for seq in range(9, 17):
+        reader.reads = reader.bytes_read = 0
+        proof = reader.segment_proof(seq)
+
+        assert proof.leaf == _leaf(seq)
+        assert proof.root == root
+        assert proof.path == merkle.inclusion_proof(leaves, seq - 9)
+        assert merkle.verify_inclusion(proof.leaf, seq - 9, _SIZE, proof.path, root)
+        # One ranged read, or none when the block was the last one read.
+        assert reader.reads <= 1
+
+
+def test_segment_root_is_a_node_of_the_larger_tree(backend):
+    _archive(backend, 1, 20)
+    backend.seal(21)
+    tree = _leaves(1, 20)
+    proof = backend.segment_proof(11)
+
+    # The in-segment path is the lower part of the full-tree audit path.
+    full = merkle.inclusion_proof(tree, 10)
+    assert full[: len(proof.path)] == proof.path
+    assert merkle.merkle_root(tree[8:16]) == proof.root
+
+
+def test_segment_proof_is_none_for_loose_leaves(backend):
+    _archive(backend, 1, 4)
+
+    assert backend.segment_proof(2) is None
@@ -0,0 +1,125 @@
+"""Differential tests: the ``jcs_bytes`` fast path against the reference serializer.
+
+``jcs_bytes`` hands documents that ``_fast_path_safe`` accepts to a C encoder
+(``orjson`` when installed, else the stdlib encoder) and everything else to
+``jcs_bytes_reference``. Either way the bytes MUST be identical, so every case
+here runs with orjson on (if installed) and forced off, and compares against
+the reference — on fuzzed documents biased toward the edges the fast-path gate
+exists for (float boundaries, integral floats, >64-bit ints, non-BMP keys) and
+on the vendored RFC 8785 suite.
+"""
+
+import json
+import math
+from pathlib import Path
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+import pytest
+
+from app.federation import canonical
+from app.federation.canonical import jcs_bytes, jcs_bytes_reference
+
+_VECTORS = Path(__file__).resolve().parent / "vendor" / "jcs_rfc8785"
+_NAMES = ["arrays", "french", "structures", "unicode", "values", "weird"]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run each test through both C encoders behind the fast path."""
+    if request.param == "orjson":
+        if canonical.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(canonical, "orjson", None)
+    return request.param
+
+
+# Surrogate-free text (see test_property_canonical.py), plus keys that mix in
+# astral characters so the UTF-16 ordering rule keeps documents off the fast path.
+_json_text = st.text(
+    alphabet=st.characters(blacklist_categories=("Cs",)),
+    max_size=12,
+)
+_keys = st.one_of(
+    _json_text,
+    st.sampled_from(["a", "é", "\U0001f602", "דּ", "￿", "\U00010000"]),
+)
+_floats = st.one_of(
+    st.floats(allow_nan=False, allow_infinity=False),
+    # Both sides of every fast-path boundary, and integral values inside it.
+    st.sampled_from(
+        [1e-4, 9.999999999999999e-5, 1e15, 999999999999999.9, 1e16, 1e21, 1e-7]
+    ),
+    st.integers(min_value=-(10**17), max_value=10**17).map(float),
+    st.floats(min_value=1e-5, max_value=1e16),
+)
+_scalars = st.one_of(
+    st.none(),
+    st.booleans(),
+    st.integers(),  # unbounded: exercises orjson's 64-bit fallback
+    _floats,
+    _json_text,
+)
+_json_values = st.recursive(
+    _scalars,
+    lambda children: st.one_of(
+        st.lists(children, max_size=4),
+        st.dictionaries(_keys, children, max_size=4),
+    ),
+    max_leaves=16,
+)
+
+
+@settings(max_examples=500, deadline=None)
+@given(value=_json_values)
+def test_fast_path_matches_reference(value) -> None:
+    """jcs_bytes and the reference agree byte-for-byte on fuzzed documents."""
+    expected = jcs_bytes_reference(value)
+    assert jcs_bytes(value) == expected
+    original = canonical.orjson
+    canonical.orjson = None
+    try:
+        assert jcs_bytes(value) == expected
+    finally:
+        canonical.orjson = original
+
+
+@pytest.mark.parametrize("name", _NAMES)
+def test_fast_path_matches_official_vector(name: str, encoder: str) -> None:
+    obj = json.loads((_VECTORS / "input" / f"{name}.json").read_bytes().decode("utf-8"))
+    expected = (_VECTORS / "output" / f"{name}.json").read_bytes()
+    assert jcs_bytes(obj) == expected
+    assert jcs_bytes_reference(obj) == expected
+
+
+@pytest.mark.parametrize(
+    "value, safe",
+    [
+        ({"lat": 41.8781, "lng": -87.6298, "id": "x"}, True),
+        ({"n": 1.0}, False),  # integral float: JCS prints "1"
+        ({"n": 1e-5}, False),  # exponent form differs
+        ({"n": 1e15}, False),
+        ({"\U0001f602": 1}, False),  # non-BMP key: UTF-16 order
+        ({"s": "\U0001f602"}, True),  # non-BMP *values* are fine
+        ([True, None, 2**70], True),  # big int: orjson falls back to stdlib
+        ({"d": 1.5, "nested": [{"x": 0.25}]}, True),
+    ],
+)
+def test_fast_path_gate(value, safe: bool, encoder: str) -> None:
+    assert canonical._fast_path_safe(value) is safe
+    assert jcs_bytes(value) == jcs_bytes_reference(value)
+
+
+@pytest.mark.parametrize(
+    "value", [{"n": math.nan}, {"n": math.inf}, {"s": {1, 2}}, {1: "a"}]
+)
+def test_unsupported_values_still_raise(value, encoder: str) -> None:
+    with pytest.raises(ValueError):
+        jcs_bytes(value)
+
+
+def test_lone_surrogate_still_raises(encoder: str) -> None:
+    with pytest.raises(UnicodeEncodeError):
+        jcs_bytes({"s": "\ud800"})
@@ -34,12 +34,14 @@ def db_session():
     ensure_audit_table(session)
     session.execute(text("TRUNCATE federation_log"))
     session.execute(text("TRUNCATE dedup_run_audit"))
+    session.execute(text("TRUNCATE location_redirect"))
     session.execute(text("TRUNCATE TABLE location CASCADE"))
     session.commit()
     yield session
     session.rollback()
     session.execute(text("TRUNCATE federation_log"))
     session.execute(text("TRUNCATE dedup_run_audit"))
+    session.execute(text("TRUNCATE location_redirect"))
     session.execute(text("TRUNCATE TABLE location CASCADE"))
     session.commit()
     session.close()
@@ -297,3 +299,47 @@ def test_dedup_script_dry_run_no_delete(db_session, configured):
         survivor_id=survivor,
     )
     assert _delete_rows(db_session) == []
+
+
+def test_redirect_resolves_edges_recorded_without_audit_rows(db_session, configured):
+    """The same-org script records its merges straight into location_redirect (no
+    audit row); the resolver's indexed lookup still reaches the terminal."""
+    dead = _insert_location(db_session, is_canonical=False)
+    mid = _insert_location(db_session, is_canonical=False)
+    terminal = _insert_location(db_session, is_canonical=True)
+    db_session.execute(
+        text("SELECT location_redirect_record(:old, :surv)"),
+        {"old": dead, "surv": mid},
+    )
+    _audit_soft_delete(db_session, mid, terminal)
+
+    seq = publish_location_delete(
+        db_session, dead_location_id=dead, survivor_location_id=None
+    )
+
+    assert seq is not None
+    obj = _delete_rows(db_session)[0].object_canonical["object"]
+    assert obj["redirectTo"] == f"{_HOST}:{terminal}"
+
+
+def test_resolver_uses_one_indexed_lookup_when_redirect_table_exists():
+    """With location_redirect present the audit chain is never scanned."""
+    from unittest.mock import MagicMock
+
+    from app.federation import publish as publish_mod
+
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = "location_redirect"
+    session.execute.return_value.first.return_value = ("terminal-id",)
+
+    terminal = publish_mod._resolve_terminal_survivor(session, "dead-id", "mid-id")
+
+    assert terminal == "terminal-id"
+    statements = [str(c.args[0]) for c in session.execute.call_args_list]
+    assert len(statements) == 2
+    assert "location_redirect" in statements[1]
+    assert not any("dedup_run_audit" in sql for sql in statements)
+    assert session.execute.call_args_list[1].args[1] == {
+        "dead": "dead-id",
+        "fallback": "mid-id",
+    }
@@ -2,9 +2,10 @@
 hook (echo-suppressed, kill-switch-guarded, publish-gated, fail-soft).
 
 Tests the guarded ``app.federation.publish.publish_location_update`` directly (the
-shared hook logic) plus the ``LocationCommitHandler`` wiring via a minimally
-constructed handler (``object.__new__`` — the full handler needs job-scoped
-collaborators a unit test should not assemble). DB-backed; all data fictional.
+shared hook logic) plus the ``LocationCommitHandler.publish_pending_updates``
+wiring, inline and outbox, via a minimally constructed handler (``object.__new__``
+— the full handler needs job-scoped collaborators a unit test should not
+assemble). DB-backed; all data fictional.
 """
 
 import base64
@@ -28,13 +29,13 @@ def db_session():
     url = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
     engine = create_engine(url)
     session = sessionmaker(bind=engine)()
-    session.execute(text("TRUNCATE federation_log"))
-    session.execute(text("TRUNCATE TABLE location CASCADE"))
+    for table in ("federation_outbox", "federation_log", "TABLE location CASCADE"):
+        session.execute(text(f"TRUNCATE {table}"))
     session.commit()
     yield session
     session.rollback()
-    session.execute(text("TRUNCATE federation_log"))
-    session.execute(text("TRUNCATE TABLE location CASCADE"))
+    for table in ("federation_outbox", "federation_log", "TABLE location CASCADE"):
+        session.execute(text(f"TRUNCATE {table}"))
     session.commit()
     session.close()
     engine.dispose()
@@ -53,6 +54,12 @@ def configured(monkeypatch):
     return live
 
 
+@pytest.fixture(params=["inline", "outbox"])
+def publish_mode(request, configured, monkeypatch):
+    monkeypatch.setattr(configured, "FEDERATION_PUBLISH_MODE", request.param)
+    return request.param
+
+
 def _insert_location(session, *, is_canonical: bool = True) -> str:
     loc_id = str(uuid.uuid4())
     session.execute(
@@ -76,6 +83,28 @@ def _log_rows(session):
     ).all()
 
 
+def _published_ids(session, mode: str) -> list[str]:
+    """Location ids handed to federation: appended inline, or queued in outbox."""
+    if mode == "outbox":
+        sql = "SELECT location_id FROM federation_outbox ORDER BY id"
+        return [str(value) for value in session.execute(text(sql)).scalars()]
+    return [
+        row.federation_id.removeprefix("node.example:")
+        for row in _log_rows(session)
+        if row.type == "Update"
+    ]
+
+
+def _handler(session, loc_id: str, **metadata):
+    from app.reconciler.location_commit import LocationCommitHandler
+
+    handler = object.__new__(LocationCommitHandler)
+    handler.db = session
+    handler.metadata = metadata
+    handler.committed_location_ids = [uuid.UUID(loc_id)]
+    return handler
+
+
 def _insert_schedule(session, location_id: str) -> None:
     session.execute(
         text(
@@ -172,41 +201,107 @@ def test_missing_location_is_fail_soft(db_session, configured):
     assert publish_location_update(db_session, missing, source_type="scraper") is None
 
 
-def test_handler_wiring_publishes_for_non_submarine(db_session, configured):
-    """LocationCommitHandler._publish_federation_update appends for a non-submarine
-    commit (verifies the hook is wired at the commit site)."""
-    from app.reconciler.location_commit import LocationCommitHandler
-
+def test_handler_wiring_publishes_for_non_submarine(db_session, publish_mode):
+    """publish_pending_updates hands a non-submarine commit to federation in both
+    publish modes (verifies the hook is wired at the commit site)."""
     loc_id = _insert_location(db_session)
-    handler = object.__new__(LocationCommitHandler)
-    handler.db = db_session
-    handler.metadata = {"source_type": "scraper"}
-    handler._publish_federation_update(uuid.UUID(loc_id))
-    rows = _log_rows(db_session)
-    assert len(rows) == 1 and rows[0].type == "Update"
-
+    _handler(db_session, loc_id, source_type="scraper").publish_pending_updates()
+    assert _published_ids(db_session, publish_mode) == [loc_id]
 
-def test_handler_wiring_echo_suppressed(db_session, configured):
-    """The handler passes source_type through, so a federated job is echo-suppressed."""
-    from app.reconciler.location_commit import LocationCommitHandler
 
+def test_handler_wiring_echo_suppressed(db_session, publish_mode):
+    """The handler passes source_type through, so a federated job is echo-suppressed
+    whether it would publish inline or enqueue."""
     loc_id = _insert_location(db_session)
-    handler = object.__new__(LocationCommitHandler)
-    handler.db = db_session
-    handler.metadata = {"source_type": publish.FEDERATED_SOURCE_TYPE}
-    handler._publish_federation_update(uuid.UUID(loc_id))
+    handler = _handler(db_session, loc_id, source_type=publish.FEDERATED_SOURCE_TYPE)
+    handler.publish_pending_updates()
+    assert _published_ids(db_session, publish_mode) == []
     assert _log_rows(db_session) == []
 
 
-def test_submarine_source_publishes_update(db_session, configured):
+def test_submarine_source_publishes_update(db_session, publish_mode):
     """PR-C Task 6: a submarine enrichment commit (PPR-origin) publishes an Update
     — submarine is not echo-suppressed (source_type != federated_node)."""
-    from app.reconciler.location_commit import LocationCommitHandler
+    loc_id = _insert_location(db_session)
+    handler = _handler(
+        db_session, loc_id, scraper_id="submarine", source_type="submarine"
+    )
+    handler.publish_pending_updates()
+    assert _published_ids(db_session, publish_mode) == [loc_id]
+
+
+def test_batch_publish_applies_gate_per_location(db_session, configured):
+    live = _insert_location(db_session)
+    retired = _insert_location(db_session, is_canonical=False)
+    missing = str(uuid.uuid4())
+
+    seqs = publish.publish_location_updates(
+        db_session, [live, retired, missing], source_type="scraper"
+    )
+
+    assert seqs[0] is not None and seqs[1:] == [None, None]
+    assert [r.federation_id for r in _log_rows(db_session)] == [f"node.example:{live}"]
+
+
+def test_batch_publish_isolates_a_nonconformant_location(db_session, configured):
+    """One id that fails the aggregate (non-UUID) falls back to the per-id path,
+    so the rest of the batch is still published."""
+    good = _insert_location(db_session)
+    db_session.execute(
+        text(
+            "INSERT INTO location (id, name, latitude, longitude, location_type,"
+            " is_canonical, created_at, updated_at) VALUES ('not-a-uuid',"
+            " 'Fictional Pantry', 40.7, -74.0, 'physical', TRUE, NOW(), NOW())"
+        )
+    )
+    db_session.commit()
+
+    seqs = publish.publish_location_updates(
+        db_session, ["not-a-uuid", good], source_type="scraper"
+    )
+
+    assert seqs[0] is None and seqs[1] is not None
+    assert len(_log_rows(db_session)) == 1
 
+
+def test_batch_publish_echo_suppressed(db_session, configured):
     loc_id = _insert_location(db_session)
-    handler = object.__new__(LocationCommitHandler)
-    handler.db = db_session
-    handler.metadata = {"scraper_id": "submarine", "source_type": "submarine"}
-    handler._publish_federation_update(uuid.UUID(loc_id))
-    rows = _log_rows(db_session)
-    assert len(rows) == 1 and rows[0].type == "Update"
+
+    assert publish.publish_location_updates(
+        db_session, [loc_id], source_type="federated_node"
+    ) == [None]
+    assert _log_rows(db_session) == []
+
+
+def test_batch_publish_group_commits_one_contiguous_range(db_session, configured):
+    ids = [_insert_location(db_session) for _ in range(3)]
+
+    seqs = publish.publish_location_updates(db_session, ids, source_type="scraper")
+
+    assert seqs == [1, 2, 3]
+    assert [r.federation_id for r in _log_rows(db_session)] == [
+        f"node.example:{loc_id}" for loc_id in ids
+    ]
+
+
+def test_batch_append_failure_falls_back_per_location(
+    db_session, configured, monkeypatch
+):
+    ids = [_insert_location(db_session) for _ in range(2)]
+
+    def _boom(*args, **kwargs):
+        raise RuntimeError("group commit failed")
+
+    singles = []
+
+    def _single(session, **kwargs):
+        singles.append(kwargs["federation_id"])
+        return len(singles)
+
+    monkeypatch.setattr(publish.log, "append_many", _boom)
+    monkeypatch.setattr(publish.log, "append", _single)
+
+    seqs = publish.publish_location_updates(db_session, ids, source_type="scraper")
+
+    assert seqs == [1, 2]
+    assert singles == [f"node.example:{loc_id}" for loc_id in ids]
@@ -314,6 +314,45 @@ def test_b58encode_matches_external_base58_vectors(vec) -> None:
     assert identity._b58encode(bytes.fromhex(vec["input_hex"])) == vec["base58"]
 
 
+@pytest.mark.parametrize("vec", _B58_VECTORS)
+def test_b58decode_matches_external_base58_vectors(vec) -> None:
+    assert identity._b58decode(vec["base58"]) == bytes.fromhex(vec["input_hex"])
+
+
+def _b58encode_textbook(data: bytes) -> str:
+    """One divmod per digit: the oracle for the chunked production codec."""
+    num = int.from_bytes(data, "big")
+    encoded = ""
+    while num > 0:
+        num, rem = divmod(num, 58)
+        encoded = _B58_ALPHABET[rem] + encoded
+    pad = len(data) - len(data.lstrip(b"\x00"))
+    return "1" * pad + encoded
+
+
+@hyp_settings(max_examples=500)
+@given(
+    st.one_of(
+        st.binary(max_size=96),
+        # Leading zeros and lengths around the 10-digit chunk boundaries.
+        st.tuples(st.integers(0, 4), st.binary(min_size=1, max_size=80)).map(
+            lambda t: b"\x00" * t[0] + t[1]
+        ),
+    )
+)
+def test_b58_codec_matches_textbook_algorithm(data: bytes) -> None:
+    encoded = identity._b58encode(data)
+    assert encoded == _b58encode_textbook(data)
+    assert identity._b58decode(encoded) == data
+    assert _b58decode(encoded) == data
+
+
+@pytest.mark.parametrize("bad", ["0", "O", "I", "l", "abc+", "11111111110"])
+def test_b58decode_rejects_characters_outside_the_alphabet(bad: str) -> None:
+    with pytest.raises(ValueError, match="invalid base58 character"):
+        identity._b58decode(bad)
+
+
 # The canonical W3C did:key Ed25519 example (did-key-spec, "Create" section).
 _W3C_DID_KEY_ED25519 = "z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK"
 
@@ -319,3 +319,110 @@ def test_append_rejects_unknown_sizes(db_session) -> None:
         log.build_consistency_proof(db_session, first_size=0, second_size=2)
     with pytest.raises(ValueError):
         log.build_consistency_proof(db_session, first_size=3, second_size=2)
+
+
+def _pending(n: int, start_loc: int = 0) -> list[log.PendingAppend]:
+    return [
+        log.PendingAppend(
+            activity_type="Update",
+            federation_id=f"example.org:loc-{start_loc + i}",
+            obj={"id": f"loc-{start_loc + i}", "name": f"Test Pantry {start_loc + i}"},
+            published="2026-06-06T00:00:00Z",
+        )
+        for i in range(n)
+    ]
+
+
+def _append_many(session, entries) -> list[int] | None:
+    return log.append_many(
+        session,
+        entries,
+        origin_did=_ORIGIN,
+        signing_key=_signing_key(),
+        context=_CONTEXT,
+        license=_LICENSE,
+    )
+
+
+def test_append_many_assigns_one_contiguous_range(db_session) -> None:
+    _append(db_session, 2)
+    assert _append_many(db_session, _pending(3, start_loc=2)) == [3, 4, 5]
+    assert _append(db_session, 1, start_loc=5) == [6]
+    rows = db_session.execute(
+        text(
+            "SELECT sequence, federation_id, object_canonical FROM federation_log"
+            " ORDER BY sequence"
+        )
+    ).all()
+    assert [r.sequence for r in rows] == [1, 2, 3, 4, 5, 6]
+    assert [r.federation_id for r in rows] == [f"example.org:loc-{i}" for i in range(6)]
+    for row in rows:
+        assert row.object_canonical["sequence"] == row.sequence
+
+
+def test_append_many_rows_match_single_appends(db_session) -> None:
+    """A group commit stores exactly the bytes the one-at-a-time path would."""
+    from app.federation import envelope as envelope_mod
+
+    _append(db_session, 3)
+    single = log.leaf_data(db_session, 3)
+    db_session.execute(text("TRUNCATE federation_log"))
+    db_session.commit()
+
+    _append_many(db_session, _pending(3))
+
+    assert log.leaf_data(db_session, 3) == single
+    for env in db_session.execute(
+        text("SELECT object_canonical FROM federation_log")
+    ).scalars():
+        assert envelope_mod.verify_envelope(env, _signing_key().public_key()) is True
+
+
+def test_append_many_is_all_or_nothing(db_session) -> None:
+    entries = [
+        *_pending(2),
+        log.PendingAppend(
+            activity_type="Update",
+            federation_id="example.org:loc-big",
+            obj={"id": "loc-big", "n": 2**60},  # outside the I-JSON range
+        ),
+    ]
+    with pytest.raises(ValueError):
+        _append_many(db_session, entries)
+    db_session.rollback()
+
+    count = db_session.execute(text("SELECT COUNT(*) FROM federation_log")).scalar_one()
+    assert count == 0
+    assert _append_many(db_session, _pending(1)) == [1]
+
+
+def test_append_many_kill_switch_and_empty_batch(db_session, monkeypatch) -> None:
+    from app.core.config import settings as live_settings
+
+    assert _append_many(db_session, []) == []
+    monkeypatch.setattr(live_settings, "FEDERATION_ENABLED", False)
+    assert _append_many(db_session, _pending(2)) is None
+    count = db_session.execute(text("SELECT COUNT(*) FROM federation_log")).scalar_one()
+    assert count == 0
+
+
+def test_append_many_takes_the_lock_once_and_inserts_once(monkeypatch) -> None:
+    """The critical section costs the same statements for 1 or N envelopes."""
+    from unittest.mock import MagicMock
+
+    from app.core.config import settings as live_settings
+
+    monkeypatch.setattr(live_settings, "FEDERATION_ENABLED", True)
+    session = MagicMock()
+    session.execute.return_value.scalar_one.return_value = 41
+
+    assert _append_many(session, _pending(5)) == [41, 42, 43, 44, 45]
+
+    statements = [str(c.args[0]) for c in session.execute.call_args_list]
+    assert len(statements) == 3
+    assert "pg_advisory_xact_lock" in statements[0]
+    assert "INSERT INTO federation_log" in statements[2]
+    params = session.execute.call_args_list[2].args[1]
+    assert params["sequences"] == [41, 42, 43, 44, 45]
+    assert len(set(params["leaf_hashes"])) == 5
+    session.commit.assert_called_once()
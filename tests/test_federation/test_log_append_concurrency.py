@@ -114,3 +114,61 @@ def test_resource_work_is_not_globally_serialized() -> None:
         f"overlap window {window:.2f}s suggests resource steps are being "
         f"serialized (serialized bound {serialized_lower_bound:.1f}s)"
     )
+
+
+def _worker_append_many(worker_id: int, batches: int, batch_size: int) -> None:
+    """Run in a SEPARATE OS process: group-commit ``batches`` x ``batch_size``."""
+    from app.federation import log  # re-import under spawn
+
+    engine = create_engine(_db_url())
+    session = sessionmaker(bind=engine)()
+    key = Ed25519PrivateKey.from_private_bytes(bytes(range(32)))
+    for b in range(batches):
+        seqs = log.append_many(
+            session,
+            [
+                log.PendingAppend(
+                    activity_type="Update",
+                    federation_id=f"example.org:w{worker_id}-{b}-{i}",
+                    obj={"id": f"w{worker_id}-{b}-{i}", "name": "Test Pantry"},
+                    published="2026-06-06T00:00:00Z",
+                )
+                for i in range(batch_size)
+            ],
+            origin_did=_ORIGIN,
+            signing_key=key,
+            context=_CONTEXT,
+            license=_LICENSE,
+        )
+        assert seqs is not None
+        assert seqs == list(range(seqs[0], seqs[0] + batch_size))
+    session.close()
+    engine.dispose()
+
+
+def test_concurrent_group_commits_are_gapless_and_duplicate_free() -> None:
+    """8 processes x 5 batches x 10 group-committed appends (mixed with single
+    appends) -> sequences exactly 1..total, each batch one contiguous range."""
+    workers, batches, batch_size = 8, 5, 10
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(workers) as pool:
+        group = pool.starmap_async(
+            _worker_append_many,
+            [(w, batches, batch_size) for w in range(workers)],
+        )
+        singles = pool.starmap_async(
+            _worker_append, [(100 + w, 5, 0.0) for w in range(2)]
+        )
+        group.get()
+        singles.get()
+    engine = create_engine(_db_url())
+    with engine.connect() as conn:
+        seqs = [
+            r[0]
+            for r in conn.execute(
+                text("SELECT sequence FROM federation_log ORDER BY sequence")
+            )
+        ]
+    engine.dispose()
+    total = workers * batches * batch_size + 2 * 5
+    assert seqs == list(range(1, total + 1))
@@ -0,0 +1,292 @@
+"""Deferred federation publishing through ``federation_outbox``.
+
+The reconciler (``FEDERATION_PUBLISH_MODE=outbox``) only enqueues; the publisher
+drains, coalescing repeated rows for one location into a single ``Update``.
+DB-backed tests run against the real ``federation_outbox`` / ``federation_log``
+tables; the drain-loop plumbing is also covered without a database.
+"""
+
+import base64
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.federation import outbox, publish
+
+_SEED = bytes(range(32))
+_DID = "did:web:node.example"
+
+
+@pytest.fixture()
+def db_session():
+    from app.core.config import settings
+
+    url = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+    engine = create_engine(url)
+    session = sessionmaker(bind=engine)()
+    for table in ("federation_outbox", "federation_log", "location CASCADE"):
+        session.execute(text(f"TRUNCATE {table}"))
+    session.commit()
+    yield session
+    session.rollback()
+    for table in ("federation_outbox", "federation_log", "location CASCADE"):
+        session.execute(text(f"TRUNCATE {table}"))
+    session.commit()
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture()
+def configured(monkeypatch):
+    from app.core.config import settings as live
+
+    monkeypatch.setattr(live, "FEDERATION_ENABLED", True)
+    monkeypatch.setattr(live, "FEDERATION_DID", _DID)
+    monkeypatch.setattr(live, "FEDERATION_DOMAIN", None)
+    monkeypatch.setattr(
+        live, "FEDERATION_SIGNING_KEY", base64.b64encode(_SEED).decode("ascii")
+    )
+    return live
+
+
+def _insert_location(session) -> str:
+    loc_id = str(uuid.uuid4())
+    session.execute(
+        text(
+            """
+            INSERT INTO location (id, name, latitude, longitude, location_type,
+                                  is_canonical, created_at, updated_at)
+            VALUES (:id, 'Fictional Pantry', 40.7, -74.0, 'physical',
+                    TRUE, NOW(), NOW())
+            """
+        ),
+        {"id": loc_id},
+    )
+    session.commit()
+    return loc_id
+
+
+def _outbox_ids(session) -> list[str]:
+    return list(
+        session.execute(
+            text("SELECT location_id FROM federation_outbox ORDER BY id")
+        ).scalars()
+    )
+
+
+def _log_fids(session) -> list[str]:
+    return list(
+        session.execute(
+            text("SELECT federation_id FROM federation_log ORDER BY sequence")
+        ).scalars()
+    )
+
+
+def test_enqueue_writes_rows_and_no_log_entries(db_session, configured):
+    loc_a, loc_b = _insert_location(db_session), _insert_location(db_session)
+
+    assert (
+        outbox.enqueue_location_updates(
+            db_session, [loc_a, loc_b], source_type="scraper"
+        )
+        == 2
+    )
+
+    assert _outbox_ids(db_session) == [loc_a, loc_b]
+    assert _log_fids(db_session) == []
+
+
+def test_enqueue_is_echo_suppressed(db_session, configured):
+    loc_id = _insert_location(db_session)
+
+    assert (
+        outbox.enqueue_location_updates(
+            db_session, [loc_id], source_type=publish.FEDERATED_SOURCE_TYPE
+        )
+        == 0
+    )
+    assert _outbox_ids(db_session) == []
+
+
+def test_drain_coalesces_a_burst_into_one_update(db_session, configured):
+    loc_a, loc_b = _insert_location(db_session), _insert_location(db_session)
+    for ids in ([loc_a], [loc_b, loc_a], [loc_a]):
+        outbox.enqueue_location_updates(db_session, ids, source_type="scraper")
+
+    result = outbox.drain(db_session, batch_size=100)
+
+    assert (result.claimed, result.locations, result.published) == (4, 2, 2)
+    assert _log_fids(db_session) == [f"node.example:{loc_a}", f"node.example:{loc_b}"]
+    assert _outbox_ids(db_session) == []
+    assert outbox.drain(db_session, batch_size=100).claimed == 0
+
+
+def test_drain_takes_the_oldest_rows_first(db_session, configured):
+    ids = [_insert_location(db_session) for _ in range(3)]
+    outbox.enqueue_location_updates(db_session, ids, source_type="scraper")
+
+    assert outbox.drain(db_session, batch_size=2).claimed == 2
+
+    assert _outbox_ids(db_session) == ids[2:]
+    assert _log_fids(db_session) == [f"node.example:{i}" for i in ids[:2]]
+
+
+def test_concurrent_drains_never_claim_the_same_row(db_session, configured):
+    ids = [_insert_location(db_session) for _ in range(2)]
+    outbox.enqueue_location_updates(db_session, ids, source_type="scraper")
+    other = sessionmaker(bind=db_session.get_bind())()
+    try:
+        # Hold the first row's lock in another transaction, as a second
+        # publisher mid-drain would.
+        other.execute(
+            text(
+                "SELECT id FROM federation_outbox ORDER BY id LIMIT 1"
+                " FOR UPDATE SKIP LOCKED"
+            )
+        ).one()
+
+        result = outbox.drain(db_session, batch_size=100)
+
+        assert result.claimed == 1
+        assert _log_fids(db_session) == [f"node.example:{ids[1]}"]
+    finally:
+        other.rollback()
+        other.close()
+    assert _outbox_ids(db_session) == [ids[0]]
+
+
+def test_crashed_drain_leaves_its_claim_in_the_outbox(
+    db_session, configured, monkeypatch
+):
+    loc_id = _insert_location(db_session)
+    outbox.enqueue_location_updates(db_session, [loc_id], source_type="scraper")
+
+    def _crash(db, ids, *, source_type):
+        raise RuntimeError("publisher died before the append committed")
+
+    monkeypatch.setattr(publish, "publish_location_updates", _crash)
+    with pytest.raises(RuntimeError):
+        outbox.drain(db_session, batch_size=100)
+    db_session.rollback()
+
+    assert _outbox_ids(db_session) == [loc_id]
+    assert _log_fids(db_session) == []
+
+
+def test_handler_enqueues_in_outbox_mode(db_session, configured, monkeypatch):
+    from app.reconciler.location_commit import LocationCommitHandler
+
+    monkeypatch.setattr(configured, "FEDERATION_PUBLISH_MODE", "outbox")
+    loc_id = _insert_location(db_session)
+    handler = object.__new__(LocationCommitHandler)
+    handler.db = db_session
+    handler.metadata = {"source_type": "scraper"}
+    handler.committed_location_ids = [uuid.UUID(loc_id)]
+
+    handler.publish_pending_updates()
+
+    assert _outbox_ids(db_session) == [loc_id]
+    assert _log_fids(db_session) == []
+
+
+def test_coalesce_keeps_first_appearance_order():
+    assert outbox.coalesce(["b", "a", "b", "c", "a"]) == ["b", "a", "c"]
+
+
+def test_drain_publishes_distinct_ids_in_claim_order(monkeypatch):
+    from app.core.config import settings as live
+
+    monkeypatch.setattr(live, "FEDERATION_ENABLED", True)
+    session = MagicMock()
+    # RETURNING order is not the claim order; drain sorts by id.
+    session.execute.return_value.fetchall.return_value = [
+        SimpleNamespace(id=3, location_id="b"),
+        SimpleNamespace(id=1, location_id="a"),
+        SimpleNamespace(id=2, location_id="b"),
+    ]
+    published = []
+
+    def _publish(db, ids, *, source_type):
+        published.append((list(ids), source_type))
+        return [7, None]
+
+    monkeypatch.setattr(publish, "publish_location_updates", _publish)
+
+    result = outbox.drain(session, batch_size=10)
+
+    assert published == [(["a", "b"], None)]
+    assert (result.claimed, result.locations, result.published) == (3, 2, 1)
+    session.commit.assert_called_once()
+
+
+def test_drain_commits_the_claim_only_after_publishing(monkeypatch):
+    from app.core.config import settings as live
+
+    monkeypatch.setattr(live, "FEDERATION_ENABLED", True)
+    session = MagicMock()
+    session.execute.return_value.fetchall.return_value = [
+        SimpleNamespace(id=1, location_id="a"),
+        SimpleNamespace(id=2, location_id="b"),
+    ]
+    commits_before_publish = []
+
+    def _publish(db, ids, *, source_type):
+        commits_before_publish.append(session.commit.call_count)
+        return [None, None]
+
+    monkeypatch.setattr(publish, "publish_location_updates", _publish)
+
+    outbox.drain(session, batch_size=10)
+
+    assert commits_before_publish == [0]
+    delete_params = session.execute.call_args_list[-1].args[1]
+    assert delete_params == {"ids": [1, 2]}
+    session.commit.assert_called_once()
+
+
+def test_drain_and_enqueue_are_noops_when_disabled(monkeypatch):
+    from app.core.config import settings as live
+
+    monkeypatch.setattr(live, "FEDERATION_ENABLED", False)
+    session = MagicMock()
+
+    assert outbox.drain(session, batch_size=10) == outbox.DrainResult()
+    assert outbox.enqueue_location_updates(session, ["a"], source_type=None) == 0
+    session.execute.assert_not_called()
+
+
+def test_enqueue_publishes_inline_without_the_outbox_table(monkeypatch):
+    from app.core.config import settings as live
+
+    monkeypatch.setattr(live, "FEDERATION_ENABLED", True)
+    monkeypatch.setattr(outbox, "_OUTBOX_PRESENT", False)
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = None  # to_regclass
+    published = []
+
+    def _publish(db, ids, *, source_type):
+        published.append((list(ids), source_type))
+        return [None] * len(ids)
+
+    monkeypatch.setattr(publish, "publish_location_updates", _publish)
+
+    assert outbox.enqueue_location_updates(session, ["a", "b"], source_type="x") == 0
+    assert published == [(["a", "b"], "x")]
+    session.execute.assert_called_once()
+    session.commit.assert_not_called()
+
+
+def test_enqueue_failure_is_fail_soft(monkeypatch):
+    from app.core.config import settings as live
+
+    monkeypatch.setattr(live, "FEDERATION_ENABLED", True)
+    monkeypatch.setattr(outbox, "_OUTBOX_PRESENT", True)
+    session = MagicMock()
+    session.execute.side_effect = RuntimeError("connection lost")
+
+    assert outbox.enqueue_location_updates(session, ["a"], source_type=None) == 0
+    session.rollback.assert_called_once()
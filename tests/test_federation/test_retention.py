@@ -18,11 +18,14 @@ These tests pin that contract (DB-backed; all data fictional):
   * inclusion proofs for a TRIMMED leaf and a SURVIVING leaf both verify;
   * a consistency proof SPANNING the trim boundary verifies;
   * write-ahead: an archive-put failure leaves the live row intact (no loss/wedge);
+  * full runs of archived leaves are sealed into segments without changing root@N;
   * the kill switch makes prune a no-op.
 """
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from sqlalchemy import create_engine, text
@@ -173,6 +176,27 @@ def test_consistency_proof_spanning_the_trim_boundary_verifies(db_session) -> No
     assert merkle.verify_consistency(3, 5, proof, root3, root5)
 
 
+def test_prune_seals_full_segments_and_keeps_the_root(db_session, monkeypatch):
+    """Leaves 1..2 form a full (2-leaf) segment below the new floor of 4: the prune
+    seals it, drops the loose copies, and leaf_data reads it back unchanged."""
+    from app.core.config import settings
+    from app.federation import retention
+
+    monkeypatch.setattr(retention, "SEGMENT_SIZE", 2)
+    monkeypatch.setattr(retention, "INDEX_STRIDE", 1)
+    _seed_five(db_session)
+    root_before = merkle.merkle_root(log.leaf_data(db_session, 5))
+
+    prune_to_horizon(
+        db_session, backend=_backend(db_session), retention_days=30, now=_NOW
+    )
+
+    archive = Path(settings.FEDERATION_ARCHIVE_PATH)
+    assert (archive / "segments" / "2" / "0.seg").is_file()
+    assert sorted(p.name for p in archive.glob("*.jsonl")) == ["3.jsonl"]
+    assert merkle.merkle_root(log.leaf_data(db_session, 5)) == root_before
+
+
 def test_archive_put_failure_skips_the_delete(db_session) -> None:
     """Write-ahead: if archiving a leaf fails, that leaf's live row is NOT deleted
     (no leaf loss, no wedge) — the floor does not advance past the failure."""
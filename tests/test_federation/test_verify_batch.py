@@ -0,0 +1,113 @@
+"""Batch envelope verification (``app/federation/verify_batch.py``).
+
+The batch path must return exactly ``verify_envelope``'s verdicts, in input
+order, whether a page is verified serially, through an injected executor, or
+across a real spawned process pool.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from app.federation import envelope, verify_batch
+from app.federation.identity import public_key_multibase
+
+_SEED = bytes(range(32))
+_ACTOR = "did:web:example.org"
+
+
+def _key() -> Ed25519PrivateKey:
+    return Ed25519PrivateKey.from_private_bytes(_SEED)
+
+
+def _envelope(sequence: int) -> dict:
+    preimage = envelope.build_preimage(
+        context="https://hsds-federation.pantrypirateradio.org/profile",
+        activity_type="Update",
+        actor=_ACTOR,
+        attributed_to=_ACTOR,
+        origin=_ACTOR,
+        federation_id=f"example.org:loc-{sequence}",
+        obj={"id": f"loc-{sequence}", "name": "Test Pantry"},
+        sequence=sequence,
+        published="2026-06-05T00:00:00Z",
+        license="sandia-ftgg-nc-os-1.0",
+    )
+    return envelope.finalize(preimage, _key())
+
+
+def _page(n: int) -> list:
+    """``n`` envelopes; every third one tampered, plus one non-dict entry."""
+    page = [_envelope(i) for i in range(1, n + 1)]
+    for env in page[::3]:
+        env["object"] = {**env["object"], "name": "Tampered Pantry"}
+    page[1] = "not an envelope"
+    return page
+
+
+@pytest.fixture()
+def multibase() -> str:
+    return public_key_multibase(_key().public_key())
+
+
+def _expected(page: list) -> list[bool]:
+    public_key = _key().public_key()
+    return [envelope.verify_envelope(env, public_key) for env in page]
+
+
+def test_serial_path_matches_verify_envelope(multibase):
+    page = _page(10)
+
+    assert verify_batch.verify_envelopes(page, multibase) == _expected(page)
+
+
+def test_injected_executor_preserves_input_order(multibase):
+    page = _page(23)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        verdicts = verify_batch.verify_envelopes(
+            page, multibase, executor=pool, chunk_size=4, min_parallel=0
+        )
+
+    assert verdicts == _expected(page)
+    assert verdicts.count(False) == 9
+
+
+def test_process_pool_matches_serial(multibase):
+    page = _page(40)
+
+    verdicts = verify_batch.verify_envelopes(
+        page, multibase, workers=2, chunk_size=7, min_parallel=0
+    )
+
+    assert verdicts == _expected(page)
+
+
+def test_wrong_key_rejects_every_envelope():
+    other = public_key_multibase(
+        Ed25519PrivateKey.from_private_bytes(bytes(32)).public_key()
+    )
+
+    assert verify_batch.verify_envelopes([_envelope(1), _envelope(2)], other) == [
+        False,
+        False,
+    ]
+
+
+def test_malformed_key_raises_before_verifying():
+    with pytest.raises(ValueError, match="base58btc"):
+        verify_batch.verify_envelopes([_envelope(1)], "not-multibase")
+
+
+def test_resolved_keys_are_cached(multibase):
+    verify_batch.resolve_public_key.cache_clear()
+
+    verify_batch.verify_envelopes([_envelope(1)], multibase)
+    verify_batch.verify_envelopes([_envelope(2)], multibase)
+
+    assert verify_batch.resolve_public_key.cache_info().misses == 1
+
+
+def test_empty_page_is_empty(multibase):
+    assert verify_batch.verify_envelopes([], multibase) == []
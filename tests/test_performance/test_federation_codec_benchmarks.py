@@ -0,0 +1,55 @@
+"""Microbenchmarks for the federation serialization hot paths.
+
+Every envelope, proof and Location aggregate is JCS-canonicalized at least
+once on publish and again on verify, and every did:key goes through base58.
+These pin the fast JCS path against the reference serializer so a regression
+in the fast-path gate (documents silently falling back) shows up as a number.
+"""
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from app.federation.canonical import jcs_bytes, jcs_bytes_reference
+from app.federation.identity import _b58decode, _b58encode
+
+# Shaped like a Location aggregate: mostly strings, a few coordinates.
+_AGGREGATE = {
+    "id": "0b6c2f0e-6f1d-4a7e-9d0b-1f1c9d7d2a11",
+    "name": "Community Food Pantry",
+    "latitude": 41.878113,
+    "longitude": -87.629799,
+    "address": {
+        "address_1": "123 Main St",
+        "city": "Chicago",
+        "state_province": "IL",
+        "postal_code": "60601",
+    },
+    "schedules": [
+        {"byday": day, "opens_at": "09:00", "closes_at": "17:00"}
+        for day in ("MO", "TU", "WE", "TH", "FR")
+    ],
+    "sources": [
+        {"scraper_id": f"scraper_{i}", "confidence_score": 80, "is_canonical": i == 0}
+        for i in range(8)
+    ],
+}
+_SIGNATURE = bytes(range(64))
+
+
+def test_jcs_fast_path_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Benchmark jcs_bytes on a fast-path-eligible aggregate."""
+    result = benchmark(jcs_bytes, _AGGREGATE)
+    assert result == jcs_bytes_reference(_AGGREGATE)
+
+
+def test_jcs_reference_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Benchmark the reference serializer on the same aggregate, for comparison."""
+    benchmark(jcs_bytes_reference, _AGGREGATE)
+
+
+def test_b58_roundtrip_benchmark(benchmark: BenchmarkFixture) -> None:
+    """Benchmark base58 encode + decode of a 64-byte signature."""
+
+    def roundtrip() -> bytes:
+        return _b58decode(_b58encode(_SIGNATURE))
+
+    assert benchmark(roundtrip) == _SIGNATURE
@@ -5,7 +5,13 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from app.pipeline.sqs_sender import _is_retryable, reset_sqs_client, send_to_sqs
+from app.pipeline.sqs_sender import (
+    SqsMessage,
+    _is_retryable,
+    reset_sqs_client,
+    send_batch_to_sqs,
+    send_to_sqs,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -110,6 +116,84 @@ class TestSendToSqs:
         assert len(body["job_id"]) == 36  # UUID format
 
 
+class TestSendBatchToSqs:
+    """Tests for send_batch_to_sqs function."""
+
+    @staticmethod
+    def _accept_all(QueueUrl, Entries):  # noqa: N803 - boto3 kwargs
+        return {
+            "Successful": [
+                {"Id": e["Id"], "MessageId": f"msg-{e['Id']}"} for e in Entries
+            ]
+        }
+
+    @patch("app.pipeline.sqs_sender._get_sqs_client")
+    def test_sends_in_chunks_of_ten(self, mock_get_client, mock_sqs_client):
+        """Should split messages into SendMessageBatch calls of at most 10."""
+        mock_get_client.return_value = mock_sqs_client
+        mock_sqs_client.send_message_batch.side_effect = self._accept_all
+        queue_url = "https://sqs.us-east-1.amazonaws.com/123/test.fifo"
+        messages = [
+            SqsMessage(body={"job_id": f"job-{n}"}, message_group_id=f"loc-{n}")
+            for n in range(23)
+        ]
+
+        result = send_batch_to_sqs(queue_url, messages, source="test-service")
+
+        assert result == [f"msg-{n}" for n in range(23)]
+        batches = [
+            c.kwargs["Entries"]
+            for c in mock_sqs_client.send_message_batch.call_args_list
+        ]
+        assert [len(b) for b in batches] == [10, 10, 3]
+        entry = batches[2][0]
+        assert entry["MessageGroupId"] == "loc-20"
+        assert entry["MessageDeduplicationId"] == "job-20"
+        body = json.loads(entry["MessageBody"])
+        assert body["data"] == {"job_id": "job-20"}
+        assert body["source"] == "test-service"
+
+    @patch("app.pipeline.sqs_sender._get_sqs_client")
+    def test_reports_rejected_entries_as_none(self, mock_get_client, mock_sqs_client):
+        """Entries SQS rejects come back as None; the rest keep their IDs."""
+        mock_get_client.return_value = mock_sqs_client
+        mock_sqs_client.send_message_batch.return_value = {
+            "Successful": [{"Id": "0", "MessageId": "msg-0"}],
+            "Failed": [{"Id": "1", "Code": "InternalError", "SenderFault": False}],
+        }
+        queue_url = "https://sqs.us-east-1.amazonaws.com/123/test-queue"
+
+        result = send_batch_to_sqs(
+            queue_url, [SqsMessage(body={"n": 0}), SqsMessage(body={"n": 1})]
+        )
+
+        assert result == ["msg-0", None]
+        entries = mock_sqs_client.send_message_batch.call_args.kwargs["Entries"]
+        assert "MessageGroupId" not in entries[0]
+
+    @patch("app.pipeline.sqs_sender.time.sleep")
+    @patch("app.pipeline.sqs_sender._get_sqs_client")
+    def test_retries_transient_batch_errors(self, mock_get_client, mock_sleep):
+        """A failed SendMessageBatch call is retried like send_to_sqs."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.send_message_batch.side_effect = [
+            ConnectionError("reset"),
+            {"Successful": [{"Id": "0", "MessageId": "msg-0"}]},
+        ]
+
+        result = send_batch_to_sqs(
+            "https://sqs.us-east-1.amazonaws.com/123/q", [SqsMessage(body={})]
+        )
+
+        assert result == ["msg-0"]
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_raises_on_empty_queue_url(self):
+        with pytest.raises(ValueError, match="queue_url is required"):
+            send_batch_to_sqs("", [SqsMessage(body={})])
+
+
 class TestSendToSqsRetry:
     """Tests for H27: send_to_sqs retry logic on transient failures."""
 
@@ -2,6 +2,7 @@
 
 import json
 import signal
+import threading
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -389,6 +390,43 @@ class TestPipelineWorkerRunLoop:
 
         assert exc_info.value.code == 1
 
+    def test_run_processes_one_poll_in_parallel_with_concurrency(self, mock_sqs_client):
+        """Should hand a multi-message poll to worker threads when concurrency > 1."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def process_fn(data):
+            barrier.wait()  # only returns once all three run at the same time
+            return None
+
+        worker = PipelineWorker(
+            queue_url="https://sqs.../queue.fifo",
+            process_fn=process_fn,
+            service_name="test",
+            max_messages=3,
+            concurrency=3,
+        )
+        worker._sqs_client = mock_sqs_client
+        messages = [
+            {
+                "MessageId": f"msg-{n}",
+                "ReceiptHandle": f"receipt-{n}",
+                "Body": json.dumps({"job_id": f"job-{n}", "data": {"n": n}}),
+            }
+            for n in range(3)
+        ]
+
+        def receive_side_effect(**kwargs):
+            if mock_sqs_client.receive_message.call_count == 1:
+                return {"Messages": messages}
+            worker._shutdown_requested = True
+            return {"Messages": []}
+
+        mock_sqs_client.receive_message.side_effect = receive_side_effect
+
+        worker.run()
+
+        assert mock_sqs_client.delete_message.call_count == 3
+
 
 class TestPipelineWorkerPoisonPillDeleteFailure:
     """Tests for T3: poison pill delete failure doesn't crash worker."""
@@ -0,0 +1,296 @@
+"""Parity tests for the precomputed PTF dedup clusters.
+
+Seeds a random field of near-duplicate pantries, then checks that the
+/locations list query served from ``ptf_location_cluster`` returns exactly
+the rows the per-request recursive connected-components query used to —
+after a full rebuild, and after incremental refreshes for moved, added and
+soft-deleted locations.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.partners.ptf.location_clusters import (
+    _REGION_SQL,
+    rebuild_location_clusters,
+    refresh_location_clusters,
+)
+from app.api.v1.partners.ptf.locations_queries import (
+    _ADDR_SIM_THRESHOLD,
+    _CANDIDATES_CTES,
+    _COMPONENTS_CTES,
+    _DEDUP_LOOSE_DEG,
+    _DEDUP_TIGHT_DEG,
+    _FANO_ALLOWLIST_TUPLE,
+    _NAME_SIM_THRESHOLD,
+    PtfLocationsQuery,
+    _bind_allowlist,
+)
+
+pytestmark = pytest.mark.integration
+
+# An isolated spot in the Gulf of Alaska; the seeded field is ~1km across,
+# a few loose-tier hops wide, so clusters of every size form.
+ORIGIN = (57.0, -145.0)
+SPREAD_DEG = 0.008
+BBOX = (56.99, -145.01, 57.02, -144.98)
+
+NAMES = [
+    "St. Mark Food Pantry",
+    "Saint Mark Food Pantry",
+    "Harbor Community Kitchen",
+    "Harbor Community Kitchen Inc",
+    "Gulf Coast Mobile Pantry",
+]
+ADDRESSES = ["100 Harbor Rd", "100 Harbor Road", "12 Dock St", "7 Pier Ave"]
+ZIPS = ["99901", "99903"]
+
+# The list query as it was before clusters were precomputed: the same
+# candidates, with the components walk run per request.
+RECURSIVE_LIST_SQL = """
+WITH RECURSIVE __CANDIDATES__,
+__COMPONENTS__
+SELECT DISTINCT ON (comp.component_id) c.id
+FROM candidates c
+JOIN components comp ON comp.node = c.id
+ORDER BY comp.component_id,
+         c.has_qualifying_source DESC,
+         c.confidence_score DESC NULLS LAST,
+         c.id
+LIMIT :limit OFFSET :offset
+""".replace(
+    "__CANDIDATES__", _CANDIDATES_CTES
+).replace(
+    "__COMPONENTS__", _COMPONENTS_CTES
+)
+
+BBOX_CLAUSE = (
+    "AND st_setsrid(st_makepoint("
+    "CAST(l.longitude AS float8), CAST(l.latitude AS float8)"
+    "), 4326) "
+    "&& ST_MakeEnvelope(:lng_min, :lat_min, :lng_max, :lat_max, 4326)"
+)
+
+
+async def _recursive_list(session: AsyncSession) -> list[str]:
+    sql = RECURSIVE_LIST_SQL.format(bbox=BBOX_CLAUSE, qfilter="", scope="")
+    result = await session.execute(
+        _bind_allowlist(text(sql)),
+        {
+            "limit": 500,
+            "offset": 0,
+            "allowlist": _FANO_ALLOWLIST_TUPLE,
+            "dedup_tight_deg": _DEDUP_TIGHT_DEG,
+            "dedup_loose_deg": _DEDUP_LOOSE_DEG,
+            "name_sim_threshold": _NAME_SIM_THRESHOLD,
+            "addr_sim_threshold": _ADDR_SIM_THRESHOLD,
+            "lat_min": BBOX[0],
+            "lng_min": BBOX[1],
+            "lat_max": BBOX[2],
+            "lng_max": BBOX[3],
+        },
+    )
+    return [str(r.id) for r in result.fetchall()]
+
+
+async def _served_list(session: AsyncSession) -> list[str]:
+    rows = await PtfLocationsQuery(session).list_locations(
+        limit=500, offset=0, bbox=BBOX
+    )
+    return [str(r.id) for r in rows]
+
+
+async def _seed_location(
+    session: AsyncSession, rng: random.Random, *, scraper_id: str
+) -> str:
+    org_id = str(uuid.uuid4())
+    loc_id = str(uuid.uuid4())
+    name = rng.choice(NAMES)
+    lat = ORIGIN[0] + rng.uniform(0, SPREAD_DEG)
+    lng = ORIGIN[1] + rng.uniform(0, SPREAD_DEG)
+    await session.execute(
+        text(
+            "INSERT INTO organization (id, name, description, website) "
+            "VALUES (:id, :name, 'cluster parity', 'https://example.org')"
+        ),
+        {"id": org_id, "name": name},
+    )
+    await session.execute(
+        text(
+            """
+            INSERT INTO location (
+                id, organization_id, name, latitude, longitude,
+                location_type, validation_status, confidence_score,
+                is_canonical
+            )
+            VALUES (:id, :org, :name, :lat, :lng,
+                    'physical', 'verified', :conf, TRUE)
+            """
+        ),
+        {
+            "id": loc_id,
+            "org": org_id,
+            "name": name,
+            "lat": lat,
+            "lng": lng,
+            "conf": rng.randint(40, 95),
+        },
+    )
+    await session.execute(
+        text(
+            """
+            INSERT INTO address (
+                id, location_id, address_1, city,
+                state_province, postal_code, country, address_type
+            )
+            VALUES (:id, :loc, :addr, 'Yakutat', 'AK', :zip, 'US', 'physical')
+            """
+        ),
+        {
+            "id": str(uuid.uuid4()),
+            "loc": loc_id,
+            "addr": rng.choice(ADDRESSES),
+            "zip": rng.choice(ZIPS),
+        },
+    )
+    await session.execute(
+        text(
+            """
+            INSERT INTO location_source (
+                id, location_id, scraper_id, name, latitude, longitude
+            )
+            VALUES (:id, :loc, :scraper, :name, :lat, :lng)
+            """
+        ),
+        {
+            "id": str(uuid.uuid4()),
+            "loc": loc_id,
+            "scraper": scraper_id,
+            "name": name,
+            "lat": lat,
+            "lng": lng,
+        },
+    )
+    return loc_id
+
+
+@pytest_asyncio.fixture
+async def field(db_session: AsyncSession) -> list[str]:
+    rng = random.Random(36)
+    ids = [
+        await _seed_location(
+            db_session,
+            rng,
+            scraper_id="vivery_api" if rng.random() < 0.3 else "no_fa_scraper",
+        )
+        for _ in range(45)
+    ]
+    await db_session.flush()
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_rebuilt_clusters_match_recursive_query(db_session, field):
+    await db_session.run_sync(rebuild_location_clusters)
+
+    expected = await _recursive_list(db_session)
+    # The seed must actually collapse something
+    assert len(expected) < len(field)
+    assert await _served_list(db_session) == expected
+
+
+@pytest.mark.asyncio
+async def test_refreshed_clusters_match_recursive_query(db_session, field):
+    await db_session.run_sync(rebuild_location_clusters)
+    rng = random.Random(3600)
+
+    moved = rng.sample(field, 5)
+    for loc_id in moved:
+        await db_session.execute(
+            text(
+                "UPDATE location SET latitude = :lat, longitude = :lng "
+                "WHERE id = :id"
+            ),
+            {
+                "id": loc_id,
+                "lat": ORIGIN[0] + rng.uniform(0, SPREAD_DEG),
+                "lng": ORIGIN[1] + rng.uniform(0, SPREAD_DEG),
+            },
+        )
+    retired = rng.choice([i for i in field if i not in moved])
+    await db_session.execute(
+        text("UPDATE location SET is_canonical = FALSE WHERE id = :id"),
+        {"id": retired},
+    )
+    added = [
+        await _seed_location(db_session, rng, scraper_id="no_fa_scraper")
+        for _ in range(5)
+    ]
+    await db_session.flush()
+
+    changed = [*moved, retired, *added]
+    await db_session.run_sync(lambda s: refresh_location_clusters(s, changed))
+
+    assert await _served_list(db_session) == await _recursive_list(db_session)
+
+
+@pytest.mark.asyncio
+async def test_refresh_matches_full_rebuild(db_session, field):
+    await db_session.run_sync(rebuild_location_clusters)
+    await db_session.execute(
+        text("UPDATE location SET latitude = latitude + 0.003 WHERE id = :id"),
+        {"id": field[0]},
+    )
+    await db_session.run_sync(lambda s: refresh_location_clusters(s, [field[0]]))
+
+    async def snapshot() -> dict[str, str]:
+        result = await db_session.execute(
+            text(
+                "SELECT location_id, cluster_id FROM ptf_location_cluster "
+                "WHERE location_id = ANY(:ids)"
+            ),
+            {"ids": field},
+        )
+        return {r.location_id: r.cluster_id for r in result.fetchall()}
+
+    refreshed = await snapshot()
+    await db_session.run_sync(rebuild_location_clusters)
+    assert refreshed == await snapshot()
+
+
+@pytest.mark.asyncio
+async def test_region_does_not_hop_through_non_candidates(db_session, field):
+    rng = random.Random(3601)
+    chain = [
+        await _seed_location(db_session, rng, scraper_id="no_fa_scraper")
+        for _ in range(3)
+    ]
+    # A chain ~170m apart per link, away from the seeded field; the middle
+    # link is rejected, so it can't connect its neighbours.
+    for step, loc_id in enumerate(chain):
+        await db_session.execute(
+            text(
+                "UPDATE location SET latitude = :lat, longitude = :lng "
+                "WHERE id = :id"
+            ),
+            {"id": loc_id, "lat": ORIGIN[0] + 0.05 + step * 0.0015, "lng": -145.1},
+        )
+    await db_session.execute(
+        text("UPDATE location SET validation_status = 'rejected' WHERE id = :id"),
+        {"id": chain[1]},
+    )
+    await db_session.flush()
+
+    result = await db_session.execute(
+        text(_REGION_SQL),
+        {"location_ids": [chain[0]], "dedup_loose_deg": _DEDUP_LOOSE_DEG},
+    )
+
+    assert {r[0] for r in result.fetchall()} == {chain[0]}
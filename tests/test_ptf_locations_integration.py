@@ -26,6 +26,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from unittest.mock import MagicMock
 
+from app.api.v1.partners.ptf.location_clusters import rebuild_location_clusters
 from app.api.v1.partners.ptf.locations_queries import PtfLocationsQuery
 from app.api.v1.partners.ptf.locations_router import list_ptf_locations
 from app.api.v1.partners.ptf.locations_transformer import (
@@ -749,6 +750,7 @@ class TestNearDuplicateCollapse:
 
     @pytest.mark.asyncio
     async def test_three_close_rows_collapse_to_one(self, db_session, beaverton_triple):
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -768,6 +770,7 @@ class TestNearDuplicateCollapse:
         endpoint is the FA enrichment block, so dropping it in favor of
         a higher-confidence sibling is a regression we never tolerate.
         """
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -854,6 +857,7 @@ class TestNearDuplicateCollapse:
             )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -950,6 +954,7 @@ class TestNearDuplicateCollapse:
             )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -1057,6 +1062,7 @@ class TestNearDuplicateCollapse:
             )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -1127,6 +1133,7 @@ class TestNearDuplicateCollapse:
             )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -1138,6 +1145,12 @@ class TestNearDuplicateCollapse:
         assert far_b in ids
 
 
+async def _rebuild_clusters(session: AsyncSession) -> None:
+    """Precompute the dedup clusters the list query joins (the reconciler
+    does this for locations it commits; these tests seed rows directly)."""
+    await session.run_sync(rebuild_location_clusters)
+
+
 async def _seed_location(
     session: AsyncSession,
     *,
@@ -1286,6 +1299,7 @@ class TestTieredDedupEdgeCases:
         )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -1335,6 +1349,7 @@ class TestTieredDedupEdgeCases:
         )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -1424,6 +1439,7 @@ class TestTieredDedupEdgeCases:
             )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -1470,6 +1486,7 @@ class TestTieredDedupEdgeCases:
         )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
@@ -1563,6 +1580,7 @@ class TestTieredDedupEdgeCases:
         )
         await db_session.flush()
 
+        await _rebuild_clusters(db_session)
         query = PtfLocationsQuery(db_session)
         rows = await query.list_locations(
             limit=200,
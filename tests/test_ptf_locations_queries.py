@@ -12,6 +12,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.api.v1.partners.ptf.location_clusters import (
+    rebuild_location_clusters,
+    refresh_location_clusters,
+)
 from app.api.v1.partners.ptf.locations_queries import (
     PtfLocationsQuery,
     clamp_limit,
@@ -176,23 +180,47 @@ class TestQuerySQL:
         assert "&&" in sql_text
 
     @pytest.mark.asyncio
-    async def test_list_query_clusters_near_duplicate_canonicals(self):
+    async def test_list_query_collapses_precomputed_clusters(self):
         """Defense-in-depth: when the reconciler leaves near-duplicate
         location rows (different name AND different org so its widen-
-        radius merge bails), the endpoint must collapse them via a
-        tiered connected-components walk (tight ~50m always-merge,
-        loose ~200m gated by trigram similarity on name or address)."""
+        radius merge bails), the endpoint must collapse them to one row
+        per cluster. The clusters are precomputed into
+        ptf_location_cluster, so the per-request SQL only joins them."""
         session = _capture_session()
         query = PtfLocationsQuery(session)
         await query.list_locations(limit=10, offset=0)
         sql_text = str(session.execute.call_args[0][0])
+        assert "ptf_location_cluster" in sql_text
+        # None of the components-walk machinery runs per request any more.
+        assert "WITH RECURSIVE" not in sql_text
+        assert "ST_ClusterDBSCAN" not in sql_text
+        assert "similarity(" not in sql_text
+        # Candidates not yet clustered are served as singletons.
+        assert "DISTINCT ON (COALESCE(pc.cluster_id, c.id))" in sql_text
+        # Survivor pick must prefer FANO-qualifying rows so the
+        # feeding_america_food_bank enrichment block is never silently
+        # stripped in favor of a non-FANO sibling.
+        norm = " ".join(sql_text.split())
+        assert "has_qualifying_source DESC" in norm
+        # …then highest confidence, then a stable id tie-break.
+        assert (
+            "confidence_score DESC NULLS LAST" in norm
+        ), "survivor pick must fall back to confidence_score after FANO"
+
+    def test_cluster_refresh_runs_tiered_components_walk(self):
+        """The precomputed clusters come from the tiered connected-
+        components walk (tight ~50m always-merge, loose ~200m gated by
+        trigram similarity on name or address)."""
+        session = MagicMock()
+        refresh_location_clusters(session, ["loc-1"])
+        sql_text = str(session.execute.call_args[0][0])
         # Tier edges + recursive reachability are the contract.
         assert (
             "WITH RECURSIVE" in sql_text
-        ), "list query must use recursive CTE for tiered dedup"
+        ), "cluster refresh must use recursive CTE for tiered dedup"
         # Loose pre-cluster keeps the per-pair self-join inside small
         # spatial groups — without it, the edges CTE is O(N^2) and the
-        # GIST index can't help (the planner can't see through the
+        # GIST index can't help (the planner can't see through to the
         # CTE-materialized `geom` column).
         assert (
             "ST_ClusterDBSCAN" in sql_text
@@ -203,6 +231,8 @@ class TestQuerySQL:
         assert (
             "similarity(" in sql_text
         ), "loose-tier gate must call pg_trgm similarity()"
+        assert "INSERT INTO ptf_location_cluster" in sql_text
+        assert "l.id = ANY(:scope_ids)" in sql_text
         # The tier thresholds must be bound (not hard-coded) so
         # operators can tune via the module constants without editing
         # SQL.
@@ -211,18 +241,20 @@ class TestQuerySQL:
         assert params["dedup_loose_deg"] == pytest.approx(0.00180)
         assert params["name_sim_threshold"] == pytest.approx(0.5)
         assert params["addr_sim_threshold"] == pytest.approx(0.7)
-        # Survivor pick must prefer FANO-qualifying rows so the
-        # feeding_america_food_bank enrichment block is never silently
-        # stripped in favor of a non-FANO sibling.
-        norm = " ".join(sql_text.split())
-        assert "has_qualifying_source DESC" in norm
-        # …then highest confidence, then a stable id tie-break.
-        assert (
-            "confidence_score DESC NULLS LAST" in norm
-        ), "survivor pick must fall back to confidence_score after FANO"
-        # DISTINCT ON the component id (not the cluster id) keeps each
-        # connected component to a single representative row.
-        assert "DISTINCT ON (comp.component_id)" in sql_text
+
+    def test_cluster_refresh_without_locations_is_a_no_op(self):
+        session = MagicMock()
+        assert refresh_location_clusters(session, []) == 0
+        session.execute.assert_not_called()
+
+    def test_cluster_rebuild_covers_every_candidate(self):
+        session = MagicMock()
+        rebuild_location_clusters(session)
+        statements = [str(call.args[0]) for call in session.execute.call_args_list]
+        assert any("pg_advisory_xact_lock" in sql for sql in statements)
+        assert "DELETE FROM ptf_location_cluster" in statements[1]
+        assert "scope_ids" not in statements[-1]
+        assert "INSERT INTO ptf_location_cluster" in statements[-1]
 
     @pytest.mark.asyncio
     async def test_list_query_keeps_confidence_score_for_survivor_ordering(self):
@@ -0,0 +1,236 @@
+"""Tests for the version-keyed API response cache middleware."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.middleware.response_cache import (
+    InMemoryResponseCache,
+    RedisResponseCache,
+    ResponseCacheMiddleware,
+    cache_key,
+)
+
+
+class _Version:
+    """Stub data version the tests can bump like a reconciler commit."""
+
+    def __init__(self, value: str | None = "1"):
+        self.value = value
+
+    async def __call__(self) -> str | None:
+        return self.value
+
+
+def _make_app(backend, version: _Version) -> tuple[FastAPI, dict[str, int]]:
+    calls = {"locations": 0}
+    app = FastAPI()
+
+    @app.get("/api/v1/locations")
+    async def locations(request: Request, page: int = 1, per_page: int = 25):
+        calls["locations"] += 1
+        return {
+            "page": page,
+            "per_page": per_page,
+            "calls": calls["locations"],
+            # Like the pagination links from app/api/v1/utils.py
+            "base": str(request.url).split("?")[0],
+        }
+
+    @app.get("/api/v1/locations/private")
+    async def private_locations(response: Response):
+        response.headers["Cache-Control"] = "private"
+        return {"calls": 0}
+
+    @app.get("/api/v1/partners/ptf/sync")
+    async def ptf_sync():
+        return {"sync": True}
+
+    @app.get("/api/v1/map/geolocate")
+    async def geolocate():
+        return {"ip": "caller-specific"}
+
+    @app.get("/api/v1/locations/missing")
+    async def missing():
+        return Response(status_code=404)
+
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        backend=backend,
+        version_source=version,
+        enabled=True,
+        api_prefix="/api/v1",
+        ttl_seconds=60,
+        max_body_bytes=10_000,
+    )
+    return app, calls
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return InMemoryResponseCache(max_bytes=1_000_000)
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisResponseCache(fakeredis.aioredis.FakeRedis())
+
+
+class TestResponseCacheMiddleware:
+    """Caching, revalidation and invalidation through the middleware."""
+
+    def test_repeat_request_is_served_from_cache(self, backend):
+        app, calls = _make_app(backend, _Version())
+        client = TestClient(app)
+
+        first = client.get("/api/v1/locations?page=2")
+        second = client.get("/api/v1/locations?page=2")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json()
+        assert second.headers["content-type"] == "application/json"
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert calls["locations"] == 1
+
+    def test_each_host_gets_its_own_entry(self, backend):
+        app, calls = _make_app(backend, _Version())
+        internal = TestClient(app, base_url="http://internal-alb:8000")
+        public = TestClient(app, base_url="https://api.example.org")
+
+        first = internal.get("/api/v1/locations?page=2")
+        second = public.get("/api/v1/locations?page=2")
+        repeat = public.get("/api/v1/locations?page=2")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "MISS"
+        assert second.json()["base"] == "https://api.example.org/api/v1/locations"
+        assert second.headers["ETag"] != first.headers["ETag"]
+        assert repeat.headers["X-Cache"] == "HIT"
+        assert calls["locations"] == 2
+
+    def test_param_order_does_not_split_the_cache(self, backend):
+        app, calls = _make_app(backend, _Version())
+        client = TestClient(app)
+
+        client.get("/api/v1/locations?page=2&per_page=10")
+        hit = client.get("/api/v1/locations?per_page=10&page=2")
+
+        assert hit.headers["X-Cache"] == "HIT"
+        assert calls["locations"] == 1
+
+    def test_if_none_match_returns_304_without_running_route(self, backend):
+        app, calls = _make_app(backend, _Version())
+        client = TestClient(app)
+        etag = client.get("/api/v1/locations").headers["ETag"]
+
+        response = client.get("/api/v1/locations", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert calls["locations"] == 1
+
+    def test_version_bump_invalidates(self, backend):
+        version = _Version("1")
+        app, calls = _make_app(backend, version)
+        client = TestClient(app)
+        etag = client.get("/api/v1/locations").headers["ETag"]
+
+        version.value = "2"
+        response = client.get("/api/v1/locations", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.headers["ETag"] != etag
+        assert calls["locations"] == 2
+
+    def test_unknown_version_bypasses_cache(self, backend):
+        app, calls = _make_app(backend, _Version(None))
+        client = TestClient(app)
+
+        client.get("/api/v1/locations")
+        response = client.get("/api/v1/locations")
+
+        assert "ETag" not in response.headers
+        assert "X-Cache" not in response.headers
+        assert calls["locations"] == 2
+
+    @pytest.mark.parametrize(
+        "path",
+        ["/api/v1/partners/ptf/sync", "/api/v1/map/geolocate"],
+    )
+    def test_excluded_routes_pass_through(self, backend, path):
+        app, _ = _make_app(backend, _Version())
+
+        response = TestClient(app).get(path)
+
+        assert response.status_code == 200
+        assert "X-Cache" not in response.headers
+
+    def test_private_and_error_responses_are_not_stored(self, backend):
+        app, _ = _make_app(backend, _Version())
+        client = TestClient(app)
+
+        for path in ("/api/v1/locations/private", "/api/v1/locations/missing"):
+            client.get(path)
+            assert client.get(path).headers.get("X-Cache") != "HIT"
+
+
+class TestInMemoryResponseCache:
+    """LRU and TTL behaviour of the in-process backend."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        cache = InMemoryResponseCache(max_bytes=2)
+        await cache.set("a", b"1", 60)
+        await cache.set("b", b"2", 60)
+        await cache.get("a")
+        await cache.set("c", b"3", 60)
+
+        assert await cache.get("a") == b"1"
+        assert await cache.get("b") is None
+        assert await cache.get("c") == b"3"
+
+    @pytest.mark.asyncio
+    async def test_bounded_by_total_bytes(self):
+        cache = InMemoryResponseCache(max_bytes=10)
+        await cache.set("a", b"x" * 4, 60)
+        await cache.set("b", b"x" * 4, 60)
+        await cache.set("a", b"x" * 2, 60)
+        assert cache.size == 6
+
+        await cache.set("c", b"x" * 6, 60)
+
+        assert cache.size <= 10
+        assert await cache.get("b") is None
+        assert await cache.get("c") == b"x" * 6
+
+    @pytest.mark.asyncio
+    async def test_oversized_value_is_not_stored(self):
+        cache = InMemoryResponseCache(max_bytes=4)
+        await cache.set("a", b"1", 60)
+        await cache.set("big", b"x" * 5, 60)
+
+        assert await cache.get("big") is None
+        assert await cache.get("a") == b"1"
+        assert cache.size == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self, monkeypatch):
+        cache = InMemoryResponseCache()
+        await cache.set("a", b"1", 60)
+        monkeypatch.setattr(
+            "app.middleware.response_cache.time.monotonic", lambda: 10**12
+        )
+
+        assert await cache.get("a") is None
+
+
+def test_cache_key_includes_version_and_blank_params():
+    assert cache_key("/l", "a=1&b=", "1") == cache_key("/l", "b=&a=1", "1")
+    assert cache_key("/l", "a=1", "1") != cache_key("/l", "a=1", "2")
+    assert cache_key("/l", "a=1", "1") != cache_key("/l", "a=1&b=", "1")
+    assert cache_key("/l", "a=1", "1", origin="http://a") != cache_key(
+        "/l", "a=1", "1", origin="https://b"
+    )
@@ -0,0 +1,164 @@
+"""Tests for the pooled submarine browser.
+
+crawl4ai is swapped for a fake module, so these cover the pool's lifecycle —
+one launch shared by many jobs, a session per job, retiring a broken
+browser — without Chromium.
+"""
+
+import asyncio
+import types
+from unittest.mock import patch
+
+import pytest
+
+from app.submarine.browser_pool import BrowserPool
+
+
+class _FakeStrategy:
+    def __init__(self):
+        self.killed: list[str] = []
+
+    async def kill_session(self, session_id):
+        self.killed.append(session_id)
+
+
+class _FakeCrawler:
+    instances: list["_FakeCrawler"] = []
+
+    def __init__(self, config=None):
+        self.config = config
+        self.crawler_strategy = _FakeStrategy()
+        self.started = False
+        self.closed = False
+        self.fail = False
+        self.sessions: list[str] = []
+        _FakeCrawler.instances.append(self)
+
+    async def start(self):
+        self.started = True
+
+    async def close(self):
+        self.closed = True
+
+    async def arun(self, url, config):
+        if self.fail:
+            raise RuntimeError("Target page, context or browser has been closed")
+        self.sessions.append(config.session_id)
+        await asyncio.sleep(0)
+        return types.SimpleNamespace(
+            success=True,
+            markdown=types.SimpleNamespace(raw_markdown=f"# {url}"),
+            links={"internal": []},
+            error_message=None,
+            status_code=200,
+            response_headers={},
+        )
+
+
+class _Config(types.SimpleNamespace):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def fake_crawl4ai():
+    _FakeCrawler.instances = []
+    module = types.ModuleType("crawl4ai")
+    module.AsyncWebCrawler = _FakeCrawler
+    module.BrowserConfig = _Config
+    module.CrawlerRunConfig = _Config
+    module.CacheMode = types.SimpleNamespace(BYPASS="bypass")
+    with patch.dict("sys.modules", {"crawl4ai": module}):
+        yield
+
+
+async def _job(pool: BrowserPool, url: str) -> str:
+    async with pool.session() as session:
+        page = await session.fetch(url)
+        return page.markdown
+
+
+@pytest.mark.asyncio
+async def test_jobs_share_one_launch_with_a_session_each():
+    pool = BrowserPool(user_agent="PantryPirateRadio/test", max_sessions=2)
+
+    pages = await asyncio.gather(
+        *(_job(pool, f"https://pantry{n}.example.org/") for n in range(4))
+    )
+
+    assert pages == [f"# https://pantry{n}.example.org/" for n in range(4)]
+    assert pool.launches == 1
+    (browser,) = _FakeCrawler.instances
+    assert browser.started
+    assert browser.config.user_agent == "PantryPirateRadio/test"
+    assert len(set(browser.sessions)) == 4
+    assert sorted(browser.crawler_strategy.killed) == sorted(browser.sessions)
+
+
+@pytest.mark.asyncio
+async def test_max_sessions_bounds_concurrent_jobs():
+    pool = BrowserPool(user_agent="ua", max_sessions=2)
+    active = 0
+    peak = 0
+
+    async def job():
+        nonlocal active, peak
+        async with pool.session():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(job() for _ in range(5)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_retires_the_browser():
+    pool = BrowserPool(user_agent="ua")
+    await _job(pool, "https://a.example.org/")
+    broken = _FakeCrawler.instances[0]
+    broken.fail = True
+
+    with pytest.raises(RuntimeError):
+        await _job(pool, "https://b.example.org/")
+
+    assert broken.closed
+    assert await _job(pool, "https://c.example.org/") == "# https://c.example.org/"
+    assert pool.launches == 2
+    assert not _FakeCrawler.instances[1].closed
+
+
+@pytest.mark.asyncio
+async def test_retired_browser_closes_after_its_last_session():
+    pool = BrowserPool(user_agent="ua", max_sessions=2)
+    release = asyncio.Event()
+
+    async def slow_job():
+        async with pool.session() as session:
+            await session.fetch("https://slow.example.org/")
+            await release.wait()
+
+    slow = asyncio.create_task(slow_job())
+    await asyncio.sleep(0)
+    broken = _FakeCrawler.instances[0]
+    broken.fail = True
+    with pytest.raises(RuntimeError):
+        await _job(pool, "https://b.example.org/")
+
+    assert not broken.closed  # slow_job still holds a session on it
+    release.set()
+    await slow
+    assert broken.closed
+
+
+@pytest.mark.asyncio
+async def test_close_shuts_the_browser_down():
+    pool = BrowserPool(user_agent="ua")
+    await _job(pool, "https://a.example.org/")
+
+    await pool.close()
+
+    assert _FakeCrawler.instances[0].closed
+    await _job(pool, "https://a.example.org/")
+    assert pool.launches == 2
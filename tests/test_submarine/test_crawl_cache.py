@@ -0,0 +1,299 @@
+"""Tests for the submarine crawl cache against a local fixture site.
+
+The fixture site is served from a temp copy of fixtures/test_site by a local
+HTTP server that answers conditional GETs (Last-Modified / If-Modified-Since,
+as http.server does for static files). Jobs run through the worker's inline
+path with an httpx page fetcher standing in for the browser and a counting
+stand-in for the LLM, so the tests count exactly what a re-crawl skips.
+"""
+
+import json
+import os
+import re
+import shutil
+import sqlite3
+import threading
+from contextlib import asynccontextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import urljoin, urlparse
+
+import httpx
+import pytest
+
+from app.submarine.crawl_cache import CachedCrawl, CrawlCache, probe_unchanged
+from app.submarine.crawler import CACHE_VALIDATORS, PageFetch, SubmarineCrawler
+from app.submarine.models import SubmarineJob, SubmarineStatus
+from app.submarine.rate_limiter import SubmarineRateLimiter
+from app.submarine.scheduler import CrawlScheduler
+from app.submarine.worker import _process_async
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "test_site"
+
+_LINK_RE = re.compile(r'<a\s+href="([^"]+)"[^>]*>(.*?)</a>', re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+class _StaticHandler(SimpleHTTPRequestHandler):
+    """Static files, with Last-Modified and 304s for If-Modified-Since."""
+
+    def log_message(self, format, *args):  # noqa: A002 - http.server API
+        pass
+
+
+class _DynamicHandler(_StaticHandler):
+    """Same files, but rendered per request: no validators, never a 304."""
+
+    def send_head(self):
+        del self.headers["If-Modified-Since"]
+        return super().send_head()
+
+    def send_header(self, keyword, value):
+        if keyword.lower() != "last-modified":
+            super().send_header(keyword, value)
+
+
+def _serve(root: Path, handler: type[SimpleHTTPRequestHandler]):
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(handler, directory=str(root))
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def site_root(tmp_path):
+    root = tmp_path / "site"
+    shutil.copytree(FIXTURES_DIR, root)
+    return root
+
+
+@pytest.fixture
+def static_site(site_root):
+    server = _serve(site_root, _StaticHandler)
+    yield f"http://127.0.0.1:{server.server_port}/index.html"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def dynamic_site(site_root):
+    server = _serve(site_root, _DynamicHandler)
+    yield f"http://127.0.0.1:{server.server_port}/index.html"
+    server.shutdown()
+    server.server_close()
+
+
+class _RenderCountingFetcher:
+    """PageFetcher over httpx that counts page renders."""
+
+    def __init__(self):
+        self.renders = 0
+
+    async def fetch(self, url: str) -> PageFetch:
+        self.renders += 1
+        async with httpx.AsyncClient() as client:
+            response = await client.get(url)
+        if response.status_code != 200:
+            return PageFetch(success=False, error=f"HTTP {response.status_code}")
+        links = [
+            (urljoin(url, href), _TAG_RE.sub("", text).strip())
+            for href, text in _LINK_RE.findall(response.text)
+        ]
+        return PageFetch(
+            success=True,
+            markdown=_TAG_RE.sub("", response.text),
+            links=[
+                (h, t) for h, t in links if urlparse(h).netloc == urlparse(url).netloc
+            ],
+            status_code=response.status_code,
+            validators={
+                name: response.headers[name]
+                for name in CACHE_VALIDATORS
+                if name in response.headers
+            },
+        )
+
+
+class _Pool:
+    def __init__(self, fetcher):
+        self.fetcher = fetcher
+
+    @asynccontextmanager
+    async def session(self):
+        yield self.fetcher
+
+
+class _CountingProvider:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt, config=None):
+        self.calls += 1
+        return SimpleNamespace(
+            text=json.dumps({"phone": "(555) 123-4567", "is_food_related": True})
+        )
+
+
+@pytest.fixture
+def harness(tmp_path, monkeypatch):
+    """Runs jobs through the worker; yields (run, fetcher, provider)."""
+    cache = CrawlCache(tmp_path / "crawl_cache.db")
+    fetcher = _RenderCountingFetcher()
+    provider = _CountingProvider()
+    monkeypatch.delenv("QUEUE_BACKEND", raising=False)
+    monkeypatch.setattr("app.submarine.worker.get_crawl_cache", lambda: cache)
+    monkeypatch.setattr(
+        "app.submarine.worker.create_provider", lambda **kwargs: provider
+    )
+    scheduler = CrawlScheduler(
+        SubmarineCrawler(
+            max_pages=3,
+            timeout=10,
+            rate_limiter=SubmarineRateLimiter(min_delay_seconds=0),
+        ),
+        _Pool(fetcher),
+    )
+
+    async def run(url: str, missing_fields=("phone",)):
+        job = SubmarineJob(
+            id="sub-cache",
+            location_id="loc-1",
+            website_url=url,
+            missing_fields=list(missing_fields),
+            source_scraper_id="test",
+        )
+        return await _process_async(job, scheduler=scheduler)
+
+    return run, fetcher, provider
+
+
+@pytest.mark.asyncio
+async def test_unchanged_site_skips_render_and_llm(harness, static_site):
+    run, fetcher, provider = harness
+
+    first = await run(static_site)
+    renders = fetcher.renders
+    second = await run(static_site)
+
+    assert first.status == SubmarineStatus.SUCCESS
+    assert renders == 3
+    assert provider.calls == 1
+    assert second.status == SubmarineStatus.NO_DATA
+    assert second.crawl_metadata["unchanged_by"] == "not_modified"
+    assert fetcher.renders == renders
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_errors_never_fail_the_job(harness, static_site, monkeypatch):
+    run, _, provider = harness
+    await run(static_site)
+
+    def fail(self, *args):
+        raise sqlite3.OperationalError("database is locked")
+
+    # A failed refresh after a 304 probe still reports the site unchanged
+    monkeypatch.setattr(CrawlCache, "put", fail)
+    unchanged = await run(static_site)
+    # A failed read just crawls and extracts again
+    monkeypatch.setattr(CrawlCache, "get", fail)
+    recrawled = await run(static_site)
+
+    assert unchanged.crawl_metadata["unchanged_by"] == "not_modified"
+    assert recrawled.status == SubmarineStatus.SUCCESS
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_changed_page_is_crawled_and_extracted_again(
+    harness, static_site, site_root
+):
+    run, fetcher, provider = harness
+    await run(static_site)
+
+    page = site_root / "about.html"
+    page.write_text(page.read_text().replace("</body>", "<p>New hours!</p></body>"))
+    mtime = page.stat().st_mtime + 10
+    os.utime(page, (mtime, mtime))
+    result = await run(static_site)
+
+    assert result.status == SubmarineStatus.SUCCESS
+    assert fetcher.renders == 6
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_same_content_without_validators_skips_only_the_llm(
+    harness, dynamic_site
+):
+    run, fetcher, provider = harness
+
+    await run(dynamic_site)
+    result = await run(dynamic_site)
+
+    assert result.status == SubmarineStatus.NO_DATA
+    assert result.crawl_metadata["unchanged_by"] == "content_hash"
+    assert fetcher.renders == 6
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_new_missing_field_bypasses_the_cache(harness, static_site):
+    run, fetcher, provider = harness
+
+    await run(static_site, missing_fields=["phone"])
+    result = await run(static_site, missing_fields=["phone", "email"])
+
+    assert result.crawl_metadata.get("unchanged") is None
+    assert fetcher.renders == 6
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_probe_accepts_a_200_with_the_same_etag():
+    def handler(request):
+        return httpx.Response(200, headers={"etag": '"v1"'}, text="same")
+
+    cached = CachedCrawl(
+        url="https://pantry.example.org/",
+        content_hash="x",
+        fields=["phone"],
+        pages={"https://pantry.example.org/": {"etag": '"v1"'}},
+    )
+    limiter = SubmarineRateLimiter(min_delay_seconds=0)
+    transport = httpx.MockTransport(handler)
+    original = httpx.AsyncClient
+
+    def client(**kwargs):
+        return original(transport=transport, **kwargs)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.submarine.crawl_cache.httpx.AsyncClient", client)
+        assert await probe_unchanged(cached, limiter)
+        cached.pages["https://pantry.example.org/"] = {"etag": '"v0"'}
+        assert not await probe_unchanged(cached, limiter)
+
+
+def test_cache_round_trips_entries(tmp_path):
+    cache = CrawlCache(tmp_path / "cache.db")
+    entry = CachedCrawl(
+        url="https://pantry.example.org/",
+        content_hash="abc",
+        fields=["phone", "hours"],
+        pages={"https://pantry.example.org/": {"last-modified": "x"}},
+    )
+
+    cache.put(entry)
+
+    assert cache.get(entry.url) == CachedCrawl(
+        url=entry.url,
+        content_hash="abc",
+        fields=["hours", "phone"],
+        pages=entry.pages,
+        checked_at=entry.checked_at,
+    )
+    assert cache.get("https://other.example.org/") is None
+    assert entry.covers(["phone"]) and not entry.covers(["email"])
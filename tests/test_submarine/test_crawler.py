@@ -4,7 +4,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.submarine.crawler import CrawlResult, SubmarineCrawler
+from app.submarine.crawler import CrawlResult, PageFetch, SubmarineCrawler
+from app.submarine.rate_limiter import SubmarineRateLimiter
 
 
 class TestSubmarineCrawler:
@@ -78,3 +79,67 @@ class TestSubmarineCrawler:
     def test_link_filtering_handles_empty(self, crawler):
         """Empty link list returns empty."""
         assert crawler._filter_relevant_links([]) == []
+
+
+class _ScriptedFetcher:
+    """PageFetcher returning canned pages by URL."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+
+    async def fetch(self, url):
+        self.fetched.append(url)
+        return self.pages[url]
+
+
+class TestThrottleResponses:
+    """A 429/503 pauses the domain instead of pressing on."""
+
+    @pytest.fixture
+    def crawler(self):
+        return SubmarineCrawler(
+            max_pages=3, rate_limiter=SubmarineRateLimiter(min_delay_seconds=0)
+        )
+
+    @pytest.mark.asyncio
+    async def test_throttled_main_page_pauses_domain_and_errors(self, crawler):
+        fetcher = _ScriptedFetcher(
+            {
+                "https://foodbank.org/": PageFetch(
+                    success=False, status_code=429, retry_after=45
+                )
+            }
+        )
+
+        result = await crawler.crawl("https://foodbank.org/", fetcher=fetcher)
+
+        assert result.status == "error"
+        assert "HTTP 429" in result.error
+        assert 44 < crawler.rate_limiter.get_delay("https://www.foodbank.org/") <= 45
+
+    @pytest.mark.asyncio
+    async def test_throttled_link_stops_following(self, crawler):
+        fetcher = _ScriptedFetcher(
+            {
+                "https://foodbank.org/": PageFetch(
+                    success=True,
+                    markdown="# Food Bank",
+                    links=[
+                        ("https://foodbank.org/hours", "Hours"),
+                        ("https://foodbank.org/contact", "Contact"),
+                    ],
+                ),
+                "https://foodbank.org/hours": PageFetch(success=False, status_code=503),
+            }
+        )
+
+        result = await crawler.crawl("https://foodbank.org/", fetcher=fetcher)
+
+        assert result.status == "success"
+        assert result.pages_crawled == 1
+        assert fetcher.fetched == [
+            "https://foodbank.org/",
+            "https://foodbank.org/hours",
+        ]
+        assert crawler.rate_limiter.get_delay("https://foodbank.org/") > 0
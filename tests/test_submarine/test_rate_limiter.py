@@ -1,10 +1,23 @@
 """Tests for submarine rate limiter — per-domain throttling."""
 
+import asyncio
+import threading
 import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from itertools import pairwise
+from unittest.mock import MagicMock
 
 import pytest
 
-from app.submarine.rate_limiter import SubmarineRateLimiter
+from app.submarine.rate_limiter import (
+    InMemoryRateLimitBackend,
+    RateLimitedError,
+    RedisRateLimitBackend,
+    SubmarineRateLimiter,
+    parse_retry_after,
+    registrable_domain,
+)
 
 
 class TestPerDomainThrottle:
@@ -44,7 +57,7 @@ class TestPerDomainThrottle:
         """Domain extraction works for various URL formats."""
         assert (
             limiter._extract_domain("https://www.foodbank.org/contact")
-            == "www.foodbank.org"
+            == "foodbank.org"
         )
         assert limiter._extract_domain("http://foodbank.org") == "foodbank.org"
         assert (
@@ -70,3 +83,175 @@ class TestUserAgent:
         limiter = SubmarineRateLimiter(min_delay_seconds=5)
         assert "PantryPirateRadio" in limiter.user_agent
         assert "food-bank" in limiter.user_agent.lower()
+
+
+class TestRegistrableDomain:
+    """Tests for the rate-limit key."""
+
+    def test_subdomains_share_a_key(self):
+        assert registrable_domain("https://hours.foodbank.org/x") == "foodbank.org"
+        assert registrable_domain("https://WWW.FoodBank.org./") == "foodbank.org"
+
+    def test_second_level_registries(self):
+        assert registrable_domain("https://www.pantry.org.uk/") == "pantry.org.uk"
+        assert registrable_domain("https://a.b.foodbank.com.au/") == "foodbank.com.au"
+
+    def test_site_builder_tenants_are_separate_sites(self):
+        assert registrable_domain("https://joe.wixsite.com/pantry") == "joe.wixsite.com"
+        assert registrable_domain("https://a.wordpress.com/") == "a.wordpress.com"
+        assert registrable_domain("https://b.wordpress.com/") == "b.wordpress.com"
+        assert registrable_domain("https://x.squarespace.com") == "x.squarespace.com"
+        assert registrable_domain("https://wordpress.com/") == "wordpress.com"
+
+    def test_google_sites_are_keyed_by_path(self):
+        assert (
+            registrable_domain("https://sites.google.com/view/pantry/hours")
+            == "sites.google.com/view/pantry"
+        )
+        assert (
+            registrable_domain("https://sites.google.com/a/church.org/pantry/home")
+            == "sites.google.com/a/church.org/pantry"
+        )
+        assert registrable_domain("https://www.google.com/maps") == "google.com"
+
+    def test_ip_literals_and_ports_kept(self):
+        assert registrable_domain("http://127.0.0.1:8080/") == "127.0.0.1:8080"
+        assert registrable_domain("http://[::1]:81/") == "[::1]:81"
+        assert registrable_domain("http://localhost/") == "localhost"
+
+
+class TestRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_delta_seconds(self):
+        assert parse_retry_after("120") == 120
+
+    def test_http_date(self):
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=60), usegmt=True)
+        assert 55 <= parse_retry_after(when) <= 60
+
+    def test_missing_or_garbage(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestTokenBucket:
+    """Burst, throttle backoff and the wait cap (in-memory backend)."""
+
+    def test_burst_then_spaced(self):
+        limiter = SubmarineRateLimiter(min_delay_seconds=5, burst=2)
+        url = "https://foodbank.example.com/"
+
+        limiter.record_request(url)
+        assert limiter.get_delay(url) == 0
+        limiter.record_request(url)
+        assert 4.9 < limiter.get_delay(url) <= 5
+
+    @pytest.mark.asyncio
+    async def test_penalize_honors_retry_after(self):
+        limiter = SubmarineRateLimiter(min_delay_seconds=1)
+
+        pause = await limiter.penalize("https://foodbank.org/", retry_after=30)
+
+        assert pause == 30
+        assert 29 < limiter.get_delay("https://www.foodbank.org/hours") <= 30
+
+    @pytest.mark.asyncio
+    async def test_consecutive_throttles_double_the_backoff(self):
+        limiter = SubmarineRateLimiter(min_delay_seconds=2, max_backoff_seconds=5)
+        url = "https://foodbank.org/"
+
+        pauses = [await limiter.penalize(url) for _ in range(3)]
+
+        assert pauses == [2, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_backoff_resets_once_the_site_recovers(self):
+        backend = InMemoryRateLimitBackend()
+        limiter = SubmarineRateLimiter(min_delay_seconds=0.01, backend=backend)
+        url = "https://foodbank.org/"
+
+        assert await limiter.penalize(url) == 1
+        backend._domains["foodbank.org"].blocked_until -= 5  # long recovered
+
+        assert await limiter.penalize(url) == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_beyond_cap_raises_without_taking_the_slot(self):
+        limiter = SubmarineRateLimiter(min_delay_seconds=1, max_wait_seconds=10)
+        url = "https://foodbank.org/"
+        await limiter.penalize(url, retry_after=3600)
+
+        with pytest.raises(RateLimitedError) as exc_info:
+            await limiter.wait_and_record(url)
+
+        assert exc_info.value.domain == "foodbank.org"
+        assert limiter.get_delay(url) <= 3600
+
+
+def _fake_redis_backend(server):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # fakeredis runs Lua scripts through lupa
+    return RedisRateLimitBackend(fakeredis.FakeRedis(server=server))
+
+
+class TestRedisBackend:
+    """The shared Lua token bucket, through fakeredis."""
+
+    def test_rate_holds_across_concurrent_workers(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        _fake_redis_backend(server)
+        delay, workers, requests = 0.05, 4, 5
+        sent: list[tuple[str, float]] = []
+        lock = threading.Lock()
+
+        def worker(n: int) -> None:
+            # Own client and limiter per worker, like separate processes
+            limiter = SubmarineRateLimiter(
+                min_delay_seconds=delay, backend=_fake_redis_backend(server)
+            )
+
+            async def crawl() -> None:
+                for i in range(requests):
+                    for site in ("https://www.pantry-a.org", "https://pantry-b.org"):
+                        await limiter.wait_and_record(f"{site}/page-{n}-{i}")
+                        with lock:
+                            sent.append((registrable_domain(site), time.time()))
+
+            asyncio.run(crawl())
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for domain in ("pantry-a.org", "pantry-b.org"):
+            stamps = sorted(at for d, at in sent if d == domain)
+            assert len(stamps) == workers * requests
+            assert min(b - a for a, b in pairwise(stamps)) >= delay - 0.015
+            # Workers didn't just run one after another: the domain stayed busy
+            assert stamps[-1] - stamps[0] < delay * len(stamps) + 0.5
+
+    def test_penalty_is_shared(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        first = SubmarineRateLimiter(1, backend=_fake_redis_backend(server))
+        second = SubmarineRateLimiter(1, backend=_fake_redis_backend(server))
+
+        asyncio.run(first.penalize("https://foodbank.org/", retry_after=30))
+
+        assert 29 < second.get_delay("https://www.foodbank.org/") <= 30
+        assert second.get_delay("https://other.org/") == 0
+
+    def test_falls_back_to_memory_when_redis_fails(self):
+        client = MagicMock()
+        client.register_script.return_value = MagicMock(
+            side_effect=ConnectionError("redis down")
+        )
+        limiter = SubmarineRateLimiter(5, backend=RedisRateLimitBackend(client))
+
+        limiter.record_request("https://foodbank.org/")
+
+        assert 4.9 < limiter.get_delay("https://foodbank.org/") <= 5
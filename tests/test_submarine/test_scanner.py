@@ -1,134 +1,185 @@
 """Tests for submarine batch scanner."""
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from app.reconciler.submarine_dispatcher import SubmarineDispatcher
+
+
+def _row(
+    loc_id,
+    website="https://foodbank.example.org",
+    last_crawled=None,
+    last_status=None,
+    has_phone=False,
+    has_schedule=False,
+    email=None,
+    description=None,
+):
+    """A page-query row: a location with every target field missing by default."""
+    return (
+        loc_id,
+        f"org-{loc_id}",
+        f"Pantry {loc_id}",
+        40.7,
+        -74.0,
+        last_crawled,
+        last_status,
+        website,
+        has_phone,
+        has_schedule,
+        email,
+        description,
+    )
+
+
+@pytest.fixture
+def mock_session():
+    with (
+        patch("app.submarine.scanner.create_engine"),
+        patch("app.submarine.scanner.sessionmaker") as mock_session_factory,
+    ):
+        session = MagicMock()
+        session.__enter__ = MagicMock(return_value=session)
+        session.__exit__ = MagicMock(return_value=False)
+        mock_session_factory.return_value = MagicMock(return_value=session)
+        yield session
+
+
+@pytest.fixture
+def enqueue_many():
+    with patch.object(
+        SubmarineDispatcher,
+        "enqueue_many",
+        autospec=True,
+        side_effect=lambda self, jobs: [job.id for job in jobs],
+    ) as mock_enqueue:
+        yield mock_enqueue
+
+
+def _pages(session, *pages):
+    session.execute.return_value.fetchall.side_effect = list(pages)
+
 
 class TestScanAndEnqueue:
     """Tests for the scan_and_enqueue function."""
 
-    @patch("app.submarine.scanner.SubmarineDispatcher")
-    @patch("app.submarine.scanner.sessionmaker")
-    @patch("app.submarine.scanner.create_engine")
-    def test_scan_with_no_candidates(
-        self, mock_engine, mock_session_factory, mock_disp
-    ):
+    def test_scan_with_no_candidates(self, mock_session, enqueue_many):
         """Scan returns zero enqueued when no candidates found."""
         from app.submarine.scanner import scan_and_enqueue
 
-        mock_session = MagicMock()
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
-        mock_session.execute.return_value.fetchall.return_value = []
-        mock_session_factory.return_value = MagicMock(return_value=mock_session)
+        _pages(mock_session, [])
 
         summary = scan_and_enqueue()
 
         assert summary["total_candidates"] == 0
         assert summary["enqueued"] == 0
+        enqueue_many.assert_not_called()
 
-    @patch("app.submarine.scanner.SubmarineDispatcher")
-    @patch("app.submarine.scanner.sessionmaker")
-    @patch("app.submarine.scanner.create_engine")
-    def test_scan_enqueues_candidates(
-        self, mock_engine, mock_session_factory, mock_disp
-    ):
-        """Scan enqueues jobs for locations with gaps."""
+    def test_scan_enqueues_candidates(self, mock_session, enqueue_many):
+        """Scan enqueues jobs for locations with gaps, skips the rest."""
         from app.submarine.scanner import scan_and_enqueue
 
-        mock_session = MagicMock()
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
-        mock_session.execute.return_value.fetchall.return_value = [
-            ("loc-1", "org-1"),
-            ("loc-2", "org-2"),
-        ]
-        mock_session_factory.return_value = MagicMock(return_value=mock_session)
-
-        mock_dispatcher_instance = MagicMock()
-        mock_dispatcher_instance.check_and_enqueue.side_effect = ["sub-001", None]
-        mock_disp.return_value = mock_dispatcher_instance
+        _pages(
+            mock_session,
+            [
+                _row("loc-1", has_phone=True),
+                _row(
+                    "loc-2",
+                    has_phone=True,
+                    has_schedule=True,
+                    email="pantry@example.org",
+                    description="Weekly groceries for families.",
+                ),
+            ],
+        )
 
         summary = scan_and_enqueue()
 
         assert summary["total_candidates"] == 2
         assert summary["enqueued"] == 1
         assert summary["skipped"] == 1
-
-    @patch("app.submarine.scanner.SubmarineDispatcher")
-    @patch("app.submarine.scanner.sessionmaker")
-    @patch("app.submarine.scanner.create_engine")
-    def test_scan_uses_force_flag(self, mock_engine, mock_session_factory, mock_disp):
-        """Scanner passes force=True to bypass SUBMARINE_ENABLED check."""
+        (job,) = enqueue_many.call_args.args[1]
+        assert job.location_id == "loc-1"
+        assert job.organization_id == "org-loc-1"
+        assert job.website_url == "https://foodbank.example.org"
+        assert job.missing_fields == ["hours", "email", "description"]
+        assert job.source_scraper_id == "scanner"
+        assert job.location_name == "Pantry loc-1"
+        assert job.latitude == 40.7
+
+    def test_scan_skips_without_website_or_in_cooldown(
+        self, mock_session, enqueue_many
+    ):
+        """The dispatcher's website and cooldown rules apply to each row."""
         from app.submarine.scanner import scan_and_enqueue
 
-        mock_session = MagicMock()
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
-        mock_session.execute.return_value.fetchall.return_value = [("loc-1", "org-1")]
-        mock_session_factory.return_value = MagicMock(return_value=mock_session)
-
-        mock_dispatcher_instance = MagicMock()
-        mock_dispatcher_instance.check_and_enqueue.return_value = "sub-001"
-        mock_disp.return_value = mock_dispatcher_instance
+        now = datetime.now(UTC)
+        _pages(
+            mock_session,
+            [
+                _row("loc-1", website=None),
+                _row(
+                    "loc-2", last_crawled=now - timedelta(days=1), last_status="error"
+                ),
+                _row(
+                    "loc-3", last_crawled=now - timedelta(days=30), last_status="error"
+                ),
+                _row("loc-4", description="Food service location: Pantry loc-4"),
+            ],
+        )
 
-        scan_and_enqueue()
+        summary = scan_and_enqueue()
 
-        # Verify force=True was passed
-        call_kwargs = mock_dispatcher_instance.check_and_enqueue.call_args
-        assert call_kwargs.kwargs.get("force") is True
+        assert summary["skipped"] == 2
+        jobs = enqueue_many.call_args.args[1]
+        assert [job.location_id for job in jobs] == ["loc-3", "loc-4"]
+        assert "description" in jobs[1].missing_fields
 
-    @patch("app.submarine.scanner.SubmarineDispatcher")
-    @patch("app.submarine.scanner.sessionmaker")
-    @patch("app.submarine.scanner.create_engine")
-    def test_scan_handles_errors_gracefully(
-        self, mock_engine, mock_session_factory, mock_disp
-    ):
-        """Scanner doesn't crash on individual location errors."""
+    def test_scan_pages_with_keyset(self, mock_session, enqueue_many):
+        """Pages continue after the last ID seen, one enqueue batch per page."""
         from app.submarine.scanner import scan_and_enqueue
 
-        mock_session = MagicMock()
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
-        mock_session.execute.return_value.fetchall.return_value = [
-            ("loc-1", "org-1"),
-            ("loc-2", "org-2"),
-        ]
-        mock_session_factory.return_value = MagicMock(return_value=mock_session)
+        _pages(
+            mock_session,
+            [_row("loc-1"), _row("loc-2")],
+            [_row("loc-3"), _row("loc-4")],
+            [_row("loc-5")],
+        )
+
+        summary = scan_and_enqueue(page_size=2)
+
+        assert summary["total_candidates"] == 5
+        assert summary["enqueued"] == 5
+        assert summary["pages"] == 3
+        assert enqueue_many.call_count == 3
+        params = [c.args[1] for c in mock_session.execute.call_args_list]
+        assert [p["after"] for p in params] == ["", "loc-2", "loc-4"]
+        assert all(p["page_size"] == 2 for p in params)
+        assert "l.id > :after" in str(mock_session.execute.call_args.args[0])
+
+    def test_scan_handles_errors_gracefully(self, mock_session, enqueue_many):
+        """A failed enqueue batch is counted and the scan moves on."""
+        from app.submarine.scanner import scan_and_enqueue
 
-        mock_dispatcher_instance = MagicMock()
-        mock_dispatcher_instance.check_and_enqueue.side_effect = [
-            Exception("DB error"),
-            "sub-002",
+        _pages(mock_session, [_row("loc-1"), _row("loc-2")], [_row("loc-3")])
+        enqueue_many.side_effect = [
+            Exception("Redis down"),
+            ["sub-003"],
         ]
-        mock_disp.return_value = mock_dispatcher_instance
 
-        summary = scan_and_enqueue()
+        summary = scan_and_enqueue(page_size=2)
 
-        assert summary["errors"] == 1
+        assert summary["errors"] == 2
         assert summary["enqueued"] == 1
 
-    @patch("app.submarine.scanner.SubmarineDispatcher")
-    @patch("app.submarine.scanner.sessionmaker")
-    @patch("app.submarine.scanner.create_engine")
-    def test_scan_by_scraper_filters_query(
-        self, mock_engine, mock_session_factory, mock_disp
-    ):
+    def test_scan_by_scraper_filters_query(self, mock_session, enqueue_many):
         """Scanner with --scraper filters to locations from that scraper."""
         from app.submarine.scanner import scan_and_enqueue
 
-        mock_session = MagicMock()
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
-        mock_session.execute.return_value.fetchall.return_value = [
-            ("loc-1", "org-1"),
-        ]
-        mock_session_factory.return_value = MagicMock(return_value=mock_session)
-
-        mock_dispatcher_instance = MagicMock()
-        mock_dispatcher_instance.check_and_enqueue.return_value = "sub-001"
-        mock_disp.return_value = mock_dispatcher_instance
+        _pages(mock_session, [_row("loc-1")])
 
         summary = scan_and_enqueue(scraper_id="capital_area_food_bank_dc")
 
@@ -139,35 +190,90 @@ class TestScanAndEnqueue:
         call_args = mock_session.execute.call_args_list[0]
         sql_text = str(call_args[0][0])
         assert "scraper_id" in sql_text
+        assert call_args[0][1]["scraper_id"] == "capital_area_food_bank_dc"
 
-    @patch("app.submarine.scanner.SubmarineDispatcher")
-    @patch("app.submarine.scanner.sessionmaker")
-    @patch("app.submarine.scanner.create_engine")
-    def test_scan_by_scraper_with_limit(
-        self, mock_engine, mock_session_factory, mock_disp
-    ):
+    def test_scan_by_scraper_with_limit(self, mock_session, enqueue_many):
         """Scanner accepts both --scraper and --limit together."""
         from app.submarine.scanner import scan_and_enqueue
 
-        mock_session = MagicMock()
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
-        mock_session.execute.return_value.fetchall.return_value = [
-            ("loc-1", "org-1"),
-        ]
-        mock_session_factory.return_value = MagicMock(return_value=mock_session)
-
-        mock_dispatcher_instance = MagicMock()
-        mock_dispatcher_instance.check_and_enqueue.return_value = "sub-001"
-        mock_disp.return_value = mock_dispatcher_instance
+        _pages(mock_session, [_row("loc-1"), _row("loc-2")], [_row("loc-3")])
 
-        summary = scan_and_enqueue(scraper_id="north_country_food_bank_mn", limit=5)
+        summary = scan_and_enqueue(
+            scraper_id="north_country_food_bank_mn", limit=3, page_size=2
+        )
 
-        assert summary["enqueued"] == 1
+        assert summary["enqueued"] == 3
         assert summary["scraper_id"] == "north_country_food_bank_mn"
 
-        # Verify SQL has both scraper_id and LIMIT
-        call_args = mock_session.execute.call_args_list[0]
-        sql_text = str(call_args[0][0])
+        # Verify SQL has both scraper_id and LIMIT, and the last page is
+        # cut down to what is left of the limit
+        sql_text = str(mock_session.execute.call_args_list[0][0][0])
         assert "scraper_id" in sql_text
         assert "LIMIT" in sql_text
+        params = [c.args[1] for c in mock_session.execute.call_args_list]
+        assert [p["page_size"] for p in params] == [2, 1]
+
+    def test_scan_single_location(self, mock_session, enqueue_many):
+        """--location-id targets one location without the candidate filters."""
+        from app.submarine.scanner import scan_and_enqueue
+
+        _pages(mock_session, [_row("loc-9")])
+
+        summary = scan_and_enqueue(location_id="loc-9")
+
+        assert summary["enqueued"] == 1
+        call_args = mock_session.execute.call_args_list[0]
+        assert "l.id = :location_id" in str(call_args[0][0])
+        assert "rejected" not in str(call_args[0][0])
+        assert call_args[0][1]["location_id"] == "loc-9"
+
+
+class TestEnqueueMany:
+    """Tests for SubmarineDispatcher.enqueue_many batching."""
+
+    @pytest.fixture
+    def jobs(self):
+        return [
+            SubmarineDispatcher.build_job(
+                location_id=f"loc-{n}",
+                organization_id=None,
+                website_url="https://foodbank.example.org",
+                missing_fields=["phone"],
+                source_scraper_id="scanner",
+            )
+            for n in range(3)
+        ]
+
+    @patch.dict("os.environ", {"QUEUE_BACKEND": "redis"})
+    def test_redis_enqueues_in_one_call(self, jobs):
+        with patch("app.llm.queue.queues.submarine_queue") as mock_queue:
+            enqueued = SubmarineDispatcher(db=MagicMock()).enqueue_many(jobs)
+
+        assert enqueued == [job.id for job in jobs]
+        mock_queue.enqueue_many.assert_called_once()
+        (job_datas,) = mock_queue.enqueue_many.call_args.args
+        assert [d.args[0]["location_id"] for d in job_datas] == [
+            "loc-0",
+            "loc-1",
+            "loc-2",
+        ]
+        assert job_datas[0].func == "app.submarine.worker.process_submarine_job"
+
+    @patch.dict(
+        "os.environ",
+        {
+            "QUEUE_BACKEND": "sqs",
+            "SUBMARINE_QUEUE_URL": "https://sqs.us-east-1.amazonaws.com/1/sub.fifo",
+        },
+    )
+    def test_sqs_drops_rejected_entries(self, jobs):
+        with patch(
+            "app.pipeline.sqs_sender.send_batch_to_sqs",
+            return_value=["m-0", None, "m-2"],
+        ) as mock_send:
+            enqueued = SubmarineDispatcher(db=MagicMock()).enqueue_many(jobs)
+
+        assert enqueued == [jobs[0].id, jobs[2].id]
+        messages = mock_send.call_args.kwargs["messages"]
+        assert [m.message_group_id for m in messages] == ["loc-0", "loc-1", "loc-2"]
+        assert [m.deduplication_id for m in messages] == [job.id for job in jobs]
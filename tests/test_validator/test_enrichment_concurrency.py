@@ -0,0 +1,146 @@
+"""Tests for concurrent lookup resolution in GeocodingEnricher.enrich_job_data."""
+
+import copy
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.validator.enrichment import GeocodingEnricher
+
+
+class StubGeocodingService:
+    """Geocoding service stub with fixed per-call latency."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.geocode_calls = []
+        self.reverse_calls = []
+        self._lock = threading.Lock()
+
+    def geocode(self, address):
+        with self._lock:
+            self.geocode_calls.append(address)
+        time.sleep(self.latency)
+        number = int(address.split()[0])
+        return (40.0 + number / 1000, -75.0)
+
+    def geocode_with_provider(self, address, provider):
+        return None
+
+    def reverse_geocode(self, lat, lon):
+        with self._lock:
+            self.reverse_calls.append((lat, lon))
+        time.sleep(self.latency)
+        return {
+            "address": "1 Reverse Rd",
+            "city": "Philadelphia",
+            "state": "Pennsylvania",
+            "postal_code": "19103",
+        }
+
+
+def _job(count, duplicate_every=None):
+    locations = []
+    for i in range(count):
+        number = i % duplicate_every if duplicate_every else i
+        locations.append(
+            {
+                "name": f"Pantry {i}",
+                "addresses": [
+                    {
+                        "address_1": f"{number + 1} Main St",
+                        "city": "Philadelphia",
+                        "state_province": "PA",
+                        "postal_code": "19103",
+                        "country": "US",
+                        "address_type": "physical",
+                    }
+                ],
+                "latitude": None,
+                "longitude": None,
+            }
+        )
+    return {"organization": [], "service": [], "location": locations}
+
+
+def _enricher(service, concurrency):
+    cache = MagicMock()
+    cache.get.return_value = None
+    return GeocodingEnricher(
+        geocoding_service=service,
+        config={
+            "enrichment_enabled": True,
+            "geocoding_providers": ["arcgis"],
+            "enrichment_concurrency": concurrency,
+        },
+        cache_backend=cache,
+    )
+
+
+class TestConcurrentEnrichment:
+    """Tests for the prefetch stage of enrich_job_data."""
+
+    def test_results_match_sequential_enrichment(self):
+        job = _job(6)
+        job["location"].append(
+            {"name": "Coordinates Only", "latitude": 39.95, "longitude": -75.16}
+        )
+        job["location"].append(
+            {"name": "Virtual", "location_type": "virtual", "latitude": None}
+        )
+
+        sequential = _enricher(StubGeocodingService(), concurrency=1)
+        concurrent = _enricher(StubGeocodingService(), concurrency=8)
+
+        expected = sequential.enrich_job_data(copy.deepcopy(job))
+        result = concurrent.enrich_job_data(copy.deepcopy(job))
+
+        assert result == expected
+        assert result["location"][0]["latitude"] == pytest.approx(40.001)
+        assert result["location"][6]["addresses"][0]["state_province"] == "PA"
+        assert (
+            concurrent.get_enrichment_details()["locations_enriched"]
+            == sequential.get_enrichment_details()["locations_enriched"]
+        )
+
+    def test_duplicate_lookups_are_resolved_once(self):
+        service = StubGeocodingService()
+        enricher = _enricher(service, concurrency=4)
+
+        result = enricher.enrich_job_data(_job(12, duplicate_every=3))
+
+        assert len(service.geocode_calls) == 3
+        assert all(location["latitude"] for location in result["location"])
+        assert enricher.get_enrichment_details()["locations_enriched"] == 12
+
+    def test_prefetched_lookups_are_cleared_after_job(self):
+        enricher = _enricher(StubGeocodingService(), concurrency=4)
+        enricher.enrich_job_data(_job(3))
+        assert enricher._prefetched_lookups == {}
+
+    def test_enrichment_time_scales_with_concurrency(self):
+        """Wall time drops roughly in proportion to the concurrency level."""
+        latency = 0.02
+        timings = {}
+        for concurrency in (1, 4, 8):
+            enricher = _enricher(StubGeocodingService(latency), concurrency)
+            start = time.monotonic()
+            enricher.enrich_job_data(_job(40))
+            timings[concurrency] = time.monotonic() - start
+
+        # 40 sequential lookups take at least 40 * latency
+        assert timings[1] >= 40 * latency
+        assert timings[4] < timings[1] / 2.5
+        assert timings[8] < timings[1] / 4
+
+    def test_worker_threads_do_not_outlive_the_job(self):
+        enricher = _enricher(StubGeocodingService(), concurrency=4)
+        enricher.enrich_job_data(_job(8))
+
+        assert not [
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith("enrichment")
+        ]